@@ -15,6 +15,22 @@ Mixture distributions are:
     Mixture_Model - this must be created using 2 or more of the above standard distributions
     Competing_Risks_Model - this must be created using 2 or more of the above standard distributions
 
+Batches of the standard distributions are:
+    Weibull_Distribution_batch
+    Normal_Distribution_batch
+    Lognormal_Distribution_batch
+    Exponential_Distribution_batch
+    Gamma_Distribution_batch
+    Beta_Distribution_batch
+    Loglogistic_Distribution_batch
+    Gumbel_Distribution_batch
+These take arrays of parameters and return 2D arrays with one row per distribution
+
+The descriptive statistics (mean, variance, median, etc.) and parameter titles
+of the distributions and models are calculated when they are first accessed
+and are then cached on the object. This keeps the creation of a distribution
+cheap when only its functions (such as the SF) are used.
+
 Example usage:
 dist = Weibull_Distribution(alpha = 8, beta = 1.2)
 print(dist.mean)
@@ -33,7 +49,25 @@ values = dist.random_samples(number_of_samples=10000)
 
 import scipy.stats as ss
 import numpy as np
+from functools import cached_property
 from scipy import integrate
+from scipy.optimize import minimize_scalar
+from scipy.special import (
+    ndtr,
+    ndtri,
+    log_ndtr,
+    gammainc,
+    gammaincc,
+    gammaincinv,
+    gammainccinv,
+    gammaln,
+    betainc,
+    betaincinv,
+    betaln,
+    exp1,
+    xlogy,
+    xlog1py,
+)
 import matplotlib.pyplot as plt
 from reliability.Utils import (
     round_and_string,
@@ -46,6 +80,8 @@ from reliability.Utils import (
     extract_CI,
     distributions_input_checking,
     unpack_single_arrays,
+    bracketed_root,
+    mean_residual_life_from_SF,
 )
 
 dec = 4  # number of decimals to use when rounding descriptive statistics and parameter titles
@@ -107,16 +143,6 @@ class Weibull_Distribution:
         self.beta = float(beta)
         self.gamma = float(gamma)
         self.parameters = np.array([self.alpha, self.beta, self.gamma])
-        mean, var, skew, kurt = ss.weibull_min.stats(
-            self.beta, scale=self.alpha, loc=self.gamma, moments="mvsk"
-        )
-        self.mean = float(mean)
-        self.variance = float(var)
-        self.standard_deviation = var ** 0.5
-        self.skewness = float(skew)
-        self.kurtosis = kurt + 3
-        self.excess_kurtosis = float(kurt)
-        self.median = ss.weibull_min.median(self.beta, scale=self.alpha, loc=self.gamma)
         if self.beta >= 1:
             self.mode = (
                 self.alpha * ((self.beta - 1) / self.beta) ** (1 / self.beta)
@@ -125,41 +151,9 @@ class Weibull_Distribution:
         else:
             self.mode = self.gamma
         if self.gamma != 0:
-            self.param_title = str(
-                "α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-            )
-            self.param_title_long = str(
-                "Weibull Distribution (α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-                + ")"
-            )
             self.name2 = "Weibull_3P"
         else:
-            self.param_title = str(
-                "α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-            )
-            self.param_title_long = str(
-                "Weibull Distribution (α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ")"
-            )
             self.name2 = "Weibull_2P"
-        self.b5 = ss.weibull_min.ppf(0.05, self.beta, scale=self.alpha, loc=self.gamma)
-        self.b95 = ss.weibull_min.ppf(0.95, self.beta, scale=self.alpha, loc=self.gamma)
 
         # extracts values for confidence interval plotting
         if "alpha_SE" in kwargs:
@@ -192,14 +186,80 @@ class Weibull_Distribution:
                 ),
                 text_color="red",
             )
-        self._pdf0 = ss.weibull_min.pdf(
-            0, self.beta, scale=self.alpha, loc=0
-        )  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
-        self._hf0 = ss.weibull_min.pdf(
-            0, self.beta, scale=self.alpha, loc=0
-        ) / ss.weibull_min.sf(
-            0, self.beta, scale=self.alpha, loc=0
-        )  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+
+    @cached_property
+    def _moments(self):
+        return ss.weibull_min.stats(
+            self.beta, scale=self.alpha, loc=self.gamma, moments="mvsk"
+        )
+
+    @cached_property
+    def mean(self):
+        return float(self._moments[0])
+
+    @cached_property
+    def variance(self):
+        return float(self._moments[1])
+
+    @cached_property
+    def standard_deviation(self):
+        return self._moments[1] ** 0.5
+
+    @cached_property
+    def skewness(self):
+        return float(self._moments[2])
+
+    @cached_property
+    def kurtosis(self):
+        return self._moments[3] + 3
+
+    @cached_property
+    def excess_kurtosis(self):
+        return float(self._moments[3])
+
+    @cached_property
+    def median(self):
+        return ss.weibull_min.median(self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def b5(self):
+        return ss.weibull_min.ppf(0.05, self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def b95(self):
+        return ss.weibull_min.ppf(0.95, self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def param_title(self):
+        if self.gamma != 0:
+            return str(
+                "α="
+                + round_and_string(self.alpha, dec)
+                + ",β="
+                + round_and_string(self.beta, dec)
+                + ",γ="
+                + round_and_string(self.gamma, dec)
+            )
+        return str(
+            "α="
+            + round_and_string(self.alpha, dec)
+            + ",β="
+            + round_and_string(self.beta, dec)
+        )
+
+    @cached_property
+    def param_title_long(self):
+        return str("Weibull Distribution (" + self.param_title + ")")
+
+    @cached_property
+    def _pdf0(self):
+        # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return ss.weibull_min.pdf(0, self.beta, scale=self.alpha, loc=0)
+
+    @cached_property
+    def _hf0(self):
+        # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return self._pdf0 / ss.weibull_min.sf(0, self.beta, scale=self.alpha, loc=0)
 
     def plot(self, xvals=None, xmin=None, xmax=None):
         """
@@ -908,6 +968,127 @@ class Weibull_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.maximum(x - self.gamma, 0) / self.alpha
+        pdf = (
+            (self.beta / self.alpha) * z ** (self.beta - 1) * np.exp(-(z ** self.beta))
+        )
+        return np.where(x < self.gamma, 0, pdf)[()]
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return -np.expm1(-(z ** self.beta))
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return np.exp(-(z ** self.beta))
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.maximum(x - self.gamma, 0) / self.alpha
+        hf = (self.beta / self.alpha) * z ** (self.beta - 1)
+        return np.where(x < self.gamma, 0, hf)[()]
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return z ** self.beta
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -965,18 +1146,24 @@ class Weibull_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.weibull_min.sf(x, self.beta, scale=self.alpha, loc=self.gamma)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Weibull_Distribution_batch(
+            alpha=self.alpha, beta=self.beta, gamma=self.gamma
+        )
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -1116,21 +1303,6 @@ class Normal_Distribution:
         self.excess_kurtosis = 0
         self.median = mu
         self.mode = mu
-        self.param_title = str(
-            "μ="
-            + round_and_string(self.mu, dec)
-            + ",σ="
-            + round_and_string(self.sigma, dec)
-        )
-        self.param_title_long = str(
-            "Normal Distribution (μ="
-            + round_and_string(self.mu, dec)
-            + ",σ="
-            + round_and_string(self.sigma, dec)
-            + ")"
-        )
-        self.b5 = ss.norm.ppf(0.05, loc=self.mu, scale=self.sigma)
-        self.b95 = ss.norm.ppf(0.95, loc=self.mu, scale=self.sigma)
 
         # extracts values for confidence interval plotting
         if "mu_SE" in kwargs:
@@ -1167,6 +1339,27 @@ class Normal_Distribution:
         self._pdf0 = 0  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
         self._hf0 = 0  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
 
+    @cached_property
+    def b5(self):
+        return ss.norm.ppf(0.05, loc=self.mu, scale=self.sigma)
+
+    @cached_property
+    def b95(self):
+        return ss.norm.ppf(0.95, loc=self.mu, scale=self.sigma)
+
+    @cached_property
+    def param_title(self):
+        return str(
+            "μ="
+            + round_and_string(self.mu, dec)
+            + ",σ="
+            + round_and_string(self.sigma, dec)
+        )
+
+    @cached_property
+    def param_title_long(self):
+        return str("Normal Distribution (" + self.param_title + ")")
+
     def plot(self, xvals=None, xmin=None, xmax=None):
         """
         Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
@@ -1849,6 +2042,119 @@ class Normal_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return np.exp(-0.5 * z ** 2) / (self.sigma * np.sqrt(2 * np.pi))
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return ndtr((np.asarray(x, dtype=float) - self.mu) / self.sigma)
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return ndtr((self.mu - np.asarray(x, dtype=float)) / self.sigma)
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        # the ratio of the pdf and sf is taken in log space to avoid 0/0 in the tail
+        return np.exp(-0.5 * z ** 2 - log_ndtr(-z)) / (self.sigma * np.sqrt(2 * np.pi))
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return -log_ndtr((self.mu - np.asarray(x, dtype=float)) / self.sigma)
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -1906,18 +2212,22 @@ class Normal_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.norm.sf(x, loc=self.mu, scale=self.sigma)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Normal_Distribution_batch(mu=self.mu, sigma=self.sigma)
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -2037,55 +2347,11 @@ class Lognormal_Distribution:
         self.sigma = float(sigma)
         self.gamma = float(gamma)
         self.parameters = np.array([self.mu, self.sigma, self.gamma])
-        mean, var, skew, kurt = ss.lognorm.stats(
-            self.sigma, self.gamma, np.exp(self.mu), moments="mvsk"
-        )
-        self.mean = float(mean)
-        self.variance = float(var)
-        self.standard_deviation = var ** 0.5
-        self.skewness = float(skew)
-        self.kurtosis = kurt + 3
-        self.excess_kurtosis = float(kurt)
-        self.median = ss.lognorm.median(self.sigma, self.gamma, np.exp(self.mu))
         self.mode = np.exp(self.mu - self.sigma ** 2) + self.gamma
         if self.gamma != 0:
-            self.param_title = str(
-                "μ="
-                + round_and_string(self.mu, dec)
-                + ",σ="
-                + round_and_string(self.sigma, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-            )
-            self.param_title_long = str(
-                "Lognormal Distribution (μ="
-                + round_and_string(self.mu, dec)
-                + ",σ="
-                + round_and_string(self.sigma, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-                + ")"
-            )
             self.name2 = "Lognormal_3P"
         else:
-            self.param_title = str(
-                "μ="
-                + round_and_string(self.mu, dec)
-                + ",σ="
-                + round_and_string(self.sigma, dec)
-            )
-            self.param_title_long = str(
-                "Lognormal Distribution (μ="
-                + round_and_string(self.mu, dec)
-                + ",σ="
-                + round_and_string(self.sigma, dec)
-                + ")"
-            )
             self.name2 = "Lognormal_2P"
-        self.b5 = ss.lognorm.ppf(
-            0.05, self.sigma, self.gamma, np.exp(self.mu)
-        )  # note that scipy uses mu in a log way compared to most other software, so we must take the exp of the input
-        self.b95 = ss.lognorm.ppf(0.95, self.sigma, self.gamma, np.exp(self.mu))
 
         # extracts values for confidence interval plotting
         if "mu_SE" in kwargs:
@@ -2119,39 +2385,108 @@ class Lognormal_Distribution:
                 text_color="red",
             )
 
-        self._pdf0 = ss.lognorm.pdf(
-            0, self.sigma, 0, np.exp(self.mu)
-        )  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
-        self._hf0 = ss.lognorm.pdf(0, self.sigma, 0, np.exp(self.mu)) / ss.lognorm.sf(
-            0, self.sigma, 0, np.exp(self.mu)
-        )  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+    @cached_property
+    def _moments(self):
+        return ss.lognorm.stats(
+            self.sigma, self.gamma, np.exp(self.mu), moments="mvsk"
+        )
 
-    def plot(self, xvals=None, xmin=None, xmax=None):
-        """
-        Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
-        in a single figure
+    @cached_property
+    def mean(self):
+        return float(self._moments[0])
 
-        Parameters
-        ----------
-        xvals : list, array, optional
-            x-values for plotting
-        xmin : int, float, optional
-            minimum x-value for plotting
-        xmax : int, float, optional
-            maximum x-value for plotting
+    @cached_property
+    def variance(self):
+        return float(self._moments[1])
 
-        Returns
-        -------
-        None
+    @cached_property
+    def standard_deviation(self):
+        return self._moments[1] ** 0.5
 
-        Notes
-        -----
-        The plot will be shown. No need to use plt.show().
-        If xvals is specified, it will be used. If xvals is not specified but
-        xmin and/or xmax are specified then an array with 200 elements will be
-        created using these limits. If nothing is specified then the range will
-        be based on the distribution's parameters. No plotting keywords are
-        accepted.
+    @cached_property
+    def skewness(self):
+        return float(self._moments[2])
+
+    @cached_property
+    def kurtosis(self):
+        return self._moments[3] + 3
+
+    @cached_property
+    def excess_kurtosis(self):
+        return float(self._moments[3])
+
+    @cached_property
+    def median(self):
+        return ss.lognorm.median(self.sigma, self.gamma, np.exp(self.mu))
+
+    @cached_property
+    def b5(self):
+        # note that scipy uses mu in a log way compared to most other software,
+        # so we must take the exp of the input
+        return ss.lognorm.ppf(0.05, self.sigma, self.gamma, np.exp(self.mu))
+
+    @cached_property
+    def b95(self):
+        return ss.lognorm.ppf(0.95, self.sigma, self.gamma, np.exp(self.mu))
+
+    @cached_property
+    def param_title(self):
+        if self.gamma != 0:
+            return str(
+                "μ="
+                + round_and_string(self.mu, dec)
+                + ",σ="
+                + round_and_string(self.sigma, dec)
+                + ",γ="
+                + round_and_string(self.gamma, dec)
+            )
+        return str(
+            "μ="
+            + round_and_string(self.mu, dec)
+            + ",σ="
+            + round_and_string(self.sigma, dec)
+        )
+
+    @cached_property
+    def param_title_long(self):
+        return str("Lognormal Distribution (" + self.param_title + ")")
+
+    @cached_property
+    def _pdf0(self):
+        # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return ss.lognorm.pdf(0, self.sigma, 0, np.exp(self.mu))
+
+    @cached_property
+    def _hf0(self):
+        # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return self._pdf0 / ss.lognorm.sf(0, self.sigma, 0, np.exp(self.mu))
+
+    def plot(self, xvals=None, xmin=None, xmax=None):
+        """
+        Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
+        in a single figure
+
+        Parameters
+        ----------
+        xvals : list, array, optional
+            x-values for plotting
+        xmin : int, float, optional
+            minimum x-value for plotting
+        xmax : int, float, optional
+            maximum x-value for plotting
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The plot will be shown. No need to use plt.show().
+        If xvals is specified, it will be used. If xvals is not specified but
+        xmin and/or xmax are specified then an array with 200 elements will be
+        created using these limits. If nothing is specified then the range will
+        be based on the distribution's parameters. No plotting keywords are
+        accepted.
         """
         X, xvals, xmin, xmax = distributions_input_checking(
             self, "ALL", xvals, xmin, xmax
@@ -2816,6 +3151,128 @@ class Lognormal_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        z = (np.log(t) - self.mu) / self.sigma
+        pdf = np.exp(-0.5 * z ** 2) / (t * self.sigma * np.sqrt(2 * np.pi))
+        return np.where(t > 0, pdf, 0)[()]
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        return ndtr((np.log(t) - self.mu) / self.sigma)
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        return ndtr((self.mu - np.log(t)) / self.sigma)
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        z = (np.log(t) - self.mu) / self.sigma
+        # the ratio of the pdf and sf is taken in log space to avoid 0/0 in the tail
+        hf = np.exp(-0.5 * z ** 2 - log_ndtr(-z)) / (
+            t * self.sigma * np.sqrt(2 * np.pi)
+        )
+        return np.where(t > 0, hf, 0)[()]
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        return -log_ndtr((self.mu - np.log(t)) / self.sigma)
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -2873,18 +3330,24 @@ class Lognormal_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.lognorm.sf(x, self.sigma, self.gamma, np.exp(self.mu))
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Lognormal_Distribution_batch(
+            mu=self.mu, sigma=self.sigma, gamma=self.gamma
+        )
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -3017,42 +3480,11 @@ class Exponential_Distribution:
         self.Lambda = float(Lambda)
         self.gamma = float(gamma)
         self.parameters = np.array([self.Lambda, self.gamma])
-        mean, var, skew, kurt = ss.expon.stats(
-            scale=1 / self.Lambda, loc=self.gamma, moments="mvsk"
-        )
-        self.mean = float(mean)
-        self.variance = float(var)
-        self.standard_deviation = var ** 0.5
-        self.skewness = float(skew)
-        self.kurtosis = kurt + 3
-        self.excess_kurtosis = float(kurt)
-        self.median = ss.expon.median(scale=1 / self.Lambda, loc=self.gamma)
         self.mode = self.gamma
         if self.gamma != 0:
-            self.param_title = str(
-                "λ="
-                + round_and_string(self.Lambda, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-            )
-            self.param_title_long = str(
-                "Exponential Distribution (λ="
-                + round_and_string(self.Lambda, dec)
-                + ",γ="
-                + round_and_string(gamma, dec)
-                + ")"
-            )
             self.name2 = "Exponential_2P"
         else:
-            self.param_title = str("λ=" + round_and_string(self.Lambda, dec))
-            self.param_title_long = str(
-                "Exponential Distribution (λ="
-                + round_and_string(self.Lambda, dec)
-                + ")"
-            )
             self.name2 = "Exponential_1P"
-        self.b5 = ss.expon.ppf(0.05, scale=1 / self.Lambda, loc=self.gamma)
-        self.b95 = ss.expon.ppf(0.95, scale=1 / self.Lambda, loc=self.gamma)
 
         # extracts values for confidence interval plotting
         if "Lambda_SE" in kwargs:
@@ -3073,13 +3505,72 @@ class Exponential_Distribution:
                 ),
                 text_color="red",
             )
-        self._pdf0 = ss.expon.pdf(
-            0, scale=1 / self.Lambda, loc=0
-        )  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array.
         self._hf0 = (
             self.Lambda
         )  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
 
+    @cached_property
+    def _moments(self):
+        return ss.expon.stats(
+            scale=1 / self.Lambda, loc=self.gamma, moments="mvsk"
+        )
+
+    @cached_property
+    def mean(self):
+        return float(self._moments[0])
+
+    @cached_property
+    def variance(self):
+        return float(self._moments[1])
+
+    @cached_property
+    def standard_deviation(self):
+        return self._moments[1] ** 0.5
+
+    @cached_property
+    def skewness(self):
+        return float(self._moments[2])
+
+    @cached_property
+    def kurtosis(self):
+        return self._moments[3] + 3
+
+    @cached_property
+    def excess_kurtosis(self):
+        return float(self._moments[3])
+
+    @cached_property
+    def median(self):
+        return ss.expon.median(scale=1 / self.Lambda, loc=self.gamma)
+
+    @cached_property
+    def b5(self):
+        return ss.expon.ppf(0.05, scale=1 / self.Lambda, loc=self.gamma)
+
+    @cached_property
+    def b95(self):
+        return ss.expon.ppf(0.95, scale=1 / self.Lambda, loc=self.gamma)
+
+    @cached_property
+    def param_title(self):
+        if self.gamma != 0:
+            return str(
+                "λ="
+                + round_and_string(self.Lambda, dec)
+                + ",γ="
+                + round_and_string(self.gamma, dec)
+            )
+        return str("λ=" + round_and_string(self.Lambda, dec))
+
+    @cached_property
+    def param_title_long(self):
+        return str("Exponential Distribution (" + self.param_title + ")")
+
+    @cached_property
+    def _pdf0(self):
+        # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return ss.expon.pdf(0, scale=1 / self.Lambda, loc=0)
+
     def plot(self, xvals=None, xmin=None, xmax=None):
         """
         Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
@@ -3772,6 +4263,121 @@ class Exponential_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        t = np.maximum(x - self.gamma, 0)
+        return np.where(x < self.gamma, 0, self.Lambda * np.exp(-self.Lambda * t))[()]
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        return -np.expm1(-self.Lambda * t)
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        return np.exp(-self.Lambda * t)
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return np.where(np.asarray(x, dtype=float) < self.gamma, 0, self.Lambda)[()]
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        t = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0)
+        return self.Lambda * t
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -3829,18 +4435,22 @@ class Exponential_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.expon.sf(x, scale=1 / self.Lambda, loc=self.gamma)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Exponential_Distribution_batch(Lambda=self.Lambda, gamma=self.gamma)
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -3970,56 +4580,14 @@ class Gamma_Distribution:
         self.beta = float(beta)
         self.gamma = float(gamma)
         self.parameters = np.array([self.alpha, self.beta, self.gamma])
-        mean, var, skew, kurt = ss.gamma.stats(
-            self.beta, scale=self.alpha, loc=self.gamma, moments="mvsk"
-        )
-        self.mean = float(mean)
-        self.variance = float(var)
-        self.standard_deviation = var ** 0.5
-        self.skewness = float(skew)
-        self.kurtosis = kurt + 3
-        self.excess_kurtosis = float(kurt)
-        self.median = ss.gamma.median(self.beta, scale=self.alpha, loc=self.gamma)
         if self.beta >= 1:
             self.mode = (self.beta - 1) * self.alpha + self.gamma
         else:
             self.mode = self.gamma
         if self.gamma != 0:
-            self.param_title = str(
-                "α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-            )
-            self.param_title_long = str(
-                "Gamma Distribution (α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-                + ")"
-            )
             self.name2 = "Gamma_3P"
         else:
-            self.param_title = str(
-                "α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-            )
-            self.param_title_long = str(
-                "Gamma Distribution (α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ")"
-            )
             self.name2 = "Gamma_2P"
-        self.b5 = ss.gamma.ppf(0.05, self.beta, scale=self.alpha, loc=self.gamma)
-        self.b95 = ss.gamma.ppf(0.95, self.beta, scale=self.alpha, loc=self.gamma)
 
         # extracts values for confidence interval plotting
         if "mu" in kwargs:
@@ -4065,29 +4633,96 @@ class Gamma_Distribution:
                 text_color="red",
             )
 
-        self._pdf0 = ss.gamma.pdf(
-            0, self.beta, scale=self.alpha, loc=0
-        )  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
-        self._hf0 = ss.gamma.pdf(0, self.beta, scale=self.alpha, loc=0) / ss.gamma.sf(
-            0, self.beta, scale=self.alpha, loc=0
-        )  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+    @cached_property
+    def _moments(self):
+        return ss.gamma.stats(
+            self.beta, scale=self.alpha, loc=self.gamma, moments="mvsk"
+        )
 
-    def plot(self, xvals=None, xmin=None, xmax=None):
-        """
-        Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
-        in a single figure
+    @cached_property
+    def mean(self):
+        return float(self._moments[0])
 
-        Parameters
-        ----------
-        xvals : list, array, optional
-            x-values for plotting
-        xmin : int, float, optional
-            minimum x-value for plotting
-        xmax : int, float, optional
-            maximum x-value for plotting
+    @cached_property
+    def variance(self):
+        return float(self._moments[1])
 
-        Returns
-        -------
+    @cached_property
+    def standard_deviation(self):
+        return self._moments[1] ** 0.5
+
+    @cached_property
+    def skewness(self):
+        return float(self._moments[2])
+
+    @cached_property
+    def kurtosis(self):
+        return self._moments[3] + 3
+
+    @cached_property
+    def excess_kurtosis(self):
+        return float(self._moments[3])
+
+    @cached_property
+    def median(self):
+        return ss.gamma.median(self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def b5(self):
+        return ss.gamma.ppf(0.05, self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def b95(self):
+        return ss.gamma.ppf(0.95, self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def param_title(self):
+        if self.gamma != 0:
+            return str(
+                "α="
+                + round_and_string(self.alpha, dec)
+                + ",β="
+                + round_and_string(self.beta, dec)
+                + ",γ="
+                + round_and_string(self.gamma, dec)
+            )
+        return str(
+            "α="
+            + round_and_string(self.alpha, dec)
+            + ",β="
+            + round_and_string(self.beta, dec)
+        )
+
+    @cached_property
+    def param_title_long(self):
+        return str("Gamma Distribution (" + self.param_title + ")")
+
+    @cached_property
+    def _pdf0(self):
+        # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return ss.gamma.pdf(0, self.beta, scale=self.alpha, loc=0)
+
+    @cached_property
+    def _hf0(self):
+        # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return self._pdf0 / ss.gamma.sf(0, self.beta, scale=self.alpha, loc=0)
+
+    def plot(self, xvals=None, xmin=None, xmax=None):
+        """
+        Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
+        in a single figure
+
+        Parameters
+        ----------
+        xvals : list, array, optional
+            x-values for plotting
+        xmin : int, float, optional
+            minimum x-value for plotting
+        xmax : int, float, optional
+            maximum x-value for plotting
+
+        Returns
+        -------
         None
 
         Notes
@@ -4758,6 +5393,121 @@ class Gamma_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.maximum(x - self.gamma, 0) / self.alpha
+        pdf = np.exp(xlogy(self.beta - 1, z) - z - gammaln(self.beta)) / self.alpha
+        return np.where(x < self.gamma, 0, pdf)[()]
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return gammainc(self.beta, z)
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return gammaincc(self.beta, z)
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return self.PDF_fast(x) / self.SF_fast(x)
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return -np.log(self.SF_fast(x))
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -4815,18 +5565,24 @@ class Gamma_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.gamma.sf(x, self.beta, scale=self.alpha, loc=self.gamma)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Gamma_Distribution_batch(
+            alpha=self.alpha, beta=self.beta, gamma=self.gamma
+        )
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -4959,43 +5715,74 @@ class Beta_Distribution:
         self.alpha = float(alpha)
         self.beta = float(beta)
         self.parameters = np.array([self.alpha, self.beta])
-        mean, var, skew, kurt = ss.beta.stats(
-            self.alpha, self.beta, 0, 1, moments="mvsk"
-        )
-        self.mean = float(mean)
-        self.variance = float(var)
-        self.standard_deviation = var ** 0.5
-        self.skewness = float(skew)
-        self.kurtosis = kurt + 3
-        self.excess_kurtosis = float(kurt)
-        self.median = ss.beta.median(self.alpha, self.beta, 0, 1)
         if self.alpha > 1 and self.beta > 1:
             self.mode = (self.alpha - 1) / (self.beta + self.alpha - 2)
         else:
             self.mode = r"No mode exists unless $\alpha$ > 1 and $\beta$ > 1"
-        self.param_title = str(
+        self.Z = None  # this is necessary because distributions_input_checking looks for this value
+
+    @cached_property
+    def _moments(self):
+        return ss.beta.stats(self.alpha, self.beta, 0, 1, moments="mvsk")
+
+    @cached_property
+    def mean(self):
+        return float(self._moments[0])
+
+    @cached_property
+    def variance(self):
+        return float(self._moments[1])
+
+    @cached_property
+    def standard_deviation(self):
+        return self._moments[1] ** 0.5
+
+    @cached_property
+    def skewness(self):
+        return float(self._moments[2])
+
+    @cached_property
+    def kurtosis(self):
+        return self._moments[3] + 3
+
+    @cached_property
+    def excess_kurtosis(self):
+        return float(self._moments[3])
+
+    @cached_property
+    def median(self):
+        return ss.beta.median(self.alpha, self.beta, 0, 1)
+
+    @cached_property
+    def b5(self):
+        return ss.beta.ppf(0.05, self.alpha, self.beta, 0, 1)
+
+    @cached_property
+    def b95(self):
+        return ss.beta.ppf(0.95, self.alpha, self.beta, 0, 1)
+
+    @cached_property
+    def param_title(self):
+        return str(
             "α="
             + round_and_string(self.alpha, dec)
             + ",β="
             + round_and_string(self.beta, dec)
         )
-        self.param_title_long = str(
-            "Beta Distribution (α="
-            + round_and_string(self.alpha, dec)
-            + ",β="
-            + round_and_string(self.beta, dec)
-            + ")"
-        )
-        self.b5 = ss.beta.ppf(0.05, self.alpha, self.beta, 0, 1)
-        self.b95 = ss.beta.ppf(0.95, self.alpha, self.beta, 0, 1)
 
+    @cached_property
+    def param_title_long(self):
+        return str("Beta Distribution (" + self.param_title + ")")
+
+    @cached_property
+    def _pdf0(self):
         # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
-        self._pdf0 = ss.beta.pdf(0, self.alpha, self.beta, 0, 1)
+        return ss.beta.pdf(0, self.alpha, self.beta, 0, 1)
+
+    @cached_property
+    def _hf0(self):
         # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
-        self._hf0 = ss.beta.pdf(0, self.alpha, self.beta, 0, 1) / ss.beta.sf(
-            0, self.alpha, self.beta, 0, 1
-        )
-        self.Z = None  # this is necessary because distributions_input_checking looks for this value
+        return self._pdf0 / ss.beta.sf(0, self.alpha, self.beta, 0, 1)
 
     def plot(self, xvals=None, xmin=None, xmax=None):
         """
@@ -5479,6 +6266,124 @@ class Beta_Distribution:
 
         return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.clip(x, 0, 1)
+        pdf = np.exp(
+            xlogy(self.alpha - 1, z)
+            + xlog1py(self.beta - 1, -z)
+            - betaln(self.alpha, self.beta)
+        )
+        return np.where((x < 0) | (x > 1), 0, pdf)[()]
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return betainc(self.alpha, self.beta, np.clip(np.asarray(x, dtype=float), 0, 1))
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.clip(np.asarray(x, dtype=float), 0, 1)
+        return betainc(self.beta, self.alpha, 1 - z)
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return self.PDF_fast(x) / self.SF_fast(x)
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return -np.log(self.SF_fast(x))
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -5536,18 +6441,22 @@ class Beta_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.beta.sf(x, self.alpha, self.beta, 0, 1)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Beta_Distribution_batch(alpha=self.alpha, beta=self.beta)
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -5685,37 +6594,6 @@ class Loglogistic_Distribution:
         self.beta = float(beta)
         self.gamma = float(gamma)
         self.parameters = np.array([self.alpha, self.beta, self.gamma])
-
-        if self.beta > 1:
-            self.mean = float(
-                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="m")
-            )
-        else:
-            self.mean = r"no mean when $\beta \leq 1$"
-        if self.beta > 2:
-            self.variance = float(
-                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="v")
-            )
-            self.standard_deviation = self.variance ** 0.5
-        else:
-            self.variance = r"no variance when $\beta \leq 2$"
-            self.standard_deviation = r"no stdev when $\beta \leq 2$"
-        if self.beta > 3:
-            self.skewness = float(
-                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="s")
-            )
-        else:
-            self.skewness = r"no skewness when $\beta \leq 3$"
-        if self.beta > 4:
-            self.excess_kurtosis = float(
-                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="k")
-            )
-            self.kurtosis = self.excess_kurtosis + 3
-        else:
-            self.excess_kurtosis = r"no kurtosis when $\beta \leq 4$"
-            self.kurtosis = r"no kurtosis when $\beta \leq 4$"
-
-        self.median = ss.fisk.median(self.beta, scale=self.alpha, loc=self.gamma)
         if self.beta >= 1:
             self.mode = (
                 self.alpha * ((self.beta - 1) / (self.beta + 1)) ** (1 / self.beta)
@@ -5724,41 +6602,9 @@ class Loglogistic_Distribution:
         else:
             self.mode = self.gamma
         if self.gamma != 0:
-            self.param_title = str(
-                "α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-            )
-            self.param_title_long = str(
-                "Loglogistic Distribution (α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ",γ="
-                + round_and_string(self.gamma, dec)
-                + ")"
-            )
             self.name2 = "Loglogistic_3P"
         else:
-            self.param_title = str(
-                "α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-            )
-            self.param_title_long = str(
-                "Loglogistic Distribution (α="
-                + round_and_string(self.alpha, dec)
-                + ",β="
-                + round_and_string(self.beta, dec)
-                + ")"
-            )
             self.name2 = "Loglogistic_2P"
-        self.b5 = ss.fisk.ppf(0.05, self.beta, scale=self.alpha, loc=self.gamma)
-        self.b95 = ss.fisk.ppf(0.95, self.beta, scale=self.alpha, loc=self.gamma)
 
         # extracts values for confidence interval plotting
         if "alpha_SE" in kwargs:
@@ -5791,32 +6637,114 @@ class Loglogistic_Distribution:
                 ),
                 text_color="red",
             )
-        self._pdf0 = ss.fisk.pdf(
-            0, self.beta, scale=self.alpha, loc=0
-        )  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
-        self._hf0 = ss.fisk.pdf(0, self.beta, scale=self.alpha, loc=0) / ss.fisk.sf(
-            0, self.beta, scale=self.alpha, loc=0
-        )  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
 
-    def plot(self, xvals=None, xmin=None, xmax=None):
-        """
-        Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
-        in a single figure
+    @cached_property
+    def mean(self):
+        if self.beta > 1:
+            return float(
+                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="m")
+            )
+        return r"no mean when $\beta \leq 1$"
 
-        Parameters
-        ----------
-        xvals : list, array, optional
-            x-values for plotting
-        xmin : int, float, optional
-            minimum x-value for plotting
-        xmax : int, float, optional
-            maximum x-value for plotting
+    @cached_property
+    def variance(self):
+        if self.beta > 2:
+            return float(
+                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="v")
+            )
+        return r"no variance when $\beta \leq 2$"
 
-        Returns
-        -------
-        None
+    @cached_property
+    def standard_deviation(self):
+        if self.beta > 2:
+            return self.variance ** 0.5
+        return r"no stdev when $\beta \leq 2$"
 
-        Notes
+    @cached_property
+    def skewness(self):
+        if self.beta > 3:
+            return float(
+                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="s")
+            )
+        return r"no skewness when $\beta \leq 3$"
+
+    @cached_property
+    def excess_kurtosis(self):
+        if self.beta > 4:
+            return float(
+                ss.fisk.stats(self.beta, scale=self.alpha, loc=self.gamma, moments="k")
+            )
+        return r"no kurtosis when $\beta \leq 4$"
+
+    @cached_property
+    def kurtosis(self):
+        if self.beta > 4:
+            return self.excess_kurtosis + 3
+        return r"no kurtosis when $\beta \leq 4$"
+
+    @cached_property
+    def median(self):
+        return ss.fisk.median(self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def b5(self):
+        return ss.fisk.ppf(0.05, self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def b95(self):
+        return ss.fisk.ppf(0.95, self.beta, scale=self.alpha, loc=self.gamma)
+
+    @cached_property
+    def param_title(self):
+        if self.gamma != 0:
+            return str(
+                "α="
+                + round_and_string(self.alpha, dec)
+                + ",β="
+                + round_and_string(self.beta, dec)
+                + ",γ="
+                + round_and_string(self.gamma, dec)
+            )
+        return str(
+            "α="
+            + round_and_string(self.alpha, dec)
+            + ",β="
+            + round_and_string(self.beta, dec)
+        )
+
+    @cached_property
+    def param_title_long(self):
+        return str("Loglogistic Distribution (" + self.param_title + ")")
+
+    @cached_property
+    def _pdf0(self):
+        # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return ss.fisk.pdf(0, self.beta, scale=self.alpha, loc=0)
+
+    @cached_property
+    def _hf0(self):
+        # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
+        return self._pdf0 / ss.fisk.sf(0, self.beta, scale=self.alpha, loc=0)
+
+    def plot(self, xvals=None, xmin=None, xmax=None):
+        """
+        Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
+        in a single figure
+
+        Parameters
+        ----------
+        xvals : list, array, optional
+            x-values for plotting
+        xmin : int, float, optional
+            minimum x-value for plotting
+        xmax : int, float, optional
+            maximum x-value for plotting
+
+        Returns
+        -------
+        None
+
+        Notes
         -----
         The plot will be shown. No need to use plt.show().
         If xvals is specified, it will be used. If xvals is not specified but
@@ -6534,6 +7462,127 @@ class Loglogistic_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.maximum(x - self.gamma, 0) / self.alpha
+        pdf = (
+            (self.beta / self.alpha) * z ** (self.beta - 1) / (1 + z ** self.beta) ** 2
+        )
+        return np.where(x < self.gamma, 0, pdf)[()]
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return 1 / (1 + z ** -self.beta)
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return 1 / (1 + z ** self.beta)
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.maximum(x - self.gamma, 0) / self.alpha
+        hf = (self.beta / self.alpha) * z ** (self.beta - 1) / (1 + z ** self.beta)
+        return np.where(x < self.gamma, 0, hf)[()]
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = np.maximum(np.asarray(x, dtype=float) - self.gamma, 0) / self.alpha
+        return np.log1p(z ** self.beta)
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -6591,18 +7640,24 @@ class Loglogistic_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.fisk.sf(x, self.beta, scale=self.alpha, loc=self.gamma)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Loglogistic_Distribution_batch(
+            alpha=self.alpha, beta=self.beta, gamma=self.gamma
+        )
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -6734,30 +7789,8 @@ class Gumbel_Distribution:
         self.mu = float(mu)
         self.sigma = float(sigma)
         self.parameters = np.array([self.mu, self.sigma])
-        mean, var, skew, kurt = ss.gumbel_l.stats(self.mu, self.sigma, moments="mvsk")
-        self.mean = float(mean)
-        self.standard_deviation = float(var ** 0.5)
-        self.variance = float(var)
-        self.skewness = float(skew)
-        self.kurtosis = float(kurt + 3)
-        self.excess_kurtosis = float(kurt)
         self.median = mu + sigma * np.log(np.log(2))
         self.mode = mu
-        self.param_title = str(
-            "μ="
-            + round_and_string(self.mu, dec)
-            + ",σ="
-            + round_and_string(self.sigma, dec)
-        )
-        self.param_title_long = str(
-            "Gumbel Distribution (μ="
-            + round_and_string(self.mu, dec)
-            + ",σ="
-            + round_and_string(self.sigma, dec)
-            + ")"
-        )
-        self.b5 = ss.gumbel_l.ppf(0.05, loc=self.mu, scale=self.sigma)
-        self.b95 = ss.gumbel_l.ppf(0.95, loc=self.mu, scale=self.sigma)
 
         # extracts values for confidence interval plotting
         if "mu_SE" in kwargs:
@@ -6794,6 +7827,55 @@ class Gumbel_Distribution:
         self._pdf0 = 0  # the pdf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
         self._hf0 = 0  # the hf at 0. Used by Utils.restore_axes_limits and Utils.generate_X_array
 
+    @cached_property
+    def _moments(self):
+        return ss.gumbel_l.stats(self.mu, self.sigma, moments="mvsk")
+
+    @cached_property
+    def mean(self):
+        return float(self._moments[0])
+
+    @cached_property
+    def variance(self):
+        return float(self._moments[1])
+
+    @cached_property
+    def standard_deviation(self):
+        return float(self._moments[1] ** 0.5)
+
+    @cached_property
+    def skewness(self):
+        return float(self._moments[2])
+
+    @cached_property
+    def kurtosis(self):
+        return float(self._moments[3] + 3)
+
+    @cached_property
+    def excess_kurtosis(self):
+        return float(self._moments[3])
+
+    @cached_property
+    def b5(self):
+        return ss.gumbel_l.ppf(0.05, loc=self.mu, scale=self.sigma)
+
+    @cached_property
+    def b95(self):
+        return ss.gumbel_l.ppf(0.95, loc=self.mu, scale=self.sigma)
+
+    @cached_property
+    def param_title(self):
+        return str(
+            "μ="
+            + round_and_string(self.mu, dec)
+            + ",σ="
+            + round_and_string(self.sigma, dec)
+        )
+
+    @cached_property
+    def param_title_long(self):
+        return str("Gumbel Distribution (" + self.param_title + ")")
+
     def plot(self, xvals=None, xmin=None, xmax=None):
         """
         Plots all functions (PDF, CDF, SF, HF, CHF) and descriptive statistics
@@ -7477,6 +8559,120 @@ class Gumbel_Distribution:
         else:
             return chf
 
+    def PDF_fast(self, x):
+        """
+        Evaluates the PDF (probability density function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the PDF
+
+        Returns
+        -------
+        pdf : float, array
+            The PDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by PDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return np.exp(z - np.exp(z)) / self.sigma
+
+    def CDF_fast(self, x):
+        """
+        Evaluates the CDF (cumulative distribution function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CDF
+
+        Returns
+        -------
+        cdf : float, array
+            The CDF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CDF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return -np.expm1(-np.exp(z))
+
+    def SF_fast(self, x):
+        """
+        Evaluates the SF (survival function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the SF
+
+        Returns
+        -------
+        sf : float, array
+            The SF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by SF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return np.exp(-np.exp(z))
+
+    def HF_fast(self, x):
+        """
+        Evaluates the HF (hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the HF
+
+        Returns
+        -------
+        hf : float, array
+            The HF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by HF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return np.exp(z) / self.sigma
+
+    def CHF_fast(self, x):
+        """
+        Evaluates the CHF (cumulative hazard function) at x using its closed form
+
+        Parameters
+        ----------
+        x : int, float, array
+            The x-values at which to evaluate the CHF
+
+        Returns
+        -------
+        chf : float, array
+            The CHF at x. This has the same shape as x.
+
+        Notes
+        -----
+        This skips the input checking and plotting that is done by CHF so it
+        is much faster for small inputs such as those in a simulation loop.
+        Confidence intervals are not available.
+        """
+        return np.exp((np.asarray(x, dtype=float) - self.mu) / self.sigma)
+
     def quantile(self, q):
         """
         Quantile calculator
@@ -7534,18 +8730,22 @@ class Gumbel_Distribution:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
         """
-        R = lambda x: ss.gumbel_l.sf(x, loc=self.mu, scale=self.sigma)
-        integral_R, error = integrate.quad(R, t, np.inf)
-        MRL = integral_R / R(t)
-        return MRL
+        # a batch of one distribution has the closed form MRL for many t
+        batch = Gumbel_Distribution_batch(mu=self.mu, sigma=self.sigma)
+        MRL = batch.mean_residual_life(t)[0]
+        return unpack_single_arrays(MRL)
 
     def stats(self):
         """
@@ -7662,16 +8862,12 @@ class Competing_Risks_Model:
     risks are competing to cause failure rather than being mixed.
 
     As this process is multiplicative for the survival function, and may accept
-    many distributions of different types, the mathematical formulation quickly
-    gets complex. For this reason, the algorithm combines the models numerically
-    rather than empirically so there are no simple formulas for many of the
-    descriptive statistics (mean, median, etc.). Also, the accuracy of the model
-    is dependent on xvals. If the xvals array is small (<100 values) then the
-    answer will be 'blocky' and inaccurate. The variable xvals is only accepted
-    for PDF, CDF, SF, HF, CHF. The other methods (like random samples) use the
-    default xvals for maximum accuracy. The default number of values generated
-    when xvals is not given is 1000. Consider this carefully when specifying
-    xvals in order to avoid inaccuracies in the results.
+    many distributions of different types, there are no simple formulas for
+    many of the descriptive statistics (mean, median, etc.). The PDF, CDF, SF,
+    HF, and CHF are evaluated exactly at xvals using the constituent
+    distributions. The moments are found using adaptive quadrature, and the
+    quantiles are found using vectorized root finding on the CDF. The descriptive
+    statistics are only calculated when they are first accessed.
     """
 
     def __init__(self, distributions):
@@ -7704,12 +8900,6 @@ class Competing_Risks_Model:
             "Competing risks using " + str(self.num_dists) + " distributions"
         )
 
-        # This is essentially just the same as the __combiner method but more automated with a high amount of detail for the X array to minimize errors
-        xmax = -1e100
-        xmin = 1e100
-        xmax999 = -1e100
-        xmin001 = 1e100
-        xmax_inf = -1e100
         number_of_params = 0
         for dist in distributions:
             if dist.parameters[-1] == 0:
@@ -7717,62 +8907,132 @@ class Competing_Risks_Model:
             else:
                 params_in_dist = len(dist.parameters)
             number_of_params += params_in_dist
-            xmax = max(xmax, dist.quantile(1 - 1e-10))
-            xmin = min(xmin, dist.quantile(1e-10))
-            xmax999 = max(xmax999, dist.quantile(0.999))
-            xmin001 = min(xmin001, dist.quantile(0.001))
-            xmax_inf = max(
-                xmax_inf, dist.quantile(1 - 1e-10)
-            )  # effective infinity used by MRL
         self.__number_of_params = number_of_params
-        self.__xmax999 = xmax999
-        self.__xmin001 = xmin001
-        self.__xmax_inf = xmax_inf
-
-        X = np.linspace(xmin, xmax, 1000000)
-        X_positive = X[X >= 0]
-        X_negative = X[X < 0]
-        Y_negative_zeros = np.zeros_like(X_negative)
-        Y_negative_ones = np.ones_like(X_negative)
 
+    @cached_property
+    def _support(self):
+        # The limits beyond which the CDF (below) or SF (above) of the model are
+        # negligible, and the points inside these limits where the PDF may have
+        # features. These are used for integration and root finding. The SF of
+        # the model is below the SF of every component so the upper limit is
+        # the lowest of the upper limits of the components.
+        lower = min(
+            dist.quantile(1e-10 / self.num_dists) for dist in self.distributions
+        )
+        upper = min(dist.quantile(1 - 1e-10) for dist in self.distributions)
+        points = np.unique(
+            [dist.quantile([0.01, 0.5, 0.99]) for dist in self.distributions]
+        )
+        return lower, upper, points[(points > lower) & (points < upper)]
+
+    @cached_property
+    def __xmin001(self):
+        return min(dist.quantile(0.001) for dist in self.distributions)
+
+    @cached_property
+    def __xmax999(self):
+        return max(dist.quantile(0.999) for dist in self.distributions)
+
+    @cached_property
+    def _moments(self):
+        lower, upper, points = self._support
+        mean = integrate.quad(
+            lambda x: x * self.__pdf_at(x), lower, upper, points=points, limit=200
+        )[0]
+        central_moments = integrate.quad_vec(
+            lambda x: self.__pdf_at(x) * (x - mean) ** np.arange(2, 5),
+            lower,
+            upper,
+            points=points,
+        )[0]
+        variance = central_moments[0]
+        skewness = central_moments[1] / variance ** 1.5
+        kurtosis = central_moments[2] / variance ** 2
+        return mean, variance, skewness, kurtosis
+
+    @cached_property
+    def mean(self):
+        return self._moments[0]
+
+    @cached_property
+    def variance(self):
+        return self._moments[1]
+
+    @cached_property
+    def standard_deviation(self):
+        return self._moments[1] ** 0.5
+
+    @cached_property
+    def skewness(self):
+        return self._moments[2]
+
+    @cached_property
+    def kurtosis(self):
+        return self._moments[3]
+
+    @cached_property
+    def excess_kurtosis(self):
+        return self._moments[3] - 3
+
+    @cached_property
+    def median(self):
+        return self.quantile(0.5)
+
+    @cached_property
+    def b5(self):
+        return self.quantile(0.05)
+
+    @cached_property
+    def b95(self):
+        return self.quantile(0.95)
+
+    @cached_property
+    def mode(self):
+        # the highest peak of the PDF is found on a coarse grid and then refined
+        lower = self._support[0]
+        X = np.linspace(lower, self.quantile(0.999), 1000)
+        i = np.argmax(self.__pdf_at(X))
+        if i == 0:
+            return lower
+        result = minimize_scalar(
+            lambda x: -self.__pdf_at(x),
+            bounds=(X[i - 1], X[min(i + 1, len(X) - 1)]),
+            method="bounded",
+            options={"xatol": (X[1] - X[0]) * 1e-8},
+        )
+        return result.x
+
+    def __sf_hf(self, X):
+        """
+        Returns the SF and HF of the model at X. The SF is the product of the
+        SFs of the distributions and the HF is the sum of their HFs.
+        """
+        X = np.asarray(X, dtype=float)
         sf = np.ones_like(X)
         hf = np.zeros_like(X)
-        # combine the distributions using the product of the survival functions: SF_total = SF_1 x SF_2 x SF_3 x ....x SF_n
-        for i in range(len(distributions)):
-            if type(distributions[i]) in [Normal_Distribution, Gumbel_Distribution]:
-                sf *= distributions[i].SF(X, show_plot=False)
-                hf += distributions[i].HF(X, show_plot=False)
-            else:
-                sf *= np.hstack(
-                    [Y_negative_ones, distributions[i].SF(X_positive, show_plot=False)]
-                )
-                hf += np.hstack(
-                    [Y_negative_zeros, distributions[i].HF(X_positive, show_plot=False)]
-                )
-        pdf = hf * sf
-        np.nan_to_num(
-            pdf, copy=False, nan=0.0, posinf=None, neginf=None
-        )  # because the hf is nan (which is expected due to being pdf/sf=0/0)
+        for dist in self.distributions:
+            sf = sf * dist.SF_fast(X)
+            hf = hf + dist.HF_fast(X)
+        return sf, hf
+
+    def __pdf_at(self, X):
+        sf, hf = self.__sf_hf(X)
+        # the hf may be nan where the sf is 0 (pdf/sf=0/0) so the pdf is set to 0
+        return np.nan_to_num(sf * hf, nan=0.0, posinf=np.inf)
+
+    def __sf_at(self, X):
+        sf = np.ones_like(np.asarray(X, dtype=float))
+        for dist in self.distributions:
+            sf = sf * dist.SF_fast(X)
+        return sf
 
-        self.__xvals_init = X  # used by random_samples
-        self.__pdf_init = pdf  # used by random_samples
-        self.__sf_init = sf  # used by quantile and inverse_SF
-        self.mean = integrate.simps(pdf * X, x=X)
-        self.standard_deviation = (
-            integrate.simps(pdf * (X - self.mean) ** 2, x=X)
-        ) ** 0.5
-        self.variance = self.standard_deviation ** 2
-        self.skewness = integrate.simps(
-            pdf * ((X - self.mean) / self.standard_deviation) ** 3, x=X
-        )
-        self.kurtosis = integrate.simps(
-            pdf * ((X - self.mean) / self.standard_deviation) ** 4, x=X
-        )
-        self.mode = X[np.argmax(pdf)]
-        self.median = X[np.argmin(abs(sf - 0.5))]
-        self.excess_kurtosis = self.kurtosis - 3
-        self.b5 = X[np.argmin(abs((1 - sf) - 0.05))]
-        self.b95 = X[np.argmin(abs((1 - sf) - 0.95))]
+    def __inverse(self, q, function):
+        """
+        Finds x such that function(x) = q for each q. function must be either
+        the CDF (increasing) or the SF (decreasing) of the model.
+        """
+        lower, upper, _ = self._support
+        return bracketed_root(function, q, lower, upper)[()]
 
     def __combiner(self, xvals=None, xmin=None, xmax=None):
         """
@@ -7781,8 +9041,6 @@ class Competing_Risks_Model:
         This approach keeps the API the same as the other probability distributions.
         Users should never need to access this function directly.
         """
-        distributions = self.distributions
-
         # obtain the X values
         if xvals is not None:
             X = xvals
@@ -7816,24 +9074,7 @@ class Competing_Risks_Model:
                 "xvals was found to contain values below 0. This is only allowed if some of the mixture components are Normal or Gumbel distributions."
             )
 
-        X_positive = X[X >= 0]
-        X_negative = X[X < 0]
-        Y_negative_zeros = np.zeros_like(X_negative).astype(np.float64)
-        Y_negative_ones = np.ones_like(X_negative).astype(np.float64)
-
-        sf = np.ones_like(X).astype(np.float64)
-        hf = np.zeros_like(X).astype(np.float64)
-        for i in range(len(distributions)):
-            if type(distributions[i]) in [Normal_Distribution, Gumbel_Distribution]:
-                sf *= distributions[i].SF(X, show_plot=False)
-                hf += distributions[i].HF(X, show_plot=False)
-            else:
-                sf *= np.hstack(
-                    [Y_negative_ones, distributions[i].SF(X_positive, show_plot=False)]
-                )
-                hf += np.hstack(
-                    [Y_negative_zeros, distributions[i].HF(X_positive, show_plot=False)]
-                )
+        sf, hf = self.__sf_hf(X)
         pdf = sf * hf
         np.nan_to_num(
             pdf, copy=False, nan=0.0, posinf=None, neginf=None
@@ -8434,7 +9675,7 @@ class Competing_Risks_Model:
                 raise ValueError("Quantile must be between 0 and 1")
         else:
             raise ValueError("Quantile must be of type float, list, array")
-        ppf = self.__xvals_init[np.argmin(abs((1 - self.__sf_init) - q))]
+        ppf = self.__inverse(q, lambda X: 1 - self.__sf_at(X))
         return unpack_single_arrays(ppf)
 
     def inverse_SF(self, q):
@@ -8459,7 +9700,7 @@ class Competing_Risks_Model:
                 raise ValueError("Quantile must be between 0 and 1")
         else:
             raise ValueError("Quantile must be of type float, list, array")
-        isf = self.__xvals_init[np.argmin(abs(self.__sf_init - q))]
+        isf = self.__inverse(q, self.__sf_at)
         return unpack_single_arrays(isf)
 
     def stats(self):
@@ -8498,55 +9739,17 @@ class Competing_Risks_Model:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
         """
-
-        def __subcombiner(X):
-            """
-            This function does what __combiner does but more efficiently and
-            also accepts single values
-            """
-            if type(X) == np.ndarray:
-                sf = np.ones_like(X)
-                X_positive = X[X >= 0]
-                X_negative = X[X < 0]
-                Y_negative = np.ones_like(X_negative)
-                for i in range(len(self.distributions)):
-                    if type(self.distributions[i]) in [
-                        Normal_Distribution,
-                        Gumbel_Distribution,
-                    ]:
-                        sf *= self.distributions[i].SF(X, show_plot=False)
-                    else:
-                        sf *= np.hstack(
-                            [
-                                Y_negative,
-                                self.distributions[i].SF(X_positive, show_plot=False),
-                            ]
-                        )
-            else:
-                sf = 1
-                for i in range(len(self.distributions)):
-                    if type(self.distributions[i]) in [
-                        Normal_Distribution,
-                        Gumbel_Distribution,
-                    ]:
-                        sf *= self.distributions[i].SF(X, show_plot=False)
-                    elif X > 0:
-                        sf *= self.distributions[i].SF(X, show_plot=False)
-            return sf
-
-        t_full = np.linspace(t, self.__xmax_inf, 1000000)
-        sf_full = __subcombiner(t_full)
-        sf_single = __subcombiner(t)
-        MRL = integrate.simps(sf_full, x=t_full) / sf_single
-        return MRL
+        upper, points = self._support[1:]
+        MRL = mean_residual_life_from_SF(self.__sf_at, t, upper, points=points)
+        return unpack_single_arrays(MRL)
 
     def random_samples(self, number_of_samples, seed=None):
         """
@@ -8566,17 +9769,15 @@ class Competing_Risks_Model:
 
         Notes
         -----
-        This is the same as rvs in scipy.stats
+        Each sample is the minimum of a sample from each of the distributions,
+        which is the time of the first failure when the risks compete.
         """
         if type(number_of_samples) != int or number_of_samples < 1:
             raise ValueError("number_of_samples must be an integer greater than 0")
         if seed is not None:
             np.random.seed(seed)
-        return np.random.choice(
-            self.__xvals_init,
-            size=number_of_samples,
-            p=self.__pdf_init / np.sum(self.__pdf_init),
-        )
+        samples = [dist.random_samples(number_of_samples) for dist in self.distributions]
+        return np.min(samples, axis=0)
 
 
 class Mixture_Model:
@@ -8709,6 +9910,7 @@ class Mixture_Model:
         self.__number_of_params = number_of_params - 1 # minus 1 because last proportion is not needed as they sum to 1
         self.__xmax999 = xmax999
         self.__xmin001 = xmin001
+        self.__xmin_inf = xmin
         self.__xmax_inf = xmax_inf
 
         X = np.linspace(xmin, xmax, 1000000)
@@ -8738,9 +9940,6 @@ class Mixture_Model:
                         * proportions[i],
                     ]
                 )
-        self.__pdf_init = pdf
-        self.__cdf_init = cdf
-        self.__xvals_init = X
         self.mean = integrate.simps(pdf * X, x=X)
         self.standard_deviation = (
             integrate.simps(pdf * (X - self.mean) ** 2, x=X)
@@ -8753,10 +9952,29 @@ class Mixture_Model:
             pdf * ((X - self.mean) / self.standard_deviation) ** 4, x=X
         )
         self.mode = X[np.argmax(pdf)]
-        self.median = X[np.argmin(abs((1 - cdf) - 0.5))]
+        self.median = self.__inverse(0.5, self.__cdf_at)
         self.excess_kurtosis = self.kurtosis - 3
-        self.b5 = X[np.argmin(abs(cdf - 0.05))]
-        self.b95 = X[np.argmin(abs(cdf - 0.95))]
+        self.b5 = self.__inverse(0.05, self.__cdf_at)
+        self.b95 = self.__inverse(0.95, self.__cdf_at)
+
+    def __cdf_at(self, X):
+        cdf = np.zeros_like(np.asarray(X, dtype=float))
+        for dist, proportion in zip(self.distributions, self.proportions):
+            cdf = cdf + dist.CDF_fast(X) * proportion
+        return cdf
+
+    def __sf_at(self, X):
+        sf = np.zeros_like(np.asarray(X, dtype=float))
+        for dist, proportion in zip(self.distributions, self.proportions):
+            sf = sf + dist.SF_fast(X) * proportion
+        return sf
+
+    def __inverse(self, q, function):
+        """
+        Finds x such that function(x) = q for each q. function must be either
+        the CDF (increasing) or the SF (decreasing) of the model.
+        """
+        return bracketed_root(function, q, self.__xmin_inf, self.__xmax_inf)[()]
 
     def __combiner(self, xvals=None, xmin=None, xmax=None):
         """
@@ -9421,7 +10639,7 @@ class Mixture_Model:
                 raise ValueError("Quantile must be between 0 and 1")
         else:
             raise ValueError("Quantile must be of type float, list, array")
-        ppf = self.__xvals_init[np.argmin(abs(self.__cdf_init - q))]
+        ppf = self.__inverse(q, self.__cdf_at)
         return unpack_single_arrays(ppf)
 
     def inverse_SF(self, q):
@@ -9446,7 +10664,7 @@ class Mixture_Model:
                 raise ValueError("Quantile must be between 0 and 1")
         else:
             raise ValueError("Quantile must be of type float, list, array")
-        isf = self.__xvals_init[np.argmin(abs((1 - self.__cdf_init) - q))]
+        isf = self.__inverse(q, self.__sf_at)
         return unpack_single_arrays(isf)
 
     def stats(self):
@@ -9483,65 +10701,21 @@ class Mixture_Model:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life
         """
-
-        def __subcombiner(X):
-            """
-            This function does what __combiner does but more efficiently and
-            also accepts single values.
-            """
-            if type(X) == np.ndarray:
-                cdf = np.zeros_like(X)
-                X_positive = X[X >= 0]
-                X_negative = X[X < 0]
-                Y_negative = np.zeros_like(X_negative)
-                for i in range(len(self.distributions)):
-                    if type(self.distributions[i]) in [
-                        Normal_Distribution,
-                        Gumbel_Distribution,
-                    ]:
-                        cdf += (
-                            self.distributions[i].CDF(X, show_plot=False)
-                            * self.proportions[i]
-                        )
-                    else:
-                        cdf += np.hstack(
-                            [
-                                Y_negative,
-                                self.distributions[i].CDF(X_positive, show_plot=False)
-                                * self.proportions[i],
-                            ]
-                        )
-            else:
-                cdf = 0
-                for i in range(len(self.distributions)):
-                    if type(self.distributions[i]) in [
-                        Normal_Distribution,
-                        Gumbel_Distribution,
-                    ]:
-                        cdf += (
-                            self.distributions[i].CDF(X, show_plot=False)
-                            * self.proportions[i]
-                        )
-                    elif X > 0:
-                        cdf += (
-                            self.distributions[i].CDF(X, show_plot=False)
-                            * self.proportions[i]
-                        )
-            return 1 - cdf
-
-        t_full = np.linspace(t, self.__xmax_inf, 1000000)
-        sf_full = __subcombiner(t_full)
-        sf_single = __subcombiner(t)
-        MRL = integrate.simps(sf_full, x=t_full) / sf_single
-        return MRL
+        points = np.hstack(
+            [dist.quantile([0.01, 0.5, 0.99]) for dist in self.distributions]
+        )
+        MRL = mean_residual_life_from_SF(
+            self.__sf_at, t, self.__xmax_inf, points=points
+        )
+        return unpack_single_arrays(MRL)
 
     def random_samples(self, number_of_samples, seed=None):
         """
@@ -9561,17 +10735,23 @@ class Mixture_Model:
 
         Notes
         -----
-        This is the same as rvs in scipy.stats
+        The distribution that each sample comes from is chosen randomly using
+        the proportions. The samples are then drawn from each distribution.
         """
         if type(number_of_samples) != int or number_of_samples < 1:
             raise ValueError("number_of_samples must be an integer greater than 0")
         if seed is not None:
             np.random.seed(seed)
-        return np.random.choice(
-            self.__xvals_init,
-            size=number_of_samples,
-            p=self.__pdf_init / np.sum(self.__pdf_init),
+        proportions = np.asarray(self.proportions, dtype=float)
+        labels = np.random.choice(
+            self.num_dists, size=number_of_samples, p=proportions / proportions.sum()
         )
+        samples = np.empty(number_of_samples)
+        for i, dist in enumerate(self.distributions):
+            in_dist = labels == i
+            if in_dist.any():
+                samples[in_dist] = dist.random_samples(int(in_dist.sum()))
+        return samples
 
 
 class DSZI_Model:
@@ -9695,18 +10875,21 @@ class DSZI_Model:
             )
             self.__number_of_params = params_in_dist + 2
 
-        xmax = self.__base_distribution.quantile(1 - 1e-10)
-        xmin = self.__base_distribution.quantile(1e-10)
-        X = np.linspace(xmin, xmax, 1000000)
-        pdf0 = self.__base_distribution.PDF(xvals=X, show_plot=False)
-        pdf = pdf0 * (self.DS - self.ZI)  # the DSZI formula for the PDF
-        cdf0 = self.__base_distribution.CDF(xvals=X, show_plot=False)
-        cdf = cdf0 * (self.DS - self.ZI) + self.ZI  # the DSZI formula for the CDF
-        self.__pdf_init = pdf
-        self.__cdf_init = cdf
-        self.__xvals_init = X
-        self.b5 = X[np.argmin(abs(cdf - 0.05))]
-        self.b95 = X[np.argmin(abs(cdf - 0.95))]
+        self.b5 = self.__inverse_CDF(0.05)
+        self.b95 = self.__inverse_CDF(0.95)
+
+    def __inverse_CDF(self, q):
+        # the DSZI formula for the CDF is CDF = CDF0 * (DS - ZI) + ZI so the
+        # quantile is found exactly from the quantile of the base distribution.
+        # Values of q outside of ZI to DS are limited to the extremes of the base
+        # distribution.
+        q0 = np.clip((np.asarray(q) - self.ZI) / (self.DS - self.ZI), 1e-10, 1 - 1e-10)
+        return self.__base_distribution.quantile(q0)
+
+    def __inverse_SF(self, q):
+        # the DSZI formula for the SF is SF = SF0 * (DS - ZI) + 1 - DS
+        q0 = (np.asarray(q) - (1 - self.DS)) / (self.DS - self.ZI)
+        return self.__base_distribution.inverse_SF(np.clip(q0, 1e-10, 1 - 1e-10))
 
     def plot(self, xvals=None, xmin=None, xmax=None):
         """
@@ -10259,7 +11442,7 @@ class DSZI_Model:
                 )
         else:
             raise ValueError("Quantile must be of type float, list, array")
-        ppf = self.__xvals_init[np.argmin(abs(self.__cdf_init - q))]
+        ppf = self.__inverse_CDF(q)
         return unpack_single_arrays(ppf)
 
     def inverse_SF(self, q):
@@ -10284,7 +11467,7 @@ class DSZI_Model:
                 raise ValueError("Quantile must be between 0 and 1")
         else:
             raise ValueError("Quantile must be of type float, list, array")
-        isf = self.__xvals_init[np.argmin(abs((1 - self.__cdf_init) - q))]
+        isf = self.__inverse_SF(q)
         return unpack_single_arrays(isf)
 
     def mean_residual_life(self, t):
@@ -10293,12 +11476,12 @@ class DSZI_Model:
 
         Parameters
         ----------
-        t : int, float
+        t : int, float, list, array
             Time (x-value) at which mean residual life is to be evaluated
 
         Returns
         -------
-        MRL : float
+        MRL : float, array
             The mean residual life.
 
         Notes
@@ -10308,7 +11491,7 @@ class DSZI_Model:
 
         if self.DS < 1:
             # infinite life if the CDF never reaches 1
-            MRL = np.inf
+            MRL = unpack_single_arrays(np.full(np.size(t), np.inf))
         else:
             # the MRL of the scaled distribution is the same as that of the base distribution
             MRL = self.__base_distribution.mean_residual_life(t=t)
@@ -10417,3 +11600,1811 @@ class DSZI_Model:
             )
 
         return failures, right_censored
+
+
+def _batch_parameters(*parameters):
+    """
+    Broadcasts the parameters of a distribution batch against each other.
+
+    Parameters
+    ----------
+    parameters : int, float, list, array
+        The parameters. Each parameter must be a scalar or a 1D array.
+
+    Returns
+    -------
+    parameters : list
+        A list of 1D float arrays which all have the same length.
+    """
+    parameters = [np.asarray(item, dtype=float) for item in parameters]
+    if max(item.ndim for item in parameters) > 1:
+        raise ValueError("The parameters must be scalars or 1D arrays")
+    try:
+        parameters = np.broadcast_arrays(*[np.atleast_1d(item) for item in parameters])
+    except ValueError:
+        raise ValueError("The parameters must all be the same length or scalars")
+    return [np.array(item) for item in parameters]
+
+
+def _batch_array(values, name="xvals"):
+    """
+    Converts the input of a distribution batch function into a 2D row array
+    that broadcasts against the parameters.
+
+    Parameters
+    ----------
+    values : int, float, list, array
+        The input values. Must be a scalar or a 1D array.
+    name : str, optional
+        The name of the input used in the error message. Default is "xvals".
+
+    Returns
+    -------
+    values : array
+        A 2D array with one row.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim > 1:
+        raise ValueError(str(name + " must be a scalar or a 1D array"))
+    if name == "q" and values.size > 0 and (values.min() < 0 or values.max() > 1):
+        raise ValueError("Quantile must be between 0 and 1")
+    return np.atleast_1d(values)[None, :]
+
+
+class Weibull_Distribution_batch:
+    """
+    A batch of Weibull probability distributions. This is used to evaluate many
+    Weibull distributions with different parameters at the same x-values without
+    creating a Weibull_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    alpha : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+    beta : float, int, list, array
+        Shape parameter of each distribution. Must be > 0
+    gamma : float, int, list, array, optional
+        threshold (offset) parameter of each distribution. Must be >= 0.
+        Default = 0
+
+    Returns
+    -------
+    name : str
+        'Weibull'
+    alpha : array
+    beta : array
+    gamma : array
+    parameters : array
+        A 2D array with one row of [alpha,beta,gamma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Weibull_Distribution_batch
+        import numpy as np
+        dist = Weibull_Distribution_batch(alpha=[50, 60, 70], beta=[2, 2.5, 3])
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, alpha=None, beta=None, gamma=0):
+        self.name = "Weibull"
+        if alpha is None or beta is None:
+            raise ValueError(
+                "Parameters alpha and beta must be specified. Eg. Weibull_Distribution_batch(alpha=[5, 6],beta=[2, 3])"
+            )
+        self.alpha, self.beta, self.gamma = _batch_parameters(alpha, beta, gamma)
+        if (self.alpha <= 0).any() or (self.beta <= 0).any():
+            raise ValueError("alpha and beta must be greater than 0")
+        if (self.gamma < 0).any():
+            raise ValueError("gamma must be greater than or equal to 0")
+        self.parameters = np.column_stack([self.alpha, self.beta, self.gamma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(X - gamma, 0) / alpha
+        pdf = (beta / alpha) * z ** (beta - 1) * np.exp(-(z ** beta))
+        return np.where(X < gamma, 0, pdf)
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return -np.expm1(-(z ** self.beta[:, None]))
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return np.exp(-(z ** self.beta[:, None]))
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(X - gamma, 0) / alpha
+        return np.where(X < gamma, 0, (beta / alpha) * z ** (beta - 1))
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return z ** self.beta[:, None]
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        return gamma + alpha * (-np.log1p(-q)) ** (1 / beta)
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        return gamma + alpha * (-np.log(q)) ** (1 / beta)
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(t - gamma, 0) / alpha
+        # the integral of the SF from t to inf uses the upper incomplete gamma function
+        integral_R = alpha * np.exp(gammaln(1 + 1 / beta))
+        integral_R = integral_R * gammaincc(1 / beta, z ** beta)
+        return (integral_R + np.maximum(gamma - t, 0)) / np.exp(-(z ** beta))
+
+
+class Normal_Distribution_batch:
+    """
+    A batch of Normal probability distributions. This is used to evaluate many
+    Normal distributions with different parameters at the same x-values without
+    creating a Normal_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    mu : float, int, list, array
+        Location parameter of each distribution
+    sigma : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+
+    Returns
+    -------
+    name : str
+        'Normal'
+    mu : array
+    sigma : array
+    parameters : array
+        A 2D array with one row of [mu,sigma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Normal_Distribution_batch
+        import numpy as np
+        dist = Normal_Distribution_batch(mu=[50, 60, 70], sigma=5)
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, mu=None, sigma=None):
+        self.name = "Normal"
+        if mu is None or sigma is None:
+            raise ValueError(
+                "Parameters mu and sigma must be specified. Eg. Normal_Distribution_batch(mu=[5, 6],sigma=[2, 3])"
+            )
+        self.mu, self.sigma = _batch_parameters(mu, sigma)
+        if (self.sigma <= 0).any():
+            raise ValueError("sigma must be greater than 0")
+        self.parameters = np.column_stack([self.mu, self.sigma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = (_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None]
+        return np.exp(-0.5 * z ** 2) / (self.sigma[:, None] * np.sqrt(2 * np.pi))
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return ndtr((_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None])
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return ndtr((self.mu[:, None] - _batch_array(xvals)) / self.sigma[:, None])
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = (_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None]
+        # the ratio of the pdf and sf is taken in log space to avoid 0/0 in the tail
+        hf = np.exp(-0.5 * z ** 2 - log_ndtr(-z))
+        return hf / (self.sigma[:, None] * np.sqrt(2 * np.pi))
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return -log_ndtr((self.mu[:, None] - _batch_array(xvals)) / self.sigma[:, None])
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return self.mu[:, None] + self.sigma[:, None] * ndtri(q)
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return self.mu[:, None] - self.sigma[:, None] * ndtri(q)
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        mu, sigma = self.mu[:, None], self.sigma[:, None]
+        z = (t - mu) / sigma
+        # E[X|X>t] = mu + sigma * pdf(z) / sf(z) for the standard normal pdf and sf
+        ratio = np.exp(-0.5 * z ** 2 - log_ndtr(-z)) / np.sqrt(2 * np.pi)
+        return mu - t + sigma * ratio
+
+
+class Lognormal_Distribution_batch:
+    """
+    A batch of Lognormal probability distributions. This is used to evaluate many
+    Lognormal distributions with different parameters at the same x-values without
+    creating a Lognormal_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    mu : float, int, list, array
+        Location parameter of each distribution
+    sigma : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+    gamma : float, int, list, array, optional
+        threshold (offset) parameter of each distribution. Must be >= 0.
+        Default = 0
+
+    Returns
+    -------
+    name : str
+        'Lognormal'
+    mu : array
+    sigma : array
+    gamma : array
+    parameters : array
+        A 2D array with one row of [mu,sigma,gamma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Lognormal_Distribution_batch
+        import numpy as np
+        dist = Lognormal_Distribution_batch(mu=[3, 3.5, 4], sigma=0.5)
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, mu=None, sigma=None, gamma=0):
+        self.name = "Lognormal"
+        if mu is None or sigma is None:
+            raise ValueError(
+                "Parameters mu and sigma must be specified. Eg. Lognormal_Distribution_batch(mu=[5, 6],sigma=[2, 3])"
+            )
+        self.mu, self.sigma, self.gamma = _batch_parameters(mu, sigma, gamma)
+        if (self.sigma <= 0).any():
+            raise ValueError("sigma must be greater than 0")
+        if (self.gamma < 0).any():
+            raise ValueError("gamma must be greater than or equal to 0")
+        self.parameters = np.column_stack([self.mu, self.sigma, self.gamma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        z = (np.log(t) - self.mu[:, None]) / self.sigma[:, None]
+        pdf = np.exp(-0.5 * z ** 2) / (t * self.sigma[:, None] * np.sqrt(2 * np.pi))
+        return np.where(t > 0, pdf, 0)
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        return ndtr((np.log(t) - self.mu[:, None]) / self.sigma[:, None])
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        return ndtr((self.mu[:, None] - np.log(t)) / self.sigma[:, None])
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        z = (np.log(t) - self.mu[:, None]) / self.sigma[:, None]
+        # the ratio of the pdf and sf is taken in log space to avoid 0/0 in the tail
+        hf = np.exp(-0.5 * z ** 2 - log_ndtr(-z))
+        hf = hf / (t * self.sigma[:, None] * np.sqrt(2 * np.pi))
+        return np.where(t > 0, hf, 0)
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        return -log_ndtr((self.mu[:, None] - np.log(t)) / self.sigma[:, None])
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        mu, sigma, gamma = self.parameters.T[:, :, None]
+        return gamma + np.exp(mu + sigma * ndtri(q))
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        mu, sigma, gamma = self.parameters.T[:, :, None]
+        return gamma + np.exp(mu - sigma * ndtri(q))
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        mu, sigma, gamma = self.parameters.T[:, :, None]
+        u = np.maximum(t - gamma, 0)
+        z = (np.log(u) - mu) / sigma
+        # the partial expectation of the lognormal above u divided by the sf at u
+        conditional_mean = np.exp(
+            mu + sigma ** 2 / 2 + log_ndtr(sigma - z) - log_ndtr(-z)
+        )
+        return conditional_mean - u + np.maximum(gamma - t, 0)
+
+
+class Exponential_Distribution_batch:
+    """
+    A batch of Exponential probability distributions. This is used to evaluate many
+    Exponential distributions with different parameters at the same x-values without
+    creating a Exponential_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    Lambda : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+    gamma : float, int, list, array, optional
+        threshold (offset) parameter of each distribution. Must be >= 0.
+        Default = 0
+
+    Returns
+    -------
+    name : str
+        'Exponential'
+    Lambda : array
+    gamma : array
+    parameters : array
+        A 2D array with one row of [Lambda,gamma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Exponential_Distribution_batch
+        import numpy as np
+        dist = Exponential_Distribution_batch(Lambda=[0.01, 0.02, 0.03])
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, Lambda=None, gamma=0):
+        self.name = "Exponential"
+        if Lambda is None:
+            raise ValueError(
+                "Parameter Lambda must be specified. Eg. Exponential_Distribution_batch(Lambda=[0.2, 0.3])"
+            )
+        self.Lambda, self.gamma = _batch_parameters(Lambda, gamma)
+        if (self.Lambda <= 0).any():
+            raise ValueError("Lambda must be greater than 0")
+        if (self.gamma < 0).any():
+            raise ValueError("gamma must be greater than or equal to 0")
+        self.parameters = np.column_stack([self.Lambda, self.gamma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        Lambda, gamma = self.Lambda[:, None], self.gamma[:, None]
+        pdf = Lambda * np.exp(-Lambda * np.maximum(X - gamma, 0))
+        return np.where(X < gamma, 0, pdf)
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        return -np.expm1(-self.Lambda[:, None] * t)
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        return np.exp(-self.Lambda[:, None] * t)
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        return np.where(X < self.gamma[:, None], 0, self.Lambda[:, None])
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        t = np.maximum(_batch_array(xvals) - self.gamma[:, None], 0)
+        return self.Lambda[:, None] * t
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return self.gamma[:, None] - np.log1p(-q) / self.Lambda[:, None]
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return self.gamma[:, None] - np.log(q) / self.Lambda[:, None]
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        return 1 / self.Lambda[:, None] + np.maximum(self.gamma[:, None] - t, 0)
+
+
+class Gamma_Distribution_batch:
+    """
+    A batch of Gamma probability distributions. This is used to evaluate many
+    Gamma distributions with different parameters at the same x-values without
+    creating a Gamma_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    alpha : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+    beta : float, int, list, array
+        Shape parameter of each distribution. Must be > 0
+    gamma : float, int, list, array, optional
+        threshold (offset) parameter of each distribution. Must be >= 0.
+        Default = 0
+
+    Returns
+    -------
+    name : str
+        'Gamma'
+    alpha : array
+    beta : array
+    gamma : array
+    parameters : array
+        A 2D array with one row of [alpha,beta,gamma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Gamma_Distribution_batch
+        import numpy as np
+        dist = Gamma_Distribution_batch(alpha=[10, 15, 20], beta=[2, 2.5, 3])
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, alpha=None, beta=None, gamma=0):
+        self.name = "Gamma"
+        if alpha is None or beta is None:
+            raise ValueError(
+                "Parameters alpha and beta must be specified. Eg. Gamma_Distribution_batch(alpha=[5, 6],beta=[2, 3])"
+            )
+        self.alpha, self.beta, self.gamma = _batch_parameters(alpha, beta, gamma)
+        if (self.alpha <= 0).any() or (self.beta <= 0).any():
+            raise ValueError("alpha and beta must be greater than 0")
+        if (self.gamma < 0).any():
+            raise ValueError("gamma must be greater than or equal to 0")
+        self.parameters = np.column_stack([self.alpha, self.beta, self.gamma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(X - gamma, 0) / alpha
+        pdf = np.exp(xlogy(beta - 1, z) - z - gammaln(beta)) / alpha
+        return np.where(X < gamma, 0, pdf)
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return gammainc(self.beta[:, None], z)
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return gammaincc(self.beta[:, None], z)
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return self.PDF(xvals) / self.SF(xvals)
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return -np.log(self.SF(xvals))
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        return gamma + alpha * gammaincinv(beta, q)
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        return gamma + alpha * gammainccinv(beta, q)
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(t - gamma, 0) / alpha
+        # the partial expectation of the distribution above z divided by the sf at z
+        conditional_mean = alpha * beta * gammaincc(beta + 1, z) / gammaincc(beta, z)
+        return conditional_mean - alpha * z + np.maximum(gamma - t, 0)
+
+
+class Beta_Distribution_batch:
+    """
+    A batch of Beta probability distributions. This is used to evaluate many
+    Beta distributions with different parameters at the same x-values without
+    creating a Beta_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    alpha : float, int, list, array
+        Shape parameter 1 of each distribution. Must be > 0
+    beta : float, int, list, array
+        Shape parameter 2 of each distribution. Must be > 0
+
+    Returns
+    -------
+    name : str
+        'Beta'
+    alpha : array
+    beta : array
+    parameters : array
+        A 2D array with one row of [alpha,beta] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Beta_Distribution_batch
+        import numpy as np
+        dist = Beta_Distribution_batch(alpha=[2, 3, 4], beta=[5, 4, 3])
+        sf = dist.SF(np.linspace(0, 1, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, alpha=None, beta=None):
+        self.name = "Beta"
+        if alpha is None or beta is None:
+            raise ValueError(
+                "Parameters alpha and beta must be specified. Eg. Beta_Distribution_batch(alpha=[5, 6],beta=[2, 3])"
+            )
+        self.alpha, self.beta = _batch_parameters(alpha, beta)
+        if (self.alpha <= 0).any() or (self.beta <= 0).any():
+            raise ValueError("alpha and beta must be greater than 0")
+        self.parameters = np.column_stack([self.alpha, self.beta])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        alpha, beta = self.alpha[:, None], self.beta[:, None]
+        z = np.clip(X, 0, 1)
+        pdf = np.exp(xlogy(alpha - 1, z) + xlog1py(beta - 1, -z) - betaln(alpha, beta))
+        return np.where((X < 0) | (X > 1), 0, pdf)
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = np.clip(_batch_array(xvals), 0, 1)
+        return betainc(self.alpha[:, None], self.beta[:, None], z)
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = np.clip(_batch_array(xvals), 0, 1)
+        return betainc(self.beta[:, None], self.alpha[:, None], 1 - z)
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return self.PDF(xvals) / self.SF(xvals)
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return -np.log(self.SF(xvals))
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return betaincinv(self.alpha[:, None], self.beta[:, None], q)
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return 1 - betaincinv(self.beta[:, None], self.alpha[:, None], q)
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        alpha, beta = self.alpha[:, None], self.beta[:, None]
+        z = np.clip(t, 0, 1)
+        # the partial expectation of the distribution above z divided by the sf at z
+        partial_mean = alpha / (alpha + beta) * betainc(beta, alpha + 1, 1 - z)
+        return partial_mean / betainc(beta, alpha, 1 - z) - t
+
+
+class Loglogistic_Distribution_batch:
+    """
+    A batch of Loglogistic probability distributions. This is used to evaluate many
+    Loglogistic distributions with different parameters at the same x-values without
+    creating a Loglogistic_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    alpha : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+    beta : float, int, list, array
+        Shape parameter of each distribution. Must be > 0
+    gamma : float, int, list, array, optional
+        threshold (offset) parameter of each distribution. Must be >= 0.
+        Default = 0
+
+    Returns
+    -------
+    name : str
+        'Loglogistic'
+    alpha : array
+    beta : array
+    gamma : array
+    parameters : array
+        A 2D array with one row of [alpha,beta,gamma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Loglogistic_Distribution_batch
+        import numpy as np
+        dist = Loglogistic_Distribution_batch(alpha=[50, 60, 70], beta=[2, 2.5, 3])
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, alpha=None, beta=None, gamma=0):
+        self.name = "Loglogistic"
+        if alpha is None or beta is None:
+            raise ValueError(
+                "Parameters alpha and beta must be specified. Eg. Loglogistic_Distribution_batch(alpha=[5, 6],beta=[2, 3])"
+            )
+        self.alpha, self.beta, self.gamma = _batch_parameters(alpha, beta, gamma)
+        if (self.alpha <= 0).any() or (self.beta <= 0).any():
+            raise ValueError("alpha and beta must be greater than 0")
+        if (self.gamma < 0).any():
+            raise ValueError("gamma must be greater than or equal to 0")
+        self.parameters = np.column_stack([self.alpha, self.beta, self.gamma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(X - gamma, 0) / alpha
+        pdf = (beta / alpha) * z ** (beta - 1) / (1 + z ** beta) ** 2
+        return np.where(X < gamma, 0, pdf)
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return 1 / (1 + z ** -self.beta[:, None])
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return 1 / (1 + z ** self.beta[:, None])
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        z = np.maximum(X - gamma, 0) / alpha
+        hf = (beta / alpha) * z ** (beta - 1) / (1 + z ** beta)
+        return np.where(X < gamma, 0, hf)
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        X = _batch_array(xvals)
+        z = np.maximum(X - self.gamma[:, None], 0) / self.alpha[:, None]
+        return np.log1p(z ** self.beta[:, None])
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        return gamma + alpha * (q / (1 - q)) ** (1 / beta)
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        return gamma + alpha * ((1 - q) / q) ** (1 / beta)
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        alpha, beta, gamma = self.parameters.T[:, :, None]
+        zb = (np.maximum(t - gamma, 0) / alpha) ** beta
+        # the integral of the SF from t to inf uses the regularized incomplete beta
+        # function. It only converges when beta > 1.
+        integral_R = alpha * (np.pi / beta) / np.sin(np.pi / beta)
+        integral_R = integral_R * betainc(1 - 1 / beta, 1 / beta, 1 / (1 + zb))
+        MRL = (integral_R + np.maximum(gamma - t, 0)) * (1 + zb)
+        return np.where(beta > 1, MRL, np.inf)
+
+
+class Gumbel_Distribution_batch:
+    """
+    A batch of Gumbel probability distributions. This is used to evaluate many
+    Gumbel distributions with different parameters at the same x-values without
+    creating a Gumbel_Distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    mu : float, int, list, array
+        Location parameter of each distribution
+    sigma : float, int, list, array
+        Scale parameter of each distribution. Must be > 0
+
+    Returns
+    -------
+    name : str
+        'Gumbel'
+    mu : array
+    sigma : array
+    parameters : array
+        A 2D array with one row of [mu,sigma] for each distribution
+
+    Notes
+    -----
+    The parameters are broadcast against each other so a scalar may be used for
+    any parameter which is shared by all of the distributions. All of the
+    functions (PDF, CDF, SF, HF, CHF, quantile, inverse_SF, mean_residual_life)
+    return a 2D array with one row for each distribution and one column for each
+    input value. No plotting is done.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Distributions import Gumbel_Distribution_batch
+        import numpy as np
+        dist = Gumbel_Distribution_batch(mu=[50, 60, 70], sigma=5)
+        sf = dist.SF(np.linspace(0, 100, 101))  # sf has shape (3, 101)
+    """
+
+    def __init__(self, mu=None, sigma=None):
+        self.name = "Gumbel"
+        if mu is None or sigma is None:
+            raise ValueError(
+                "Parameters mu and sigma must be specified. Eg. Gumbel_Distribution_batch(mu=[5, 6],sigma=[2, 3])"
+            )
+        self.mu, self.sigma = _batch_parameters(mu, sigma)
+        if (self.sigma <= 0).any():
+            raise ValueError("sigma must be greater than 0")
+        self.parameters = np.column_stack([self.mu, self.sigma])
+
+    def PDF(self, xvals):
+        """
+        Evaluates the PDF (probability density function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the PDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        pdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = (_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None]
+        return np.exp(z - np.exp(z)) / self.sigma[:, None]
+
+    def CDF(self, xvals):
+        """
+        Evaluates the CDF (cumulative distribution function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CDF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        cdf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = (_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None]
+        return -np.expm1(-np.exp(z))
+
+    def SF(self, xvals):
+        """
+        Evaluates the SF (survival function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the SF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        sf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = (_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None]
+        return np.exp(-np.exp(z))
+
+    def HF(self, xvals):
+        """
+        Evaluates the HF (hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the HF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        hf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        z = (_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None]
+        return np.exp(z) / self.sigma[:, None]
+
+    def CHF(self, xvals):
+        """
+        Evaluates the CHF (cumulative hazard function) of each distribution
+
+        Parameters
+        ----------
+        xvals : int, float, list, array
+            The x-values at which to evaluate the CHF. These are shared by all
+            of the distributions.
+
+        Returns
+        -------
+        chf : array
+            A 2D array with one row for each distribution and one column for
+            each x-value
+        """
+        return np.exp((_batch_array(xvals) - self.mu[:, None]) / self.sigma[:, None])
+
+    def quantile(self, q):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the CDF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return self.mu[:, None] + self.sigma[:, None] * np.log(-np.log1p(-q))
+
+    def inverse_SF(self, q):
+        """
+        Inverse survival function calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1. These are
+            shared by all of the distributions.
+
+        Returns
+        -------
+        x : array
+            The inverse of the SF at q. This is a 2D array with one row for
+            each distribution and one column for each value of q.
+        """
+        q = _batch_array(q, name="q")
+        return self.mu[:, None] + self.sigma[:, None] * np.log(-np.log(q))
+
+    def mean_residual_life(self, t):
+        """
+        Mean Residual Life calculator
+
+        Parameters
+        ----------
+        t : int, float, list, array
+            Time (x-value) at which mean residual life is to be evaluated.
+            These are shared by all of the distributions.
+
+        Returns
+        -------
+        MRL : array
+            The mean residual life. This is a 2D array with one row for each
+            distribution and one column for each value of t.
+
+        Notes
+        -----
+        The integral of the SF is evaluated using its closed form.
+        """
+        t = _batch_array(t, name="t")
+        # the integral of the SF from t to inf is sigma * E1(exp(z))
+        ez = np.exp((t - self.mu[:, None]) / self.sigma[:, None])
+        return self.sigma[:, None] * exp1(ez) * np.exp(ez)
@@ -6,6 +6,7 @@ support complete and right censored data.
 The included functions are:
 
 - Fit_Weibull_2P
+- Fit_Weibull_2P_batch
 - Fit_Weibull_3P
 - Fit_Exponential_1P
 - Fit_Exponential_2P
@@ -23,6 +24,7 @@ The included functions are:
 - Fit_Weibull_DS
 - Fit_Weibull_ZI
 - Fit_Weibull_DSZI
+- Fit_Lean
 
 Note that the Beta distribution is only for data in the range 0 < t < 1.
 There is also a Fit_Everything function which will fit all distributions (except
@@ -37,11 +39,14 @@ non-linear least squares (depending on the function). If the distribution is an
 extremely bad fit or is heavily censored (>99%) then these guesses may be poor
 and the fit might not be successful. Generally the fit achieved by autograd is
 highly successful, and whenever it fails the initial guess will be used and a
-warning will be displayed.
+warning will be displayed. For the distributions that have closed form
+derivatives of the log-likelihood (see Utils.LL_derivatives_registry), these
+are used in place of autograd as they are much faster to evaluate.
 """
 
 import numpy as np
 from numpy.linalg import LinAlgError
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import pandas as pd
 from scipy.optimize import minimize
@@ -58,23 +63,27 @@ from reliability.Distributions import (
     Mixture_Model,
     Competing_Risks_Model,
     DSZI_Model,
+    Weibull_Distribution_batch,
 )
-from reliability.Nonparametric import KaplanMeier
 from reliability.Probability_plotting import plotting_positions
 from reliability.Utils import (
     round_and_string,
     anderson_darling,
     fitters_input_checking,
+    prepared_data,
     colorprint,
     least_squares,
     MLE_optimization,
-    LS_optimization,
     xy_downsample,
     extract_CI,
+    weibull_2P_profile_MLE,
+    weibull_2P_information,
+    weibull_2P_profile_fit,
+    closed_form_MLE,
+    LL_hessian,
 )
 import autograd.numpy as anp
 from autograd import value_and_grad
-from autograd.differential_operators import hessian
 from autograd.scipy.special import gamma as agamma
 from autograd.scipy.special import beta as abeta
 from autograd.scipy.special import erf
@@ -92,6 +101,130 @@ pd.options.display.max_columns = 9  # shows the dataframe without ... truncation
 pd.options.display.width = 200  # prevents wrapping after default 80 characters
 
 
+def _fit_everything_candidate(name, data, method, optimizer):
+    # fits one of the distributions for Fit_Everything. This is a module level function so that it can be sent to a process pool.
+    return globals()["Fit_" + name](
+        failures=data,
+        method=method,
+        optimizer=optimizer,
+        show_probability_plot=False,
+        print_results=False,
+    )
+
+
+def _fit_everything_racing_scores(candidates, data, sort_by, margin):
+    # scores each of the candidates for Fit_Everything using the log-likelihood at the least squares estimates
+    if type(sort_by) != str:
+        raise ValueError(
+            "Invalid input to sort_by. Options are 'BIC', 'AICc', 'AD', or 'Log-likelihood'. Default is 'BIC'."
+        )
+    if sort_by.upper() == "AD":
+        raise ValueError(
+            "racing can not be used when sort_by is 'AD'. Use 'BIC', 'AICc', or 'Log-likelihood'."
+        )
+    if sort_by.upper() not in [
+        "BIC",
+        "AICC",
+        "AIC",
+        "LOGLIK",
+        "LOG LIK",
+        "LOG-LIKELIHOOD",
+        "LL",
+        "LOGLIKELIHOOD",
+        "LOG LIKELIHOOD",
+    ]:
+        raise ValueError(
+            "Invalid input to sort_by. Options are 'BIC', 'AICc', 'AD', or 'Log-likelihood'. Default is 'BIC'."
+        )
+    failures = data.failures
+    right_censored = data.right_censored
+    failure_weights = data.failure_weights
+    right_censored_weights = data.right_censored_weights
+    n = np.sum(failure_weights) + np.sum(right_censored_weights)
+    # the composite models contain Weibull_2P as a special case so they use its score
+    scored = [
+        name
+        for name in candidates
+        if name not in ["Weibull_Mixture", "Weibull_CR", "Weibull_DS"]
+    ]
+    if len(scored) < len(candidates) and "Weibull_2P" not in scored:
+        scored.append("Weibull_2P")
+    LL2, k = {}, {}
+    for name in scored:
+        parameter_names, LL_func, LS_LL_func = _lean_fit_specifications[name][1:]
+        LS_results = data.LS_results(
+            func_name=name,
+            LL_func=LS_LL_func,
+            method="LS",
+        )
+        LL2[name] = 2 * LL_func(
+            np.asarray(LS_results.guess, dtype=float),
+            failures,
+            right_censored,
+            failure_weights,
+            right_censored_weights,
+        )
+        k[name] = len(parameter_names)
+    criterion = sort_by.upper()
+    if criterion in ["AICC", "AIC"] and n - max(k.values()) - 1 <= 0:
+        criterion = "BIC"  # the same change that is made when sorting the results
+    scores = {}
+    for name in scored:
+        if criterion == "BIC":
+            scores[name] = np.log(n) * k[name] + LL2[name]
+        elif criterion in ["AICC", "AIC"]:
+            scores[name] = (
+                2 * k[name]
+                + LL2[name]
+                + (2 * k[name] ** 2 + 2 * k[name]) / (n - k[name] - 1)
+            )
+        else:
+            scores[name] = abs(LL2[name] * -0.5)
+    candidate_scores = np.array(
+        [
+            scores["Weibull_2P"] if name not in scores else scores[name]
+            for name in candidates
+        ]
+    )
+    pruned = candidate_scores > min(scores.values()) + margin
+    df = pd.DataFrame(
+        data={
+            "Distribution": candidates,
+            "Score": candidate_scores,
+            "Pruned": pruned,
+        },
+        columns=["Distribution", "Score", "Pruned"],
+    )
+    return df.sort_values(by="Score", kind="stable").reset_index(drop=True)
+
+
+def _combine_update_data(
+    fit, failures, right_censored, failure_weights, right_censored_weights
+):
+    # combines the data of a fitted object with new data for the update method of the Fitters
+    new_data = {}
+    for name, weights_name, data, weights in [
+        ("failures", "failure_weights", failures, failure_weights),
+        (
+            "right_censored",
+            "right_censored_weights",
+            right_censored,
+            right_censored_weights,
+        ),
+    ]:
+        data = np.array([]) if data is None else np.asarray(data, dtype=float)
+        if weights is None:
+            weights = np.ones_like(data)
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != data.shape:
+            raise ValueError(
+                str(weights_name + " must be the same length as " + name + ".")
+            )
+        new_data[name] = np.hstack([getattr(fit, name), data])
+        new_data[weights_name] = np.hstack([getattr(fit, weights_name), weights])
+    return new_data
+
+
 class Fit_Everything:
     """
     This function will fit all available distributions to the data provided.
@@ -100,10 +233,12 @@ class Fit_Everything:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements for all the 2 parameter
         distributions to be fitted and 3 elements for all distributions to be
         fitted.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     sort_by : str
@@ -152,6 +287,33 @@ class Fit_Everything:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    executor : str, object, optional
+        Used to fit the distributions concurrently. Must be None, 'process',
+        'thread', or a concurrent.futures.Executor. None will fit the
+        distributions one after another. 'process' will use a process pool
+        and 'thread' will use a thread pool. If an Executor is provided it will
+        be used and will not be shut down. The results are the same regardless
+        of the executor used. Default is None.
+    max_workers : int, optional
+        The maximum number of workers in the pool created when executor is
+        'process' or 'thread'. Default is None which uses the
+        concurrent.futures default.
+    racing : bool, optional
+        If True, each distribution is first scored using its least squares
+        estimates and only the distributions that could plausibly be the best
+        fit are fitted. Racing is a heuristic which may prune the best fitting
+        distribution. See Notes for more detail. True or False.
+        Default = False.
+    racing_margin : int, float, optional
+        The margin (in the units of sort_by) by which a distribution's racing
+        score may exceed the best racing score before the distribution is
+        pruned. Only used if racing is True. Default is 10.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
 
     Returns
     -------
@@ -170,6 +332,12 @@ class Fit_Everything:
         Weibull_3P_loglik
     excluded_distributions : list
         a list of strings of the excluded distributions.
+    pruned_distributions : list
+        a list of strings of the distributions that were not fitted because
+        they were pruned by racing. This is empty if racing is False.
+    racing_scores : dataframe
+        a pandas dataframe of the racing score of each distribution and whether
+        it was pruned. This is None if racing is False.
     probability_plot : object
         The figure handle from the probability plot (only provided if
         show_probability_plot is True).
@@ -195,6 +363,30 @@ class Fit_Everything:
     If the data provided contains only 2 failures, the three parameter
     distributions will automatically be excluded.
 
+    The racing scores are obtained by evaluating the log-likelihood at the
+    least squares estimates. A distribution is pruned if its racing score is
+    more than racing_margin worse than the best racing score. The least
+    squares results are then reused as the initial guess of the distributions
+    that are fitted. Weibull_Mixture, Weibull_CR and Weibull_DS contain
+    Weibull_2P as a special case so they are given the racing score of
+    Weibull_2P and are only pruned if Weibull_2P is pruned.
+
+    Racing is a heuristic and it can drop the true best fit. As the MLE can
+    only increase the log-likelihood, the racing score is only an upper bound
+    on the BIC or AICc that a distribution will achieve when it is fitted. A
+    pruned distribution may therefore improve by more than racing_margin and
+    have been the best fit, particularly when the least squares estimates are
+    poor (such as with heavy censoring) or for the composite models, whose
+    improvement over Weibull_2P can not be bounded cheaply. Increase
+    racing_margin to reduce this risk, or leave racing as False if the best
+    fit must be guaranteed. Racing is not available when sort_by is 'AD'.
+
+    The process pool is generally the fastest executor for large datasets as
+    each distribution is fitted on its own core. For small datasets the time
+    taken to start the pool may exceed the time saved. When using the process
+    pool on Windows or macOS, Fit_Everything must be called from within an
+    ``if __name__ == "__main__":`` block.
+
     Example Usage:
 
     .. code:: python
@@ -218,6 +410,12 @@ class Fit_Everything:
         show_probability_plot=True,
         show_best_distribution_probability_plot=True,
         downsample_scatterplot=True,
+        executor=None,
+        max_workers=None,
+        racing=False,
+        racing_margin=10,
+        failure_weights=None,
+        right_censored_weights=None,
     ):
 
         inputs = fitters_input_checking(
@@ -226,11 +424,20 @@ class Fit_Everything:
             right_censored=right_censored,
             method=method,
             optimizer=optimizer,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         method = inputs.method
         optimizer = inputs.optimizer
+        # the prepared data is shared by all the distributions so the plotting
+        # positions are calculated once. They are calculated here so that they
+        # are sent to the workers when an executor is used.
+        data = inputs.prepared
+        data.plotting_positions
 
         if method in ["RRX", "RRY", "LS", "NLLS"]:
             method = "LS"
@@ -255,16 +462,32 @@ class Fit_Everything:
             raise ValueError(
                 "show_best_distribution_probability_plot must be either True or False. Defaults to True."
             )
+        if racing not in [True, False]:
+            raise ValueError("racing must be either True or False. Defaults to False.")
+        if type(racing_margin) not in [int, float] or racing_margin < 0:
+            raise ValueError(
+                "racing_margin must be a non-negative number. Defaults to 10."
+            )
+        if executor not in [None, "process", "thread"] and not isinstance(
+            executor, Executor
+        ):
+            raise ValueError(
+                'executor must be None, "process", "thread", or a concurrent.futures.Executor. Defaults to None.'
+            )
 
         self.failures = failures
         self.right_censored = right_censored
+        self.failure_weights = failure_weights
+        self.right_censored_weights = right_censored_weights
+        self._prepared = data
         self._all_data = np.hstack([failures, right_censored])
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         # This is used for scaling the histogram when there is censored data
-        self._frac_fail = len(failures) / len(self._all_data)
+        self._frac_fail = np.sum(failure_weights) / n
         # This is used for reporting the fraction censored in the printed output
-        self._frac_cens = len(right_censored) / len(self._all_data)
+        self._frac_cens = np.sum(right_censored_weights) / n
         # sorting the failure data is necessary for plotting quantiles in order
-        d = sorted(self._all_data)
+        d = self._all_data[data.sort_order]
         self.__downsample_scatterplot = downsample_scatterplot
 
         if exclude is None:
@@ -416,16 +639,72 @@ class Fit_Everything:
                 "optimizer",
             ]
         )
-        # Fit the parametric models and extract the fitted parameters
-        if "Weibull_3P" not in self.excluded_distributions:
-            self.__Weibull_3P_params = Fit_Weibull_3P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
+        # Fit the parametric models. These are independent so they may be fitted concurrently.
+        candidates = [
+            "Weibull_3P",
+            "Gamma_3P",
+            "Exponential_2P",
+            "Lognormal_3P",
+            "Normal_2P",
+            "Lognormal_2P",
+            "Gumbel_2P",
+            "Weibull_2P",
+            "Weibull_Mixture",
+            "Weibull_CR",
+            "Weibull_DS",
+            "Gamma_2P",
+            "Exponential_1P",
+            "Loglogistic_2P",
+            "Loglogistic_3P",
+            "Beta_2P",
+        ]
+        candidates = [
+            name for name in candidates if name not in self.excluded_distributions
+        ]
+        if racing is True:
+            self.racing_scores = _fit_everything_racing_scores(
+                candidates, data, sort_by, racing_margin
             )
+            pruned = self.racing_scores["Pruned"].values
+            self.pruned_distributions = list(
+                self.racing_scores["Distribution"].values[pruned]
+            )
+            candidates = [
+                name for name in candidates if name not in self.pruned_distributions
+            ]
+        else:
+            self.racing_scores = None
+            self.pruned_distributions = []
+        if executor is None:
+            fitted = {
+                name: _fit_everything_candidate(name, data, method, optimizer)
+                for name in candidates
+            }
+        else:
+            if executor == "process":
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+            elif executor == "thread":
+                pool = ThreadPoolExecutor(max_workers=max_workers)
+            else:
+                pool = executor
+            try:
+                futures = [
+                    pool.submit(
+                        _fit_everything_candidate, name, data, method, optimizer
+                    )
+                    for name in candidates
+                ]
+                # the results are collected in the same order as the serial case so the output is deterministic
+                fitted = {
+                    name: future.result() for name, future in zip(candidates, futures)
+                }
+            finally:
+                if pool is not executor:
+                    pool.shutdown()
+
+        # extract the fitted parameters
+        if "Weibull_3P" in fitted:
+            self.__Weibull_3P_params = fitted["Weibull_3P"]
             self.Weibull_3P_alpha = self.__Weibull_3P_params.alpha
             self.Weibull_3P_beta = self.__Weibull_3P_params.beta
             self.Weibull_3P_gamma = self.__Weibull_3P_params.gamma
@@ -465,15 +744,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Gamma_3P" not in self.excluded_distributions:
-            self.__Gamma_3P_params = Fit_Gamma_3P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Gamma_3P" in fitted:
+            self.__Gamma_3P_params = fitted["Gamma_3P"]
             self.Gamma_3P_alpha = self.__Gamma_3P_params.alpha
             self.Gamma_3P_beta = self.__Gamma_3P_params.beta
             self.Gamma_3P_mu = self.__Gamma_3P_params.mu
@@ -514,15 +786,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Exponential_2P" not in self.excluded_distributions:
-            self.__Exponential_2P_params = Fit_Exponential_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Exponential_2P" in fitted:
+            self.__Exponential_2P_params = fitted["Exponential_2P"]
             self.Exponential_2P_lambda = self.__Exponential_2P_params.Lambda
             self.Exponential_2P_gamma = self.__Exponential_2P_params.gamma
             self.Exponential_2P_loglik = self.__Exponential_2P_params.loglik
@@ -561,15 +826,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Lognormal_3P" not in self.excluded_distributions:
-            self.__Lognormal_3P_params = Fit_Lognormal_3P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Lognormal_3P" in fitted:
+            self.__Lognormal_3P_params = fitted["Lognormal_3P"]
             self.Lognormal_3P_mu = self.__Lognormal_3P_params.mu
             self.Lognormal_3P_sigma = self.__Lognormal_3P_params.sigma
             self.Lognormal_3P_gamma = self.__Lognormal_3P_params.gamma
@@ -609,15 +867,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Normal_2P" not in self.excluded_distributions:
-            self.__Normal_2P_params = Fit_Normal_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Normal_2P" in fitted:
+            self.__Normal_2P_params = fitted["Normal_2P"]
             self.Normal_2P_mu = self.__Normal_2P_params.mu
             self.Normal_2P_sigma = self.__Normal_2P_params.sigma
             self.Normal_2P_loglik = self.__Normal_2P_params.loglik
@@ -656,15 +907,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Lognormal_2P" not in self.excluded_distributions:
-            self.__Lognormal_2P_params = Fit_Lognormal_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Lognormal_2P" in fitted:
+            self.__Lognormal_2P_params = fitted["Lognormal_2P"]
             self.Lognormal_2P_mu = self.__Lognormal_2P_params.mu
             self.Lognormal_2P_sigma = self.__Lognormal_2P_params.sigma
             self.Lognormal_2P_gamma = 0
@@ -704,15 +948,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Gumbel_2P" not in self.excluded_distributions:
-            self.__Gumbel_2P_params = Fit_Gumbel_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Gumbel_2P" in fitted:
+            self.__Gumbel_2P_params = fitted["Gumbel_2P"]
             self.Gumbel_2P_mu = self.__Gumbel_2P_params.mu
             self.Gumbel_2P_sigma = self.__Gumbel_2P_params.sigma
             self.Gumbel_2P_loglik = self.__Gumbel_2P_params.loglik
@@ -751,15 +988,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Weibull_2P" not in self.excluded_distributions:
-            self.__Weibull_2P_params = Fit_Weibull_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Weibull_2P" in fitted:
+            self.__Weibull_2P_params = fitted["Weibull_2P"]
             self.Weibull_2P_alpha = self.__Weibull_2P_params.alpha
             self.Weibull_2P_beta = self.__Weibull_2P_params.beta
             self.Weibull_2P_gamma = 0
@@ -799,15 +1029,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Weibull_Mixture" not in self.excluded_distributions:
-            self.__Weibull_Mixture_params = Fit_Weibull_Mixture(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Weibull_Mixture" in fitted:
+            self.__Weibull_Mixture_params = fitted["Weibull_Mixture"]
             self.Weibull_Mixture_alpha_1 = self.__Weibull_Mixture_params.alpha_1
             self.Weibull_Mixture_beta_1 = self.__Weibull_Mixture_params.beta_1
             self.Weibull_Mixture_alpha_2 = self.__Weibull_Mixture_params.alpha_2
@@ -851,15 +1074,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Weibull_CR" not in self.excluded_distributions:
-            self.__Weibull_CR_params = Fit_Weibull_CR(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Weibull_CR" in fitted:
+            self.__Weibull_CR_params = fitted["Weibull_CR"]
             self.Weibull_CR_alpha_1 = self.__Weibull_CR_params.alpha_1
             self.Weibull_CR_beta_1 = self.__Weibull_CR_params.beta_1
             self.Weibull_CR_alpha_2 = self.__Weibull_CR_params.alpha_2
@@ -900,15 +1116,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Weibull_DS" not in self.excluded_distributions:
-            self.__Weibull_DS_params = Fit_Weibull_DS(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Weibull_DS" in fitted:
+            self.__Weibull_DS_params = fitted["Weibull_DS"]
             self.Weibull_DS_alpha = self.__Weibull_DS_params.alpha
             self.Weibull_DS_beta = self.__Weibull_DS_params.beta
             self.Weibull_DS_DS = self.__Weibull_DS_params.DS
@@ -948,15 +1157,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Gamma_2P" not in self.excluded_distributions:
-            self.__Gamma_2P_params = Fit_Gamma_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Gamma_2P" in fitted:
+            self.__Gamma_2P_params = fitted["Gamma_2P"]
             self.Gamma_2P_alpha = self.__Gamma_2P_params.alpha
             self.Gamma_2P_beta = self.__Gamma_2P_params.beta
             self.Gamma_2P_mu = self.__Gamma_2P_params.mu
@@ -997,15 +1199,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Exponential_1P" not in self.excluded_distributions:
-            self.__Exponential_1P_params = Fit_Exponential_1P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Exponential_1P" in fitted:
+            self.__Exponential_1P_params = fitted["Exponential_1P"]
             self.Exponential_1P_lambda = self.__Exponential_1P_params.Lambda
             self.Exponential_1P_gamma = 0
             self.Exponential_1P_loglik = self.__Exponential_1P_params.loglik
@@ -1044,15 +1239,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Loglogistic_2P" not in self.excluded_distributions:
-            self.__Loglogistic_2P_params = Fit_Loglogistic_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Loglogistic_2P" in fitted:
+            self.__Loglogistic_2P_params = fitted["Loglogistic_2P"]
             self.Loglogistic_2P_alpha = self.__Loglogistic_2P_params.alpha
             self.Loglogistic_2P_beta = self.__Loglogistic_2P_params.beta
             self.Loglogistic_2P_gamma = 0
@@ -1092,15 +1280,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Loglogistic_3P" not in self.excluded_distributions:
-            self.__Loglogistic_3P_params = Fit_Loglogistic_3P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Loglogistic_3P" in fitted:
+            self.__Loglogistic_3P_params = fitted["Loglogistic_3P"]
             self.Loglogistic_3P_alpha = self.__Loglogistic_3P_params.alpha
             self.Loglogistic_3P_beta = self.__Loglogistic_3P_params.beta
             self.Loglogistic_3P_gamma = self.__Loglogistic_3P_params.gamma
@@ -1140,15 +1321,8 @@ class Fit_Everything:
                 ]
             )
 
-        if "Beta_2P" not in self.excluded_distributions:
-            self.__Beta_2P_params = Fit_Beta_2P(
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                optimizer=optimizer,
-                show_probability_plot=False,
-                print_results=False,
-            )
+        if "Beta_2P" in fitted:
+            self.__Beta_2P_params = fitted["Beta_2P"]
             self.Beta_2P_alpha = self.__Beta_2P_params.alpha
             self.Beta_2P_beta = self.__Beta_2P_params.beta
             self.Beta_2P_loglik = self.__Beta_2P_params.loglik
@@ -1325,10 +1499,20 @@ class Fit_Everything:
             print("Analysis method:", method)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
+            if len(self.pruned_distributions) > 0:
+                print(
+                    "Pruned by racing:",
+                    ", ".join(self.pruned_distributions),
+                    "\n",
+                )
             print(self.results.to_string(index=False), "\n")
 
         if show_histogram_plot is True:
@@ -1444,10 +1628,12 @@ class Fit_Everything:
         plotting_order = self.results["Distribution"].values
         iqr = np.subtract(*np.percentile(X, [75, 25]))  # interquartile range
         # Freedman–Diaconis rule ==> https://en.wikipedia.org/wiki/Freedman%E2%80%93Diaconis_rule
-        bin_width = 2 * iqr * len(X) ** -(1 / 3)
+        bin_width = 2 * iqr * np.sum(self.failure_weights) ** -(1 / 3)
         num_bins = int(np.ceil((max(X) - min(X)) / bin_width))
         # we need to make the histogram manually (can't use plt.hist) due to need to scale the heights when there's censored data
-        hist, bins = np.histogram(X, bins=num_bins, density=True)
+        hist, bins = np.histogram(
+            X, bins=num_bins, density=True, weights=self.failure_weights
+        )
         hist_cumulative = np.cumsum(hist) / sum(hist)
         width = np.diff(bins)
         center = (bins[:-1] + bins[1:]) / 2
@@ -1557,9 +1743,7 @@ class Fit_Everything:
 
         # Cumulative Distribution Functions
         plt.subplot(133)
-        _, ecdf_y = plotting_positions(
-            failures=self.failures, right_censored=self.right_censored
-        )
+        _, ecdf_y = self._prepared.plotting_positions
         plt.bar(
             center,
             hist_cumulative * max(ecdf_y),
@@ -1633,13 +1817,7 @@ class Fit_Everything:
         parametric vs non-parametric plots of the fitted distributions.
         """
         # Kaplan-Meier estimate of quantiles. Used in P-P plot.
-        nonparametric = KaplanMeier(
-            failures=self.failures,
-            right_censored=self.right_censored,
-            print_results=False,
-            show_plot=False,
-        )
-        nonparametric_CDF = 1 - nonparametric.KM  # change SF into CDF
+        nonparametric_CDF = 1 - self._prepared.KM  # change SF into CDF
 
         cols, rows, _, figsizePP = Fit_Everything.__probplot_layout(self)
         # this is the order to plot things which matches the results dataframe
@@ -1789,6 +1967,8 @@ class Fit_Everything:
                 Exponential_probability_plot_Weibull_Scale(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Exponential_1P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1796,6 +1976,8 @@ class Fit_Everything:
                 Exponential_probability_plot_Weibull_Scale(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Exponential_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1803,6 +1985,8 @@ class Fit_Everything:
                 Lognormal_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Lognormal_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1810,6 +1994,8 @@ class Fit_Everything:
                 Lognormal_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Lognormal_3P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1817,6 +2003,8 @@ class Fit_Everything:
                 Weibull_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Weibull_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1824,6 +2012,8 @@ class Fit_Everything:
                 Weibull_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Weibull_3P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1831,6 +2021,8 @@ class Fit_Everything:
                 Weibull_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     show_fitted_distribution=False,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1840,6 +2032,8 @@ class Fit_Everything:
                 Weibull_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     show_fitted_distribution=False,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1849,6 +2043,8 @@ class Fit_Everything:
                 Weibull_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     show_fitted_distribution=False,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1858,6 +2054,8 @@ class Fit_Everything:
                 Loglogistic_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Loglogistic_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1865,6 +2063,8 @@ class Fit_Everything:
                 Loglogistic_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Loglogistic_3P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1872,6 +2072,8 @@ class Fit_Everything:
                 Gamma_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Gamma_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1879,6 +2081,8 @@ class Fit_Everything:
                 Gamma_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Gamma_3P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1886,6 +2090,8 @@ class Fit_Everything:
                 Normal_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Normal_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1893,6 +2099,8 @@ class Fit_Everything:
                 Gumbel_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Gumbel_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1900,6 +2108,8 @@ class Fit_Everything:
                 Beta_probability_plot(
                     failures=self.failures,
                     right_censored=self.right_censored,
+                    failure_weights=self.failure_weights,
+                    right_censored_weights=self.right_censored_weights,
                     __fitted_dist_params=self.__Beta_2P_params,
                     downsample_scatterplot=self.__downsample_scatterplot,
                 )
@@ -1941,9 +2151,11 @@ class Fit_Weibull_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements if force_beta is not
         specified or at least 1 element if force_beta is specified.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -1963,7 +2175,9 @@ class Fit_Weibull_2P:
         'best' and the best result will be returned. The default behaviour is to
         try each optimizer in order ('TNC', 'L-BFGS-B', 'nelder-mead', and
         'powell') and stop once one of the optimizers finds a solution. If the
-        optimizer fails, the initial guess will be returned.
+        optimizer fails, the initial guess will be returned. For Weibull_2P,
+        the default behaviour first solves the profile likelihood of beta
+        (which is much faster) and the optimizers are only used if this fails.
         For more detail see the `documentation
         <https://reliability.readthedocs.io/en/latest/Optimizers.html>`_.
     CI : float, optional
@@ -1993,6 +2207,20 @@ class Fit_Weibull_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
+    initial_guess : list, array, optional
+        The initial guess of [alpha, beta] for the MLE, such as the parameters
+        from a previous fit. If specified, the least squares estimates are not
+        calculated and the MLE is warm started from this guess. Only used if
+        method is 'MLE'. Default is None.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -2050,6 +2278,10 @@ class Fit_Weibull_2P:
     may be caused by the chosen distribution being a very poor fit to the data
     or the data being heavily censored. If a warning is printed, consider trying
     a different optimizer.
+
+    To refit with additional data use the update method (e.g.
+    fit.update(failures=new_failures)). This warm starts the MLE from the
+    parameters of this fit so it is much faster than fitting from scratch.
     """
 
     def __init__(
@@ -2065,6 +2297,10 @@ class Fit_Weibull_2P:
         optimizer=None,
         force_beta=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        initial_guess=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -2072,6 +2308,8 @@ class Fit_Weibull_2P:
             dist="Weibull_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -2081,6 +2319,8 @@ class Fit_Weibull_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -2088,26 +2328,47 @@ class Fit_Weibull_2P:
         force_beta = inputs.force_beta
         CI_type = inputs.CI_type
         self.gamma = 0
+        if initial_guess is not None and (
+            type(initial_guess) not in [list, tuple, np.ndarray]
+            or len(initial_guess) != 2
+        ):
+            raise ValueError("initial_guess must be a list or array of [alpha, beta].")
+        self.failures = failures
+        self.right_censored = right_censored
+        self.failure_weights = failure_weights
+        self.right_censored_weights = right_censored_weights
+        # these are kept so that update can refit with the same options
+        self.__fit_options = dict(
+            CI=CI,
+            quantiles=quantiles,
+            CI_type=CI_type,
+            method=method,
+            optimizer=optimizer,
+            force_beta=force_beta,
+            downsample_scatterplot=downsample_scatterplot,
+        )
 
-        # Obtain least squares estimates
-        if method == "MLE":
-            LS_method = "LS"
+        # Obtain least squares estimates. These are not needed for a warm start.
+        if method == "MLE" and initial_guess is not None:
+            guess = initial_guess
         else:
-            LS_method = method
-        LS_results = LS_optimization(
-            func_name="Weibull_2P",
-            LL_func=Fit_Weibull_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
-            method=LS_method,
-            force_shape=force_beta,
-            LL_func_force=Fit_Weibull_2P.LL_fb,
-        )
+            if method == "MLE":
+                LS_method = "LS"
+            else:
+                LS_method = method
+            LS_results = inputs.prepared.LS_results(
+                func_name="Weibull_2P",
+                LL_func=Fit_Weibull_2P.LL,
+                method=LS_method,
+                force_shape=force_beta,
+                LL_func_force=Fit_Weibull_2P.LL_fb,
+            )
+            guess = LS_results.guess
 
         # least squares method
         if method in ["LS", "RRX", "RRY"]:
-            self.alpha = LS_results.guess[0]
-            self.beta = LS_results.guess[1]
+            self.alpha = guess[0]
+            self.beta = guess[1]
             self.method = str("Least Squares Estimation (" + LS_results.method + ")")
             self.optimizer = None
         # maximum likelihood method
@@ -2115,12 +2376,15 @@ class Fit_Weibull_2P:
             MLE_results = MLE_optimization(
                 func_name="Weibull_2P",
                 LL_func=Fit_Weibull_2P.LL,
-                initial_guess=[LS_results.guess[0], LS_results.guess[1]],
+                initial_guess=[guess[0], guess[1]],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
                 force_shape=force_beta,
                 LL_func_force=Fit_Weibull_2P.LL_fb,
+                warm_start=initial_guess is not None,
             )
             self.alpha = MLE_results.scale
             self.beta = MLE_results.shape
@@ -2131,10 +2395,12 @@ class Fit_Weibull_2P:
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta]
         if force_beta is None:
-            hessian_matrix = hessian(Fit_Weibull_2P.LL)(
+            hessian_matrix = LL_hessian("Weibull_2P", Fit_Weibull_2P.LL)(
                 np.array(tuple(params)),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -2170,11 +2436,13 @@ class Fit_Weibull_2P:
                 self.beta_lower = self.beta
 
         else:  # this is for when force beta is specified
-            hessian_matrix = hessian(Fit_Weibull_2P.LL_fb)(
+            hessian_matrix = LL_hessian("Weibull_2P", Fit_Weibull_2P.LL_fb)(
                 np.array(tuple([self.alpha])),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
                 np.array(tuple([force_beta])),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -2209,23 +2477,6 @@ class Fit_Weibull_2P:
                 self.beta_upper = self.beta
                 self.beta_lower = self.beta
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta"],
-            "Point Estimate": [self.alpha, self.beta],
-            "Standard Error": [self.alpha_SE, self.beta_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Weibull_Distribution(
             alpha=self.alpha,
             beta=self.beta,
@@ -2262,13 +2513,26 @@ class Fit_Weibull_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         if force_beta is None:
             k = 2
-            LL2 = 2 * Fit_Weibull_2P.LL(params, failures, right_censored)
+            LL2 = 2 * Fit_Weibull_2P.LL(
+                params,
+                failures,
+                right_censored,
+                failure_weights,
+                right_censored_weights,
+            )
         else:
             k = 1
-            LL2 = 2 * Fit_Weibull_2P.LL_fb(params, failures, right_censored, force_beta)
+            LL2 = 2 * Fit_Weibull_2P.LL_fb(
+                params,
+                failures,
+                right_censored,
+                force_beta,
+                failure_weights,
+                right_censored_weights,
+            )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -2277,9 +2541,32 @@ class Fit_Weibull_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta"],
+            "Point Estimate": [self.alpha, self.beta],
+            "Standard Error": [self.alpha_SE, self.beta_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -2293,7 +2580,7 @@ class Fit_Weibull_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -2306,7 +2593,11 @@ class Fit_Weibull_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -2333,6 +2624,8 @@ class Fit_Weibull_2P:
             Weibull_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -2341,6 +2634,60 @@ class Fit_Weibull_2P:
             )
             self.probability_plot = plt.gca()
 
+    def update(
+        self,
+        failures=None,
+        right_censored=None,
+        failure_weights=None,
+        right_censored_weights=None,
+        show_probability_plot=False,
+        print_results=False,
+        **kwargs,
+    ):
+        """
+        Fits the Weibull_2P distribution to the data of this fit combined with
+        new data. The MLE is warm started from the parameters of this fit so
+        only a few iterations are needed when a small amount of data is added.
+
+        Parameters
+        ----------
+        failures : array, list, optional
+            The new failure data. Default = None.
+        right_censored : array, list, optional
+            The new right censored data. Default = None.
+        failure_weights : array, list, optional
+            The number of units at each new failure time. Default is None
+            which gives each new failure a weight of 1.
+        right_censored_weights : array, list, optional
+            The number of units at each new right censored time. Default is
+            None which gives each new right censored value a weight of 1.
+        show_probability_plot : bool, optional
+            True or False. Default = False
+        print_results : bool, optional
+            True or False. Default = False
+        kwargs
+            Plotting keywords that are passed directly to matplotlib for the
+            probability plot (e.g. color, label, linestyle)
+
+        Returns
+        -------
+        fit : object
+            A new Fit_Weibull_2P object fitted to the combined data. The other
+            options (e.g. CI, method, force_beta) are the same as this fit.
+            This fit is not modified.
+        """
+        data = _combine_update_data(
+            self, failures, right_censored, failure_weights, right_censored_weights
+        )
+        return Fit_Weibull_2P(
+            show_probability_plot=show_probability_plot,
+            print_results=print_results,
+            initial_guess=[self.alpha, self.beta],
+            **data,
+            **self.__fit_options,
+            **kwargs,
+        )
+
     @staticmethod
     def logf(t, a, b):  # Log PDF (2 parameter Weibull)
         return (b - 1) * anp.log(t / a) + anp.log(b / a) - (t / a) ** b
@@ -2350,17 +2697,17 @@ class Fit_Weibull_2P:
         return -((t / a) ** b)
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter weibull)
-        LL_f = Fit_Weibull_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Weibull_2P.logR(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Weibull_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Weibull_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
     @staticmethod
-    def LL_fb(params, T_f, T_rc, force_beta):
+    def LL_fb(params, T_f, T_rc, force_beta, W_f=1, W_rc=1):
         # log likelihood function (2 parameter weibull) FORCED BETA
-        LL_f = Fit_Weibull_2P.logf(T_f, params[0], force_beta).sum()
-        LL_rc = Fit_Weibull_2P.logR(T_rc, params[0], force_beta).sum()
+        LL_f = (W_f * Fit_Weibull_2P.logf(T_f, params[0], force_beta)).sum()
+        LL_rc = (W_rc * Fit_Weibull_2P.logR(T_rc, params[0], force_beta)).sum()
         return -(LL_f + LL_rc)
 
 
@@ -2386,9 +2733,10 @@ class Fit_Weibull_2P_grouped:
         RRX and RRY and return the better one. Default is 'MLE'.
     optimizer : str, optional
         The optimization algorithm used to find the solution. Must be either
-        'TNC', 'L-BFGS-B', 'nelder-mead', or 'powell'. The default optimizer is
-        'TNC'. The option to use all these optimizers is not available (as it is
-        in all the other Fitters). If the optimizer fails, the initial guess
+        'TNC', 'L-BFGS-B', 'nelder-mead', or 'powell'. The default is to solve
+        the profile likelihood of beta and only use the 'TNC' optimizer if this
+        fails. The option to use all these optimizers is not available (as it
+        is in all the other Fitters). If the optimizer fails, the initial guess
         will be returned.
     CI : float, optional
         confidence interval for estimating confidence limits on parameters. Must
@@ -2568,33 +2916,25 @@ class Fit_Weibull_2P_grouped:
         right_censored_times = right_censored_df.time.values
         right_censored_qty = right_censored_df.quantity.values
 
-        # recompile the data to get the plotting positions for the initial guess
-        failures = np.array([])
-        right_censored = np.array([])
-        for i in range(len(failure_times)):
-            failures = np.append(
-                failures, failure_times[i] * np.ones(int(failure_qty[i]))
-            )
-        for i in range(len(right_censored_times)):
-            right_censored = np.append(
-                right_censored,
-                right_censored_times[i] * np.ones(int(right_censored_qty[i])),
-            )
-
-        # perform input error checking for the rest of the inputs
+        # perform input error checking for the rest of the inputs. The
+        # quantities are used as weights so the data is never expanded.
         inputs = fitters_input_checking(
             dist="Weibull_2P",
-            failures=failures,
-            right_censored=right_censored,
+            failures=failure_times,
+            right_censored=right_censored_times,
             method=method,
             optimizer=optimizer,
             CI=CI,
             quantiles=quantiles,
             force_beta=force_beta,
             CI_type=CI_type,
+            failure_weights=failure_qty,
+            right_censored_weights=right_censored_qty,
         )
-        failures = inputs.failures
-        right_censored = inputs.right_censored
+        failures = failure_times = inputs.failures
+        right_censored = right_censored_times = inputs.right_censored
+        failure_qty = inputs.failure_weights
+        right_censored_qty = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -2602,6 +2942,8 @@ class Fit_Weibull_2P_grouped:
         force_beta = inputs.force_beta
         CI_type = inputs.CI_type
         self.gamma = 0
+        # the profile likelihood is used by default with TNC as the fallback
+        use_profile_likelihood = optimizer is None
         if optimizer not in ["L-BFGS-B", "TNC", "powell", "nelder-mead"]:
             optimizer = "TNC"  # temporary correction for "best" and "all"
 
@@ -2612,6 +2954,8 @@ class Fit_Weibull_2P_grouped:
                 right_censored=right_censored,
                 method="RRX",
                 force_shape=force_beta,
+                failure_weights=failure_qty,
+                right_censored_weights=right_censored_qty,
             )
             LS_method = "RRX"
         elif method == "RRY":
@@ -2621,6 +2965,8 @@ class Fit_Weibull_2P_grouped:
                 right_censored=right_censored,
                 method="RRY",
                 force_shape=force_beta,
+                failure_weights=failure_qty,
+                right_censored_weights=right_censored_qty,
             )
             LS_method = "RRY"
         elif method in ["LS", "MLE"]:
@@ -2630,6 +2976,8 @@ class Fit_Weibull_2P_grouped:
                 right_censored=right_censored,
                 method="RRX",
                 force_shape=force_beta,
+                failure_weights=failure_qty,
+                right_censored_weights=right_censored_qty,
             )
             guess_RRY = least_squares(
                 dist="Weibull_2P",
@@ -2637,6 +2985,8 @@ class Fit_Weibull_2P_grouped:
                 right_censored=right_censored,
                 method="RRY",
                 force_shape=force_beta,
+                failure_weights=failure_qty,
+                right_censored_weights=right_censored_qty,
             )
             if force_beta is not None:
                 loglik_RRX = -Fit_Weibull_2P_grouped.LL_fb(
@@ -2685,114 +3035,129 @@ class Fit_Weibull_2P_grouped:
             self.optimizer = None
         elif method == "MLE":
             self.method = "Maximum Likelihood Estimation (MLE)"
-            self.optimizer = optimizer
-            n = sum(failure_qty) + sum(right_censored_qty)
-            k = len(guess)
-            initial_guess = guess
-            if force_beta is None:
-                bnds = [
-                    (0, None),
-                    (0, None),
-                ]  # bounds on the solution. Helps a lot with stability
-                runs = 0
-                delta_BIC = 1
-                BIC_array = [1000000]
-                while (
-                    delta_BIC > 0.001 and runs < 10
-                ):  # exits after BIC convergence or 10 iterations
-                    runs += 1
-                    result = minimize(
-                        value_and_grad(Fit_Weibull_2P_grouped.LL),
-                        guess,
-                        args=(
+            profile_success = False
+            if use_profile_likelihood is True:
+                alpha, beta, profile_success = weibull_2P_profile_fit(
+                    failures=failure_times,
+                    right_censored=right_censored_times,
+                    failure_weights=failure_qty,
+                    right_censored_weights=right_censored_qty,
+                    initial_beta=guess[1],
+                    force_beta=force_beta,
+                )
+            if profile_success is True:
+                self.optimizer = "profile likelihood"
+                self.alpha = alpha
+                self.beta = beta
+            else:
+                self.optimizer = optimizer
+                n = sum(failure_qty) + sum(right_censored_qty)
+                k = len(guess)
+                initial_guess = guess
+                if force_beta is None:
+                    bnds = [
+                        (0, None),
+                        (0, None),
+                    ]  # bounds on the solution. Helps a lot with stability
+                    runs = 0
+                    delta_BIC = 1
+                    BIC_array = [1000000]
+                    while (
+                        delta_BIC > 0.001 and runs < 10
+                    ):  # exits after BIC convergence or 10 iterations
+                        runs += 1
+                        result = minimize(
+                            value_and_grad(Fit_Weibull_2P_grouped.LL),
+                            guess,
+                            args=(
+                                failure_times,
+                                right_censored_times,
+                                failure_qty,
+                                right_censored_qty,
+                            ),
+                            jac=True,
+                            method=optimizer,
+                            bounds=bnds,
+                            options={"maxiter": 300},
+                        )  # this includes maxiter as TNC often exceeds the default limit of 100
+                        params = result.x
+                        guess = [params[0], params[1]]
+                        LL2 = 2 * Fit_Weibull_2P_grouped.LL(
+                            guess,
                             failure_times,
                             right_censored_times,
                             failure_qty,
                             right_censored_qty,
-                        ),
-                        jac=True,
-                        method=optimizer,
-                        bounds=bnds,
-                        options={"maxiter": 300},
-                    )  # this includes maxiter as TNC often exceeds the default limit of 100
-                    params = result.x
-                    guess = [params[0], params[1]]
-                    LL2 = 2 * Fit_Weibull_2P_grouped.LL(
-                        guess,
-                        failure_times,
-                        right_censored_times,
-                        failure_qty,
-                        right_censored_qty,
-                    )
-                    BIC_array.append(np.log(n) * k + LL2)
-                    delta_BIC = abs(BIC_array[-1] - BIC_array[-2])
-            else:  # force beta is True
-                bnds = [(0, None)]  # bounds on the solution. Helps a lot with stability
-                runs = 0
-                delta_BIC = 1
-                BIC_array = [1000000]
-                guess = [guess[0]]
-                k = len(guess)
-                while (
-                    delta_BIC > 0.001 and runs < 10
-                ):  # exits after BIC convergence or 5 iterations
-                    runs += 1
-                    result = minimize(
-                        value_and_grad(Fit_Weibull_2P_grouped.LL_fb),
-                        guess,
-                        args=(
+                        )
+                        BIC_array.append(np.log(n) * k + LL2)
+                        delta_BIC = abs(BIC_array[-1] - BIC_array[-2])
+                else:  # force beta is True
+                    bnds = [(0, None)]  # bounds on the solution. Helps a lot with stability
+                    runs = 0
+                    delta_BIC = 1
+                    BIC_array = [1000000]
+                    guess = [guess[0]]
+                    k = len(guess)
+                    while (
+                        delta_BIC > 0.001 and runs < 10
+                    ):  # exits after BIC convergence or 5 iterations
+                        runs += 1
+                        result = minimize(
+                            value_and_grad(Fit_Weibull_2P_grouped.LL_fb),
+                            guess,
+                            args=(
+                                failure_times,
+                                right_censored_times,
+                                failure_qty,
+                                right_censored_qty,
+                                force_beta,
+                            ),
+                            jac=True,
+                            method=optimizer,
+                            bounds=bnds,
+                            options={"maxiter": 300},
+                        )
+                        params = result.x
+                        guess = [params[0]]
+                        LL2 = 2 * Fit_Weibull_2P_grouped.LL_fb(
+                            guess,
                             failure_times,
                             right_censored_times,
                             failure_qty,
                             right_censored_qty,
                             force_beta,
-                        ),
-                        jac=True,
-                        method=optimizer,
-                        bounds=bnds,
-                        options={"maxiter": 300},
-                    )
+                        )
+                        BIC_array.append(np.log(n) * k + LL2)
+                        delta_BIC = abs(BIC_array[-1] - BIC_array[-2])
+
+                # check if the optimizer was successful. If it failed then return the initial guess with a warning
+                if result.success is True:
                     params = result.x
-                    guess = [params[0]]
-                    LL2 = 2 * Fit_Weibull_2P_grouped.LL_fb(
-                        guess,
-                        failure_times,
-                        right_censored_times,
-                        failure_qty,
-                        right_censored_qty,
-                        force_beta,
+                    if force_beta is None:
+                        self.alpha = params[0]
+                        self.beta = params[1]
+                    else:
+                        self.alpha = params[0]
+                        self.beta = force_beta
+                else:  # return the initial guess with a warning
+                    colorprint(
+                        str(
+                            "WARNING: MLE estimates failed for Fit_Weibull_2P_grouped. The least squares estimates have been returned. These results may not be as accurate as MLE. You may want to try another optimzer from 'L-BFGS-B','TNC','powell','nelder-mead'."
+                        ),
+                        text_color="red",
                     )
-                    BIC_array.append(np.log(n) * k + LL2)
-                    delta_BIC = abs(BIC_array[-1] - BIC_array[-2])
-
-            # check if the optimizer was successful. If it failed then return the initial guess with a warning
-            if result.success is True:
-                params = result.x
-                if force_beta is None:
-                    self.alpha = params[0]
-                    self.beta = params[1]
-                else:
-                    self.alpha = params[0]
-                    self.beta = force_beta
-            else:  # return the initial guess with a warning
-                colorprint(
-                    str(
-                        "WARNING: MLE estimates failed for Fit_Weibull_2P_grouped. The least squares estimates have been returned. These results may not be as accurate as MLE. You may want to try another optimzer from 'L-BFGS-B','TNC','powell','nelder-mead'."
-                    ),
-                    text_color="red",
-                )
-                if force_beta is None:
-                    self.alpha = initial_guess[0]
-                    self.beta = initial_guess[1]
-                else:
-                    self.alpha = initial_guess[0]
-                    self.beta = force_beta
+                    if force_beta is None:
+                        self.alpha = initial_guess[0]
+                        self.beta = initial_guess[1]
+                    else:
+                        self.alpha = initial_guess[0]
+                        self.beta = force_beta
 
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta]
         if force_beta is None:
-            hessian_matrix = hessian(Fit_Weibull_2P_grouped.LL)(
+            hessian_matrix = LL_hessian("Weibull_2P_grouped", Fit_Weibull_2P_grouped.LL)(
                 np.array(tuple(params)),
                 np.array(tuple(failure_times)),
                 np.array(tuple(right_censored_times)),
@@ -2833,7 +3198,7 @@ class Fit_Weibull_2P_grouped:
                 self.beta_lower = self.beta
 
         else:  # this is for when force beta is specified
-            hessian_matrix = hessian(Fit_Weibull_2P_grouped.LL_fb)(
+            hessian_matrix = LL_hessian("Weibull_2P_grouped", Fit_Weibull_2P_grouped.LL_fb)(
                 np.array(tuple([self.alpha])),
                 np.array(tuple(failure_times)),
                 np.array(tuple(right_censored_times)),
@@ -2955,9 +3320,16 @@ class Fit_Weibull_2P_grouped:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        x, y = plotting_positions(
+            failures=failures,
+            right_censored=right_censored,
+            failure_weights=failure_qty,
+            right_censored_weights=right_censored_qty,
+        )
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_qty,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -2986,7 +3358,11 @@ class Fit_Weibull_2P_grouped:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(sum(failure_qty)) + "/" + str(sum(right_censored_qty))),
+                str(
+                    round_and_string(np.sum(failure_qty))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_qty))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -3013,6 +3389,8 @@ class Fit_Weibull_2P_grouped:
             Weibull_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_qty,
+                right_censored_weights=right_censored_qty if rc is not None else None,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -3044,17 +3422,264 @@ class Fit_Weibull_2P_grouped:
         return -(LL_f + LL_rc)
 
 
-class Fit_Weibull_3P:
+class Fit_Weibull_2P_batch:
     """
-    Fits a three parameter Weibull distribution (alpha,beta,gamma) to the data
-    provided.
+    Fits a two parameter Weibull distribution (alpha,beta) to each of many
+    independent datasets. All of the datasets are fitted simultaneously using
+    vectorized calculations, making this much faster than calling
+    Fit_Weibull_2P for each dataset.
 
     Parameters
     ----------
-    failures : array, list
-        The failure data. Must have at least 3 elements
-    right_censored : array, list, optional
-        The right censored data. Optional input. Default = None.
+    failures : list, array
+        The failure data. This may be a list of arrays (one array per dataset)
+        or a single array of failure times if failure_groups is specified. Each
+        dataset must have at least 2 distinct failures.
+    right_censored : list, array, optional
+        The right censored data. This must be in the same format as failures,
+        so if failures is a list of arrays then right_censored must be a list of
+        the same length (use an empty list for datasets without right censored
+        data). Default = None.
+    failure_groups : list, array, optional
+        The dataset label for each failure. Only used if failures is a single
+        array. Labels may be any sortable type (e.g. int or str).
+        Default = None.
+    right_censored_groups : list, array, optional
+        The dataset label for each right censored time. Only used if
+        failure_groups is specified. Default = None.
+    CI : float, optional
+        confidence interval for estimating confidence limits on parameters. Must
+        be between 0 and 1. Default is 0.95 for 95% CI.
+
+    Returns
+    -------
+    groups : array
+        the label of each dataset. The returned arrays are in this order. If
+        failures was a list of arrays, this is the index of each array.
+    alpha : array
+        the fitted Weibull_2P alpha parameter of each dataset
+    beta : array
+        the fitted Weibull_2P beta parameter of each dataset
+    alpha_SE : array
+        the standard error (sqrt(variance)) of the parameter
+    beta_SE : array
+        the standard error (sqrt(variance)) of the parameter
+    Cov_alpha_beta : array
+        the covariance between the parameters
+    alpha_upper : array
+        the upper CI estimate of the parameter
+    alpha_lower : array
+        the lower CI estimate of the parameter
+    beta_upper : array
+        the upper CI estimate of the parameter
+    beta_lower : array
+        the lower CI estimate of the parameter
+    loglik : array
+        Log Likelihood (as used in Minitab and Reliasoft)
+    loglik2 : array
+        LogLikelihood*-2 (as used in JMP Pro)
+    AICc : array
+        Akaike Information Criterion. This is nan for datasets with
+        insufficient data.
+    BIC : array
+        Bayesian Information Criterion
+    success : array
+        whether the fit was successful for each dataset. Datasets with fewer
+        than 2 distinct failures can not be fitted and will have nan results.
+    results : dataframe
+        a pandas dataframe of the results with one row per dataset
+    distribution : object
+        a Weibull_Distribution_batch object with the fitted parameters of every
+        dataset. This may be used to evaluate the fitted SF (etc.) of all of the
+        datasets at once.
+
+    Notes
+    -----
+    This function only performs maximum likelihood estimation. The MLE is found
+    by solving the profile likelihood equation for beta (for which alpha has a
+    closed form solution) and the standard errors are obtained from the closed
+    form observed information matrix. The results match Fit_Weibull_2P within
+    the tolerance of the optimizer used by Fit_Weibull_2P.
+
+    Example Usage:
+
+    .. code:: python
+
+        data = [[10, 12, 35, 48], [51, 88, 91, 120, 125]]
+        rc = [[50, 50], []]
+        fit = Fit_Weibull_2P_batch(failures=data, right_censored=rc)
+        print(fit.alpha, fit.beta)
+    """
+
+    def __init__(
+        self,
+        failures=None,
+        right_censored=None,
+        failure_groups=None,
+        right_censored_groups=None,
+        CI=0.95,
+    ):
+        if type(CI) not in [float, np.float64] or CI <= 0 or CI >= 1:
+            raise ValueError(
+                "CI must be between 0 and 1. Default is 0.95 for 95% Confidence interval."
+            )
+
+        if failure_groups is None:
+            # ragged input as a list of arrays
+            if type(failures) not in [list, tuple]:
+                raise ValueError(
+                    "failures must be a list of arrays (one for each dataset) or an array of failure times with failure_groups specified."
+                )
+            if right_censored is None:
+                right_censored = [[] for _ in failures]
+            if type(right_censored) not in [list, tuple] or len(right_censored) != len(
+                failures
+            ):
+                raise ValueError(
+                    "right_censored must be a list of arrays with the same length as failures."
+                )
+            if right_censored_groups is not None:
+                raise ValueError(
+                    "right_censored_groups can only be used if failure_groups is specified."
+                )
+            failure_lengths = [len(item) for item in failures]
+            right_censored_lengths = [len(item) for item in right_censored]
+            labels = np.arange(len(failures))
+            T_f = np.hstack([np.asarray(item, dtype=float) for item in failures] + [[]])
+            T_rc = np.hstack(
+                [np.asarray(item, dtype=float) for item in right_censored] + [[]]
+            )
+            G_f = np.repeat(labels, failure_lengths)
+            G_rc = np.repeat(labels, right_censored_lengths)
+        else:
+            T_f = np.asarray(failures, dtype=float)
+            failure_groups = np.asarray(failure_groups)
+            if right_censored is None:
+                right_censored = []
+                right_censored_groups = []
+            elif right_censored_groups is None:
+                raise ValueError(
+                    "right_censored_groups must be specified when right_censored and failure_groups are specified."
+                )
+            T_rc = np.asarray(right_censored, dtype=float)
+            right_censored_groups = np.asarray(
+                right_censored_groups, dtype=failure_groups.dtype
+            )
+            if len(failure_groups) != len(T_f) or len(right_censored_groups) != len(
+                T_rc
+            ):
+                raise ValueError(
+                    "failure_groups and right_censored_groups must be the same length as failures and right_censored."
+                )
+            labels, G = np.unique(
+                np.hstack([failure_groups, right_censored_groups]), return_inverse=True
+            )
+            G_f = G[: len(T_f)]
+            G_rc = G[len(T_f) :]
+
+        if len(T_f) == 0:
+            raise ValueError("failures must contain at least one failure time.")
+        if min(np.hstack([T_f, T_rc])) < 0:
+            raise ValueError(
+                "All failure and censoring times must be greater than zero."
+            )
+        # remove zeros and issue a warning. These are impossible since the pdf should be 0 at t=0.
+        if (T_f == 0).any() or (T_rc == 0).any():
+            colorprint(
+                "WARNING: The data contained zeros. These have been removed to enable fitting of the Weibull_2P distribution.",
+                text_color="red",
+            )
+            G_f, T_f = G_f[T_f != 0], T_f[T_f != 0]
+            G_rc, T_rc = G_rc[T_rc != 0], T_rc[T_rc != 0]
+
+        n_groups = len(labels)
+        times = np.hstack([T_f, T_rc])
+        failure_codes = np.hstack([np.ones_like(T_f), np.zeros_like(T_rc)])
+        groups = np.hstack([G_f, G_rc]).astype(int)
+
+        alpha, beta, success = weibull_2P_profile_MLE(
+            times=times, failure_codes=failure_codes, groups=groups, n_groups=n_groups
+        )
+        if not success.all():
+            colorprint(
+                str(
+                    "WARNING: "
+                    + str(int((~success).sum()))
+                    + " of the "
+                    + str(n_groups)
+                    + " datasets could not be fitted. Each dataset requires at least 2 distinct failures. The results for these datasets are nan."
+                ),
+                text_color="red",
+            )
+
+        loglik, information = weibull_2P_information(
+            alpha=alpha,
+            beta=beta,
+            times=times,
+            failure_codes=failure_codes,
+            groups=groups,
+            n_groups=n_groups,
+        )
+        # analytical inverse of each 2x2 information matrix
+        det = information[:, 0, 0] * information[:, 1, 1] - information[:, 0, 1] ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var_alpha = information[:, 1, 1] / det
+            var_beta = information[:, 0, 0] / det
+            covariance = -information[:, 0, 1] / det
+
+        Z = -ss.norm.ppf((1 - CI) / 2)
+        self.groups = labels
+        self.alpha = alpha
+        self.beta = beta
+        self.alpha_SE = abs(var_alpha) ** 0.5
+        self.beta_SE = abs(var_beta) ** 0.5
+        self.Cov_alpha_beta = covariance
+        self.alpha_upper = self.alpha * (np.exp(Z * (self.alpha_SE / self.alpha)))
+        self.alpha_lower = self.alpha * (np.exp(-Z * (self.alpha_SE / self.alpha)))
+        self.beta_upper = self.beta * (np.exp(Z * (self.beta_SE / self.beta)))
+        self.beta_lower = self.beta * (np.exp(-Z * (self.beta_SE / self.beta)))
+        self.success = success
+
+        # goodness of fit measures
+        n = np.bincount(groups, minlength=n_groups)
+        k = 2
+        LL2 = -2 * loglik
+        self.loglik2 = LL2
+        self.loglik = loglik
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.AICc = np.where(
+                n - k - 1 > 0, 2 * k + LL2 + (2 * k**2 + 2 * k) / (n - k - 1), np.nan
+            )
+        self.BIC = np.log(n) * k + LL2
+
+        results_data = {
+            "Group": self.groups,
+            "Alpha": self.alpha,
+            "Beta": self.beta,
+            "Alpha SE": self.alpha_SE,
+            "Beta SE": self.beta_SE,
+            "Cov Alpha Beta": self.Cov_alpha_beta,
+            "Log-likelihood": self.loglik,
+            "AICc": self.AICc,
+            "BIC": self.BIC,
+        }
+        self.results = pd.DataFrame(results_data)
+        self.distribution = Weibull_Distribution_batch(alpha=self.alpha, beta=self.beta)
+
+
+class Fit_Weibull_3P:
+    """
+    Fits a three parameter Weibull distribution (alpha,beta,gamma) to the data
+    provided.
+
+    Parameters
+    ----------
+    failures : array, list, prepared_data
+        The failure data. Must have at least 3 elements
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
+    right_censored : array, list, optional
+        The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
         True or False. Default = True
     print_results : bool, optional
@@ -3097,6 +3722,15 @@ class Fit_Weibull_3P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -3180,6 +3814,9 @@ class Fit_Weibull_3P:
         optimizer=None,
         method="MLE",
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -3187,6 +3824,8 @@ class Fit_Weibull_3P:
             dist="Weibull_3P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -3195,6 +3834,8 @@ class Fit_Weibull_3P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -3207,11 +3848,9 @@ class Fit_Weibull_3P:
         else:
             LS_method = method
 
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Weibull_3P",
             LL_func=Fit_Weibull_3P.LL,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -3234,6 +3873,8 @@ class Fit_Weibull_3P:
                 ],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.alpha = MLE_results.scale
@@ -3246,11 +3887,11 @@ class Fit_Weibull_3P:
             self.gamma < 0.01
         ):  # If the solver finds that gamma is very near zero then we should have used a Weibull_2P distribution. Can't proceed with Weibull_3P as the confidence interval calculations for gamma result in nan (Zero division error). Need to recalculate everything as the SE values will be incorrect for Weibull_3P
             weibull_2P_results = Fit_Weibull_2P(
-                failures=failures,
-                right_censored=right_censored,
+                failures=inputs.prepared,  # shares the plotting positions and least squares results
                 show_probability_plot=False,
                 print_results=False,
                 CI=CI,
+                _lean=True,
             )
             self.alpha = weibull_2P_results.alpha
             self.beta = weibull_2P_results.beta
@@ -3272,18 +3913,22 @@ class Fit_Weibull_3P:
             params_2P = [self.alpha, self.beta]
             params_3P = [self.alpha, self.beta, self.gamma]
             # here we need to get alpha_SE and beta_SE from the Weibull_2P by providing an adjusted dataset (adjusted for gamma)
-            hessian_matrix = hessian(Fit_Weibull_2P.LL)(
+            hessian_matrix = LL_hessian("Weibull_2P", Fit_Weibull_2P.LL)(
                 np.array(tuple(params_2P)),
                 np.array(tuple(failures - self.gamma)),
                 np.array(tuple(right_censored - self.gamma)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
                 # this is to get the gamma_SE. Unfortunately this approach for alpha_SE and beta_SE give SE values that are very large resulting in incorrect CI plots. This is the same method used by Reliasoft
-                hessian_matrix_for_gamma = hessian(Fit_Weibull_3P.LL)(
+                hessian_matrix_for_gamma = LL_hessian("Weibull_3P", Fit_Weibull_3P.LL)(
                     np.array(tuple(params_3P)),
                     np.array(tuple(failures)),
                     np.array(tuple(right_censored)),
+                    np.array(tuple(failure_weights)),
+                    np.array(tuple(right_censored_weights)),
                 )
                 covariance_matrix_for_gamma = np.linalg.inv(hessian_matrix_for_gamma)
                 self.alpha_SE = abs(covariance_matrix[0][0]) ** 0.5
@@ -3327,23 +3972,6 @@ class Fit_Weibull_3P:
                 self.gamma_upper = self.gamma
                 self.gamma_lower = self.gamma
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta", "Gamma"],
-            "Point Estimate": [self.alpha, self.beta, self.gamma],
-            "Standard Error": [self.alpha_SE, self.beta_SE, self.gamma_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower, self.gamma_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper, self.gamma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Weibull_Distribution(
             alpha=self.alpha,
             beta=self.beta,
@@ -3381,9 +4009,11 @@ class Fit_Weibull_3P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 3
-        LL2 = 2 * Fit_Weibull_3P.LL(params_3P, failures, right_censored)
+        LL2 = 2 * Fit_Weibull_3P.LL(
+            params_3P, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -3392,9 +4022,32 @@ class Fit_Weibull_3P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta", "Gamma"],
+            "Point Estimate": [self.alpha, self.beta, self.gamma],
+            "Standard Error": [self.alpha_SE, self.beta_SE, self.gamma_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower, self.gamma_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper, self.gamma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -3408,7 +4061,7 @@ class Fit_Weibull_3P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -3421,7 +4074,11 @@ class Fit_Weibull_3P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -3448,6 +4105,8 @@ class Fit_Weibull_3P:
             fig = Weibull_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -3478,11 +4137,11 @@ class Fit_Weibull_3P:
         return -(((t - g) / a) ** b)
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (3 parameter Weibull)
-        LL_f = Fit_Weibull_3P.logf(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Weibull_3P.logR(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_f + LL_rc)
+        LL_f = Fit_Weibull_3P.logf(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Weibull_3P.logR(T_rc, params[0], params[1], params[2])
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Weibull_Mixture:
@@ -3496,10 +4155,12 @@ class Fit_Weibull_Mixture:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         An array or list of the failure data. There must be at least 4 failures,
         but it is highly recommended to use another model if you have less than
         20 failures.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -3527,6 +4188,15 @@ class Fit_Weibull_Mixture:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -3635,6 +4305,8 @@ class Fit_Weibull_Mixture:
         CI=0.95,
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs,
     ):
 
@@ -3642,15 +4314,19 @@ class Fit_Weibull_Mixture:
             dist="Weibull_Mixture",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             CI=CI,
             optimizer=optimizer,
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         optimizer = inputs.optimizer
 
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         _, y = plotting_positions(
             failures=failures, right_censored=right_censored
         )  # this is only used to find AD
@@ -3661,7 +4337,12 @@ class Fit_Weibull_Mixture:
         # the dividing line is the point where the difference between the kde and the straight lines is greatest
         max_failures = max(failures)
         min_failures = min(failures)
-        gkde = ss.gaussian_kde(failures)
+        # Scott's factor is based on the number of units rather than the number of rows
+        gkde = ss.gaussian_kde(
+            failures,
+            bw_method=np.sum(failure_weights) ** -0.2,
+            weights=failure_weights,
+        )
         delta = max_failures - min_failures
         x_kde = np.linspace(min_failures - delta / 5, max_failures + delta / 5, 100)
         y_kde = gkde.evaluate(x_kde)
@@ -3709,38 +4390,33 @@ class Fit_Weibull_Mixture:
             ) / 2  # adjusts the dividing line in case there aren't enough failures in the second group
 
         # this is the point at which data is assigned to one group or another for the purpose of generating the initial guess
-        GROUP_1_failures = []
-        GROUP_2_failures = []
-        GROUP_1_right_cens = []
-        GROUP_2_right_cens = []
-        for item in failures:
-            if item < dividing_line:
-                GROUP_1_failures.append(item)
-            else:
-                GROUP_2_failures.append(item)
-        for item in right_censored:
-            if item < dividing_line:
-                GROUP_1_right_cens.append(item)
-            else:
-                GROUP_2_right_cens.append(item)
+        GROUP_1_f = failures < dividing_line
+        GROUP_1_rc = right_censored < dividing_line
 
         # get inputs for the guess by fitting a weibull to each of the groups with their respective censored data
         group_1_estimates = Fit_Weibull_2P(
-            failures=GROUP_1_failures,
-            right_censored=GROUP_1_right_cens,
+            failures=failures[GROUP_1_f],
+            right_censored=right_censored[GROUP_1_rc],
+            failure_weights=failure_weights[GROUP_1_f],
+            right_censored_weights=right_censored_weights[GROUP_1_rc],
             show_probability_plot=False,
             print_results=False,
             optimizer=optimizer,
         )
         group_2_estimates = Fit_Weibull_2P(
-            failures=GROUP_2_failures,
-            right_censored=GROUP_2_right_cens,
+            failures=failures[~GROUP_1_f],
+            right_censored=right_censored[~GROUP_1_rc],
+            failure_weights=failure_weights[~GROUP_1_f],
+            right_censored_weights=right_censored_weights[~GROUP_1_rc],
             show_probability_plot=False,
             print_results=False,
             optimizer=optimizer,
         )
         # proportion guess
-        p_guess = (len(GROUP_1_failures) + len(GROUP_1_right_cens)) / n
+        p_guess = (
+            np.sum(failure_weights[GROUP_1_f])
+            + np.sum(right_censored_weights[GROUP_1_rc])
+        ) / n
         guess = [
             group_1_estimates.alpha,
             group_1_estimates.beta,
@@ -3756,6 +4432,8 @@ class Fit_Weibull_Mixture:
             initial_guess=guess,
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
         )
         self.alpha_1 = MLE_results.alpha_1
@@ -3779,7 +4457,9 @@ class Fit_Weibull_Mixture:
             self.beta_2,
             self.proportion_1,
         ]
-        LL2 = 2 * Fit_Weibull_Mixture.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Weibull_Mixture.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         k = 5
@@ -3791,10 +4471,12 @@ class Fit_Weibull_Mixture:
 
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
-        hessian_matrix = hessian(Fit_Weibull_Mixture.LL)(
+        hessian_matrix = LL_hessian("Weibull_Mixture", Fit_Weibull_Mixture.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -3903,9 +4585,11 @@ class Fit_Weibull_Mixture:
             ],
         )
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -3919,7 +4603,7 @@ class Fit_Weibull_Mixture:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -3932,7 +4616,11 @@ class Fit_Weibull_Mixture:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -3949,6 +4637,8 @@ class Fit_Weibull_Mixture:
             Weibull_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_fitted_distribution=False,
                 downsample_scatterplot=downsample_scatterplot,
                 **kwargs,
@@ -3993,15 +4683,15 @@ class Fit_Weibull_Mixture:
         )
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # Log Mixture Likelihood function (2 parameter weibull)
         LL_f = Fit_Weibull_Mixture.logf(
             T_f, params[0], params[1], params[2], params[3], params[4]
-        ).sum()
+        )
         LL_rc = Fit_Weibull_Mixture.logR(
             T_rc, params[0], params[1], params[2], params[3], params[4]
-        ).sum()
-        return -(LL_f + LL_rc)
+        )
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Weibull_CR:
@@ -4013,10 +4703,12 @@ class Fit_Weibull_CR:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         An array or list of the failure data. There must be at least 4 failures,
         but it is highly recommended to use another model if you have less than
         20 failures.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -4044,6 +4736,15 @@ class Fit_Weibull_CR:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -4133,6 +4834,8 @@ class Fit_Weibull_CR:
         CI=0.95,
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs,
     ):
 
@@ -4140,15 +4843,19 @@ class Fit_Weibull_CR:
             dist="Weibull_CR",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             CI=CI,
             optimizer=optimizer,
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         optimizer = inputs.optimizer
 
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         _, y = plotting_positions(
             failures=failures, right_censored=right_censored
         )  # this is only used to find AD
@@ -4159,7 +4866,12 @@ class Fit_Weibull_CR:
         # the dividing line is the point where the difference between the kde and the straight lines is greatest
         max_failures = max(failures)
         min_failures = min(failures)
-        gkde = ss.gaussian_kde(failures)
+        # Scott's factor is based on the number of units rather than the number of rows
+        gkde = ss.gaussian_kde(
+            failures,
+            bw_method=np.sum(failure_weights) ** -0.2,
+            weights=failure_weights,
+        )
         delta = max_failures - min_failures
         x_kde = np.linspace(min_failures - delta / 5, max_failures + delta / 5, 100)
         y_kde = gkde.evaluate(x_kde)
@@ -4207,31 +4919,23 @@ class Fit_Weibull_CR:
             ) / 2  # adjusts the dividing line in case there aren't enough failures in the second group
 
         # this is the point at which data is assigned to one group or another for the purpose of generating the initial guess
-        GROUP_1_failures = []
-        GROUP_2_failures = []
-        GROUP_1_right_cens = []
-        GROUP_2_right_cens = []
-        for item in failures:
-            if item < dividing_line:
-                GROUP_1_failures.append(item)
-            else:
-                GROUP_2_failures.append(item)
-        for item in right_censored:
-            if item < dividing_line:
-                GROUP_1_right_cens.append(item)
-            else:
-                GROUP_2_right_cens.append(item)
+        GROUP_1_f = failures < dividing_line
+        GROUP_1_rc = right_censored < dividing_line
 
         # get inputs for the guess by fitting a weibull to each of the groups with their respective censored data
         group_1_estimates = Fit_Weibull_2P(
-            failures=GROUP_1_failures,
-            right_censored=GROUP_1_right_cens,
+            failures=failures[GROUP_1_f],
+            right_censored=right_censored[GROUP_1_rc],
+            failure_weights=failure_weights[GROUP_1_f],
+            right_censored_weights=right_censored_weights[GROUP_1_rc],
             show_probability_plot=False,
             print_results=False,
         )
         group_2_estimates = Fit_Weibull_2P(
-            failures=GROUP_2_failures,
-            right_censored=GROUP_2_right_cens,
+            failures=failures[~GROUP_1_f],
+            right_censored=right_censored[~GROUP_1_rc],
+            failure_weights=failure_weights[~GROUP_1_f],
+            right_censored_weights=right_censored_weights[~GROUP_1_rc],
             show_probability_plot=False,
             print_results=False,
         )
@@ -4249,6 +4953,8 @@ class Fit_Weibull_CR:
             initial_guess=guess,
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
         )
         self.alpha_1 = MLE_results.alpha_1
@@ -4262,7 +4968,9 @@ class Fit_Weibull_CR:
 
         params = [self.alpha_1, self.beta_1, self.alpha_2, self.beta_2]
         k = 4
-        LL2 = 2 * Fit_Weibull_CR.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Weibull_CR.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -4273,10 +4981,12 @@ class Fit_Weibull_CR:
 
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
-        hessian_matrix = hessian(Fit_Weibull_CR.LL)(
+        hessian_matrix = LL_hessian("Weibull_CR", Fit_Weibull_CR.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -4351,9 +5061,11 @@ class Fit_Weibull_CR:
             ],
         )
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -4367,7 +5079,7 @@ class Fit_Weibull_CR:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -4380,7 +5092,11 @@ class Fit_Weibull_CR:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -4397,6 +5113,8 @@ class Fit_Weibull_CR:
             Weibull_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_fitted_distribution=False,
                 downsample_scatterplot=downsample_scatterplot,
                 **kwargs,
@@ -4436,15 +5154,15 @@ class Fit_Weibull_CR:
         return -((t / a1) ** b1) - ((t / a2) ** b2)
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # Log Likelihood function (Competing Risks)
         LL_f = Fit_Weibull_CR.logf(
             T_f, params[0], params[1], params[2], params[3]
-        ).sum()
+        )
         LL_rc = Fit_Weibull_CR.logR(
             T_rc, params[0], params[1], params[2], params[3]
-        ).sum()
-        return -(LL_f + LL_rc)
+        )
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Weibull_DSZI:
@@ -4454,9 +5172,11 @@ class Fit_Weibull_DSZI:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         An array or list of the failure data. There must be at least 2 non-zero
         failures.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -4484,6 +5204,15 @@ class Fit_Weibull_DSZI:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -4561,39 +5290,79 @@ class Fit_Weibull_DSZI:
         CI=0.95,
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs,
     ):
         # need to remove zeros before passing to fitters input checking
+        if isinstance(failures, prepared_data):
+            if (
+                right_censored is not None
+                or failure_weights is not None
+                or right_censored_weights is not None
+            ):
+                raise ValueError(
+                    "right_censored, failure_weights, and right_censored_weights must not be specified when failures is a prepared_data object"
+                )
+            right_censored = failures.right_censored
+            failure_weights = failures.failure_weights
+            right_censored_weights = failures.right_censored_weights
+            failures = failures.failures
         failures = np.asarray(failures)
+        if failure_weights is None:
+            failure_weights = np.ones_like(failures, dtype=float)
+        elif type(failure_weights) not in [list, np.ndarray] or len(
+            failure_weights
+        ) != len(failures):
+            raise ValueError(
+                "failure_weights must be a list or array of the same length as failures"
+            )
+        failure_weights = np.asarray(failure_weights, dtype=float)
+        zeros = (failures == 0) & (failure_weights > 0)
         failures_no_zeros = failures[failures != 0]
-        failures_zeros = failures[failures == 0]
+        failures_zeros = failures[zeros]
+        failure_weights_zeros = failure_weights[zeros]
 
         inputs = fitters_input_checking(
             dist="Weibull_DSZI",
             failures=failures_no_zeros,
             right_censored=right_censored,
+            failure_weights=failure_weights[failures != 0],
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
             CI=CI,
         )
         failures_no_zeros = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights_no_zeros = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
+        failures = np.hstack([failures_zeros, failures_no_zeros])
+        failure_weights = np.hstack([failure_weights_zeros, failure_weights_no_zeros])
         CI = inputs.CI
         optimizer = inputs.optimizer
 
         # obtain initial estimates of the parameters
-        _, y_pts = plotting_positions(failures=failures, right_censored=right_censored)
+        _, y_pts = plotting_positions(
+            failures=failures,
+            right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
+        )
         DS_guess = max(y_pts)
 
         weibull_2P_fit = Fit_Weibull_2P(
             failures=failures_no_zeros,
             right_censored=None,
+            failure_weights=failure_weights_no_zeros,
             print_results=False,
             show_probability_plot=False,
             optimizer=optimizer,
         )
         alpha_guess = weibull_2P_fit.alpha
         beta_guess = weibull_2P_fit.beta
-        ZI_guess = len(failures_zeros) / (len(failures) + len(right_censored))
+        ZI_guess = np.sum(failure_weights_zeros) / (
+            np.sum(failure_weights) + np.sum(right_censored_weights)
+        )
 
         # maximum likelihood method
         MLE_results = MLE_optimization(
@@ -4602,6 +5371,8 @@ class Fit_Weibull_DSZI:
             initial_guess=[alpha_guess, beta_guess, DS_guess, ZI_guess],
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
         )
         self.alpha = MLE_results.alpha
@@ -4614,11 +5385,14 @@ class Fit_Weibull_DSZI:
         # confidence interval estimates of parameters. This uses the Fisher Matrix so it can be applied to both MLE and LS estimates.
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta, self.DS, self.ZI]
-        hessian_matrix = hessian(Fit_Weibull_DSZI.LL)(
+        hessian_matrix = LL_hessian("Weibull_DSZI", Fit_Weibull_DSZI.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures_zeros)),
             np.array(tuple(failures_no_zeros)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights_zeros)),
+            np.array(tuple(failure_weights_no_zeros)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -4706,10 +5480,16 @@ class Fit_Weibull_DSZI:
         )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 4
         LL2 = 2 * Fit_Weibull_DSZI.LL(
-            params, failures_zeros, failures_no_zeros, right_censored
+            params,
+            failures_zeros,
+            failures_no_zeros,
+            right_censored,
+            failure_weights_zeros,
+            failure_weights_no_zeros,
+            right_censored_weights,
         )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
@@ -4719,11 +5499,18 @@ class Fit_Weibull_DSZI:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        x, y = plotting_positions(
+            failures=failures,
+            right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
+        )
         # moves all the y values for the x=0 points to be equal to the value of ZI.
         y = np.where(x == 0, self.ZI, y)
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -4737,7 +5524,7 @@ class Fit_Weibull_DSZI:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -4750,7 +5537,11 @@ class Fit_Weibull_DSZI:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -4770,6 +5561,8 @@ class Fit_Weibull_DSZI:
             Weibull_probability_plot(
                 failures=failures_no_zeros,
                 right_censored=rc,
+                failure_weights=failure_weights_no_zeros,
+                right_censored_weights=right_censored_weights,
                 show_fitted_distribution=False,
                 show_scatter_points=False,
                 **kwargs,
@@ -4793,6 +5586,8 @@ class Fit_Weibull_DSZI:
             plot_points(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 downsample_scatterplot=downsample_scatterplot,
                 **kwargs,
             )
@@ -4820,19 +5615,20 @@ class Fit_Weibull_DSZI:
         return anp.log(1 - ((1 - anp.exp(-((t / a) ** b))) * (ds - zi) + zi))
 
     @staticmethod
-    def LL(params, T_0, T_f, T_rc):
+    def LL(params, T_0, T_f, T_rc, W_0=1, W_f=1, W_rc=1):
         # log likelihood function (Weibull DSZI)
         if params[3] > 0:
-            LL_0 = anp.log(params[3]) * len(T_0)  # deals with t=0
+            # deals with t=0
+            LL_0 = anp.log(params[3]) * anp.sum(W_0 * anp.ones_like(T_0))
         else:
             LL_0 = 0  # enables fitting when ZI = 0 to avoid log(0) error
         LL_f = Fit_Weibull_DSZI.logf(
             T_f, params[0], params[1], params[2], params[3]
-        ).sum()
+        )
         LL_rc = Fit_Weibull_DSZI.logR(
             T_rc, params[0], params[1], params[2], params[3]
-        ).sum()
-        return -(LL_0 + LL_f + LL_rc)
+        )
+        return -(LL_0 + (W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Weibull_DS:
@@ -4842,8 +5638,10 @@ class Fit_Weibull_DS:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         An array or list of the failure data. There must be at least 2 failures.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -4871,6 +5669,15 @@ class Fit_Weibull_DS:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -4940,6 +5747,8 @@ class Fit_Weibull_DS:
         CI=0.95,
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs,
     ):
 
@@ -4947,21 +5756,31 @@ class Fit_Weibull_DS:
             dist="Weibull_DS",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
             CI=CI,
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         optimizer = inputs.optimizer
 
         # obtain initial estimates of the parameters
-        _, y_pts = plotting_positions(failures=failures, right_censored=right_censored)
+        _, y_pts = plotting_positions(
+            failures=failures,
+            right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
+        )
 
         DS_guess = max(y_pts)
         weibull_2P_fit = Fit_Weibull_2P(
             failures=failures,
             right_censored=None,
+            failure_weights=failure_weights,
             print_results=False,
             show_probability_plot=False,
             optimizer=optimizer,
@@ -4976,6 +5795,8 @@ class Fit_Weibull_DS:
             initial_guess=[alpha_guess, beta_guess, DS_guess],
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
         )
         self.alpha = MLE_results.alpha
@@ -4987,10 +5808,12 @@ class Fit_Weibull_DS:
         # confidence interval estimates of parameters. This uses the Fisher Matrix so it can be applied to both MLE and LS estimates.
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta, self.DS]
-        hessian_matrix = hessian(Fit_Weibull_DS.LL)(
+        hessian_matrix = LL_hessian("Weibull_DS", Fit_Weibull_DS.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -5053,9 +5876,11 @@ class Fit_Weibull_DS:
         )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 3
-        LL2 = 2 * Fit_Weibull_DS.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Weibull_DS.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -5064,9 +5889,11 @@ class Fit_Weibull_DS:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -5080,7 +5907,7 @@ class Fit_Weibull_DS:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -5093,7 +5920,11 @@ class Fit_Weibull_DS:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -5110,6 +5941,8 @@ class Fit_Weibull_DS:
             Weibull_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_fitted_distribution=False,
                 downsample_scatterplot=downsample_scatterplot,
                 **kwargs,
@@ -5144,11 +5977,11 @@ class Fit_Weibull_DS:
         return anp.log(1 - ((1 - anp.exp(-((t / a) ** b))) * ds))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (Weibull DS)
-        LL_f = Fit_Weibull_DS.logf(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Weibull_DS.logR(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_f + LL_rc)
+        LL_f = Fit_Weibull_DS.logf(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Weibull_DS.logR(T_rc, params[0], params[1], params[2])
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Weibull_ZI:
@@ -5158,9 +5991,11 @@ class Fit_Weibull_ZI:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         An array or list of the failure data. There must be at least 2 non-zero
         failures.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -5188,6 +6023,15 @@ class Fit_Weibull_ZI:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -5257,23 +6101,55 @@ class Fit_Weibull_ZI:
         CI=0.95,
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs,
     ):
 
         # need to remove zeros before passing to fitters input checking
+        if isinstance(failures, prepared_data):
+            if (
+                right_censored is not None
+                or failure_weights is not None
+                or right_censored_weights is not None
+            ):
+                raise ValueError(
+                    "right_censored, failure_weights, and right_censored_weights must not be specified when failures is a prepared_data object"
+                )
+            right_censored = failures.right_censored
+            failure_weights = failures.failure_weights
+            right_censored_weights = failures.right_censored_weights
+            failures = failures.failures
         failures = np.asarray(failures)
+        if failure_weights is None:
+            failure_weights = np.ones_like(failures, dtype=float)
+        elif type(failure_weights) not in [list, np.ndarray] or len(
+            failure_weights
+        ) != len(failures):
+            raise ValueError(
+                "failure_weights must be a list or array of the same length as failures"
+            )
+        failure_weights = np.asarray(failure_weights, dtype=float)
+        zeros = (failures == 0) & (failure_weights > 0)
         failures_no_zeros = failures[failures != 0]
-        failures_zeros = failures[failures == 0]
+        failures_zeros = failures[zeros]
+        failure_weights_zeros = failure_weights[zeros]
 
         inputs = fitters_input_checking(
             dist="Weibull_ZI",
             failures=failures_no_zeros,
             right_censored=right_censored,
+            failure_weights=failure_weights[failures != 0],
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
             CI=CI,
         )
         failures_no_zeros = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights_no_zeros = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
+        failures = np.hstack([failures_zeros, failures_no_zeros])
+        failure_weights = np.hstack([failure_weights_zeros, failure_weights_no_zeros])
         CI = inputs.CI
         optimizer = inputs.optimizer
 
@@ -5281,6 +6157,8 @@ class Fit_Weibull_ZI:
         weibull_2P_fit = Fit_Weibull_2P(
             failures=failures_no_zeros,
             right_censored=right_censored,
+            failure_weights=failure_weights_no_zeros,
+            right_censored_weights=right_censored_weights,
             print_results=False,
             show_probability_plot=False,
             optimizer=optimizer,
@@ -5288,7 +6166,9 @@ class Fit_Weibull_ZI:
         )
         alpha_guess = weibull_2P_fit.alpha
         beta_guess = weibull_2P_fit.beta
-        ZI_guess = len(failures_zeros) / (len(failures) + len(right_censored))
+        ZI_guess = np.sum(failure_weights_zeros) / (
+            np.sum(failure_weights) + np.sum(right_censored_weights)
+        )
 
         # maximum likelihood method
         MLE_results = MLE_optimization(
@@ -5297,6 +6177,8 @@ class Fit_Weibull_ZI:
             initial_guess=[alpha_guess, beta_guess, ZI_guess],
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             optimizer=optimizer,
         )
         self.alpha = MLE_results.alpha
@@ -5308,11 +6190,14 @@ class Fit_Weibull_ZI:
         # confidence interval estimates of parameters. This uses the Fisher Matrix so it can be applied to both MLE and LS estimates.
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta, self.ZI]
-        hessian_matrix = hessian(Fit_Weibull_ZI.LL)(
+        hessian_matrix = LL_hessian("Weibull_ZI", Fit_Weibull_ZI.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures_zeros)),
             np.array(tuple(failures_no_zeros)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights_zeros)),
+            np.array(tuple(failure_weights_no_zeros)),
+            np.array(tuple(right_censored_weights)),
         )
 
         try:
@@ -5376,10 +6261,16 @@ class Fit_Weibull_ZI:
         )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 3
         LL2 = 2 * Fit_Weibull_ZI.LL(
-            params, failures_zeros, failures_no_zeros, right_censored
+            params,
+            failures_zeros,
+            failures_no_zeros,
+            right_censored,
+            failure_weights_zeros,
+            failure_weights_no_zeros,
+            right_censored_weights,
         )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
@@ -5389,11 +6280,18 @@ class Fit_Weibull_ZI:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        x, y = plotting_positions(
+            failures=failures,
+            right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
+        )
         # moves all the y values for the x=0 points to be equal to the value of ZI.
         y = np.where(x == 0, self.ZI, y)
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -5407,7 +6305,7 @@ class Fit_Weibull_ZI:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -5420,7 +6318,11 @@ class Fit_Weibull_ZI:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -5440,6 +6342,8 @@ class Fit_Weibull_ZI:
             Weibull_probability_plot(
                 failures=failures_no_zeros,
                 right_censored=rc,
+                failure_weights=failure_weights_no_zeros,
+                right_censored_weights=right_censored_weights,
                 show_fitted_distribution=False,
                 show_scatter_points=False,
                 **kwargs,
@@ -5460,6 +6364,8 @@ class Fit_Weibull_ZI:
             plot_points(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 downsample_scatterplot=downsample_scatterplot,
                 **kwargs,
             )
@@ -5484,15 +6390,16 @@ class Fit_Weibull_ZI:
         return anp.log(1 - ((1 - anp.exp(-((t / a) ** b))) * (1 - zi) + zi))
 
     @staticmethod
-    def LL(params, T_0, T_f, T_rc):
+    def LL(params, T_0, T_f, T_rc, W_0=1, W_f=1, W_rc=1):
         # log likelihood function (Weibull ZI)
         if params[2] > 0:
-            LL_0 = anp.log(params[2]) * len(T_0)  # deals with t=0
+            # deals with t=0
+            LL_0 = anp.log(params[2]) * anp.sum(W_0 * anp.ones_like(T_0))
         else:
             LL_0 = 0  # enables fitting when ZI = 0 to avoid log(0) error
-        LL_f = Fit_Weibull_ZI.logf(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Weibull_ZI.logR(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_0 + LL_f + LL_rc)
+        LL_f = Fit_Weibull_ZI.logf(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Weibull_ZI.logR(T_rc, params[0], params[1], params[2])
+        return -(LL_0 + (W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Exponential_1P:
@@ -5501,8 +6408,10 @@ class Fit_Exponential_1P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 1 element.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -5543,6 +6452,15 @@ class Fit_Exponential_1P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -5617,6 +6535,9 @@ class Fit_Exponential_1P:
         method="MLE",
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -5624,6 +6545,8 @@ class Fit_Exponential_1P:
             dist="Exponential_1P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -5631,51 +6554,74 @@ class Fit_Exponential_1P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
         quantiles = inputs.quantiles
         self.gamma = 0
 
-        # Obtain least squares estimates
-        if method == "MLE":
-            LS_method = "LS"
-        else:
-            LS_method = method
-        LS_results = LS_optimization(
-            func_name="Exponential_1P",
-            LL_func=Fit_Exponential_1P.LL,
-            failures=failures,
-            right_censored=right_censored,
-            method=LS_method,
-        )
-
-        # least squares method
-        if method in ["LS", "RRX", "RRY"]:
-            self.Lambda = LS_results.guess[0]
-            self.method = str("Least Squares Estimation (" + LS_results.method + ")")
-            self.optimizer = None
-        # maximum likelihood method
-        elif method == "MLE":
-            MLE_results = MLE_optimization(
+        # the MLE has a closed form for some datasets so the least squares
+        # estimates are not needed
+        if method == "MLE" and optimizer is None:
+            closed_form_params = closed_form_MLE(
                 func_name="Exponential_1P",
-                LL_func=Fit_Exponential_1P.LL,
-                initial_guess=[LS_results.guess[0]],
                 failures=failures,
                 right_censored=right_censored,
-                optimizer=optimizer,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
             )
-            self.Lambda = MLE_results.scale
+        else:
+            closed_form_params = None
+        if closed_form_params is not None:
+            self.Lambda = closed_form_params[0]
             self.method = "Maximum Likelihood Estimation (MLE)"
-            self.optimizer = MLE_results.optimizer
+            self.optimizer = "closed form"
+        else:
+            # Obtain least squares estimates
+            if method == "MLE":
+                LS_method = "LS"
+            else:
+                LS_method = method
+            LS_results = inputs.prepared.LS_results(
+                func_name="Exponential_1P",
+                LL_func=Fit_Exponential_1P.LL,
+                method=LS_method,
+            )
+
+            # least squares method
+            if method in ["LS", "RRX", "RRY"]:
+                self.Lambda = LS_results.guess[0]
+                self.method = str(
+                    "Least Squares Estimation (" + LS_results.method + ")"
+                )
+                self.optimizer = None
+            # maximum likelihood method
+            elif method == "MLE":
+                MLE_results = MLE_optimization(
+                    func_name="Exponential_1P",
+                    LL_func=Fit_Exponential_1P.LL,
+                    initial_guess=[LS_results.guess[0]],
+                    failures=failures,
+                    right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
+                    optimizer=optimizer,
+                )
+                self.Lambda = MLE_results.scale
+                self.method = "Maximum Likelihood Estimation (MLE)"
+                self.optimizer = MLE_results.optimizer
 
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.Lambda]
-        hessian_matrix = hessian(Fit_Exponential_1P.LL)(
+        hessian_matrix = LL_hessian("Exponential_1P", Fit_Exponential_1P.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -5712,23 +6658,6 @@ class Fit_Exponential_1P:
             self.Lambda_lower_inv = 1 / self.Lambda
             self.Lambda_upper_inv = 1 / self.Lambda
 
-        results_data = {
-            "Parameter": ["Lambda", "1/Lambda"],
-            "Point Estimate": [self.Lambda, self.Lambda_inv],
-            "Standard Error": [self.Lambda_SE, self.Lambda_SE_inv],
-            "Lower CI": [self.Lambda_lower, self.Lambda_lower_inv],
-            "Upper CI": [self.Lambda_upper, self.Lambda_upper_inv],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Exponential_Distribution(
             Lambda=self.Lambda, Lambda_SE=self.Lambda_SE, CI=CI
         )
@@ -5759,9 +6688,11 @@ class Fit_Exponential_1P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 1
-        LL2 = 2 * Fit_Exponential_1P.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Exponential_1P.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -5770,25 +6701,48 @@ class Fit_Exponential_1P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
-        self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
-        )
-        GoF_data = {
-            "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
-            "Value": [self.loglik, self.AICc, self.BIC, self.AD],
-        }
-        self.goodness_of_fit = pd.DataFrame(
-            GoF_data, columns=["Goodness of fit", "Value"]
-        )
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
 
-        if print_results is True:
-            CI_rounded = CI * 100
-            if CI_rounded % 1 == 0:
-                CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
-            if frac_censored % 1 < 1e-10:
-                frac_censored = int(frac_censored)
+        results_data = {
+            "Parameter": ["Lambda", "1/Lambda"],
+            "Point Estimate": [self.Lambda, self.Lambda_inv],
+            "Standard Error": [self.Lambda_SE, self.Lambda_SE_inv],
+            "Lower CI": [self.Lambda_lower, self.Lambda_lower_inv],
+            "Upper CI": [self.Lambda_upper, self.Lambda_upper_inv],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
+        self.AD = anderson_darling(
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
+        )
+        GoF_data = {
+            "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
+            "Value": [self.loglik, self.AICc, self.BIC, self.AD],
+        }
+        self.goodness_of_fit = pd.DataFrame(
+            GoF_data, columns=["Goodness of fit", "Value"]
+        )
+
+        if print_results is True:
+            CI_rounded = CI * 100
+            if CI_rounded % 1 == 0:
+                CI_rounded = int(CI * 100)
+            frac_censored = np.sum(right_censored_weights) / n * 100
+            if frac_censored % 1 < 1e-10:
+                frac_censored = int(frac_censored)
             colorprint(
                 str("Results from Fit_Exponential_1P (" + str(CI_rounded) + "% CI):"),
                 bold=True,
@@ -5799,7 +6753,11 @@ class Fit_Exponential_1P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -5844,10 +6802,10 @@ class Fit_Exponential_1P:
         return -(L * t)
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (1 parameter Expon)
-        LL_f = Fit_Exponential_1P.logf(T_f, params[0]).sum()
-        LL_rc = Fit_Exponential_1P.logR(T_rc, params[0]).sum()
+        LL_f = (W_f * Fit_Exponential_1P.logf(T_f, params[0])).sum()
+        LL_rc = (W_rc * Fit_Exponential_1P.logR(T_rc, params[0])).sum()
         return -(LL_f + LL_rc)
 
 
@@ -5858,8 +6816,10 @@ class Fit_Exponential_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 1 element.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -5900,6 +6860,15 @@ class Fit_Exponential_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -5982,6 +6951,9 @@ class Fit_Exponential_2P:
         method="MLE",
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
         # To obtain the confidence intervals of the parameters, the gamma parameter is estimated by optimizing the log-likelihood function but
@@ -5994,6 +6966,8 @@ class Fit_Exponential_2P:
             dist="Exponential_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             CI=CI,
             quantiles=quantiles,
             method=method,
@@ -6001,66 +6975,92 @@ class Fit_Exponential_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         quantiles = inputs.quantiles
         method = inputs.method
         optimizer = inputs.optimizer
 
-        # Obtain least squares estimates
-        if method == "MLE":
-            LS_method = "LS"
+        # the MLE has a closed form for some datasets so the least squares
+        # estimates are not needed
+        if method == "MLE" and optimizer is None:
+            closed_form_params = closed_form_MLE(
+                func_name="Exponential_2P",
+                failures=failures,
+                right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+            )
         else:
-            LS_method = method
-        LS_results = LS_optimization(
-            func_name="Exponential_2P",
-            LL_func=Fit_Exponential_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
-            method=LS_method,
-        )
-
-        # least squares method
-        if method in ["LS", "RRX", "RRY"]:
-            self.Lambda = LS_results.guess[0]
-            self.gamma = LS_results.guess[1]
-            self.method = str("Least Squares Estimation (" + LS_results.method + ")")
-            self.optimizer = None
-        # maximum likelihood method
-        elif method == "MLE":
-            if (
-                LS_results.guess[0] < 1
-            ):  # The reason for having an inverted and non-inverted cases is due to the gradient being too shallow in some cases. If Lambda<1 we invert it so it's bigger. This prevents the gradient getting too shallow for the optimizer to find the correct minimum.
-                MLE_results = MLE_optimization(
-                    func_name="Exponential_2P",
-                    LL_func=Fit_Exponential_2P.LL_inv,
-                    initial_guess=[1 / LS_results.guess[0], LS_results.guess[1]],
-                    failures=failures,
-                    right_censored=right_censored,
-                    optimizer=optimizer,
-                )
-                self.Lambda = 1 / MLE_results.scale
+            closed_form_params = None
+        if closed_form_params is not None:
+            self.Lambda = closed_form_params[0]
+            self.gamma = closed_form_params[1]
+            self.method = "Maximum Likelihood Estimation (MLE)"
+            self.optimizer = "closed form"
+        else:
+            # Obtain least squares estimates
+            if method == "MLE":
+                LS_method = "LS"
             else:
-                MLE_results = MLE_optimization(
-                    func_name="Exponential_2P",
-                    LL_func=Fit_Exponential_2P.LL,
-                    initial_guess=[LS_results.guess[0], LS_results.guess[1]],
-                    failures=failures,
-                    right_censored=right_censored,
-                    optimizer=optimizer,
+                LS_method = method
+            LS_results = inputs.prepared.LS_results(
+                func_name="Exponential_2P",
+                LL_func=Fit_Exponential_2P.LL,
+                method=LS_method,
+            )
+
+            # least squares method
+            if method in ["LS", "RRX", "RRY"]:
+                self.Lambda = LS_results.guess[0]
+                self.gamma = LS_results.guess[1]
+                self.method = str(
+                    "Least Squares Estimation (" + LS_results.method + ")"
                 )
-                self.Lambda = MLE_results.scale
-            self.gamma = MLE_results.gamma
-            self.method = "Maximum Likelihood Estimation (MLE)"
-            self.optimizer = MLE_results.optimizer
+                self.optimizer = None
+            # maximum likelihood method
+            elif method == "MLE":
+                if (
+                    LS_results.guess[0] < 1
+                ):  # The reason for having an inverted and non-inverted cases is due to the gradient being too shallow in some cases. If Lambda<1 we invert it so it's bigger. This prevents the gradient getting too shallow for the optimizer to find the correct minimum.
+                    MLE_results = MLE_optimization(
+                        func_name="Exponential_2P",
+                        LL_func=Fit_Exponential_2P.LL_inv,
+                        initial_guess=[1 / LS_results.guess[0], LS_results.guess[1]],
+                        failures=failures,
+                        right_censored=right_censored,
+                        failure_weights=failure_weights,
+                        right_censored_weights=right_censored_weights,
+                        optimizer=optimizer,
+                    )
+                    self.Lambda = 1 / MLE_results.scale
+                else:
+                    MLE_results = MLE_optimization(
+                        func_name="Exponential_2P",
+                        LL_func=Fit_Exponential_2P.LL,
+                        initial_guess=[LS_results.guess[0], LS_results.guess[1]],
+                        failures=failures,
+                        right_censored=right_censored,
+                        failure_weights=failure_weights,
+                        right_censored_weights=right_censored_weights,
+                        optimizer=optimizer,
+                    )
+                    self.Lambda = MLE_results.scale
+                self.gamma = MLE_results.gamma
+                self.method = "Maximum Likelihood Estimation (MLE)"
+                self.optimizer = MLE_results.optimizer
 
         # confidence interval estimates of parameters. Uses Exponential_1P because gamma (while optimized) cannot be used in the MLE solution as the solution is unbounded. This is why there are no CI limits on gamma.
         Z = -ss.norm.ppf((1 - CI) / 2)
         params_1P = [self.Lambda]
         params_2P = [self.Lambda, self.gamma]
-        hessian_matrix = hessian(Fit_Exponential_1P.LL)(
+        hessian_matrix = LL_hessian("Exponential_1P", Fit_Exponential_1P.LL)(
             np.array(tuple(params_1P)),
             np.array(tuple(failures - self.gamma)),
             np.array(tuple(right_censored - self.gamma)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -6103,24 +7103,6 @@ class Fit_Exponential_2P:
             self.Lambda_lower_inv = 1 / self.Lambda
             self.Lambda_upper_inv = 1 / self.Lambda
 
-        results_data = {
-            "Parameter": ["Lambda", "1/Lambda", "Gamma"],
-            "Point Estimate": [self.Lambda, self.Lambda_inv, self.gamma],
-            "Standard Error": [self.Lambda_SE, self.Lambda_SE_inv, self.gamma_SE],
-            "Lower CI": [self.Lambda_lower, self.Lambda_lower_inv, self.gamma_lower],
-            "Upper CI": [self.Lambda_upper, self.Lambda_upper_inv, self.gamma_upper],
-        }
-
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Exponential_Distribution(
             Lambda=self.Lambda, gamma=self.gamma, Lambda_SE=self.Lambda_SE, CI=CI
         )
@@ -6151,9 +7133,11 @@ class Fit_Exponential_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 2
-        LL2 = 2 * Fit_Exponential_2P.LL(params_2P, failures, right_censored)
+        LL2 = 2 * Fit_Exponential_2P.LL(
+            params_2P, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -6162,9 +7146,33 @@ class Fit_Exponential_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Lambda", "1/Lambda", "Gamma"],
+            "Point Estimate": [self.Lambda, self.Lambda_inv, self.gamma],
+            "Standard Error": [self.Lambda_SE, self.Lambda_SE_inv, self.gamma_SE],
+            "Lower CI": [self.Lambda_lower, self.Lambda_lower_inv, self.gamma_lower],
+            "Upper CI": [self.Lambda_upper, self.Lambda_upper_inv, self.gamma_upper],
+        }
+
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -6178,7 +7186,7 @@ class Fit_Exponential_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -6191,7 +7199,11 @@ class Fit_Exponential_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -6236,18 +7248,18 @@ class Fit_Exponential_2P:
         return -(L * (t - g))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Expon)
-        LL_f = Fit_Exponential_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Exponential_2P.logR(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Exponential_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Exponential_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
     # #this is the inverted forms of the above functions. It simply changes Lambda to be 1/Lambda which is necessary when Lambda<<1
     @staticmethod
-    def LL_inv(params, T_f, T_rc):
+    def LL_inv(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Expon)
-        LL_f = Fit_Exponential_2P.logf(T_f, 1 / params[0], params[1]).sum()
-        LL_rc = Fit_Exponential_2P.logR(T_rc, 1 / params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Exponential_2P.logf(T_f, 1 / params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Exponential_2P.logR(T_rc, 1 / params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
 
@@ -6260,9 +7272,11 @@ class Fit_Normal_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements if force_sigma is not
         specified or at least 1 element if force_sigma is specified.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -6312,6 +7326,15 @@ class Fit_Normal_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -6384,6 +7407,9 @@ class Fit_Normal_2P:
         method="MLE",
         force_sigma=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -6391,6 +7417,8 @@ class Fit_Normal_2P:
             dist="Normal_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -6400,6 +7428,8 @@ class Fit_Normal_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -6407,52 +7437,75 @@ class Fit_Normal_2P:
         force_sigma = inputs.force_sigma
         CI_type = inputs.CI_type
 
-        # Obtain least squares estimates
-        if method == "MLE":
-            LS_method = "LS"
-        else:
-            LS_method = method
-        LS_results = LS_optimization(
-            func_name="Normal_2P",
-            LL_func=Fit_Normal_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
-            method=LS_method,
-            force_shape=force_sigma,
-            LL_func_force=Fit_Normal_2P.LL_fs,
-        )
-
-        # least squares method
-        if method in ["LS", "RRX", "RRY"]:
-            self.mu = LS_results.guess[0]
-            self.sigma = LS_results.guess[1]
-            self.method = str("Least Squares Estimation (" + LS_results.method + ")")
-            self.optimizer = None
-        # maximum likelihood method
-        elif method == "MLE":
-            MLE_results = MLE_optimization(
+        # the MLE has a closed form for some datasets so the least squares
+        # estimates are not needed
+        if method == "MLE" and optimizer is None:
+            closed_form_params = closed_form_MLE(
                 func_name="Normal_2P",
-                LL_func=Fit_Normal_2P.LL,
-                initial_guess=[LS_results.guess[0], LS_results.guess[1]],
                 failures=failures,
                 right_censored=right_censored,
-                optimizer=optimizer,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 force_shape=force_sigma,
-                LL_func_force=Fit_Normal_2P.LL_fs,
             )
-            self.mu = MLE_results.scale
-            self.sigma = MLE_results.shape
+        else:
+            closed_form_params = None
+        if closed_form_params is not None:
+            self.mu = closed_form_params[0]
+            self.sigma = closed_form_params[1]
             self.method = "Maximum Likelihood Estimation (MLE)"
-            self.optimizer = MLE_results.optimizer
+            self.optimizer = "closed form"
+        else:
+            # Obtain least squares estimates
+            if method == "MLE":
+                LS_method = "LS"
+            else:
+                LS_method = method
+            LS_results = inputs.prepared.LS_results(
+                func_name="Normal_2P",
+                LL_func=Fit_Normal_2P.LL,
+                method=LS_method,
+                force_shape=force_sigma,
+                LL_func_force=Fit_Normal_2P.LL_fs,
+            )
+
+            # least squares method
+            if method in ["LS", "RRX", "RRY"]:
+                self.mu = LS_results.guess[0]
+                self.sigma = LS_results.guess[1]
+                self.method = str(
+                    "Least Squares Estimation (" + LS_results.method + ")"
+                )
+                self.optimizer = None
+            # maximum likelihood method
+            elif method == "MLE":
+                MLE_results = MLE_optimization(
+                    func_name="Normal_2P",
+                    LL_func=Fit_Normal_2P.LL,
+                    initial_guess=[LS_results.guess[0], LS_results.guess[1]],
+                    failures=failures,
+                    right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
+                    optimizer=optimizer,
+                    force_shape=force_sigma,
+                    LL_func_force=Fit_Normal_2P.LL_fs,
+                )
+                self.mu = MLE_results.scale
+                self.sigma = MLE_results.shape
+                self.method = "Maximum Likelihood Estimation (MLE)"
+                self.optimizer = MLE_results.optimizer
 
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.mu, self.sigma]
         if force_sigma is None:
-            hessian_matrix = hessian(Fit_Normal_2P.LL)(
+            hessian_matrix = LL_hessian("Normal_2P", Fit_Normal_2P.LL)(
                 np.array(tuple(params)),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -6490,11 +7543,13 @@ class Fit_Normal_2P:
                 self.sigma_lower = self.sigma
 
         else:
-            hessian_matrix = hessian(Fit_Normal_2P.LL_fs)(
+            hessian_matrix = LL_hessian("Normal_2P", Fit_Normal_2P.LL_fs)(
                 np.array(tuple([self.mu])),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
                 np.array(tuple([force_sigma])),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -6527,23 +7582,6 @@ class Fit_Normal_2P:
                 self.sigma_upper = self.sigma
                 self.sigma_lower = self.sigma
 
-        results_data = {
-            "Parameter": ["Mu", "Sigma"],
-            "Point Estimate": [self.mu, self.sigma],
-            "Standard Error": [self.mu_SE, self.sigma_SE],
-            "Lower CI": [self.mu_lower, self.sigma_lower],
-            "Upper CI": [self.mu_upper, self.sigma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Normal_Distribution(
             mu=self.mu,
             sigma=self.sigma,
@@ -6580,10 +7618,16 @@ class Fit_Normal_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         if force_sigma is None:
             k = 2
-            LL2 = 2 * Fit_Normal_2P.LL(params, failures, right_censored)
+            LL2 = 2 * Fit_Normal_2P.LL(
+                params,
+                failures,
+                right_censored,
+                failure_weights,
+                right_censored_weights,
+            )
         else:
             k = 1
             LL2 = 2 * Fit_Normal_2P.LL_fs(
@@ -6597,9 +7641,32 @@ class Fit_Normal_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Mu", "Sigma"],
+            "Point Estimate": [self.mu, self.sigma],
+            "Standard Error": [self.mu_SE, self.sigma_SE],
+            "Lower CI": [self.mu_lower, self.sigma_lower],
+            "Upper CI": [self.mu_upper, self.sigma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -6613,7 +7680,7 @@ class Fit_Normal_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -6626,7 +7693,11 @@ class Fit_Normal_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -6653,6 +7724,8 @@ class Fit_Normal_2P:
             Normal_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -6672,16 +7745,17 @@ class Fit_Normal_2P:
         return anp.log((1 + erf(((mu - t) / sigma) / 2 ** 0.5)) / 2)
 
     @staticmethod
-    def LL(params, T_f, T_rc):  # log likelihood function (2 parameter Normal)
-        LL_f = Fit_Normal_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Normal_2P.logR(T_rc, params[0], params[1]).sum()
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
+        # log likelihood function (2 parameter Normal)
+        LL_f = (W_f * Fit_Normal_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Normal_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
     @staticmethod
-    def LL_fs(params, T_f, T_rc, force_sigma):
+    def LL_fs(params, T_f, T_rc, force_sigma, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Normal) FORCED SIGMA
-        LL_f = Fit_Normal_2P.logf(T_f, params[0], force_sigma).sum()
-        LL_rc = Fit_Normal_2P.logR(T_rc, params[0], force_sigma).sum()
+        LL_f = (W_f * Fit_Normal_2P.logf(T_f, params[0], force_sigma)).sum()
+        LL_rc = (W_rc * Fit_Normal_2P.logR(T_rc, params[0], force_sigma)).sum()
         return -(LL_f + LL_rc)
 
 
@@ -6694,8 +7768,10 @@ class Fit_Gumbel_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -6741,6 +7817,15 @@ class Fit_Gumbel_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle).
@@ -6815,6 +7900,9 @@ class Fit_Gumbel_2P:
         method="MLE",
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -6822,6 +7910,8 @@ class Fit_Gumbel_2P:
             dist="Gumbel_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -6830,6 +7920,8 @@ class Fit_Gumbel_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -6841,11 +7933,9 @@ class Fit_Gumbel_2P:
             LS_method = "LS"
         else:
             LS_method = method
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Gumbel_2P",
             LL_func=Fit_Gumbel_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -6863,6 +7953,8 @@ class Fit_Gumbel_2P:
                 initial_guess=[LS_results.guess[0], LS_results.guess[1]],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.mu = MLE_results.scale
@@ -6873,10 +7965,12 @@ class Fit_Gumbel_2P:
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.mu, self.sigma]
-        hessian_matrix = hessian(Fit_Gumbel_2P.LL)(
+        hessian_matrix = LL_hessian("Gumbel_2P", Fit_Gumbel_2P.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -6909,23 +8003,6 @@ class Fit_Gumbel_2P:
             self.sigma_upper = self.sigma
             self.sigma_lower = self.sigma
 
-        results_data = {
-            "Parameter": ["Mu", "Sigma"],
-            "Point Estimate": [self.mu, self.sigma],
-            "Standard Error": [self.mu_SE, self.sigma_SE],
-            "Lower CI": [self.mu_lower, self.sigma_lower],
-            "Upper CI": [self.mu_upper, self.sigma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Gumbel_Distribution(
             mu=self.mu,
             sigma=self.sigma,
@@ -6962,9 +8039,11 @@ class Fit_Gumbel_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 2
-        LL2 = 2 * Fit_Gumbel_2P.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Gumbel_2P.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -6973,9 +8052,32 @@ class Fit_Gumbel_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Mu", "Sigma"],
+            "Point Estimate": [self.mu, self.sigma],
+            "Standard Error": [self.mu_SE, self.sigma_SE],
+            "Lower CI": [self.mu_lower, self.sigma_lower],
+            "Upper CI": [self.mu_upper, self.sigma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -6989,7 +8091,7 @@ class Fit_Gumbel_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -7002,7 +8104,11 @@ class Fit_Gumbel_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -7029,6 +8135,8 @@ class Fit_Gumbel_2P:
             Gumbel_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -7046,10 +8154,10 @@ class Fit_Gumbel_2P:
         return -anp.exp((t - mu) / sigma)
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Gumbel)
-        LL_f = Fit_Gumbel_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Gumbel_2P.logR(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Gumbel_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Gumbel_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
 
@@ -7059,9 +8167,11 @@ class Fit_Lognormal_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements if force_sigma is not
         specified or at least 1 element if force_sigma is specified.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -7111,6 +8221,20 @@ class Fit_Lognormal_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
+    initial_guess : list, array, optional
+        The initial guess of [mu, sigma] for the MLE, such as the parameters
+        from a previous fit. If specified, the least squares estimates are not
+        calculated and the MLE is warm started from this guess. Only used if
+        method is 'MLE'. Default is None.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle).
@@ -7168,6 +8292,10 @@ class Fit_Lognormal_2P:
     may be caused by the chosen distribution being a very poor fit to the data
     or the data being heavily censored. If a warning is printed, consider trying
     a different optimizer.
+
+    To refit with additional data use the update method (e.g.
+    fit.update(failures=new_failures)). This warm starts the MLE from the
+    parameters of this fit so it is much faster than fitting from scratch.
     """
 
     def __init__(
@@ -7183,6 +8311,10 @@ class Fit_Lognormal_2P:
         method="MLE",
         force_sigma=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        initial_guess=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -7190,6 +8322,8 @@ class Fit_Lognormal_2P:
             dist="Lognormal_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -7199,6 +8333,8 @@ class Fit_Lognormal_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -7206,53 +8342,100 @@ class Fit_Lognormal_2P:
         force_sigma = inputs.force_sigma
         CI_type = inputs.CI_type
         self.gamma = 0
-
-        # Obtain least squares estimates
-        if method == "MLE":
-            LS_method = "LS"
-        else:
-            LS_method = method
-        LS_results = LS_optimization(
-            func_name="Lognormal_2P",
-            LL_func=Fit_Lognormal_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
-            method=LS_method,
-            force_shape=force_sigma,
-            LL_func_force=Fit_Lognormal_2P.LL_fs,
+        if initial_guess is not None and (
+            type(initial_guess) not in [list, tuple, np.ndarray]
+            or len(initial_guess) != 2
+        ):
+            raise ValueError("initial_guess must be a list or array of [mu, sigma].")
+        self.failures = failures
+        self.right_censored = right_censored
+        self.failure_weights = failure_weights
+        self.right_censored_weights = right_censored_weights
+        # these are kept so that update can refit with the same options
+        self.__fit_options = dict(
+            CI=CI,
+            quantiles=quantiles,
+            CI_type=CI_type,
+            method=method,
+            optimizer=optimizer,
+            force_sigma=force_sigma,
+            downsample_scatterplot=downsample_scatterplot,
         )
 
-        # least squares method
-        if method in ["LS", "RRX", "RRY"]:
-            self.mu = LS_results.guess[0]
-            self.sigma = LS_results.guess[1]
-            self.method = str("Least Squares Estimation (" + LS_results.method + ")")
-            self.optimizer = None
-        # maximum likelihood method
-        elif method == "MLE":
-            MLE_results = MLE_optimization(
+        # the MLE has a closed form for some datasets so the least squares
+        # estimates are not needed
+        if method == "MLE" and optimizer is None:
+            closed_form_params = closed_form_MLE(
                 func_name="Lognormal_2P",
-                LL_func=Fit_Lognormal_2P.LL,
-                initial_guess=[LS_results.guess[0], LS_results.guess[1]],
                 failures=failures,
                 right_censored=right_censored,
-                optimizer=optimizer,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 force_shape=force_sigma,
-                LL_func_force=Fit_Lognormal_2P.LL_fs,
             )
-            self.mu = MLE_results.scale
-            self.sigma = MLE_results.shape
+        else:
+            closed_form_params = None
+        if closed_form_params is not None:
+            self.mu = closed_form_params[0]
+            self.sigma = closed_form_params[1]
             self.method = "Maximum Likelihood Estimation (MLE)"
-            self.optimizer = MLE_results.optimizer
+            self.optimizer = "closed form"
+        else:
+            # Obtain least squares estimates. These are not needed for a warm start.
+            if method == "MLE" and initial_guess is not None:
+                guess = initial_guess
+            else:
+                if method == "MLE":
+                    LS_method = "LS"
+                else:
+                    LS_method = method
+                LS_results = inputs.prepared.LS_results(
+                    func_name="Lognormal_2P",
+                    LL_func=Fit_Lognormal_2P.LL,
+                    method=LS_method,
+                    force_shape=force_sigma,
+                    LL_func_force=Fit_Lognormal_2P.LL_fs,
+                )
+                guess = LS_results.guess
+
+            # least squares method
+            if method in ["LS", "RRX", "RRY"]:
+                self.mu = guess[0]
+                self.sigma = guess[1]
+                self.method = str(
+                    "Least Squares Estimation (" + LS_results.method + ")"
+                )
+                self.optimizer = None
+            # maximum likelihood method
+            elif method == "MLE":
+                MLE_results = MLE_optimization(
+                    func_name="Lognormal_2P",
+                    LL_func=Fit_Lognormal_2P.LL,
+                    initial_guess=[guess[0], guess[1]],
+                    failures=failures,
+                    right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
+                    optimizer=optimizer,
+                    force_shape=force_sigma,
+                    LL_func_force=Fit_Lognormal_2P.LL_fs,
+                    warm_start=initial_guess is not None,
+                )
+                self.mu = MLE_results.scale
+                self.sigma = MLE_results.shape
+                self.method = "Maximum Likelihood Estimation (MLE)"
+                self.optimizer = MLE_results.optimizer
 
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.mu, self.sigma]
         if force_sigma is None:
-            hessian_matrix = hessian(Fit_Lognormal_2P.LL)(
+            hessian_matrix = LL_hessian("Lognormal_2P", Fit_Lognormal_2P.LL)(
                 np.array(tuple(params)),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -7287,11 +8470,13 @@ class Fit_Lognormal_2P:
                 self.sigma_upper = self.sigma
                 self.sigma_lower = self.sigma
         else:
-            hessian_matrix = hessian(Fit_Lognormal_2P.LL_fs)(
+            hessian_matrix = LL_hessian("Lognormal_2P", Fit_Lognormal_2P.LL_fs)(
                 np.array(tuple([self.mu])),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
                 np.array(tuple([force_sigma])),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -7322,23 +8507,6 @@ class Fit_Lognormal_2P:
                 self.sigma_upper = self.sigma
                 self.sigma_lower = self.sigma
 
-        results_data = {
-            "Parameter": ["Mu", "Sigma"],
-            "Point Estimate": [self.mu, self.sigma],
-            "Standard Error": [self.mu_SE, self.sigma_SE],
-            "Lower CI": [self.mu_lower, self.sigma_lower],
-            "Upper CI": [self.mu_upper, self.sigma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Lognormal_Distribution(
             mu=self.mu,
             sigma=self.sigma,
@@ -7375,10 +8543,16 @@ class Fit_Lognormal_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         if force_sigma is None:
             k = 2
-            LL2 = 2 * Fit_Lognormal_2P.LL(params, failures, right_censored)
+            LL2 = 2 * Fit_Lognormal_2P.LL(
+                params,
+                failures,
+                right_censored,
+                failure_weights,
+                right_censored_weights,
+            )
         else:
             k = 1
             LL2 = 2 * Fit_Lognormal_2P.LL_fs(
@@ -7392,9 +8566,32 @@ class Fit_Lognormal_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Mu", "Sigma"],
+            "Point Estimate": [self.mu, self.sigma],
+            "Standard Error": [self.mu_SE, self.sigma_SE],
+            "Lower CI": [self.mu_lower, self.sigma_lower],
+            "Upper CI": [self.mu_upper, self.sigma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -7408,7 +8605,7 @@ class Fit_Lognormal_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -7421,7 +8618,11 @@ class Fit_Lognormal_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -7448,6 +8649,8 @@ class Fit_Lognormal_2P:
             Lognormal_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -7456,6 +8659,60 @@ class Fit_Lognormal_2P:
             )
             self.probability_plot = plt.gca()
 
+    def update(
+        self,
+        failures=None,
+        right_censored=None,
+        failure_weights=None,
+        right_censored_weights=None,
+        show_probability_plot=False,
+        print_results=False,
+        **kwargs,
+    ):
+        """
+        Fits the Lognormal_2P distribution to the data of this fit combined with
+        new data. The MLE is warm started from the parameters of this fit so
+        only a few iterations are needed when a small amount of data is added.
+
+        Parameters
+        ----------
+        failures : array, list, optional
+            The new failure data. Default = None.
+        right_censored : array, list, optional
+            The new right censored data. Default = None.
+        failure_weights : array, list, optional
+            The number of units at each new failure time. Default is None
+            which gives each new failure a weight of 1.
+        right_censored_weights : array, list, optional
+            The number of units at each new right censored time. Default is
+            None which gives each new right censored value a weight of 1.
+        show_probability_plot : bool, optional
+            True or False. Default = False
+        print_results : bool, optional
+            True or False. Default = False
+        kwargs
+            Plotting keywords that are passed directly to matplotlib for the
+            probability plot (e.g. color, label, linestyle)
+
+        Returns
+        -------
+        fit : object
+            A new Fit_Lognormal_2P object fitted to the combined data. The other
+            options (e.g. CI, method, force_sigma) are the same as this fit.
+            This fit is not modified.
+        """
+        data = _combine_update_data(
+            self, failures, right_censored, failure_weights, right_censored_weights
+        )
+        return Fit_Lognormal_2P(
+            show_probability_plot=show_probability_plot,
+            print_results=print_results,
+            initial_guess=[self.mu, self.sigma],
+            **data,
+            **self.__fit_options,
+            **kwargs,
+        )
+
     @staticmethod
     def logf(t, mu, sigma):  # Log PDF (Lognormal)
         return anp.log(
@@ -7468,17 +8725,17 @@ class Fit_Lognormal_2P:
         return anp.log(0.5 - 0.5 * erf((anp.log(t) - mu) / (sigma * 2 ** 0.5)))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter lognormal)
-        LL_f = Fit_Lognormal_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Lognormal_2P.logR(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Lognormal_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Lognormal_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
     @staticmethod
-    def LL_fs(params, T_f, T_rc, force_sigma):
+    def LL_fs(params, T_f, T_rc, force_sigma, W_f=1, W_rc=1):
         # log likelihood function (2 parameter lognormal) FORCED SIGMA
-        LL_f = Fit_Lognormal_2P.logf(T_f, params[0], force_sigma).sum()
-        LL_rc = Fit_Lognormal_2P.logR(T_rc, params[0], force_sigma).sum()
+        LL_f = (W_f * Fit_Lognormal_2P.logf(T_f, params[0], force_sigma)).sum()
+        LL_rc = (W_rc * Fit_Lognormal_2P.logR(T_rc, params[0], force_sigma)).sum()
         return -(LL_f + LL_rc)
 
 
@@ -7489,8 +8746,10 @@ class Fit_Lognormal_3P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 3 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -7535,6 +8794,15 @@ class Fit_Lognormal_3P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle).
@@ -7618,6 +8886,9 @@ class Fit_Lognormal_3P:
         optimizer=None,
         method="MLE",
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -7625,6 +8896,8 @@ class Fit_Lognormal_3P:
             dist="Lognormal_3P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -7633,6 +8906,8 @@ class Fit_Lognormal_3P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -7644,11 +8919,9 @@ class Fit_Lognormal_3P:
             LS_method = "LS"
         else:
             LS_method = method
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Lognormal_3P",
             LL_func=Fit_Lognormal_3P.LL,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -7671,6 +8944,8 @@ class Fit_Lognormal_3P:
                 ],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.mu = MLE_results.scale
@@ -7685,9 +8960,12 @@ class Fit_Lognormal_3P:
             lognormal_2P_results = Fit_Lognormal_2P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
                 CI=CI,
+                _lean=True,
             )
             self.mu = lognormal_2P_results.mu
             self.sigma = lognormal_2P_results.sigma
@@ -7710,18 +8988,22 @@ class Fit_Lognormal_3P:
             params_2P = [self.mu, self.sigma]
             params_3P = [self.mu, self.sigma, self.gamma]
             # here we need to get mu_SE and sigma_SE from the Lognormal_2P by providing an adjusted dataset (adjusted for gamma)
-            hessian_matrix = hessian(Fit_Lognormal_2P.LL)(
+            hessian_matrix = LL_hessian("Lognormal_2P", Fit_Lognormal_2P.LL)(
                 np.array(tuple(params_2P)),
                 np.array(tuple(failures - self.gamma)),
                 np.array(tuple(right_censored - self.gamma)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
                 # this is to get the gamma_SE. Unfortunately this approach for mu_SE and sigma_SE give SE values that are very large resulting in incorrect CI plots. This is the same method used by Reliasoft
-                hessian_matrix_for_gamma = hessian(Fit_Lognormal_3P.LL)(
+                hessian_matrix_for_gamma = LL_hessian("Lognormal_3P", Fit_Lognormal_3P.LL)(
                     np.array(tuple(params_3P)),
                     np.array(tuple(failures)),
                     np.array(tuple(right_censored)),
+                    np.array(tuple(failure_weights)),
+                    np.array(tuple(right_censored_weights)),
                 )
                 covariance_matrix_for_gamma = np.linalg.inv(hessian_matrix_for_gamma)
                 self.mu_SE = abs(covariance_matrix[0][0]) ** 0.5
@@ -7767,23 +9049,6 @@ class Fit_Lognormal_3P:
                 self.gamma_upper = self.gamma
                 self.gamma_lower = self.gamma
 
-        results_data = {
-            "Parameter": ["Mu", "Sigma", "Gamma"],
-            "Point Estimate": [self.mu, self.sigma, self.gamma],
-            "Standard Error": [self.mu_SE, self.sigma_SE, self.gamma_SE],
-            "Lower CI": [self.mu_lower, self.sigma_lower, self.gamma_lower],
-            "Upper CI": [self.mu_upper, self.sigma_upper, self.gamma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Lognormal_Distribution(
             mu=self.mu,
             sigma=self.sigma,
@@ -7821,9 +9086,11 @@ class Fit_Lognormal_3P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 3
-        LL2 = 2 * Fit_Lognormal_3P.LL(params_3P, failures, right_censored)
+        LL2 = 2 * Fit_Lognormal_3P.LL(
+            params_3P, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -7832,9 +9099,32 @@ class Fit_Lognormal_3P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Mu", "Sigma", "Gamma"],
+            "Point Estimate": [self.mu, self.sigma, self.gamma],
+            "Standard Error": [self.mu_SE, self.sigma_SE, self.gamma_SE],
+            "Lower CI": [self.mu_lower, self.sigma_lower, self.gamma_lower],
+            "Upper CI": [self.mu_upper, self.sigma_upper, self.gamma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -7848,7 +9138,7 @@ class Fit_Lognormal_3P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -7861,7 +9151,11 @@ class Fit_Lognormal_3P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -7888,6 +9182,8 @@ class Fit_Lognormal_3P:
             fig = Lognormal_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -7921,11 +9217,11 @@ class Fit_Lognormal_3P:
         return anp.log(0.5 - 0.5 * erf((anp.log(t - gamma) - mu) / (sigma * 2 ** 0.5)))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (3 parameter Lognormal)
-        LL_f = Fit_Lognormal_3P.logf(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Lognormal_3P.logR(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_f + LL_rc)
+        LL_f = Fit_Lognormal_3P.logf(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Lognormal_3P.logR(T_rc, params[0], params[1], params[2])
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Gamma_2P:
@@ -7934,8 +9230,10 @@ class Fit_Gamma_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -7981,6 +9279,15 @@ class Fit_Gamma_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -8074,6 +9381,9 @@ class Fit_Gamma_2P:
         quantiles=None,
         CI_type="time",
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -8081,6 +9391,8 @@ class Fit_Gamma_2P:
             dist="Gamma_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -8089,6 +9401,8 @@ class Fit_Gamma_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -8097,11 +9411,9 @@ class Fit_Gamma_2P:
         self.gamma = 0
 
         # Obtain least squares estimates
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Gamma_2P",
             LL_func=Fit_Gamma_2P.LL_ab,
-            failures=failures,
-            right_censored=right_censored,
             method="LS",
         )
 
@@ -8120,6 +9432,8 @@ class Fit_Gamma_2P:
                 initial_guess=[LS_results.guess[0], LS_results.guess[1]],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.alpha = MLE_results_ab.scale
@@ -8133,10 +9447,12 @@ class Fit_Gamma_2P:
         # and mu beta (mb) parametrisation
         Z = -ss.norm.ppf((1 - CI) / 2)
         params_ab = [self.alpha, self.beta]
-        hessian_matrix_ab = hessian(Fit_Gamma_2P.LL_ab)(
+        hessian_matrix_ab = LL_hessian("Gamma_2P", Fit_Gamma_2P.LL_ab)(
             np.array(tuple(params_ab)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix_ab = np.linalg.inv(hessian_matrix_ab)
@@ -8149,10 +9465,12 @@ class Fit_Gamma_2P:
             self.beta_lower = self.beta * (np.exp(-Z * (self.beta_SE / self.beta)))
 
             params_mb = [self.mu, self.beta]
-            hessian_matrix_mb = hessian(Fit_Gamma_2P.LL_mb)(
+            hessian_matrix_mb = LL_hessian("Gamma_2P", Fit_Gamma_2P.LL_mb)(
                 np.array(tuple(params_mb)),
                 np.array(tuple(failures)),
                 np.array(tuple(right_censored)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             covariance_matrix_mb = np.linalg.inv(hessian_matrix_mb)
             self.mu_SE = abs(covariance_matrix_mb[0][0]) ** 0.5
@@ -8183,23 +9501,6 @@ class Fit_Gamma_2P:
             self.mu_upper = self.mu
             self.mu_lower = self.mu
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta"],
-            "Point Estimate": [self.alpha, self.beta],
-            "Standard Error": [self.alpha_SE, self.beta_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Gamma_Distribution(
             alpha=self.alpha,
             mu=self.mu,
@@ -8239,9 +9540,11 @@ class Fit_Gamma_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 2
-        LL2 = 2 * Fit_Gamma_2P.LL_ab(params_ab, failures, right_censored)
+        LL2 = 2 * Fit_Gamma_2P.LL_ab(
+            params_ab, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -8250,9 +9553,32 @@ class Fit_Gamma_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta"],
+            "Point Estimate": [self.alpha, self.beta],
+            "Standard Error": [self.alpha_SE, self.beta_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -8266,7 +9592,7 @@ class Fit_Gamma_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -8279,7 +9605,11 @@ class Fit_Gamma_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -8306,6 +9636,8 @@ class Fit_Gamma_2P:
             Gamma_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI_type=CI_type,
                 CI=CI,
@@ -8323,10 +9655,10 @@ class Fit_Gamma_2P:
         return anp.log(gammaincc(b, t / a))
 
     @staticmethod
-    def LL_ab(params, T_f, T_rc):
+    def LL_ab(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Gamma) - alpha, beta parametrisation
-        LL_f = Fit_Gamma_2P.logf_ab(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Gamma_2P.logR_ab(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Gamma_2P.logf_ab(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Gamma_2P.logR_ab(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
     @staticmethod
@@ -8342,10 +9674,10 @@ class Fit_Gamma_2P:
         return anp.log(gammaincc(b, t / anp.exp(m)))
 
     @staticmethod
-    def LL_mb(params, T_f, T_rc):
+    def LL_mb(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Gamma) - mu, beta parametrisation
-        LL_f = Fit_Gamma_2P.logf_mb(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Gamma_2P.logR_mb(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Gamma_2P.logf_mb(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Gamma_2P.logR_mb(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
 
@@ -8356,8 +9688,10 @@ class Fit_Gamma_3P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 3 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -8402,6 +9736,15 @@ class Fit_Gamma_3P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -8508,6 +9851,9 @@ class Fit_Gamma_3P:
         quantiles=None,
         CI_type="time",
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -8515,6 +9861,8 @@ class Fit_Gamma_3P:
             dist="Gamma_3P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -8523,6 +9871,8 @@ class Fit_Gamma_3P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -8534,11 +9884,9 @@ class Fit_Gamma_3P:
             LS_method = "LS"
         else:
             LS_method = method
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Gamma_3P",
             LL_func=Fit_Gamma_3P.LL_abg,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -8562,6 +9910,8 @@ class Fit_Gamma_3P:
                 ],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.alpha = MLE_results_abg.scale
@@ -8577,9 +9927,12 @@ class Fit_Gamma_3P:
             gamma_2P_results = Fit_Gamma_2P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
                 CI=CI,
+                _lean=True,
             )
             self.alpha = gamma_2P_results.alpha
             self.beta = gamma_2P_results.beta
@@ -8607,25 +9960,31 @@ class Fit_Gamma_3P:
             params_2P_mb = [self.mu, self.beta]
             params_3P_abg = [self.alpha, self.beta, self.gamma]
             # here we need to get alpha_SE and beta_SE from the Gamma_2P by providing an adjusted dataset (adjusted for gamma)
-            hessian_matrix_ab = hessian(Fit_Gamma_2P.LL_ab)(
+            hessian_matrix_ab = LL_hessian("Gamma_2P", Fit_Gamma_2P.LL_ab)(
                 np.array(tuple(params_2P_ab)),
                 np.array(tuple(failures - self.gamma)),
                 np.array(tuple(right_censored - self.gamma)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix_ab = np.linalg.inv(hessian_matrix_ab)
-                hessian_matrix_mb = hessian(Fit_Gamma_2P.LL_mb)(
+                hessian_matrix_mb = LL_hessian("Gamma_2P", Fit_Gamma_2P.LL_mb)(
                     np.array(tuple(params_2P_mb)),
                     np.array(tuple(failures - self.gamma)),
                     np.array(tuple(right_censored - self.gamma)),
+                    np.array(tuple(failure_weights)),
+                    np.array(tuple(right_censored_weights)),
                 )
                 covariance_matrix_mb = np.linalg.inv(hessian_matrix_mb)
 
                 # this is to get the gamma_SE. Unfortunately this approach for alpha_SE and beta_SE give SE values that are very large resulting in incorrect CI plots. This is the same method used by Reliasoft
-                hessian_matrix_for_gamma = hessian(Fit_Gamma_3P.LL_abg)(
+                hessian_matrix_for_gamma = LL_hessian("Gamma_3P", Fit_Gamma_3P.LL_abg)(
                     np.array(tuple(params_3P_abg)),
                     np.array(tuple(failures)),
                     np.array(tuple(right_censored)),
+                    np.array(tuple(failure_weights)),
+                    np.array(tuple(right_censored_weights)),
                 )
                 covariance_matrix_for_gamma = np.linalg.inv(hessian_matrix_for_gamma)
 
@@ -8678,23 +10037,6 @@ class Fit_Gamma_3P:
                 self.gamma_upper = self.gamma
                 self.gamma_lower = self.gamma
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta", "Gamma"],
-            "Point Estimate": [self.alpha, self.beta, self.gamma],
-            "Standard Error": [self.alpha_SE, self.beta_SE, self.gamma_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower, self.gamma_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper, self.gamma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Gamma_Distribution(
             alpha=self.alpha,
             beta=self.beta,
@@ -8735,9 +10077,15 @@ class Fit_Gamma_3P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 3
-        LL2 = 2 * Fit_Gamma_3P.LL_abg(params_3P_abg, failures, right_censored)
+        LL2 = 2 * Fit_Gamma_3P.LL_abg(
+            params_3P_abg,
+            failures,
+            right_censored,
+            failure_weights,
+            right_censored_weights,
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -8746,9 +10094,32 @@ class Fit_Gamma_3P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta", "Gamma"],
+            "Point Estimate": [self.alpha, self.beta, self.gamma],
+            "Standard Error": [self.alpha_SE, self.beta_SE, self.gamma_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower, self.gamma_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper, self.gamma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -8762,7 +10133,7 @@ class Fit_Gamma_3P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -8775,7 +10146,11 @@ class Fit_Gamma_3P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -8802,6 +10177,8 @@ class Fit_Gamma_3P:
             fig = Gamma_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -8834,11 +10211,11 @@ class Fit_Gamma_3P:
         return anp.log(gammaincc(b, (t - g) / a))
 
     @staticmethod
-    def LL_abg(params, T_f, T_rc):
+    def LL_abg(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (3 parameter Gamma) - alpha,beta,gamma
-        LL_f = Fit_Gamma_3P.logf_abg(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Gamma_3P.logR_abg(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_f + LL_rc)
+        LL_f = Fit_Gamma_3P.logf_abg(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Gamma_3P.logR_abg(T_rc, params[0], params[1], params[2])
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
     @staticmethod
     def logf_mbg(t, m, b, g):  # Log PDF (3 parameter Gamma) - mu,beta,gamma
@@ -8853,11 +10230,11 @@ class Fit_Gamma_3P:
         return anp.log(gammaincc(b, (t - g) / anp.exp(m)))
 
     @staticmethod
-    def LL_mbg(params, T_f, T_rc):
+    def LL_mbg(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (3 parameter Gamma) - mu,beta,gamma
-        LL_f = Fit_Gamma_3P.logf_mbg(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Gamma_3P.logR_mbg(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_f + LL_rc)
+        LL_f = Fit_Gamma_3P.logf_mbg(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Gamma_3P.logR_mbg(T_rc, params[0], params[1], params[2])
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
 
 
 class Fit_Beta_2P:
@@ -8867,8 +10244,10 @@ class Fit_Beta_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -8908,6 +10287,15 @@ class Fit_Beta_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -8980,6 +10368,9 @@ class Fit_Beta_2P:
         method="MLE",
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -8987,6 +10378,8 @@ class Fit_Beta_2P:
             dist="Beta_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -8994,6 +10387,8 @@ class Fit_Beta_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -9004,11 +10399,9 @@ class Fit_Beta_2P:
             LS_method = "LS"
         else:
             LS_method = method
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Beta_2P",
             LL_func=Fit_Beta_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -9026,6 +10419,8 @@ class Fit_Beta_2P:
                 initial_guess=[LS_results.guess[0], LS_results.guess[1]],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             # for Beta_2P there are actually 2 shape parameters but this just uses the scale and shape nomenclature
@@ -9037,10 +10432,12 @@ class Fit_Beta_2P:
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta]
-        hessian_matrix = hessian(Fit_Beta_2P.LL)(
+        hessian_matrix = LL_hessian("Beta_2P", Fit_Beta_2P.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -9071,23 +10468,6 @@ class Fit_Beta_2P:
             self.beta_upper = self.beta
             self.beta_lower = self.beta
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta"],
-            "Point Estimate": [self.alpha, self.beta],
-            "Standard Error": [self.alpha_SE, self.beta_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Beta_Distribution(
             alpha=self.alpha,
             beta=self.beta,
@@ -9108,9 +10488,11 @@ class Fit_Beta_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 2
-        LL2 = 2 * Fit_Beta_2P.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Beta_2P.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -9119,9 +10501,32 @@ class Fit_Beta_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta"],
+            "Point Estimate": [self.alpha, self.beta],
+            "Standard Error": [self.alpha_SE, self.beta_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -9135,7 +10540,7 @@ class Fit_Beta_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -9148,7 +10553,11 @@ class Fit_Beta_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -9175,6 +10584,8 @@ class Fit_Beta_2P:
             Beta_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 downsample_scatterplot=downsample_scatterplot,
                 **kwargs,
@@ -9190,10 +10601,10 @@ class Fit_Beta_2P:
         return anp.log(1 - betainc(a, b, t))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter beta)
-        LL_f = Fit_Beta_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Beta_2P.logR(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Beta_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Beta_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
 
@@ -9204,8 +10615,10 @@ class Fit_Loglogistic_2P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 2 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -9251,6 +10664,15 @@ class Fit_Loglogistic_2P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -9322,6 +10744,9 @@ class Fit_Loglogistic_2P:
         method="MLE",
         optimizer=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -9329,6 +10754,8 @@ class Fit_Loglogistic_2P:
             dist="Loglogistic_2P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -9337,6 +10764,8 @@ class Fit_Loglogistic_2P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -9349,11 +10778,9 @@ class Fit_Loglogistic_2P:
             LS_method = "LS"
         else:
             LS_method = method
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Loglogistic_2P",
             LL_func=Fit_Loglogistic_2P.LL,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -9371,6 +10798,8 @@ class Fit_Loglogistic_2P:
                 initial_guess=[LS_results.guess[0], LS_results.guess[1]],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.alpha = MLE_results.scale
@@ -9381,10 +10810,12 @@ class Fit_Loglogistic_2P:
         # confidence interval estimates of parameters
         Z = -ss.norm.ppf((1 - CI) / 2)
         params = [self.alpha, self.beta]
-        hessian_matrix = hessian(Fit_Loglogistic_2P.LL)(
+        hessian_matrix = LL_hessian("Loglogistic_2P", Fit_Loglogistic_2P.LL)(
             np.array(tuple(params)),
             np.array(tuple(failures)),
             np.array(tuple(right_censored)),
+            np.array(tuple(failure_weights)),
+            np.array(tuple(right_censored_weights)),
         )
         try:
             covariance_matrix = np.linalg.inv(hessian_matrix)
@@ -9415,23 +10846,6 @@ class Fit_Loglogistic_2P:
             self.beta_upper = self.beta
             self.beta_lower = self.beta
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta"],
-            "Point Estimate": [self.alpha, self.beta],
-            "Standard Error": [self.alpha_SE, self.beta_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Loglogistic_Distribution(
             alpha=self.alpha,
             beta=self.beta,
@@ -9468,9 +10882,11 @@ class Fit_Loglogistic_2P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 2
-        LL2 = 2 * Fit_Loglogistic_2P.LL(params, failures, right_censored)
+        LL2 = 2 * Fit_Loglogistic_2P.LL(
+            params, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -9479,9 +10895,32 @@ class Fit_Loglogistic_2P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta"],
+            "Point Estimate": [self.alpha, self.beta],
+            "Standard Error": [self.alpha_SE, self.beta_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -9495,7 +10934,7 @@ class Fit_Loglogistic_2P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -9508,7 +10947,11 @@ class Fit_Loglogistic_2P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -9535,6 +10978,8 @@ class Fit_Loglogistic_2P:
             Loglogistic_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -9554,10 +10999,10 @@ class Fit_Loglogistic_2P:
         return -anp.log((1 + (t / a) ** b))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (2 parameter Loglogistic)
-        LL_f = Fit_Loglogistic_2P.logf(T_f, params[0], params[1]).sum()
-        LL_rc = Fit_Loglogistic_2P.logR(T_rc, params[0], params[1]).sum()
+        LL_f = (W_f * Fit_Loglogistic_2P.logf(T_f, params[0], params[1])).sum()
+        LL_rc = (W_rc * Fit_Loglogistic_2P.logR(T_rc, params[0], params[1])).sum()
         return -(LL_f + LL_rc)
 
 
@@ -9568,8 +11013,10 @@ class Fit_Loglogistic_3P:
 
     Parameters
     ----------
-    failures : array, list
+    failures : array, list, prepared_data
         The failure data. Must have at least 3 elements.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
     show_probability_plot : bool, optional
@@ -9614,6 +11061,15 @@ class Fit_Loglogistic_3P:
         will be used as the downsample factor. Default is True. This
         functionality makes plotting faster when there are very large numbers of
         points. It only affects the scatterplot not the calculations.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. This
+        allows grouped data to be fitted without repeating each failure time.
+        Must be the same length as failures. Default is None which gives each
+        failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time.
+        Must be the same length as right_censored. Default is None which gives
+        each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         probability plot (e.g. color, label, linestyle)
@@ -9697,6 +11153,9 @@ class Fit_Loglogistic_3P:
         method="MLE",
         quantiles=None,
         downsample_scatterplot=True,
+        failure_weights=None,
+        right_censored_weights=None,
+        _lean=False,
         **kwargs,
     ):
 
@@ -9704,6 +11163,8 @@ class Fit_Loglogistic_3P:
             dist="Loglogistic_3P",
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             method=method,
             optimizer=optimizer,
             CI=CI,
@@ -9712,6 +11173,8 @@ class Fit_Loglogistic_3P:
         )
         failures = inputs.failures
         right_censored = inputs.right_censored
+        failure_weights = inputs.failure_weights
+        right_censored_weights = inputs.right_censored_weights
         CI = inputs.CI
         method = inputs.method
         optimizer = inputs.optimizer
@@ -9723,11 +11186,9 @@ class Fit_Loglogistic_3P:
             LS_method = "LS"
         else:
             LS_method = method
-        LS_results = LS_optimization(
+        LS_results = inputs.prepared.LS_results(
             func_name="Loglogistic_3P",
             LL_func=Fit_Lognormal_3P.LL,
-            failures=failures,
-            right_censored=right_censored,
             method=LS_method,
         )
 
@@ -9750,6 +11211,8 @@ class Fit_Loglogistic_3P:
                 ],
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 optimizer=optimizer,
             )
             self.alpha = MLE_results.scale
@@ -9764,9 +11227,12 @@ class Fit_Loglogistic_3P:
             loglogistic_2P_results = Fit_Loglogistic_2P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
                 CI=CI,
+                _lean=True,
             )
             self.alpha = loglogistic_2P_results.alpha
             self.beta = loglogistic_2P_results.beta
@@ -9788,18 +11254,22 @@ class Fit_Loglogistic_3P:
             params_2P = [self.alpha, self.beta]
             params_3P = [self.alpha, self.beta, self.gamma]
             # here we need to get alpha_SE and beta_SE from the Loglogistic_2P by providing an adjusted dataset (adjusted for gamma)
-            hessian_matrix = hessian(Fit_Loglogistic_2P.LL)(
+            hessian_matrix = LL_hessian("Loglogistic_2P", Fit_Loglogistic_2P.LL)(
                 np.array(tuple(params_2P)),
                 np.array(tuple(failures - self.gamma)),
                 np.array(tuple(right_censored - self.gamma)),
+                np.array(tuple(failure_weights)),
+                np.array(tuple(right_censored_weights)),
             )
             try:
                 covariance_matrix = np.linalg.inv(hessian_matrix)
                 # this is to get the gamma_SE. Unfortunately this approach for alpha_SE and beta_SE give SE values that are very large resulting in incorrect CI plots. This is the same method used by Reliasoft
-                hessian_matrix_for_gamma = hessian(Fit_Loglogistic_3P.LL)(
+                hessian_matrix_for_gamma = LL_hessian("Loglogistic_3P", Fit_Loglogistic_3P.LL)(
                     np.array(tuple(params_3P)),
                     np.array(tuple(failures)),
                     np.array(tuple(right_censored)),
+                    np.array(tuple(failure_weights)),
+                    np.array(tuple(right_censored_weights)),
                 )
                 covariance_matrix_for_gamma = np.linalg.inv(hessian_matrix_for_gamma)
                 self.alpha_SE = abs(covariance_matrix[0][0]) ** 0.5
@@ -9843,23 +11313,6 @@ class Fit_Loglogistic_3P:
                 self.gamma_upper = self.gamma
                 self.gamma_lower = self.gamma
 
-        results_data = {
-            "Parameter": ["Alpha", "Beta", "Gamma"],
-            "Point Estimate": [self.alpha, self.beta, self.gamma],
-            "Standard Error": [self.alpha_SE, self.beta_SE, self.gamma_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower, self.gamma_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper, self.gamma_upper],
-        }
-        self.results = pd.DataFrame(
-            results_data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
         self.distribution = Loglogistic_Distribution(
             alpha=self.alpha,
             beta=self.beta,
@@ -9897,9 +11350,11 @@ class Fit_Loglogistic_3P:
             )
 
         # goodness of fit measures
-        n = len(failures) + len(right_censored)
+        n = np.sum(failure_weights) + np.sum(right_censored_weights)
         k = 3
-        LL2 = 2 * Fit_Loglogistic_3P.LL(params_3P, failures, right_censored)
+        LL2 = 2 * Fit_Loglogistic_3P.LL(
+            params_3P, failures, right_censored, failure_weights, right_censored_weights
+        )
         self.loglik2 = LL2
         self.loglik = LL2 * -0.5
         if n - k - 1 > 0:
@@ -9908,9 +11363,32 @@ class Fit_Loglogistic_3P:
             self.AICc = "Insufficient data"
         self.BIC = np.log(n) * k + LL2
 
-        x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        if _lean is True:
+            return  # Fit_Lean does not need the dataframes, AD, printing, or plot
+
+        results_data = {
+            "Parameter": ["Alpha", "Beta", "Gamma"],
+            "Point Estimate": [self.alpha, self.beta, self.gamma],
+            "Standard Error": [self.alpha_SE, self.beta_SE, self.gamma_SE],
+            "Lower CI": [self.alpha_lower, self.beta_lower, self.gamma_lower],
+            "Upper CI": [self.alpha_upper, self.beta_upper, self.gamma_upper],
+        }
+        self.results = pd.DataFrame(
+            results_data,
+            columns=[
+                "Parameter",
+                "Point Estimate",
+                "Standard Error",
+                "Lower CI",
+                "Upper CI",
+            ],
+        )
+
+        x, y = inputs.prepared.plotting_positions
         self.AD = anderson_darling(
-            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False), empirical_cdf=y
+            fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+            empirical_cdf=y,
+            weights=failure_weights,
         )
         GoF_data = {
             "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
@@ -9924,7 +11402,7 @@ class Fit_Loglogistic_3P:
             CI_rounded = CI * 100
             if CI_rounded % 1 == 0:
                 CI_rounded = int(CI * 100)
-            frac_censored = len(right_censored) / n * 100
+            frac_censored = np.sum(right_censored_weights) / n * 100
             if frac_censored % 1 < 1e-10:
                 frac_censored = int(frac_censored)
             colorprint(
@@ -9937,7 +11415,11 @@ class Fit_Loglogistic_3P:
                 print("Optimizer:", self.optimizer)
             print(
                 "Failures / Right censored:",
-                str(str(len(failures)) + "/" + str(len(right_censored))),
+                str(
+                    round_and_string(np.sum(failure_weights))
+                    + "/"
+                    + round_and_string(np.sum(right_censored_weights))
+                ),
                 str("(" + round_and_string(frac_censored) + "% right censored)"),
                 "\n",
             )
@@ -9964,6 +11446,8 @@ class Fit_Loglogistic_3P:
             fig = Loglogistic_probability_plot(
                 failures=failures,
                 right_censored=rc,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 __fitted_dist_params=self,
                 CI=CI,
                 CI_type=CI_type,
@@ -9998,8 +11482,379 @@ class Fit_Loglogistic_3P:
         return -anp.log((1 + ((t - g) / a) ** b))
 
     @staticmethod
-    def LL(params, T_f, T_rc):
+    def LL(params, T_f, T_rc, W_f=1, W_rc=1):
         # log likelihood function (3 parameter Loglogistic)
-        LL_f = Fit_Loglogistic_3P.logf(T_f, params[0], params[1], params[2]).sum()
-        LL_rc = Fit_Loglogistic_3P.logR(T_rc, params[0], params[1], params[2]).sum()
-        return -(LL_f + LL_rc)
+        LL_f = Fit_Loglogistic_3P.logf(T_f, params[0], params[1], params[2])
+        LL_rc = Fit_Loglogistic_3P.logR(T_rc, params[0], params[1], params[2])
+        return -((W_f * LL_f).sum() + (W_rc * LL_rc).sum())
+
+
+class Fit_Lean:
+    """
+    Fits a parametric distribution to the data provided and returns a compact
+    result record. This is intended for batch jobs that fit many datasets and
+    only need the fitted parameters and the goodness of fit criteria.
+
+    The fitting is done by the corresponding Fit_ function (e.g.
+    Fit_Weibull_2P) which stops once the goodness of fit criteria are found.
+    Nothing is printed or plotted, no dataframes are created and the
+    Anderson-Darling statistic is only calculated when it is first accessed.
+
+    Parameters
+    ----------
+    distribution : str
+        The distribution to fit. Must be one of 'Weibull_2P', 'Weibull_3P',
+        'Exponential_1P', 'Exponential_2P', 'Gamma_2P', 'Gamma_3P',
+        'Lognormal_2P', 'Lognormal_3P', 'Normal_2P', 'Gumbel_2P', 'Beta_2P',
+        'Loglogistic_2P', or 'Loglogistic_3P'.
+    failures : array, list, prepared_data
+        The failure data. The minimum number of failures is the same as for the
+        corresponding Fit_ function.
+        This may also be a Utils.prepared_data object which holds the
+        right_censored data and the weights.
+    right_censored : array, list, optional
+        The right censored data. Optional input. Default = None.
+    method : str, optional
+        The method used to fit the distribution. Must be either 'MLE' (maximum
+        likelihood estimation), 'LS' (least squares estimation), 'RRX' (Rank
+        regression on X), or 'RRY' (Rank regression on Y). LS will perform both
+        RRX and RRY and return the better one. Default is 'MLE'.
+    optimizer : str, optional
+        The optimization algorithm used to find the solution. See the
+        corresponding Fit_ function for details. Default is None.
+    CI : float, optional
+        confidence interval for estimating confidence limits on parameters. Must
+        be between 0 and 1. Default is 0.95 for 95% CI.
+    CI_type : str, None, optional
+        This is the confidence bounds on time or reliability shown on the plot
+        of the distribution object. Use 'none' to turn off the confidence
+        intervals. Must be either 'time', 'reliability', or 'none'. Default is
+        'time'. Ignored for distributions that do not have confidence bounds.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
+
+    Returns
+    -------
+    distribution_name : str
+        The name of the fitted distribution
+    parameter_names : tuple
+        The names of the fitted parameters (e.g. ('alpha', 'beta'))
+    params : array
+        The fitted parameters in the order given by parameter_names
+    SE : array
+        The standard error (sqrt(variance)) of each parameter
+    covariance : array
+        The covariance matrix of the parameters (excluding gamma, the standard
+        error of which is found separately as is done by the Fit_ functions)
+    loglik : float
+        Log Likelihood (as used in Minitab and Reliasoft)
+    loglik2 : float
+        LogLikelihood*-2 (as used in JMP Pro)
+    AICc : float
+        Akaike Information Criterion. This is 'Insufficient data' if there is
+        not enough data to calculate it.
+    BIC : float
+        Bayesian Information Criterion
+    method : str
+        The method used to fit the distribution
+    optimizer : str, None
+        The optimizer used to find the MLE. None for least squares fits.
+    distribution : object
+        a Distribution object with the parameters of the fitted distribution.
+    AD : float
+        the Anderson Darling (corrected) statistic (as reported by Minitab).
+        Calculated on first access.
+    results : dataframe
+        a pandas dataframe of the results (point estimate, standard error, Lower
+        CI and Upper CI for each parameter). Calculated on first access.
+    goodness_of_fit : dataframe
+        a pandas dataframe of the goodness of fit values (Log-likelihood, AICc,
+        BIC, AD). Calculated on first access.
+
+    Notes
+    -----
+    Each parameter is also available as an attribute using its name, as are
+    its standard error and confidence bounds. For example, fit.alpha,
+    fit.alpha_SE, fit.alpha_lower, and fit.alpha_upper.
+
+    Fit_Lean does not support forcing a parameter (such as force_beta). Use the
+    corresponding Fit_ function if this is required.
+
+    Example Usage:
+
+    .. code:: python
+
+        from reliability.Fitters import Fit_Lean
+        fit = Fit_Lean(distribution='Weibull_2P', failures=[10, 12, 35, 48, 51, 88])
+        print(fit.alpha, fit.beta_SE, fit.BIC)
+    """
+
+    __slots__ = (
+        "distribution_name",
+        "parameter_names",
+        "params",
+        "SE",
+        "covariance",
+        "loglik",
+        "loglik2",
+        "AICc",
+        "BIC",
+        "method",
+        "optimizer",
+        "distribution",
+        "CI",
+        "CI_type",
+        "failures",
+        "right_censored",
+        "failure_weights",
+        "right_censored_weights",
+        "_prepared",
+        "_lower",
+        "_upper",
+        "_AD",
+        "_results",
+        "_goodness_of_fit",
+    )
+
+    def __init__(
+        self,
+        distribution=None,
+        failures=None,
+        right_censored=None,
+        method="MLE",
+        optimizer=None,
+        CI=0.95,
+        CI_type="time",
+        failure_weights=None,
+        right_censored_weights=None,
+    ):
+        if distribution not in _lean_fit_specifications:
+            raise ValueError(
+                "distribution must be one of "
+                + str(list(_lean_fit_specifications.keys()))
+                + ". Fit_Lean does not support mixture, competing risks, or defective subpopulation models."
+            )
+        fitter, parameter_names = _lean_fit_specifications[distribution][:2]
+        inputs = fitters_input_checking(
+            dist=distribution,
+            failures=failures,
+            right_censored=right_censored,
+            method=method,
+            optimizer=optimizer,
+            CI=CI,
+            CI_type=CI_type,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
+        )
+        if distribution in ["Exponential_1P", "Exponential_2P", "Beta_2P"]:
+            kwargs = {}  # these fitters do not have the CI_type argument
+        else:
+            kwargs = {"CI_type": inputs.CI_type}
+        # the fitter stops once the goodness of fit criteria are found
+        fit = fitter(
+            failures=inputs.prepared,
+            method=inputs.method,
+            optimizer=inputs.optimizer,
+            CI=inputs.CI,
+            show_probability_plot=False,
+            print_results=False,
+            _lean=True,
+            **kwargs,
+        )
+
+        self.distribution_name = distribution
+        self.parameter_names = parameter_names
+        self.params = np.array([getattr(fit, name) for name in parameter_names])
+        self.SE = np.array([getattr(fit, name + "_SE") for name in parameter_names])
+        self._lower = [getattr(fit, name + "_lower") for name in parameter_names]
+        self._upper = [getattr(fit, name + "_upper") for name in parameter_names]
+        # gamma is excluded from the covariance as its standard error is found separately
+        n_SE = 1 if distribution.startswith("Exponential") else 2
+        self.covariance = np.diag(self.SE[:n_SE] ** 2)
+        if n_SE == 2:
+            covariance = getattr(fit, "Cov_" + "_".join(parameter_names[:2]))
+            self.covariance[0][1] = self.covariance[1][0] = covariance
+        self.loglik = fit.loglik
+        self.loglik2 = fit.loglik2
+        self.AICc = fit.AICc
+        self.BIC = fit.BIC
+        self.method = fit.method
+        self.optimizer = fit.optimizer
+        self.distribution = fit.distribution
+        self.CI = inputs.CI
+        self.CI_type = inputs.CI_type
+        self.failures = inputs.failures
+        self.right_censored = inputs.right_censored
+        self.failure_weights = inputs.failure_weights
+        self.right_censored_weights = inputs.right_censored_weights
+        self._prepared = inputs.prepared
+        self._AD = None
+        self._results = None
+        self._goodness_of_fit = None
+
+    def __getattr__(self, name):
+        # only called if normal attribute lookup fails. Provides access to the parameters by name.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        parameter_names = object.__getattribute__(self, "parameter_names")
+        for suffix, values in [
+            ("", "params"),
+            ("_SE", "SE"),
+            ("_lower", "_lower"),
+            ("_upper", "_upper"),
+        ]:
+            if suffix != "" and not name.endswith(suffix):
+                continue
+            parameter = name[: len(name) - len(suffix)] if suffix else name
+            if parameter in parameter_names:
+                index = parameter_names.index(parameter)
+                return object.__getattribute__(self, values)[index]
+        raise AttributeError(
+            "'Fit_Lean' object has no attribute '" + str(name) + "'"
+        )
+
+    def __repr__(self):
+        return str(
+            "Fit_Lean("
+            + self.distribution_name
+            + ", "
+            + ", ".join(
+                name + "=" + round_and_string(value, dec)
+                for name, value in zip(self.parameter_names, self.params)
+            )
+            + ")"
+        )
+
+    @property
+    def AD(self):
+        if self._AD is None:
+            x, y = self._prepared.plotting_positions
+            self._AD = anderson_darling(
+                fitted_cdf=self.distribution.CDF(xvals=x, show_plot=False),
+                empirical_cdf=y,
+                weights=self.failure_weights,
+            )
+        return self._AD
+
+    @property
+    def results(self):
+        if self._results is None:
+            results_data = {
+                "Parameter": [name.capitalize() for name in self.parameter_names],
+                "Point Estimate": list(self.params),
+                "Standard Error": list(self.SE),
+                "Lower CI": list(self._lower),
+                "Upper CI": list(self._upper),
+            }
+            self._results = pd.DataFrame(
+                results_data,
+                columns=[
+                    "Parameter",
+                    "Point Estimate",
+                    "Standard Error",
+                    "Lower CI",
+                    "Upper CI",
+                ],
+            )
+        return self._results
+
+    @property
+    def goodness_of_fit(self):
+        if self._goodness_of_fit is None:
+            GoF_data = {
+                "Goodness of fit": ["Log-likelihood", "AICc", "BIC", "AD"],
+                "Value": [self.loglik, self.AICc, self.BIC, self.AD],
+            }
+            self._goodness_of_fit = pd.DataFrame(
+                GoF_data, columns=["Goodness of fit", "Value"]
+            )
+        return self._goodness_of_fit
+
+
+# The fitter and the parameter names of each distribution used by Fit_Lean,
+# followed by the LL and the LL used by least squares which are used to score
+# the candidates when Fit_Everything is racing
+_lean_fit_specifications = {
+    "Weibull_2P": (
+        Fit_Weibull_2P,
+        ("alpha", "beta"),
+        Fit_Weibull_2P.LL,
+        Fit_Weibull_2P.LL,
+    ),
+    "Weibull_3P": (
+        Fit_Weibull_3P,
+        ("alpha", "beta", "gamma"),
+        Fit_Weibull_3P.LL,
+        Fit_Weibull_3P.LL,
+    ),
+    "Exponential_1P": (
+        Fit_Exponential_1P,
+        ("Lambda",),
+        Fit_Exponential_1P.LL,
+        Fit_Exponential_1P.LL,
+    ),
+    "Exponential_2P": (
+        Fit_Exponential_2P,
+        ("Lambda", "gamma"),
+        Fit_Exponential_2P.LL,
+        Fit_Exponential_2P.LL,
+    ),
+    "Gamma_2P": (
+        Fit_Gamma_2P,
+        ("alpha", "beta"),
+        Fit_Gamma_2P.LL_ab,
+        Fit_Gamma_2P.LL_ab,
+    ),
+    "Gamma_3P": (
+        Fit_Gamma_3P,
+        ("alpha", "beta", "gamma"),
+        Fit_Gamma_3P.LL_abg,
+        Fit_Gamma_3P.LL_abg,
+    ),
+    "Lognormal_2P": (
+        Fit_Lognormal_2P,
+        ("mu", "sigma"),
+        Fit_Lognormal_2P.LL,
+        Fit_Lognormal_2P.LL,
+    ),
+    "Lognormal_3P": (
+        Fit_Lognormal_3P,
+        ("mu", "sigma", "gamma"),
+        Fit_Lognormal_3P.LL,
+        Fit_Lognormal_3P.LL,
+    ),
+    "Normal_2P": (
+        Fit_Normal_2P,
+        ("mu", "sigma"),
+        Fit_Normal_2P.LL,
+        Fit_Normal_2P.LL,
+    ),
+    "Gumbel_2P": (
+        Fit_Gumbel_2P,
+        ("mu", "sigma"),
+        Fit_Gumbel_2P.LL,
+        Fit_Gumbel_2P.LL,
+    ),
+    "Beta_2P": (
+        Fit_Beta_2P,
+        ("alpha", "beta"),
+        Fit_Beta_2P.LL,
+        Fit_Beta_2P.LL,
+    ),
+    "Loglogistic_2P": (
+        Fit_Loglogistic_2P,
+        ("alpha", "beta"),
+        Fit_Loglogistic_2P.LL,
+        Fit_Loglogistic_2P.LL,
+    ),
+    "Loglogistic_3P": (
+        Fit_Loglogistic_3P,
+        ("alpha", "beta", "gamma"),
+        Fit_Loglogistic_3P.LL,
+        Fit_Lognormal_3P.LL,
+    ),
+}
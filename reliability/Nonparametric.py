@@ -12,18 +12,449 @@ These methods arrive at very similar results but are distinctly different in
 their approach. Kaplan-Meier is more popular. All three methods support failures
 and right censored data. Confidence intervals are provided using the Greenwood
 formula with Normal approximation (as implemented in Minitab).
+
+Stratified provides any of the three estimates for many groups of data (such
+as one group per supplier) in a single vectorized calculation.
 """
 
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import scipy.stats as ss
-from reliability.Utils import colorprint
+from scipy.special import digamma
+from reliability.Utils import (
+    colorprint,
+    prepared_data,
+    round_and_string,
+    unpack_single_arrays,
+)
 
 pd.set_option("display.width", 200)  # prevents wrapping after default 80 characters
 pd.set_option("display.max_columns", 9)  # shows the dataframe without ... truncation
 
 
+def _tied_rows(times, codes, weights, group=None):
+    """
+    Sorts the times and combines the tied times into one row for each distinct
+    failure time and one row for each distinct right censored time within each
+    group.
+
+    Parameters
+    ----------
+    times : array
+        The failure and right censored times.
+    codes : array
+        The censoring code (1 for a failure or 0 for right censored) of each
+        time.
+    weights : array
+        The number of units at each time.
+    group : array, None, optional
+        The integer group of each time. Default is None which treats all the
+        times as one group.
+
+    Returns
+    -------
+    times : array
+        The distinct times sorted within each group. At tied times, the
+        failures are placed before the right censored items as the right
+        censored items are still at risk at that time.
+    codes : array
+        The censoring codes of each row.
+    counts : array
+        The number of units in each row.
+    remaining : array
+        The number of units at risk at each row.
+    group : array, None
+        The group of each row. None if group was None. The rows of each group
+        are contiguous.
+    """
+    if group is None:
+        order = np.lexsort((1 - codes, times))
+    else:
+        order = np.lexsort((1 - codes, times, group))
+    times, codes = times[order], codes[order]
+    new_row = np.ones(len(times), dtype=bool)
+    new_row[1:] = (times[1:] != times[:-1]) | (codes[1:] != codes[:-1])
+    if group is not None:
+        group = group[order]
+        new_row[1:] |= group[1:] != group[:-1]
+    first = np.flatnonzero(new_row)
+    counts = np.add.reduceat(weights[order], first)
+    if np.all(counts == np.round(counts)):
+        counts = counts.astype(int)  # integer weights give integer counts
+    if group is not None:
+        group = group[first]
+        remaining = _segmented_accumulate(np.add, counts[::-1], group[::-1])[::-1]
+    else:
+        remaining = np.cumsum(counts[::-1])[::-1]
+    return times[first], codes[first], counts, remaining, group
+
+
+def _tied_times(failures, right_censored, failure_weights, right_censored_weights):
+    """
+    Combines the failures and right censored times into one row for each
+    distinct failure time and one row for each distinct right censored time.
+
+    Parameters
+    ----------
+    failures : array, list
+        The failure data.
+    right_censored : array, list
+        The right censored data.
+    failure_weights : array, list, None
+        The number of units at each failure time. None gives each failure a
+        weight of 1.
+    right_censored_weights : array, list, None
+        The number of units at each right censored time. None gives each right
+        censored time a weight of 1.
+
+    Returns
+    -------
+    times : array
+        The sorted distinct times. At tied times, the failures are placed before
+        the right censored items as the right censored items are still at risk
+        at that time.
+    codes : array
+        The censoring codes (0 or 1) of each row.
+    counts : array
+        The number of units in each row.
+    remaining : array
+        The number of units at risk at each row.
+    """
+    data = prepared_data(
+        failures=failures,
+        right_censored=right_censored,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
+    times, codes, counts, remaining, _ = _tied_rows(
+        np.hstack([data.failures, data.right_censored]),
+        np.hstack([np.ones(len(data.failures)), np.zeros(len(data.right_censored))]),
+        np.hstack([data.failure_weights, data.right_censored_weights]),
+    )
+    number_of_failures = np.sum(data.failure_weights)
+    if number_of_failures < 2:
+        raise ValueError(
+            str(
+                "failures has a length of "
+                + round_and_string(number_of_failures)
+                + ". The minimum acceptable number of failures is 2"
+            )
+        )
+    return times, codes, counts, remaining
+
+
+def _segmented_accumulate(ufunc, values, group=None):
+    """
+    Applies ufunc.accumulate (such as a cumulative sum or product) separately
+    within each group of a grouped array.
+
+    Parameters
+    ----------
+    ufunc : numpy.ufunc
+        The binary ufunc to accumulate. Must be associative (e.g. np.add or
+        np.multiply).
+    values : array
+        The values to accumulate.
+    group : array, None, optional
+        The integer group of each value. The rows of each group must be
+        contiguous. None treats all the values as one group. Default is None.
+
+    Returns
+    -------
+    accumulated : array
+        The accumulated values, restarting at the first row of each group.
+
+    Notes
+    -----
+    This uses a parallel prefix scan which combines each row with the row
+    "shift" places before it (if it is in the same group) for shift = 1, 2, 4,
+    ... so it needs log2(longest group) vectorized passes and the memory used
+    is proportional to the length of values.
+    """
+    if group is None:
+        return ufunc.accumulate(values)
+    accumulated = np.array(values)
+    shift = 1
+    while shift < len(accumulated):
+        same_group = group[shift:] == group[:-shift]
+        if not same_group.any():
+            break
+        accumulated[shift:] = np.where(
+            same_group,
+            ufunc(accumulated[shift:], accumulated[:-shift]),
+            accumulated[shift:],
+        )
+        shift *= 2
+    return accumulated
+
+
+def _adjusted_rank(codes, counts, remaining, group=None):
+    """
+    Johnson's adjusted rank of each row, as used by the rank adjustment method
+    and the plotting positions.
+
+    Parameters
+    ----------
+    codes : array
+        The censoring codes (0 or 1) of each row.
+    counts : array
+        The number of units in each row.
+    remaining : array
+        The number of units at risk at each row.
+    group : array, None, optional
+        The integer group of each row for stratified data. The rows of each
+        group must be contiguous. Default is None which is a single group.
+
+    Returns
+    -------
+    adjusted_rank : array
+        The adjusted rank at each row. This is 0 before the first failure.
+    n : array, int, float
+        The number of units in the group of each row.
+
+    Notes
+    -----
+    The adjusted rank increases by (n + 1 - previous rank) * d / (1 + items
+    remaining) at each row of d failures so n + 1 - rank is a cumulative
+    product. The product is formed from a sum of logs so that the small ranks
+    are accurate when n is large.
+    """
+    if group is None:
+        n = np.sum(counts)
+    else:
+        n = remaining[np.flatnonzero(np.diff(group, prepend=-1) != 0)][group]
+    log_factor = np.log1p(-codes * counts / (1 + remaining))
+    adjusted_rank = -(n + 1) * np.expm1(
+        _segmented_accumulate(np.add, log_factor, group)
+    )
+    return adjusted_rank, n
+
+
+def _nonparametric_SF(method, codes, counts, remaining, a=0.3, group=None):
+    """
+    The Kaplan-Meier, Nelson-Aalen, or Rank Adjustment estimate of the SF at
+    each row of the tied data.
+
+    Parameters
+    ----------
+    method : str
+        The estimation method. Must be either 'KM', 'NA', or 'RA'.
+    codes : array
+        The censoring codes (0 or 1) of each row.
+    counts : array
+        The number of units in each row.
+    remaining : array
+        The number of units at risk at each row.
+    a : float, int, optional
+        The heuristic constant of the plotting positions used by the rank
+        adjustment method. Default is 0.3.
+    group : array, None, optional
+        The integer group of each row for stratified data. The rows of each
+        group must be contiguous. Default is None which is a single group.
+
+    Returns
+    -------
+    SF : array
+        The estimate of the SF at each row.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "KM":
+            return _segmented_accumulate(
+                np.multiply, (remaining - codes * counts) / remaining, group
+            )
+        elif method == "NA":
+            # each of the tied failures in a row removes one unit from the risk
+            # set so the HF of a row of d failures is the sum of 1/n for n from
+            # n-d+1 to n, which is digamma(n+1) - digamma(n-d+1).
+            h = np.where(
+                counts == 1,
+                1 / remaining,
+                digamma(remaining + 1) - digamma(remaining - counts + 1),
+            )
+            h = np.where(codes == 1, h, 0)
+            return np.exp(-_segmented_accumulate(np.add, h, group))
+        adjusted_rank, n = _adjusted_rank(codes, counts, remaining, group)
+        SF = 1 - (adjusted_rank - a) / (n + 1 - 2 * a)
+        SF[adjusted_rank == 0] = 1  # the SF is 1 before the first failure
+        return SF
+
+
+def _greenwood_bounds(estimate, codes, counts, remaining, CI, group=None):
+    """
+    Confidence bounds on a nonparametric estimate of the SF using the Greenwood
+    formula with Normal approximation (same method as in Minitab).
+
+    Parameters
+    ----------
+    estimate : array
+        The estimate of the SF at each row.
+    codes : array
+        The censoring codes (0 or 1) of each row.
+    counts : array
+        The number of units in each row.
+    remaining : array
+        The number of units at risk at each row.
+    CI : float
+        The confidence interval.
+    group : array, None, optional
+        The integer group of each row for stratified data. The rows of each
+        group must be contiguous. Default is None which is a single group.
+
+    Returns
+    -------
+    lower, upper : array, array
+        The lower and upper confidence bounds at each row.
+    """
+    z = ss.norm.ppf(1 - (1 - CI) / 2)
+    # d/(n(n-d)) is the sum of 1/(n(n-1)) over d tied failures
+    frac = np.where(codes == 1, counts / (remaining * (remaining - counts)), 0)
+    sumfrac = _segmented_accumulate(np.add, frac, group)
+    with np.errstate(invalid="ignore"):
+        delta = np.where(estimate > 0, ((sumfrac * estimate ** 2) ** 0.5) * z, 0)
+    # censored rows use the delta from the most recent failure (0 if there is none)
+    index = np.arange(len(codes))
+    last_failure = np.maximum.accumulate(np.where(codes == 1, index, -1))
+    if group is None:
+        first_row = 0
+    else:
+        first_row = np.maximum.accumulate(
+            np.where(np.diff(group, prepend=-1) != 0, index, 0)
+        )
+    delta = np.where(last_failure >= first_row, delta[last_failure], 0)
+    upper = estimate + delta
+    lower = estimate - delta
+    upper[upper > 1] = 1
+    lower[lower < 0] = 0
+    return lower, upper
+
+
+def _step_arrays(times, estimate, lower, upper):
+    """
+    Creates the stepwise plot of a nonparametric estimate of the SF.
+
+    The step plot has a vertical step (two points) at each failure and a single
+    point at each censored item. The confidence bounds use the values from
+    before the step, except for the last point which uses the bounds of the
+    last row.
+
+    Parameters
+    ----------
+    times : array
+        The sorted times of each row.
+    estimate : array
+        The estimate of the SF at each row.
+    lower : array
+        The lower confidence bound at each row.
+    upper : array
+        The upper confidence bound at each row.
+
+    Returns
+    -------
+    xvals, SF, SF_lower, SF_upper : array, array, array, array
+        The stepwise arrays. These start from 100% reliability at 0 time.
+    """
+    previous = np.hstack([1, estimate[:-1]])
+    lower_previous = np.hstack([1, lower[:-1]])
+    upper_previous = np.hstack([1, upper[:-1]])
+    step = previous != estimate
+    repeats = step + 1
+    keep = np.column_stack([step, np.ones(len(estimate), dtype=bool)])
+    xvals = np.hstack([0, np.repeat(times, repeats)])
+    SF = np.hstack([1, np.column_stack([previous, estimate])[keep]])
+    SF_lower = np.repeat(lower_previous, repeats)
+    SF_upper = np.repeat(upper_previous, repeats)
+    # the last point uses the bounds of the last row
+    SF_lower = np.hstack([SF_lower, lower[-1]])
+    SF_upper = np.hstack([SF_upper, upper[-1]])
+    return xvals, SF, SF_lower, SF_upper
+
+
+def _SF_at(times, data, estimate, lower, upper):
+    """
+    Evaluates a nonparametric estimate of the SF and its confidence bounds at
+    any times.
+
+    Parameters
+    ----------
+    times : int, float, list, array
+        The times at which to evaluate the SF.
+    data : array
+        The sorted times of each row of the estimate.
+    estimate : array
+        The estimate of the SF at each row.
+    lower : array
+        The lower confidence bound at each row.
+    upper : array
+        The upper confidence bound at each row.
+
+    Returns
+    -------
+    SF_lower, SF, SF_upper : array, array, array
+        The SF and its confidence bounds at each time. The SF is right
+        continuous so the step occurs at the failure time. The SF is 1 before
+        the first row and remains at the value of the last row after the last
+        row.
+    """
+    if type(times) not in [int, float, np.float64, list, np.ndarray]:
+        raise ValueError("times must be of type int, float, list, array")
+    times = np.atleast_1d(np.asarray(times, dtype=float))
+    if np.isnan(times).any():
+        raise ValueError("times must not contain NaN")
+    # the row of the most recent time. This is 0 for times before the first row
+    index = np.searchsorted(data, times, side="right")
+    return (
+        np.hstack([1, lower])[index],
+        np.hstack([1, estimate])[index],
+        np.hstack([1, upper])[index],
+    )
+
+
+def _quantile(q, data, estimate, lower, upper):
+    """
+    Finds the time at which a nonparametric estimate of the CDF (and its
+    confidence bounds) first reaches q.
+
+    Parameters
+    ----------
+    q : int, float, list, array
+        The quantiles. Must be between 0 and 1.
+    data : array
+        The sorted times of each row of the estimate.
+    estimate : array
+        The estimate of the SF at each row.
+    lower : array
+        The lower confidence bound of the SF at each row.
+    upper : array
+        The upper confidence bound of the SF at each row.
+
+    Returns
+    -------
+    lower_estimate, point_estimate, upper_estimate : array, array, array
+        The times at which the CDF estimate and its confidence bounds first
+        reach q. The lower_estimate is from the upper confidence bound on the
+        CDF. The time is inf if the CDF never reaches q.
+    """
+    if type(q) in [int, float, np.float64]:
+        if q < 0 or q > 1:
+            raise ValueError("Quantile must be between 0 and 1")
+    elif type(q) in [list, np.ndarray]:
+        if min(q) < 0 or max(q) > 1:
+            raise ValueError("Quantile must be between 0 and 1")
+    else:
+        raise ValueError("Quantile must be of type float, list, array")
+    q = np.atleast_1d(np.asarray(q, dtype=float))
+    x = np.hstack([0, data, np.inf])
+    output = []
+    for SF in [lower, estimate, upper]:
+        # the running minimum makes the confidence bounds non-increasing so the
+        # search finds the first time at which they reach 1 - q
+        decreasing_SF = np.minimum.accumulate(np.hstack([1, SF]))
+        index = np.searchsorted(-decreasing_SF, q - 1, side="left")
+        output.append(x[index])
+    return output[0], output[1], output[2]
+
+
 class KaplanMeier:
     """
     Uses the Kaplan-Meier estimation method to calculate the reliability from
@@ -48,6 +479,12 @@ class KaplanMeier:
     plot_CI : bool
         Shades the upper and lower confidence interval. True or False. Default =
         True
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         plot (e.g. color, label, linestyle)
@@ -55,13 +492,19 @@ class KaplanMeier:
     Returns
     -------
     results : dataframe
-        A pandas dataframe of results for the SF
+        A pandas dataframe of results for the SF. There is one row for each
+        distinct failure time and one row for each distinct right censored
+        time, so tied or weighted data gives fewer rows than the number of
+        units. The 'Number of items' column gives the number of units in each
+        row.
     KM : array
         The Kaplan-Meier Estimate column from results dataframe. This column is
         the non-parametric estimate of the Survival Function (reliability
         function).
+        There is one value for each row of results, not one for each unit.
     xvals : array
-        the x-values to plot the stepwise plot as seen when show_plot=True
+        the x-values to plot the stepwise plot as seen when show_plot=True.
+        There is one step for each distinct failure time.
     SF : array
         survival function stepwise values (these differ from the KM values as
         there are extra values added in to make the plot into a step plot)
@@ -82,8 +525,8 @@ class KaplanMeier:
     CHF_upper : array
         cumulative hazard function stepwise values for upper CI
     data : array
-        the failures and right_censored values sorted. Same as 'Failure times'
-        column from results dataframe
+        the distinct failures and right_censored values sorted. Same as 'Failure
+        times' column from results dataframe
     censor_codes : array
         the censoring codes (0 or 1) from the sorted data. Same as 'Censoring
         code (censored=0)' column from results dataframe
@@ -93,6 +536,15 @@ class KaplanMeier:
     The confidence bounds are calculated using the Greenwood formula with
     Normal approximation, which is the same as featured in Minitab.
 
+    Tied times are combined so the results have one row for each distinct
+    failure time and one row for each distinct right censored time, with the
+    'Number of items' column giving the number of units in each row. Right
+    censored items at the same time as failures are considered to be at risk
+    of those failures. Grouped data in the form of (time, number failed,
+    number censored) can be given using the times as both the failures and the
+    right_censored, with the number failed and number censored as the
+    failure_weights and right_censored_weights.
+
     The Kaplan-Meier method provides the SF. The CDF and CHF are obtained from
     transformations of the SF. It is not possible to obtain a useful version of
     the PDF or HF as the derivative of a stepwise function produces
@@ -108,6 +560,8 @@ class KaplanMeier:
         plot_CI=True,
         CI=0.95,
         plot_type="SF",
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs
     ):
         np.seterr(
@@ -126,67 +580,23 @@ class KaplanMeier:
             raise ValueError(
                 "CI must be between 0 and 1. Default is 0.95 for 95% confidence intervals."
             )
-        if len(failures) < 2:
-            raise ValueError(
-                str(
-                    "failures has a length of "
-                    + str(len(failures))
-                    + ". The minimum acceptable number of failures is 2"
-                )
-            )
-
-        # turn the failures and right censored times into a two lists of times and censoring codes
-        times = np.hstack([failures, right_censored])
-        F = np.ones_like(failures)
-        RC = np.zeros_like(right_censored)  # censored values are given the code of 0
-        cens_code = np.hstack([F, RC])
-        Data = {"times": times, "cens_code": cens_code}
-        df = pd.DataFrame(Data, columns=["times", "cens_code"])
-        df2 = df.sort_values(by="times")
-        d = df2["times"].values
-        c = df2["cens_code"].values
+        # combine the tied times into one row for each distinct failure or right censored time
+        d, c, counts, remaining_array = _tied_times(
+            failures, right_censored, failure_weights, right_censored_weights
+        )
 
         self.data = d
         self.censor_codes = c
 
-        n = len(d)  # number of items
-        failures_array = np.arange(1, n + 1)  # array of number of items (1 to n)
-        remaining_array = failures_array[::-1]  # items remaining (n to 1)
-        KM = []  # Survival function
-        KM_upper = []  # upper CI
-        KM_lower = []  # lower CI
-        z = ss.norm.ppf(1 - (1 - CI) / 2)
-        frac = []
-        delta = 0
-        for i in failures_array:
-            if i == 1:
-                KM.append((remaining_array[i - 1] - c[i - 1]) / remaining_array[i - 1])
-            else:
-                KM.append(
-                    ((remaining_array[i - 1] - c[i - 1]) / remaining_array[i - 1])
-                    * KM[i - 2]
-                )
-            # greenwood confidence interval calculations. Uses Normal approximation (same method as in Minitab)
-            if c[i - 1] == 1:
-                risk_set = n - i + 1
-                frac.append(1 / ((risk_set) * (risk_set - 1)))
-                sumfrac = sum(frac)
-                R2 = KM[i - 1] ** 2
-                if R2 > 0:  # required if the last piece of data is a failure
-                    delta = ((sumfrac * R2) ** 0.5) * z
-                else:
-                    delta = 0
-            KM_upper.append(KM[i - 1] + delta)
-            KM_lower.append(KM[i - 1] - delta)
-        KM_lower = np.array(KM_lower)
-        KM_upper = np.array(KM_upper)
-        KM_upper[KM_upper > 1] = 1
-        KM_lower[KM_lower < 0] = 0
+        # Survival function
+        KM = _nonparametric_SF("KM", c, counts, remaining_array)
+        KM_lower, KM_upper = _greenwood_bounds(KM, c, counts, remaining_array, CI)
 
         # assemble the pandas dataframe for the output
         DATA = {
             "Failure times": d,
             "Censoring code (censored=0)": c,
+            "Number of items": counts,
             "Items remaining": remaining_array,
             "Kaplan-Meier Estimate": KM,
             "Lower CI bound": KM_lower,
@@ -197,6 +607,7 @@ class KaplanMeier:
             columns=[
                 "Failure times",
                 "Censoring code (censored=0)",
+                "Number of items",
                 "Items remaining",
                 "Kaplan-Meier Estimate",
                 "Lower CI bound",
@@ -204,49 +615,12 @@ class KaplanMeier:
             ],
         )
 
-        KM_x = [0]
-        KM_y = [1]  # adds a start point for 100% reliability at 0 time
-        KM_y_upper = []
-        KM_y_lower = []
-
-        for i in failures_array:
-            if i == 1:
-                if c[i - 1] == 0:  # if the first item is censored
-                    KM_x.append(d[i - 1])
-                    KM_y.append(1)
-                    KM_y_lower.append(1)
-                    KM_y_upper.append(1)
-                else:  # if the first item is a failure
-                    KM_x.append(d[i - 1])
-                    KM_x.append(d[i - 1])
-                    KM_y.append(1)
-                    KM_y.append(KM[i - 1])
-                    KM_y_lower.append(1)
-                    KM_y_upper.append(1)
-                    KM_y_lower.append(1)
-                    KM_y_upper.append(1)
-            else:
-                if KM[i - 2] == KM[i - 1]:  # if the next item is censored
-                    KM_x.append(d[i - 1])
-                    KM_y.append(KM[i - 1])
-                    KM_y_lower.append(KM_lower[i - 2])
-                    KM_y_upper.append(KM_upper[i - 2])
-                else:  # if the next item is a failure
-                    KM_x.append(d[i - 1])
-                    KM_y.append(KM[i - 2])
-                    KM_y_lower.append(KM_lower[i - 2])
-                    KM_y_upper.append(KM_upper[i - 2])
-                    KM_x.append(d[i - 1])
-                    KM_y.append(KM[i - 1])
-                    KM_y_lower.append(KM_lower[i - 2])
-                    KM_y_upper.append(KM_upper[i - 2])
-        KM_y_lower.append(KM_y_lower[-1])
-        KM_y_upper.append(KM_y_upper[-1])
-        self.KM = np.array(KM)
-        self.xvals = np.array(KM_x)
-        self.SF = np.array(KM_y)
-        self.SF_lower = np.array(KM_y_lower)
-        self.SF_upper = np.array(KM_y_upper)
+        self.KM = KM
+        self._KM_lower = KM_lower
+        self._KM_upper = KM_upper
+        self.xvals, self.SF, self.SF_lower, self.SF_upper = _step_arrays(
+            d, KM, KM_lower, KM_upper
+        )
         self.CDF = 1 - self.SF
         self.CDF_lower = 1 - self.SF_upper
         self.CDF_upper = 1 - self.SF_lower
@@ -267,7 +641,7 @@ class KaplanMeier:
             print(self.results.to_string(index=False), "\n")
         if show_plot is True:
             xlim_upper = plt.xlim(auto=None)[1]
-            xmax = max(times)
+            xmax = max(d)
             if plot_type in ["SF", "sf"]:
                 p = plt.plot(self.xvals, self.SF, **kwargs)
                 if plot_CI is True:  # plots the confidence bounds
@@ -346,6 +720,122 @@ class KaplanMeier:
             else:
                 raise ValueError("plot_type must be CDF, SF, CHF")
 
+    def SF_at(self, times, CI_bounds=False):
+        """
+        Evaluates the Kaplan-Meier estimate of the SF at any times.
+
+        Parameters
+        ----------
+        times : int, float, list, array
+            The times at which to evaluate the SF.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        SF : float, array
+            The SF at each time. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the lower confidence bound, the SF,
+            and the upper confidence bound at each time. Only returned if
+            CI_bounds is True.
+
+        Notes
+        -----
+        The estimate is a step function which is right continuous, so at a
+        failure time the SF is the value after the step. The SF is 1 before the
+        first failure and remains at its final value after the last failure or
+        right censored time. The times are found using a binary search
+        (np.searchsorted) of the distinct times so this is suitable for
+        millions of times.
+        """
+        lower, SF, upper = _SF_at(
+            times, self.data, self.KM, self._KM_lower, self._KM_upper
+        )
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(lower),
+                unpack_single_arrays(SF),
+                unpack_single_arrays(upper),
+            )
+        return unpack_single_arrays(SF)
+
+    def CHF_at(self, times, CI_bounds=False):
+        """
+        Evaluates the Kaplan-Meier estimate of the CHF at any times.
+
+        Parameters
+        ----------
+        times : int, float, list, array
+            The times at which to evaluate the CHF.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        CHF : float, array
+            The CHF at each time. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the lower confidence bound, the CHF,
+            and the upper confidence bound at each time. Only returned if
+            CI_bounds is True.
+
+        Notes
+        -----
+        The CHF is obtained from the SF as CHF = -ln(SF). See SF_at for how the
+        step function is evaluated. The upper bound is inf where the lower
+        bound of the SF is 0.
+        """
+        lower, SF, upper = _SF_at(
+            times, self.data, self.KM, self._KM_lower, self._KM_upper
+        )
+        with np.errstate(divide="ignore"):
+            CHF_lower, CHF, CHF_upper = -np.log(upper), -np.log(SF), -np.log(lower)
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(CHF_lower),
+                unpack_single_arrays(CHF),
+                unpack_single_arrays(CHF_upper),
+            )
+        return unpack_single_arrays(CHF)
+
+    def quantile(self, q, CI_bounds=False):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        x : float, array
+            The first time at which the Kaplan-Meier estimate of the CDF
+            reaches q. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the first times at which the upper
+            confidence bound of the CDF, the CDF, and the lower confidence bound
+            of the CDF reach q. Only returned if CI_bounds is True.
+
+        Notes
+        -----
+        The quantile is inf if the CDF estimate does not reach q, which occurs
+        when q is more than the fraction failing at the last failure.
+        """
+        lower, x, upper = _quantile(
+            q, self.data, self.KM, self._KM_lower, self._KM_upper
+        )
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(lower),
+                unpack_single_arrays(x),
+                unpack_single_arrays(upper),
+            )
+        return unpack_single_arrays(x)
+
 
 class NelsonAalen:
     """
@@ -371,6 +861,12 @@ class NelsonAalen:
     plot_CI : bool
         Shades the upper and lower confidence interval. True or False. Default =
         True
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         plot (e.g. color, label, linestyle)
@@ -378,13 +874,19 @@ class NelsonAalen:
     Returns
     -------
     results : dataframe
-        A pandas dataframe of results for the SF
+        A pandas dataframe of results for the SF. There is one row for each
+        distinct failure time and one row for each distinct right censored
+        time, so tied or weighted data gives fewer rows than the number of
+        units. The 'Number of items' column gives the number of units in each
+        row.
     NA : array
         The Nelson-Aalen Estimate column from results dataframe. This column is
         the non-parametric estimate of the Survival Function (reliability
         function).
+        There is one value for each row of results, not one for each unit.
     xvals : array
-        the x-values to plot the stepwise plot as seen when show_plot=True
+        the x-values to plot the stepwise plot as seen when show_plot=True.
+        There is one step for each distinct failure time.
     SF : array
         survival function stepwise values (these differ from the NA values as
         there are extra values added in to make the plot into a step plot)
@@ -405,8 +907,8 @@ class NelsonAalen:
     CHF_upper : array
         cumulative hazard function stepwise values for upper CI
     data : array
-        the failures and right_censored values sorted. Same as 'Failure times'
-        column from results dataframe
+        the distinct failures and right_censored values sorted. Same as 'Failure
+        times' column from results dataframe
     censor_codes : array
         the censoring codes (0 or 1) from the sorted data. Same as 'Censoring
         code (censored=0)' column from results dataframe
@@ -416,6 +918,15 @@ class NelsonAalen:
     The confidence bounds are calculated using the Greenwood formula with
     Normal approximation, which is the same as featured in Minitab.
 
+    Tied times are combined so the results have one row for each distinct
+    failure time and one row for each distinct right censored time, with the
+    'Number of items' column giving the number of units in each row. Right
+    censored items at the same time as failures are considered to be at risk
+    of those failures. Grouped data in the form of (time, number failed,
+    number censored) can be given using the times as both the failures and the
+    right_censored, with the number failed and number censored as the
+    failure_weights and right_censored_weights.
+
     The Nelson-Aalen method provides the SF. The CDF and CHF are obtained from
     transformations of the SF. It is not possible to obtain a useful version of
     the PDF or HF as the derivative of a stepwise function produces
@@ -433,6 +944,8 @@ class NelsonAalen:
         plot_CI=True,
         CI=0.95,
         plot_type="SF",
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs
     ):
         np.seterr(
@@ -451,66 +964,22 @@ class NelsonAalen:
             raise ValueError(
                 "CI must be between 0 and 1. Default is 0.95 for 95% confidence intervals."
             )
-        if len(failures) < 2:
-            raise ValueError(
-                str(
-                    "failures has a length of "
-                    + str(len(failures))
-                    + ". The minimum acceptable number of failures is 2"
-                )
-            )
-
-        # turn the failures and right censored times into a two lists of times and censoring codes
-        times = np.hstack([failures, right_censored])
-        F = np.ones_like(failures)
-        RC = np.zeros_like(right_censored)  # censored values are given the code of 0
-        cens_code = np.hstack([F, RC])
-        Data = {"times": times, "cens_code": cens_code}
-        df = pd.DataFrame(Data, columns=["times", "cens_code"])
-        df2 = df.sort_values(by="times")
-        d = df2["times"].values
-        c = df2["cens_code"].values
+        # combine the tied times into one row for each distinct failure or right censored time
+        d, c, counts, remaining_array = _tied_times(
+            failures, right_censored, failure_weights, right_censored_weights
+        )
 
         self.data = d
         self.censor_codes = c
 
-        n = len(d)  # number of items
-        failures_array = np.arange(1, n + 1)  # array of number of items (1 to n)
-        remaining_array = failures_array[::-1]  # items remaining (n to 1)
-        h = []
-        H = []
-        NA = []  # Survival function
-        NA_upper = []  # upper CI
-        NA_lower = []  # lower CI
-        z = ss.norm.ppf(1 - (1 - CI) / 2)
-        frac = []
-        delta = 0
-        for i in failures_array:
-            h.append((c[i - 1]) / remaining_array[i - 1])  # obtain HF
-            H.append(sum(h))  # obtain CHF
-            NA.append(np.exp(-H[-1]))
-
-            # greenwood confidence interval calculations. Uses Normal approximation
-            if c[i - 1] == 1:
-                risk_set = n - i + 1
-                frac.append(1 / ((risk_set) * (risk_set - 1)))
-                sumfrac = sum(frac)
-                R2 = NA[i - 1] ** 2
-                if R2 > 0:  # required if the last piece of data is a failure
-                    delta = ((sumfrac * R2) ** 0.5) * z
-                else:
-                    delta = 0
-            NA_upper.append(NA[i - 1] + delta)
-            NA_lower.append(NA[i - 1] - delta)
-        NA_lower = np.array(NA_lower)
-        NA_upper = np.array(NA_upper)
-        NA_upper[NA_upper > 1] = 1
-        NA_lower[NA_lower < 0] = 0
+        NA = _nonparametric_SF("NA", c, counts, remaining_array)
+        NA_lower, NA_upper = _greenwood_bounds(NA, c, counts, remaining_array, CI)
 
         # assemble the pandas dataframe for the output
         DATA = {
             "Failure times": d,
             "Censoring code (censored=0)": c,
+            "Number of items": counts,
             "Items remaining": remaining_array,
             "Nelson-Aalen Estimate": NA,
             "Lower CI bound": NA_lower,
@@ -521,6 +990,7 @@ class NelsonAalen:
             columns=[
                 "Failure times",
                 "Censoring code (censored=0)",
+                "Number of items",
                 "Items remaining",
                 "Nelson-Aalen Estimate",
                 "Lower CI bound",
@@ -528,49 +998,12 @@ class NelsonAalen:
             ],
         )
 
-        NA_x = [0]
-        NA_y = [1]  # adds a start point for 100% reliability at 0 time
-        NA_y_upper = []
-        NA_y_lower = []
-
-        for i in failures_array:
-            if i == 1:
-                if c[i - 1] == 0:  # if the first item is censored
-                    NA_x.append(d[i - 1])
-                    NA_y.append(1)
-                    NA_y_lower.append(1)
-                    NA_y_upper.append(1)
-                else:  # if the first item is a failure
-                    NA_x.append(d[i - 1])
-                    NA_x.append(d[i - 1])
-                    NA_y.append(1)
-                    NA_y.append(NA[i - 1])
-                    NA_y_lower.append(1)
-                    NA_y_upper.append(1)
-                    NA_y_lower.append(1)
-                    NA_y_upper.append(1)
-            else:
-                if NA[i - 2] == NA[i - 1]:  # if the next item is censored
-                    NA_x.append(d[i - 1])
-                    NA_y.append(NA[i - 1])
-                    NA_y_lower.append(NA_lower[i - 2])
-                    NA_y_upper.append(NA_upper[i - 2])
-                else:  # if the next item is a failure
-                    NA_x.append(d[i - 1])
-                    NA_y.append(NA[i - 2])
-                    NA_y_lower.append(NA_lower[i - 2])
-                    NA_y_upper.append(NA_upper[i - 2])
-                    NA_x.append(d[i - 1])
-                    NA_y.append(NA[i - 1])
-                    NA_y_lower.append(NA_lower[i - 2])
-                    NA_y_upper.append(NA_upper[i - 2])
-        NA_y_lower.append(NA_y_lower[-1])
-        NA_y_upper.append(NA_y_upper[-1])
-        self.xvals = np.array(NA_x)
-        self.NA = np.array(NA)
-        self.SF = np.array(NA_y)
-        self.SF_lower = np.array(NA_y_lower)
-        self.SF_upper = np.array(NA_y_upper)
+        self.NA = NA
+        self._NA_lower = NA_lower
+        self._NA_upper = NA_upper
+        self.xvals, self.SF, self.SF_lower, self.SF_upper = _step_arrays(
+            d, NA, NA_lower, NA_upper
+        )
         self.CDF = 1 - self.SF
         self.CDF_lower = 1 - self.SF_upper
         self.CDF_upper = 1 - self.SF_lower
@@ -591,7 +1024,7 @@ class NelsonAalen:
             print(self.results.to_string(index=False), "\n")
         if show_plot is True:
             xlim_upper = plt.xlim(auto=None)[1]
-            xmax = max(times)
+            xmax = max(d)
             if plot_type in ["SF", "sf"]:
                 p = plt.plot(self.xvals, self.SF, **kwargs)
                 if plot_CI is True:  # plots the confidence bounds
@@ -670,6 +1103,122 @@ class NelsonAalen:
             else:
                 raise ValueError("plot_type must be CDF, SF, CHF")
 
+    def SF_at(self, times, CI_bounds=False):
+        """
+        Evaluates the Nelson-Aalen estimate of the SF at any times.
+
+        Parameters
+        ----------
+        times : int, float, list, array
+            The times at which to evaluate the SF.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        SF : float, array
+            The SF at each time. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the lower confidence bound, the SF,
+            and the upper confidence bound at each time. Only returned if
+            CI_bounds is True.
+
+        Notes
+        -----
+        The estimate is a step function which is right continuous, so at a
+        failure time the SF is the value after the step. The SF is 1 before the
+        first failure and remains at its final value after the last failure or
+        right censored time. The times are found using a binary search
+        (np.searchsorted) of the distinct times so this is suitable for
+        millions of times.
+        """
+        lower, SF, upper = _SF_at(
+            times, self.data, self.NA, self._NA_lower, self._NA_upper
+        )
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(lower),
+                unpack_single_arrays(SF),
+                unpack_single_arrays(upper),
+            )
+        return unpack_single_arrays(SF)
+
+    def CHF_at(self, times, CI_bounds=False):
+        """
+        Evaluates the Nelson-Aalen estimate of the CHF at any times.
+
+        Parameters
+        ----------
+        times : int, float, list, array
+            The times at which to evaluate the CHF.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        CHF : float, array
+            The CHF at each time. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the lower confidence bound, the CHF,
+            and the upper confidence bound at each time. Only returned if
+            CI_bounds is True.
+
+        Notes
+        -----
+        The CHF is obtained from the SF as CHF = -ln(SF). See SF_at for how the
+        step function is evaluated. The upper bound is inf where the lower
+        bound of the SF is 0.
+        """
+        lower, SF, upper = _SF_at(
+            times, self.data, self.NA, self._NA_lower, self._NA_upper
+        )
+        with np.errstate(divide="ignore"):
+            CHF_lower, CHF, CHF_upper = -np.log(upper), -np.log(SF), -np.log(lower)
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(CHF_lower),
+                unpack_single_arrays(CHF),
+                unpack_single_arrays(CHF_upper),
+            )
+        return unpack_single_arrays(CHF)
+
+    def quantile(self, q, CI_bounds=False):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        x : float, array
+            The first time at which the Nelson-Aalen estimate of the CDF
+            reaches q. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the first times at which the upper
+            confidence bound of the CDF, the CDF, and the lower confidence bound
+            of the CDF reach q. Only returned if CI_bounds is True.
+
+        Notes
+        -----
+        The quantile is inf if the CDF estimate does not reach q, which occurs
+        when q is more than the fraction failing at the last failure.
+        """
+        lower, x, upper = _quantile(
+            q, self.data, self.NA, self._NA_lower, self._NA_upper
+        )
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(lower),
+                unpack_single_arrays(x),
+                unpack_single_arrays(upper),
+            )
+        return unpack_single_arrays(x)
+
 
 class RankAdjustment:
     """
@@ -701,6 +1250,12 @@ class RankAdjustment:
         rank method (same as the default in Minitab). Must be in the range 0 to
         1. For more heuristics, see:
         https://en.wikipedia.org/wiki/Q%E2%80%93Q_plot#Heuristics
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     kwargs
         Plotting keywords that are passed directly to matplotlib for the
         plot (e.g. color, label, linestyle)
@@ -708,13 +1263,19 @@ class RankAdjustment:
     Returns
     -------
     results : dataframe
-        A pandas dataframe of results for the SF
+        A pandas dataframe of results for the SF. There is one row for each
+        distinct failure time and one row for each distinct right censored
+        time, so tied or weighted data gives fewer rows than the number of
+        units. The 'Number of items' column gives the number of units in each
+        row.
     RA : array
         The Rank Adjustment Estimate column from results dataframe. This column
         is the non-parametric estimate of the Survival Function (reliability
         function).
+        There is one value for each row of results, not one for each unit.
     xvals : array
-        the x-values to plot the stepwise plot as seen when show_plot=True
+        the x-values to plot the stepwise plot as seen when show_plot=True.
+        There is one step for each distinct failure time.
     SF : array
         survival function stepwise values (these differ from the RA values as
         there are extra values added in to make the plot into a step plot)
@@ -735,8 +1296,8 @@ class RankAdjustment:
     CHF_upper : array
         cumulative hazard function stepwise values for upper CI
     data : array
-        the failures and right_censored values sorted. Same as 'Failure times'
-        column from results dataframe
+        the distinct failures and right_censored values sorted. Same as 'Failure
+        times' column from results dataframe
     censor_codes : array
         the censoring codes (0 or 1) from the sorted data. Same as 'Censoring
         code (censored=0)' column from results dataframe
@@ -746,6 +1307,15 @@ class RankAdjustment:
     The confidence bounds are calculated using the Greenwood formula with
     Normal approximation, which is the same as featured in Minitab.
 
+    Tied times are combined so the results have one row for each distinct
+    failure time and one row for each distinct right censored time, with the
+    'Number of items' column giving the number of units in each row. Right
+    censored items at the same time as failures are considered to be at risk
+    of those failures. Grouped data in the form of (time, number failed,
+    number censored) can be given using the times as both the failures and the
+    right_censored, with the number failed and number censored as the
+    failure_weights and right_censored_weights.
+
     The rank-adjustment method provides the SF. The CDF and CHF are obtained from
     transformations of the SF. It is not possible to obtain a useful version of
     the PDF or HF as the derivative of a stepwise function produces
@@ -767,6 +1337,8 @@ class RankAdjustment:
         plot_CI=True,
         CI=0.95,
         plot_type="SF",
+        failure_weights=None,
+        right_censored_weights=None,
         **kwargs
     ):
 
@@ -782,108 +1354,46 @@ class RankAdjustment:
             raise ValueError(
                 "CI must be between 0 and 1. Default is 0.95 for 95% confidence intervals."
             )
-        if len(failures) < 2:
+        if a is None:
+            a = 0.3
+        elif a < 0 or a > 1:
             raise ValueError(
-                str(
-                    "failures has a length of "
-                    + str(len(failures))
-                    + ". The minimum acceptable number of failures is 2"
-                )
+                "a must be in the range 0 to 1. Default is 0.3 which gives the median rank. For more information see https://en.wikipedia.org/wiki/Q%E2%80%93Q_plot#Heuristics"
             )
 
-        # turn the failures and right censored times into a two lists of times and censoring codes
-        times = np.hstack([failures, right_censored])
-        F = np.ones_like(failures)
-        RC = np.zeros_like(right_censored)  # censored values are given the code of 0
-        cens_code = np.hstack([F, RC])
-        Data = {"times": times, "cens_code": cens_code}
-        df = pd.DataFrame(Data, columns=["times", "cens_code"])
-        df2 = df.sort_values(by="times")
-        d = df2["times"].values
-        c = df2["cens_code"].values
-        n = len(d)  # number of items
-        failures_array = np.arange(1, n + 1)  # array of number of items (1 to n)
-        remaining_array = failures_array[::-1]  # items remaining (n to 1)
-
-        # obtain the rank adjustment estimates
-        from reliability.Probability_plotting import (
-            plotting_positions,
-        )  # can't have this at the start of the function because of circular import
-
-        x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
-        # create the stepwise plot using the plotting positions
-        x_array = [0]
-        y_array = [0]
-        for i in range(len(x)):
-            x_array.extend([x[i], x[i]])
-            if i == 0:
-                y_array.extend([0, y[i]])
-            else:
-                y_array.extend([y[i - 1], y[i]])
+        # combine the tied times into one row for each distinct failure or right censored time
+        d, c, counts, remaining_array = _tied_times(
+            failures, right_censored, failure_weights, right_censored_weights
+        )
+
+        self.data = d
+        self.censor_codes = c
+
+        # obtain the rank adjustment estimates. These use the same adjusted
+        # ranks as Probability_plotting.plotting_positions.
+        RA = _nonparametric_SF("RA", c, counts, remaining_array, a=a)
+        RA_lower, RA_upper = _greenwood_bounds(RA, c, counts, remaining_array, CI)
+
+        # create the stepwise plot using the values at the failures
+        is_failure = c == 1
+        y = 1 - RA[is_failure]
+        x_array = np.hstack([0, np.repeat(d[is_failure], 2)])
+        y_array = np.hstack([0, np.column_stack([np.hstack([0, y[:-1]]), y]).ravel()])
+        RA_y_lower = np.repeat(np.hstack([1, RA_lower[is_failure]]), 2)
+        RA_y_upper = np.repeat(np.hstack([1, RA_upper[is_failure]]), 2)
         if c[-1] == 0:  # repeat the last value if censored
-            x_array.append(d[-1])
-            y_array.append(y_array[-1])
-
-        # convert the plotting positions (which are only for the failures) into the full Rank Adjustment column by adding the values for the censored data
-        RA = []
-        y_extended = [0]
-        y_extended.extend(
-            y
-        )  # need to add 0 to the start of the plotting positions since the CDF always starts at 0
-        failure_counter = 0
-        RA_upper = []  # upper CI
-        RA_lower = []  # lower CI
-        z = ss.norm.ppf(1 - (1 - CI) / 2)
-        frac = []
-        delta = 0
-        for i in failures_array:  # failures array is 1 to n
-            cens = c[i - 1]
-            if cens == 1:  # censored values = 0. failures = 1
-                failure_counter += 1
-            RA.append(
-                1 - y_extended[failure_counter]
-            )  # RA is equivalent to the Survival function but not the stepwise version of the data. Just 1 point for each failure or right censored datapoint
-
-            # greenwood confidence interval calculations. Uses Normal approximation (same method as Minitab uses for Kaplan-Meier)
-            if c[i - 1] == 1:
-                risk_set = n - i + 1
-                frac.append(1 / ((risk_set) * (risk_set - 1)))
-                sumfrac = sum(frac)
-                R2 = RA[i - 1] ** 2
-                if R2 > 0:  # required if the last piece of data is a failure
-                    delta = ((sumfrac * R2) ** 0.5) * z
-                else:
-                    delta = 0
-            RA_upper.append(RA[i - 1] + delta)
-            RA_lower.append(RA[i - 1] - delta)
-        RA_lower = np.array(RA_lower)
-        RA_upper = np.array(RA_upper)
-        RA_upper[RA_upper > 1] = 1
-        RA_lower[RA_lower < 0] = 0
-
-        # create the stepwise plot for the confidence intervals.
-        # first we downsample the RA_lower and RA_upper. This converts the RA_upper and RA_lower to only arrays corresponding the the values where there are failures
-        RA_lower_downsample = [1]  # reliability starts at 1
-        RA_upper_downsample = [1]
-        for i in range(len(RA)):
-            if c[i] != 0:  # this means the current item is a failure
-                RA_lower_downsample.append(RA_lower[i])
-                RA_upper_downsample.append(RA_upper[i])
-        # then we upsample by converting to stepwise plot. Essentially this is just repeating each value twice in the downsampled arrays
-        RA_y_lower = []
-        RA_y_upper = []
-        for i in range(len(RA_lower_downsample)):
-            RA_y_lower.extend([RA_lower_downsample[i], RA_lower_downsample[i]])
-            RA_y_upper.extend([RA_upper_downsample[i], RA_upper_downsample[i]])
-        if (
-            c[-1] == 1
-        ):  # if the last value is a failure we need to remove the last element as the plot ends in a vertical line not a horizontal line
+            x_array = np.hstack([x_array, d[-1]])
+            y_array = np.hstack([y_array, y_array[-1]])
+        else:
+            # if the last value is a failure we need to remove the last element as the plot ends in a vertical line not a horizontal line
             RA_y_lower = RA_y_lower[0:-1]
             RA_y_upper = RA_y_upper[0:-1]
 
         self.xvals = x_array
         # RA are the values from the dataframe. 1 value for each time (failure or right censored). RA is for "rank adjustment" just as KM is "Kaplan-Meier"
-        self.RA = np.array(RA)
+        self.RA = RA
+        self._RA_lower = RA_lower
+        self._RA_upper = RA_upper
         self.SF = 1 - np.array(y_array)  # these are the stepwise values for the plot.
         self.SF_lower = np.array(RA_y_lower)
         self.SF_upper = np.array(RA_y_upper)
@@ -898,6 +1408,7 @@ class RankAdjustment:
         DATA = {
             "Failure times": d,
             "Censoring code (censored=0)": c,
+            "Number of items": counts,
             "Items remaining": remaining_array,
             "Rank Adjustment Estimate": self.RA,
             "Lower CI bound": RA_lower,
@@ -908,6 +1419,7 @@ class RankAdjustment:
             columns=[
                 "Failure times",
                 "Censoring code (censored=0)",
+                "Number of items",
                 "Items remaining",
                 "Rank Adjustment Estimate",
                 "Lower CI bound",
@@ -1010,3 +1522,334 @@ class RankAdjustment:
                 )  # set the limits for y. Need to do this because the upper CI bound is inf.
             else:
                 raise ValueError("plot_type must be CDF, SF, CHF")
+
+    def SF_at(self, times, CI_bounds=False):
+        """
+        Evaluates the Rank Adjustment estimate of the SF at any times.
+
+        Parameters
+        ----------
+        times : int, float, list, array
+            The times at which to evaluate the SF.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        SF : float, array
+            The SF at each time. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the lower confidence bound, the SF,
+            and the upper confidence bound at each time. Only returned if
+            CI_bounds is True.
+
+        Notes
+        -----
+        The estimate is a step function which is right continuous, so at a
+        failure time the SF is the value after the step. The SF is 1 before the
+        first failure and remains at its final value after the last failure or
+        right censored time. The times are found using a binary search
+        (np.searchsorted) of the distinct times so this is suitable for
+        millions of times.
+        """
+        lower, SF, upper = _SF_at(
+            times, self.data, self.RA, self._RA_lower, self._RA_upper
+        )
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(lower),
+                unpack_single_arrays(SF),
+                unpack_single_arrays(upper),
+            )
+        return unpack_single_arrays(SF)
+
+    def CHF_at(self, times, CI_bounds=False):
+        """
+        Evaluates the Rank Adjustment estimate of the CHF at any times.
+
+        Parameters
+        ----------
+        times : int, float, list, array
+            The times at which to evaluate the CHF.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        CHF : float, array
+            The CHF at each time. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the lower confidence bound, the CHF,
+            and the upper confidence bound at each time. Only returned if
+            CI_bounds is True.
+
+        Notes
+        -----
+        The CHF is obtained from the SF as CHF = -ln(SF). See SF_at for how the
+        step function is evaluated. The upper bound is inf where the lower
+        bound of the SF is 0.
+        """
+        lower, SF, upper = _SF_at(
+            times, self.data, self.RA, self._RA_lower, self._RA_upper
+        )
+        with np.errstate(divide="ignore"):
+            CHF_lower, CHF, CHF_upper = -np.log(upper), -np.log(SF), -np.log(lower)
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(CHF_lower),
+                unpack_single_arrays(CHF),
+                unpack_single_arrays(CHF_upper),
+            )
+        return unpack_single_arrays(CHF)
+
+    def quantile(self, q, CI_bounds=False):
+        """
+        Quantile calculator
+
+        Parameters
+        ----------
+        q : float, list, array
+            Quantile to be calculated. Must be between 0 and 1.
+        CI_bounds : bool, optional
+            If True, the confidence bounds are also returned. Default is False.
+
+        Returns
+        -------
+        x : float, array
+            The first time at which the Rank Adjustment estimate of the CDF
+            reaches q. Only returned if CI_bounds is False.
+        lower_estimate, point_estimate, upper_estimate : tuple
+            A tuple of arrays or floats of the first times at which the upper
+            confidence bound of the CDF, the CDF, and the lower confidence bound
+            of the CDF reach q. Only returned if CI_bounds is True.
+
+        Notes
+        -----
+        The quantile is inf if the CDF estimate does not reach q, which occurs
+        when q is more than the fraction failing at the last failure.
+        """
+        lower, x, upper = _quantile(
+            q, self.data, self.RA, self._RA_lower, self._RA_upper
+        )
+        if CI_bounds is True:
+            return (
+                unpack_single_arrays(lower),
+                unpack_single_arrays(x),
+                unpack_single_arrays(upper),
+            )
+        return unpack_single_arrays(x)
+
+
+class Stratified:
+    """
+    Uses the Kaplan-Meier, Nelson-Aalen, or Rank Adjustment estimation method
+    to calculate the reliability of many groups (strata) of data in a single
+    vectorized calculation. Right censoring is supported and confidence bounds
+    are provided.
+
+    Parameters
+    ----------
+    times : array, list
+        The failure and right censored times from all of the groups.
+    censor_codes : array, list, optional
+        The censoring code (1 for a failure or 0 for right censored) of each
+        of the times. Default is None which treats all the times as failures.
+    groups : array, list, optional
+        The group label (such as the supplier name) of each of the times.
+        Default is None which treats all the times as one group.
+    weights : array, list, optional
+        The number of units at each of the times. Default is None which gives
+        each time a weight of 1.
+    method : str, optional
+        The estimation method. Must be either 'KM' (Kaplan-Meier), 'NA'
+        (Nelson-Aalen), or 'RA' (Rank Adjustment). Default is 'KM'.
+    CI : float, optional
+        confidence interval for estimating confidence limits on parameters. Must
+        be between 0 and 1. Default is 0.95 for 95% CI.
+    a : float, int, optional
+        The heuristic constant for plotting positions of the form
+        (k-a)/(n+1-2a). Only used when method='RA'. Default is a=0.3 which is
+        the median rank method (same as the default in Minitab).
+    print_results : bool, optional
+        Prints a dataframe of the results. True or False. Default = True
+
+    Returns
+    -------
+    results : dataframe
+        A pandas dataframe of results in long format. This has one row for each
+        distinct failure time and one row for each distinct right censored time
+        within each group. The groups are sorted by their labels.
+    groups : array
+        The sorted unique group labels.
+    strata : array
+        The group label of each row. Same as 'Group' column from results
+        dataframe
+    data : array
+        The distinct failures and right_censored values sorted within each
+        group. Same as 'Failure times' column from results dataframe
+    censor_codes : array
+        the censoring codes (0 or 1) of each row. Same as 'Censoring code
+        (censored=0)' column from results dataframe
+    SF : array
+        The estimate of the Survival Function at each row. Same as the
+        'Kaplan-Meier Estimate', 'Nelson-Aalen Estimate', or 'Rank Adjustment
+        Estimate' column from results dataframe
+    SF_lower : array
+        The lower CI bound of the SF at each row. Same as 'Lower CI bound'
+        column from results dataframe
+    SF_upper : array
+        The upper CI bound of the SF at each row. Same as 'Upper CI bound'
+        column from results dataframe
+
+    Notes
+    -----
+    The results for each group are the same as from KaplanMeier, NelsonAalen
+    or RankAdjustment given the data from that group. Unlike those functions,
+    there is no minimum number of failures in each group so groups with one
+    failure or only right censored data are included.
+
+    The data from all groups are sorted together using a single lexsort and
+    the estimates are obtained using cumulative sums and products which
+    restart at the start of each group. The memory used is proportional to the
+    number of times so this is suitable for thousands of groups. Stratified
+    does not produce a plot. The stepwise plot of any group can be obtained by
+    passing the data from that group to KaplanMeier, NelsonAalen or
+    RankAdjustment.
+    """
+
+    def __init__(
+        self,
+        times=None,
+        censor_codes=None,
+        groups=None,
+        weights=None,
+        method="KM",
+        CI=0.95,
+        a=None,
+        print_results=True,
+    ):
+        if times is None:
+            raise ValueError(
+                "times must be provided to calculate non-parametric estimates."
+            )
+        if type(times) not in [list, np.ndarray]:
+            raise ValueError("times must be a list or array")
+        times = np.asarray(times, dtype=float)
+        if censor_codes is None:
+            censor_codes = np.ones_like(times)
+        elif type(censor_codes) not in [list, np.ndarray]:
+            raise ValueError("censor_codes must be a list or array")
+        censor_codes = np.asarray(censor_codes)
+        if groups is None:
+            groups = np.zeros(len(times), dtype=int)
+        elif type(groups) not in [list, np.ndarray]:
+            raise ValueError("groups must be a list or array")
+        groups = np.asarray(groups)
+        if weights is None:
+            weights = np.ones_like(times)
+        elif type(weights) not in [list, np.ndarray]:
+            raise ValueError("weights must be a list or array")
+        weights = np.asarray(weights, dtype=float)
+        if not len(times) == len(censor_codes) == len(groups) == len(weights):
+            raise ValueError(
+                "censor_codes, groups, and weights must be the same length as times"
+            )
+        if not np.isin(censor_codes, [0, 1]).all():
+            raise ValueError(
+                "censor_codes must be 1 for a failure or 0 for right censored"
+            )
+        if not np.isfinite(times).all():
+            raise ValueError("times must be finite")
+        if not np.isfinite(weights).all() or min(np.hstack([weights, 0])) < 0:
+            raise ValueError("weights must be finite and not negative")
+        if method not in ["KM", "NA", "RA"]:
+            raise ValueError(
+                "method must be 'KM' (Kaplan-Meier), 'NA' (Nelson-Aalen), or 'RA' (Rank Adjustment). Default is 'KM'."
+            )
+        if CI < 0 or CI > 1:
+            raise ValueError(
+                "CI must be between 0 and 1. Default is 0.95 for 95% confidence intervals."
+            )
+        if a is None:
+            a = 0.3
+        elif a < 0 or a > 1:
+            raise ValueError(
+                "a must be in the range 0 to 1. Default is 0.3 which gives the median rank. For more information see https://en.wikipedia.org/wiki/Q%E2%80%93Q_plot#Heuristics"
+            )
+        if not np.any((censor_codes == 1) & (weights > 0)):
+            raise ValueError(
+                "At least one failure is required to calculate non-parametric estimates."
+            )
+
+        # Rows with zero weight are dropped. The tie grouping and estimates are
+        # the same as in KaplanMeier, NelsonAalen and RankAdjustment, with sums
+        # and products that restart at the first row of each group.
+        keep = weights > 0
+        labels, group = np.unique(groups[keep], return_inverse=True)
+        times, censor_codes, weights = times[keep], censor_codes[keep], weights[keep]
+        t, c, counts, remaining, group = _tied_rows(
+            times, censor_codes.astype(int), weights, group
+        )
+        SF = _nonparametric_SF(method, c, counts, remaining, a=a, group=group)
+        SF_lower, SF_upper = _greenwood_bounds(SF, c, counts, remaining, CI, group)
+
+        self.groups = labels
+        self.strata = labels[group]
+        self.data = t
+        self.censor_codes = c
+        self.SF = SF
+        self.SF_lower = SF_lower
+        self.SF_upper = SF_upper
+
+        # assemble the pandas dataframe for the output
+        estimate_name = {
+            "KM": "Kaplan-Meier Estimate",
+            "NA": "Nelson-Aalen Estimate",
+            "RA": "Rank Adjustment Estimate",
+        }[method]
+        DATA = {
+            "Group": self.strata,
+            "Failure times": t,
+            "Censoring code (censored=0)": c,
+            "Number of items": counts,
+            "Items remaining": remaining,
+            estimate_name: SF,
+            "Lower CI bound": SF_lower,
+            "Upper CI bound": SF_upper,
+        }
+        self.results = pd.DataFrame(
+            DATA,
+            columns=[
+                "Group",
+                "Failure times",
+                "Censoring code (censored=0)",
+                "Number of items",
+                "Items remaining",
+                estimate_name,
+                "Lower CI bound",
+                "Upper CI bound",
+            ],
+        )
+
+        CI_rounded = CI * 100
+        if CI_rounded % 1 == 0:
+            CI_rounded = int(CI * 100)
+
+        if print_results is True:
+            method_name = {
+                "KM": "KaplanMeier",
+                "NA": "NelsonAalen",
+                "RA": "RankAdjustment",
+            }[method]
+            colorprint(
+                str(
+                    "Results from Stratified "
+                    + method_name
+                    + " ("
+                    + str(CI_rounded)
+                    + "% CI):"
+                ),
+                bold=True,
+                underline=True,
+            )
+            print(self.results.to_string(index=False), "\n")
@@ -39,7 +39,6 @@ plot_points - plots the failure points on a scatter plot. Useful to overlay
 import matplotlib.pyplot as plt
 from matplotlib.transforms import blended_transform_factory
 import numpy as np
-import pandas as pd
 from reliability.Distributions import (
     Weibull_Distribution,
     Lognormal_Distribution,
@@ -50,7 +49,12 @@ from reliability.Distributions import (
     Loglogistic_Distribution,
     Gumbel_Distribution,
 )
-from reliability.Nonparametric import KaplanMeier, NelsonAalen, RankAdjustment
+from reliability.Nonparametric import (
+    KaplanMeier,
+    NelsonAalen,
+    RankAdjustment,
+    _adjusted_rank,
+)
 from reliability.Utils import (
     axes_transforms,
     round_and_string,
@@ -64,7 +68,13 @@ np.seterr("ignore")
 dec = 3  # number of decimals to use when rounding fitted parameters in labels
 
 
-def plotting_positions(failures=None, right_censored=None, a=None):
+def plotting_positions(
+    failures=None,
+    right_censored=None,
+    a=None,
+    failure_weights=None,
+    right_censored_weights=None,
+):
     """
     Calculates the plotting positions for plotting on probability paper.
 
@@ -81,6 +91,12 @@ def plotting_positions(failures=None, right_censored=None, a=None):
         (same as the default in Minitab and Reliasoft). Must be in the range 0
         to 1. For more heuristics, see:
         https://en.wikipedia.org/wiki/Q%E2%80%93Q_plot#Heuristics
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
 
     Returns
     -------
@@ -93,6 +109,12 @@ def plotting_positions(failures=None, right_censored=None, a=None):
     -----
     This function is primarily used by the probability plotting functions. The
     order of the input data is preserved (not sorted).
+
+    At tied times, the failures are ranked before the right censored items.
+
+    When weights are given, n is the sum of the weights and each failure time
+    is returned once with the plotting position of the last of its units. This
+    is the same as the plotting position of that unit in the expanded data.
     """
 
     # error checking the input
@@ -115,49 +137,46 @@ def plotting_positions(failures=None, right_censored=None, a=None):
             "a must be in the range 0 to 1. Default is 0.3 which gives the median rank. For more information see https://en.wikipedia.org/wiki/Q%E2%80%93Q_plot#Heuristics"
         )
 
-    # construct the dataframe for the rank adjustment method
-    f_codes = np.ones_like(f)
-    rc_codes = np.zeros_like(rc)
-    cens_codes = np.hstack([f_codes, rc_codes])
+    if failure_weights is None:
+        f_weights = np.ones_like(f, dtype=float)
+    elif type(failure_weights) in [np.ndarray, list]:
+        f_weights = np.asarray(failure_weights, dtype=float)
+    else:
+        raise ValueError("if specified, failure_weights must be an array or list")
+    if right_censored_weights is None:
+        rc_weights = np.ones_like(rc, dtype=float)
+    elif type(right_censored_weights) in [np.ndarray, list]:
+        rc_weights = np.asarray(right_censored_weights, dtype=float)
+    else:
+        raise ValueError(
+            "if specified, right_censored_weights must be an array or list"
+        )
+    if len(f_weights) != len(f) or len(rc_weights) != len(rc):
+        raise ValueError(
+            "failure_weights and right_censored_weights must be the same length as failures and right_censored"
+        )
+
+    # sort the data for the rank adjustment method. At tied times the failures
+    # are placed before the right censored items (as in Nonparametric) so that
+    # weighted data gives the same plotting positions as the expanded data.
     all_data = np.hstack([f, rc])
-    n = len(all_data)
-    data = {"times": all_data, "cens_codes": cens_codes}
-    df = pd.DataFrame(data, columns=["times", "cens_codes"])
-    df_sorted = df.sort_values(by="times")
-    df_sorted["reverse_i"] = np.arange(1, n + 1)[::-1]
-    failure_rows = df_sorted.loc[df_sorted["cens_codes"] == 1.0]
-    reverse_i = failure_rows["reverse_i"].values
-    len_reverse_i = len(reverse_i)
-    leading_cens = np.where(df_sorted["cens_codes"].values == 1)[0][0]
-
-    if leading_cens > 0:  # there are censored items before the first failure
-        k = np.arange(1, len_reverse_i + 1)
-        adjusted_rank2 = [0]
-        rank_increment = [leading_cens / (n - 1)]
-        for j in k:
-            rank_increment.append((n + 1 - adjusted_rank2[-1]) / (1 + reverse_i[j - 1]))
-            adjusted_rank2.append(adjusted_rank2[-1] + rank_increment[-1])
-        adjusted_rank = adjusted_rank2[1:]
-    else:  # the first item is a failure
-        k = np.arange(1, len_reverse_i)
-        adjusted_rank = [1]
-        rank_increment = [1]
-        for j in k:
-            if j > 0:
-                rank_increment.append((n + 1 - adjusted_rank[-1]) / (1 + reverse_i[j]))
-                adjusted_rank.append(adjusted_rank[-1] + rank_increment[-1])
-    F = []
-    for i in adjusted_rank:
-        F.append((i - a) / (n + 1 - 2 * a))
-
-    # restore the original order of the points using the index from the sorted dataframe
-    idx = failure_rows.index.values
-    df2 = pd.DataFrame(
-        data={"x": failure_rows.times.values, "y": F, "idx": idx},
-        columns=["x", "y", "idx"],
-    ).sort_values(by="idx")
-    x = df2.x.values
-    y = df2.y.values
+    all_weights = np.hstack([f_weights, rc_weights])
+    cens_codes = np.hstack([np.ones(len(f)), np.zeros(len(rc))])
+    order = np.lexsort((1 - cens_codes, all_data))
+    sorted_weights = all_weights[order]
+    is_failure = order < len(f)  # the failures are the first len(f) items
+    # the reverse rank is the number of units at or after each row
+    reverse_i = np.cumsum(sorted_weights[::-1])[::-1]
+
+    # Johnson's adjusted rank, as used by Nonparametric.RankAdjustment. A row of
+    # w failures moves the rank by w units at once.
+    adjusted_rank, n = _adjusted_rank(cens_codes[order], sorted_weights, reverse_i)
+    F = (adjusted_rank[is_failure] - a) / (n + 1 - 2 * a)
+
+    # restore the original order of the failures
+    x = all_data[: len(f)]
+    y = np.empty(len(f))
+    y[order[is_failure]] = F
     return x, y
 
 
@@ -172,6 +191,8 @@ def Weibull_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -185,6 +206,12 @@ def Weibull_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     fit_gamma : bool, optional
         Specify this as True in order to fit the Weibull_3P distribution and
         scale the x-axis to time - gamma. Default = False.
@@ -287,6 +314,8 @@ def Weibull_probability_plot(
                 fit = Fit_Weibull_2P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -320,6 +349,8 @@ def Weibull_probability_plot(
                 fit = Fit_Weibull_3P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -359,7 +390,13 @@ def Weibull_probability_plot(
         )
 
     # plot the failure points and format the scale and axes
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -399,6 +436,8 @@ def Loglogistic_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -412,6 +451,12 @@ def Loglogistic_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     fit_gamma : bool, optional
         Specify this as True in order to fit the Loglogistic_3P distribution and
         scale the x-axis to time - gamma. Default = False.
@@ -514,6 +559,8 @@ def Loglogistic_probability_plot(
                 fit = Fit_Loglogistic_2P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -547,6 +594,8 @@ def Loglogistic_probability_plot(
                 fit = Fit_Loglogistic_3P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -585,7 +634,13 @@ def Loglogistic_probability_plot(
         )
 
     # plot the failure points and format the scale and axes
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -628,6 +683,8 @@ def Exponential_probability_plot_Weibull_Scale(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -646,6 +703,12 @@ def Exponential_probability_plot_Weibull_Scale(
         The failure data. Must have at least 1 element.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     fit_gamma : bool, optional
         Specify this as True in order to fit the Exponential_2P distribution and
         scale the x-axis to time - gamma. Default = False.
@@ -746,6 +809,8 @@ def Exponential_probability_plot_Weibull_Scale(
                 fit = Fit_Exponential_1P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -771,6 +836,8 @@ def Exponential_probability_plot_Weibull_Scale(
                 fit = Fit_Exponential_2P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -801,7 +868,13 @@ def Exponential_probability_plot_Weibull_Scale(
         ef = Exponential_Distribution(Lambda=Lambda, Lambda_SE=Lambda_SE, CI=CI)
 
     # plot the failure points and format the scale and axes
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -841,6 +914,8 @@ def Gumbel_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -853,6 +928,12 @@ def Gumbel_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     show_fitted_distribution : bool, optional
         If True, the fitted distribution will be plotted on the probability
         plot. Defaults = True.
@@ -939,6 +1020,8 @@ def Gumbel_probability_plot(
             fit = Fit_Gumbel_2P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
             )
@@ -968,7 +1051,13 @@ def Gumbel_probability_plot(
             CI_type=CI_type,
         )
 
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -1005,6 +1094,8 @@ def Normal_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -1017,6 +1108,12 @@ def Normal_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     show_fitted_distribution : bool, optional
         If True, the fitted distribution will be plotted on the probability
         plot. Defaults = True.
@@ -1103,6 +1200,8 @@ def Normal_probability_plot(
             fit = Fit_Normal_2P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
             )
@@ -1132,7 +1231,13 @@ def Normal_probability_plot(
         )
 
     # plot the failure points and format the scale and axes
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -1170,6 +1275,8 @@ def Lognormal_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -1183,6 +1290,12 @@ def Lognormal_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     fit_gamma : bool, optional
         Specify this as True in order to fit the Lognormal_3P distribution and
         scale the x-axis to time - gamma. Default = False.
@@ -1284,6 +1397,8 @@ def Lognormal_probability_plot(
                 fit = Fit_Lognormal_2P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     show_probability_plot=False,
                     print_results=False,
                 )
@@ -1317,6 +1432,8 @@ def Lognormal_probability_plot(
                 fit = Fit_Lognormal_3P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     show_probability_plot=False,
                     print_results=False,
                 )
@@ -1353,7 +1470,13 @@ def Lognormal_probability_plot(
         )
 
     # plot the failure points and format the scale and axes
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -1390,6 +1513,8 @@ def Beta_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -1402,6 +1527,12 @@ def Beta_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     show_fitted_distribution : bool, optional
         If True, the fitted distribution will be plotted on the probability
         plot. Defaults = True.
@@ -1487,6 +1618,8 @@ def Beta_probability_plot(
         fit = Fit_Beta_2P(
             failures=failures,
             right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
             show_probability_plot=False,
             print_results=False,
         )
@@ -1507,7 +1640,13 @@ def Beta_probability_plot(
         beta=beta,
     )
 
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     plt.grid(visible=True, which="major", color="k", alpha=0.3, linestyle="-")
     plt.grid(visible=True, which="minor", color="k", alpha=0.08, linestyle="-")
     if show_scatter_points is True:
@@ -1548,6 +1687,8 @@ def Gamma_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -1561,6 +1702,12 @@ def Gamma_probability_plot(
         The failure data. Must have at least 2 elements.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     fit_gamma : bool, optional
         Specify this as True in order to fit the Gamma_3P distribution and
         scale the x-axis to time - gamma. Default = False.
@@ -1670,6 +1817,8 @@ def Gamma_probability_plot(
             fit = Fit_Gamma_2P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
             )
@@ -1707,6 +1856,8 @@ def Gamma_probability_plot(
             fit = Fit_Gamma_3P(
                 failures=failures,
                 right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
                 show_probability_plot=False,
                 print_results=False,
             )
@@ -1748,7 +1899,13 @@ def Gamma_probability_plot(
     )
 
     # plot the failure points and format the scale and axes
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -1786,6 +1943,8 @@ def Exponential_probability_plot(
     show_fitted_distribution=True,
     show_scatter_points=True,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -1804,6 +1963,12 @@ def Exponential_probability_plot(
         The failure data. Must have at least 1 element.
     right_censored : array, list, optional
         The right censored data. Optional input. Default = None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     fit_gamma : bool, optional
         Specify this as True in order to fit the Exponential_2P distribution and
         scale the x-axis to time - gamma. Default = False.
@@ -1900,6 +2065,8 @@ def Exponential_probability_plot(
                 fit = Fit_Exponential_1P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -1925,6 +2092,8 @@ def Exponential_probability_plot(
                 fit = Fit_Exponential_2P(
                     failures=failures,
                     right_censored=right_censored,
+                    failure_weights=failure_weights,
+                    right_censored_weights=right_censored_weights,
                     CI=CI,
                     show_probability_plot=False,
                     print_results=False,
@@ -1948,7 +2117,13 @@ def Exponential_probability_plot(
                 right_censored = right_censored - gamma
         ef = Exponential_Distribution(Lambda=Lambda, Lambda_SE=Lambda_SE, CI=CI)
 
-    x, y = plotting_positions(failures=failures, right_censored=right_censored, a=a)
+    x, y = plotting_positions(
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
+    )
     if show_scatter_points is True:
         x_scatter, y_scatter = xy_downsample(
             x, y, downsample_factor=downsample_scatterplot
@@ -2430,7 +2605,10 @@ def PP_plot_semiparametric(
         )
         df = KM.results
         failure_rows = df.loc[df["Censoring code (censored=0)"] == 1.0]
-        ecdf = 1 - np.array(failure_rows["Kaplan-Meier Estimate"].values)
+        # tied failures are one row so the estimate is repeated for each failure
+        ecdf = 1 - np.repeat(
+            failure_rows["Kaplan-Meier Estimate"].values, failure_rows["Number of items"].values
+        )
         xlabel = "Empirical CDF (Kaplan-Meier estimate)"
     elif method == "NA":
         NA = NelsonAalen(
@@ -2441,7 +2619,10 @@ def PP_plot_semiparametric(
         )
         df = NA.results
         failure_rows = df.loc[df["Censoring code (censored=0)"] == 1.0]
-        ecdf = 1 - np.array(failure_rows["Nelson-Aalen Estimate"].values)
+        # tied failures are one row so the estimate is repeated for each failure
+        ecdf = 1 - np.repeat(
+            failure_rows["Nelson-Aalen Estimate"].values, failure_rows["Number of items"].values
+        )
         xlabel = "Empirical CDF (Nelson-Aalen estimate)"
     elif method == "RA":
         RA = RankAdjustment(
@@ -2453,7 +2634,10 @@ def PP_plot_semiparametric(
         )
         df = RA.results
         failure_rows = df.loc[df["Censoring code (censored=0)"] == 1.0]
-        ecdf = 1 - np.array(failure_rows["Rank Adjustment Estimate"].values)
+        # tied failures are one row so the estimate is repeated for each failure
+        ecdf = 1 - np.repeat(
+            failure_rows["Rank Adjustment Estimate"].values, failure_rows["Number of items"].values
+        )
         xlabel = "Empirical CDF (Rank Adjustment estimate)"
     else:
         raise ValueError(
@@ -2615,7 +2799,10 @@ def QQ_plot_semiparametric(
         )
         df = KM.results
         failure_rows = df.loc[df["Censoring code (censored=0)"] == 1.0]
-        ecdf = 1 - np.array(failure_rows["Kaplan-Meier Estimate"].values)
+        # tied failures are one row so the estimate is repeated for each failure
+        ecdf = 1 - np.repeat(
+            failure_rows["Kaplan-Meier Estimate"].values, failure_rows["Number of items"].values
+        )
         method_str = "Kaplan-Meier"
     elif method == "NA":
         NA = NelsonAalen(
@@ -2626,7 +2813,10 @@ def QQ_plot_semiparametric(
         )
         df = NA.results
         failure_rows = df.loc[df["Censoring code (censored=0)"] == 1.0]
-        ecdf = 1 - np.array(failure_rows["Nelson-Aalen Estimate"].values)
+        # tied failures are one row so the estimate is repeated for each failure
+        ecdf = 1 - np.repeat(
+            failure_rows["Nelson-Aalen Estimate"].values, failure_rows["Number of items"].values
+        )
         method_str = "Nelson-Aalen"
     elif method == "RA":
         RA = RankAdjustment(
@@ -2638,7 +2828,10 @@ def QQ_plot_semiparametric(
         )
         df = RA.results
         failure_rows = df.loc[df["Censoring code (censored=0)"] == 1.0]
-        ecdf = 1 - np.array(failure_rows["Rank Adjustment Estimate"].values)
+        # tied failures are one row so the estimate is repeated for each failure
+        ecdf = 1 - np.repeat(
+            failure_rows["Rank Adjustment Estimate"].values, failure_rows["Number of items"].values
+        )
         method_str = "Rank Adjustment"
     else:
         raise ValueError(
@@ -2717,6 +2910,8 @@ def plot_points(
     func="CDF",
     a=None,
     downsample_scatterplot=False,
+    failure_weights=None,
+    right_censored_weights=None,
     **kwargs
 ):
     """
@@ -2751,6 +2946,12 @@ def plot_points(
         result in no downsampling. This functionality makes plotting faster when
         there are very large numbers of points. It only affects the scatterplot
         not the calculations.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Optional input. Default is
+        None which gives each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Optional input.
+        Default is None which gives each right censored value a weight of 1.
     kwargs
         Keyword arguments for the scatter plot. Defaults are set for color='k'
         and marker='.' These defaults can be changed using kwargs.
@@ -2781,7 +2982,11 @@ def plot_points(
         )
 
     x, y = plotting_positions(
-        failures=failures, right_censored=right_censored, a=a
+        failures=failures,
+        right_censored=right_censored,
+        a=a,
+        failure_weights=failure_weights,
+        right_censored_weights=right_censored_weights,
     )  # get the plotting positions
     y = np.array(y)
     x = np.array(x)
@@ -12,23 +12,33 @@ Included functions are:
 - ALT_fitters_input_checking - performs input checking for the ALT_Fitters
 - ALT_least_squares - least squares estimation for ALT_Fitters
 - ALT_prob_plot - probability plotting for ALT_Fitters
+- LL_derivatives_registry - closed form derivatives of the log-likelihood functions used by the Fitters
+- LL_hessian - hessian of a log-likelihood function using closed form derivatives or autograd
+- LL_value_and_grad - value and gradient of a log-likelihood function using closed form derivatives or autograd
 - LS_optimization - least squares optimization for Fitters
 - MLE_optimization - maximum likelihood estimation optimization for Fitters
 - anderson_darling - calculated the anderson darling (AD) goodness of fit statistic
 - axes_transforms - Custom scale functions used in Probability_plotting
+- batch_extract_CI - extracts the confidence bounds at CI_x or CI_y for many fitted distributions at once
+- bracketed_root - solves function(x) = y for many values of y at once using Chandrupatla's method
 - clean_CI_arrays - cleans the CI arrays of nan and illegal values
+- closed_form_MLE - the MLE of the distributions for which it has a closed form
 - colorprint - prints to the console in color, bold, italic, and underline
 - distribution_confidence_intervals - calculates and plots the confidence intervals for the distributions
 - fill_no_autoscale - creates a shaded region without adding it to the global list of objects to consider when autoscale is calculated
 - fitters_input_checking - error checking and default values for all the fitters
 - generate_X_array - generates the X values for all distributions
+- get_LL_derivatives - finds the closed form derivatives of a log-likelihood function in LL_derivatives_registry
 - get_axes_limits - gets the current axes limits
 - least_squares - provides parameter estimates for distributions using the method of least squares. Used extensively by Fitters.
 - life_stress_plot - generates the life stress plot for ALT_Fitters
 - line_no_autoscale - creates a line without adding it to the global list of objects to consider when autoscale is calculated
 - linear_regression - given x and y data it will return slope and intercept of line of best fit. Includes options to specify slope or intercept.
 - make_fitted_dist_params_for_ALT_probplots - creates a class structure for the ALT probability plots to give to Probability_plotting
+- mean_residual_life_from_SF - calculates the mean residual life at many times from the survival function of a model
+- newton_MLE - finds the MLE using Newton's method with the closed form derivatives of the log-likelihood
 - no_reverse - corrects for reversals in confidence intervals
+- prepared_data - checks the data and stores what is shared by the fitters such as the plotting positions
 - probability_plot_xylims - sets the x and y limits on probability plots
 - probability_plot_xyticks - sets the x and y ticks on probability plots
 - removeNaNs - removes nan
@@ -37,6 +47,9 @@ Included functions are:
 - show_figure_from_object - Re-shows a figure from an axes or figure handle even after the figure has been closed.
 - transform_spaced - Creates linearly spaced array (in transform space) based on a specified transform. This is like np.logspace but it can make an array that is weibull spaced, normal spaced, etc.
 - validate_CI_params - checks that the confidence intervals have all the right parameters to be generated
+- weibull_2P_information - closed form log-likelihood and observed information matrix of the Weibull_2P distribution for many datasets at once
+- weibull_2P_profile_fit - solves the Weibull_2P MLE for a single dataset using the profile likelihood of beta
+- weibull_2P_profile_MLE - solves the Weibull_2P MLE for many datasets at once using the profile likelihood of beta
 - write_df_to_xlsx - converts a dataframe to an xlsx file
 - xy_transform - provides conversions between spatial (-inf,inf) and axes coordinates (0,1).
 - zeroise_below_gamma - sets all y values to zero when x < gamma. Used when the HF and CHF equations are specified
@@ -49,17 +62,21 @@ from matplotlib.axes import _axes
 from matplotlib.figure import Figure
 from matplotlib.collections import PolyCollection, LineCollection
 from matplotlib import ticker, colors
-from autograd import jacobian as jac
+from autograd import elementwise_grad
 from autograd_gamma import gammainccinv as agammainccinv
 from autograd_gamma import gammaincc as agammaincc
 from autograd import value_and_grad
+from autograd.differential_operators import hessian
 import autograd.numpy as anp
-from scipy.special import gammainc, betainc, erf
+from scipy.special import gammainc, gammaincc, gammainccinv, gammaln, betainc, erf, expit
 from scipy.optimize import curve_fit, minimize, OptimizeWarning
+from scipy.integrate import quad, quad_vec
 from numpy.linalg import LinAlgError
 import warnings
 import os
+from functools import partial
 import pandas as pd
+from collections import OrderedDict
 
 warnings.filterwarnings(
     action="ignore", category=OptimizeWarning
@@ -1306,7 +1323,7 @@ def probability_plot_xyticks(yticks=None):
     )  # sets the formatting of the axes coordinates in the bottom right of the figure. Without this the FuncFormatter raw strings make it into the axes coords and don't look good.
 
 
-def anderson_darling(fitted_cdf, empirical_cdf):
+def anderson_darling(fitted_cdf, empirical_cdf, weights=None):
     """
     Calculates the Anderson-Darling goodness of fit statistic.
     These formulas are based on the method used in MINITAB which gives an
@@ -1318,11 +1335,21 @@ def anderson_darling(fitted_cdf, empirical_cdf):
         The fitted CDF values at the data points
     empirical_cdf  : list, array
         The empirical (rank adjustment) CDF values at the data points
+    weights : list, array, optional
+        The number of units at each data point. Default is None which gives
+        each data point a weight of 1.
 
     Returns
     -------
     AD : float
         The anderson darling (adjusted) test statistic.
+
+    Notes
+    -----
+    When weights are given, the empirical_cdf should be the plotting position
+    of the last unit at each data point (as returned by plotting_positions).
+    Repeated units have the same fitted CDF so they add nothing to the sum and
+    the result is the same as for the expanded data.
     """
     if type(fitted_cdf) != np.ndarray:
         fitted_cdf = [fitted_cdf]  # required when there is only 1 failure
@@ -1342,7 +1369,10 @@ def anderson_darling(fitted_cdf, empirical_cdf):
         - lnZi_1 * FnZi_1**2
         + np.log(1 - Zi_1) * FnZi_1**2
     )
-    n = len(fitted_cdf)
+    if weights is None:
+        n = len(fitted_cdf)
+    else:
+        n = np.sum(weights)
     AD = n * ((A + B + C).sum())
     return AD
 
@@ -1501,6 +1531,211 @@ def colorprint(
     )
 
 
+class prepared_data:
+    """
+    Checks the failure and right censored data and stores it so that it may be
+    shared by several of the Fitters. The sort order, the plotting positions
+    and the Kaplan-Meier estimate are calculated the first time they are used
+    and are then stored so they are not calculated again.
+
+    Parameters
+    ----------
+    failures : array, list
+        The failure data
+    right_censored : array, list, optional
+        The right censored data. Default is None.
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. Must be the
+        same length as failures. Default is None which gives each failure a
+        weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time. Must
+        be the same length as right_censored. Default is None which gives each
+        right censored value a weight of 1.
+
+    Returns
+    -------
+    failures : array
+        The failure times
+    right_censored : array
+        The right censored times. This will be an empty array if the input was
+        None.
+    failure_weights : array
+        The weights of the failures. This will be an array of ones if the input
+        was None.
+    right_censored_weights : array
+        The weights of the right censored times. This will be an array of ones
+        if the input was None.
+    sort_order : array
+        The indices that sort the failures followed by the right censored times.
+        Failures are placed before right censored times that are equal to them.
+    plotting_positions : tuple
+        The (x, y) plotting positions of the failures from
+        Probability_plotting.plotting_positions.
+    KM : array
+        The Kaplan-Meier estimate of the SF at each of the sorted times.
+    LS_results : method
+        Returns the LS_optimization results for this data. The results are
+        stored so each distribution is only fitted by least squares once.
+
+    Notes
+    -----
+    Rows with a weight of zero are removed. The checks that depend on the
+    distribution (such as the removal of zeros) are done by
+    fitters_input_checking.
+
+    A prepared_data object may be given as the failures to any of the Fitters
+    in place of the failures, right_censored, failure_weights and
+    right_censored_weights. Fit_Everything creates one prepared_data object and
+    gives it to each of the distributions that it fits so the plotting
+    positions are only calculated once. When racing, the least squares
+    results used to score each distribution are reused by the Fitters as their
+    initial guess.
+
+    .. code:: python
+
+        data = prepared_data(failures=[5, 3, 8, 6, 7, 4, 5, 4, 2], right_censored=[9, 9])
+        fit_1 = Fit_Weibull_2P(failures=data)
+        fit_2 = Fit_Lognormal_2P(failures=data)
+    """
+
+    def __init__(
+        self,
+        failures,
+        right_censored=None,
+        failure_weights=None,
+        right_censored_weights=None,
+    ):
+        # fill right_censored with empty list if not specified
+        if right_censored is None:
+            right_censored = []
+
+        # type checking and converting to arrays for failures and right_censored
+        if type(failures) not in [list, np.ndarray]:
+            raise ValueError("failures must be a list or array of failure data")
+        if type(right_censored) not in [list, np.ndarray]:
+            raise ValueError(
+                "right_censored must be a list or array of right censored failure data"
+            )
+        failures = np.asarray(failures).astype(float)
+        right_censored = np.asarray(right_censored).astype(float)
+
+        # type and value checking for the weights. Rows with zero weight are dropped.
+        if failure_weights is None:
+            failure_weights = np.ones_like(failures)
+        elif type(failure_weights) not in [list, np.ndarray]:
+            raise ValueError("failure_weights must be a list or array")
+        failure_weights = np.asarray(failure_weights).astype(float)
+        if right_censored_weights is None:
+            right_censored_weights = np.ones_like(right_censored)
+        elif type(right_censored_weights) not in [list, np.ndarray]:
+            raise ValueError("right_censored_weights must be a list or array")
+        right_censored_weights = np.asarray(right_censored_weights).astype(float)
+        if len(failure_weights) != len(failures):
+            raise ValueError("failure_weights must be the same length as failures")
+        if len(right_censored_weights) != len(right_censored):
+            raise ValueError(
+                "right_censored_weights must be the same length as right_censored"
+            )
+        if (
+            min(np.hstack([failure_weights, right_censored_weights, 0])) < 0
+            or not np.isfinite(failure_weights).all()
+            or not np.isfinite(right_censored_weights).all()
+        ):
+            raise ValueError("failure_weights and right_censored_weights must be finite and not negative")
+        self.failures = failures[failure_weights > 0]
+        self.failure_weights = failure_weights[failure_weights > 0]
+        self.right_censored = right_censored[right_censored_weights > 0]
+        self.right_censored_weights = right_censored_weights[
+            right_censored_weights > 0
+        ]
+        self._sort_order = None
+        self._plotting_positions = None
+        self._KM = None
+        self._LS_results = {}
+
+    @property
+    def sort_order(self):
+        if self._sort_order is None:
+            self._sort_order = np.argsort(
+                np.hstack([self.failures, self.right_censored]), kind="stable"
+            )
+        return self._sort_order
+
+    @property
+    def plotting_positions(self):
+        if self._plotting_positions is None:
+            from reliability.Probability_plotting import (
+                plotting_positions,
+            )  # this import needs to be here to prevent circular import if it is in the main module
+
+            self._plotting_positions = plotting_positions(
+                failures=self.failures,
+                right_censored=self.right_censored,
+                failure_weights=self.failure_weights,
+                right_censored_weights=self.right_censored_weights,
+            )
+        return self._plotting_positions
+
+    def LS_results(
+        self, func_name, LL_func, method="LS", force_shape=None, LL_func_force=None
+    ):
+        """
+        Returns the LS_optimization results for this data. The results are
+        calculated the first time they are requested for each func_name, method
+        and force_shape and are then stored.
+
+        Parameters
+        ----------
+        func_name : str
+            The function to be fitted. Eg. "Weibull_2P".
+        LL_func : function
+            The log-likelihood function from the fitter
+        method : str, optional
+            Must be either "RRX", "RRY", "LS", or "NLLS". Default is "LS".
+        force_shape : float, int, optional
+            The shape parameter to be forced. Default is None which results in
+            no forcing of the shape parameter.
+        LL_func_force : function
+            The log-likelihood function for when the shape parameter is forced.
+            Only required if force_shape is not None.
+
+        Returns
+        -------
+        LS_results : object
+            The LS_optimization object which has the guess and method.
+        """
+        key = (func_name, method, force_shape)
+        if key not in self._LS_results:
+            self._LS_results[key] = LS_optimization(
+                func_name=func_name,
+                LL_func=LL_func,
+                failures=self.failures,
+                right_censored=self.right_censored,
+                method=method,
+                force_shape=force_shape,
+                LL_func_force=LL_func_force,
+                failure_weights=self.failure_weights,
+                right_censored_weights=self.right_censored_weights,
+                positions=self.plotting_positions,
+            )
+        return self._LS_results[key]
+
+    @property
+    def KM(self):
+        if self._KM is None:
+            # the product limit estimate with each row counting as its weight
+            weights = np.hstack([self.failure_weights, self.right_censored_weights])
+            codes = np.hstack(
+                [np.ones_like(self.failures), np.zeros_like(self.right_censored)]
+            )
+            weights = weights[self.sort_order]
+            codes = codes[self.sort_order]
+            at_risk = np.cumsum(weights[::-1])[::-1]
+            self._KM = np.cumprod(1 - codes * weights / at_risk)
+        return self._KM
+
+
 class fitters_input_checking:
     """
     This function performs error checking and some basic default operations for
@@ -1514,8 +1749,10 @@ class fitters_input_checking:
         "Normal_2P", "Lognormal_2P", "Lognormal_3P", "Loglogistic_2P",
         "Loglogistic_3P", "Beta_2P", "Weibull_Mixture", "Weibull_CR",
         "Weibull_DSZI", "Weibull_DS", "Weibull_ZI".
-    failures : array, list
-        The failure data
+    failures : array, list, prepared_data
+        The failure data. This may be a prepared_data object in which case
+        right_censored, failure_weights, and right_censored_weights must not be
+        specified.
     right_censored : array, list, optional
         The right censored data
     method : str, optional
@@ -1545,6 +1782,14 @@ class fitters_input_checking:
         "time" being used (controlled in Fitters). Some flexibility is strings
         is allowed. eg. "r", "R", "rel", "REL", "reliability", "RELIABILITY"
         will all be recognized as "reliability".
+    failure_weights : array, list, optional
+        The number of units (frequency weight) at each failure time. Must be the
+        same length as failures. Default is None which gives each failure a
+        weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units (frequency weight) at each right censored time. Must
+        be the same length as right_censored. Default is None which gives each
+        right censored value a weight of 1.
 
     Returns
     -------
@@ -1553,6 +1798,12 @@ class fitters_input_checking:
     right_censored : array
         The right censored times. This will be an empty array if the input was
         None.
+    failure_weights : array
+        The weights of the failures. This will be an array of ones if the input
+        was None.
+    right_censored_weights : array
+        The weights of the right censored times. This will be an array of ones
+        if the input was None.
     CI : float
         The confidence interval (between 0 and 1)
     method : str, None
@@ -1568,6 +1819,10 @@ class fitters_input_checking:
             The sigma parameter to be forced in Normal_2P, or Lognormal_2P
     CI_type : str, None
         "time", "reliability", 'None' or None
+    prepared : prepared_data
+        The prepared_data object of the failures, right_censored,
+        failure_weights, and right_censored_weights. This is the input object if
+        a prepared_data object was given and no values were removed.
 
     Notes
     -----
@@ -1591,6 +1846,8 @@ class fitters_input_checking:
         force_beta=None,
         force_sigma=None,
         CI_type=None,
+        failure_weights=None,
+        right_censored_weights=None,
     ):
 
         if dist not in [
@@ -1618,19 +1875,28 @@ class fitters_input_checking:
                 "incorrect dist specified. Use the correct name. eg. Weibull_2P"
             )
 
-        # fill right_censored with empty list if not specified
-        if right_censored is None:
-            right_censored = []
-
-        # type checking and converting to arrays for failures and right_censored
-        if type(failures) not in [list, np.ndarray]:
-            raise ValueError("failures must be a list or array of failure data")
-        if type(right_censored) not in [list, np.ndarray]:
-            raise ValueError(
-                "right_censored must be a list or array of right censored failure data"
+        # the failures may be given as a prepared_data object which has already been checked
+        if isinstance(failures, prepared_data):
+            if (
+                right_censored is not None
+                or failure_weights is not None
+                or right_censored_weights is not None
+            ):
+                raise ValueError(
+                    "right_censored, failure_weights, and right_censored_weights must not be specified when failures is a prepared_data object"
+                )
+            data = failures
+        else:
+            data = prepared_data(
+                failures=failures,
+                right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
             )
-        failures = np.asarray(failures).astype(float)
-        right_censored = np.asarray(right_censored).astype(float)
+        failures = data.failures
+        right_censored = data.right_censored
+        failure_weights = data.failure_weights
+        right_censored_weights = data.right_censored_weights
 
         # check failures and right_censored are in the right range for the distribution
         if dist not in ["Normal_2P", "Gumbel_2P"]:
@@ -1649,6 +1915,8 @@ class fitters_input_checking:
             f0 = failures
             right_censored = rc0[rc0 != 0]
             failures = f0[f0 != 0]
+            right_censored_weights = right_censored_weights[rc0 != 0]
+            failure_weights = failure_weights[f0 != 0]
             if len(failures) != len(f0):
                 if dist == "Everything":
                     colorprint(
@@ -1685,6 +1953,8 @@ class fitters_input_checking:
                 f1 = failures
                 right_censored = rc1[rc1 != 1]
                 failures = f1[f1 != 1]
+                right_censored_weights = right_censored_weights[rc1 != 1]
+                failure_weights = failure_weights[f1 != 1]
                 if len(failures) != len(f1):
                     colorprint(
                         "WARNING: failures contained ones. These have been removed to enable fitting of the Beta_2P distribution.",
@@ -1862,9 +2132,23 @@ class fitters_input_checking:
             else:
                 raise ValueError('CI_type must be "time", "reliability", or "none"')
 
+        # the data is prepared again if any values were removed for this distribution
+        if len(failures) != len(data.failures) or len(right_censored) != len(
+            data.right_censored
+        ):
+            data = prepared_data(
+                failures=failures,
+                right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+            )
+
         # return everything
+        self.prepared = data
         self.failures = failures
         self.right_censored = right_censored
+        self.failure_weights = failure_weights
+        self.right_censored_weights = right_censored_weights
         self.CI = CI
         self.method = method
         self.optimizer = optimizer
@@ -2439,62 +2723,28 @@ def clean_CI_arrays(xlower, xupper, ylower, yupper, plot_type="CDF", x=None, q=N
     in length then an error will be triggered.
     """
     # format the input as arrays
-    xlower = np.asarray(xlower)
-    xupper = np.asarray(xupper)
-    ylower = np.asarray(ylower)
-    yupper = np.asarray(yupper)
-
-    # create empty arrays to fill with cleaned values
-    xlower_out = np.array([])
-    xupper_out = np.array([])
-    ylower_out = np.array([])
-    yupper_out = np.array([])
-
-    xlower_out2 = np.array([])
-    xupper_out2 = np.array([])
-    ylower_out2 = np.array([])
-    yupper_out2 = np.array([])
-
-    xlower_out3 = np.array([])
-    xupper_out3 = np.array([])
-    ylower_out3 = np.array([])
-    yupper_out3 = np.array([])
+    xlower = np.atleast_1d(np.asarray(xlower, dtype=float))
+    xupper = np.atleast_1d(np.asarray(xupper, dtype=float))
+    ylower = np.atleast_1d(np.asarray(ylower, dtype=float))
+    yupper = np.atleast_1d(np.asarray(yupper, dtype=float))
 
     # remove nans in all arrays
-    for i in np.arange(len(xlower)):
-        if (
-            np.isfinite(xlower[i])
-            and np.isfinite(xupper[i])
-            and np.isfinite(ylower[i])
-            and np.isfinite(yupper[i])
-        ):
-            xlower_out = np.append(xlower_out, xlower[i])
-            xupper_out = np.append(xupper_out, xupper[i])
-            ylower_out = np.append(ylower_out, ylower[i])
-            yupper_out = np.append(yupper_out, yupper[i])
-
+    keep = (
+        np.isfinite(xlower)
+        & np.isfinite(xupper)
+        & np.isfinite(ylower)
+        & np.isfinite(yupper)
+    )
     # remove values >= 1 for CDF and SF
     if plot_type.upper() in ["CDF", "SF"]:
-        for i in np.arange(len(xlower_out)):
-            if ylower_out[i] < 1 and yupper_out[i] < 1:
-                xlower_out2 = np.append(xlower_out2, xlower_out[i])
-                xupper_out2 = np.append(xupper_out2, xupper_out[i])
-                ylower_out2 = np.append(ylower_out2, ylower_out[i])
-                yupper_out2 = np.append(yupper_out2, yupper_out[i])
-    else:  # do nothing
-        xlower_out2 = xlower_out
-        xupper_out2 = xupper_out
-        ylower_out2 = ylower_out
-        yupper_out2 = yupper_out
-
+        keep = keep & (ylower < 1) & (yupper < 1)
     # remove values <=0 for all cases
     tol = 1e-50  # tolerance for equivalent to zero. Accounts for precision error
-    for i in np.arange(len(xlower_out2)):
-        if ylower_out2[i] > tol and yupper_out2[i] > tol:
-            xlower_out3 = np.append(xlower_out3, xlower_out2[i])
-            xupper_out3 = np.append(xupper_out3, xupper_out2[i])
-            ylower_out3 = np.append(ylower_out3, ylower_out2[i])
-            yupper_out3 = np.append(yupper_out3, yupper_out2[i])
+    keep = keep & (ylower > tol) & (yupper > tol)
+    xlower_out3 = xlower[keep]
+    xupper_out3 = xupper[keep]
+    ylower_out3 = ylower[keep]
+    yupper_out3 = yupper[keep]
 
     # checks whether CI_x or CI_y was specified and resulted in values being deleted due to being illegal values. Raises a more detailed error for the user.
     if len(xlower_out3) != len(xlower) and x is not None:
@@ -2586,6 +2836,158 @@ def line_no_autoscale(x, y, **kwargs):
     plt.gca().add_collection(col, autolim=False)
 
 
+# the number of confidence intervals stored on each distribution object
+CI_cache_size = 32
+
+_CI_cache_parameter_names = [
+    "alpha",
+    "beta",
+    "gamma",
+    "mu",
+    "sigma",
+    "Lambda",
+    "alpha_SE",
+    "beta_SE",
+    "mu_SE",
+    "sigma_SE",
+    "Lambda_SE",
+    "Cov_alpha_beta",
+    "Cov_mu_beta",
+    "Cov_mu_sigma",
+]
+
+
+def _CI_cache_chf_end(dist):
+    # the last value of the most recently plotted CHF of a distribution object
+    return None if getattr(dist, "_chf", None) is None else dist._chf[-1]
+
+
+def _get_CI_cache(dist, func, CI_type, CI, q, x):
+    # Returns the cache key and the cached confidence interval arrays (or None) of a distribution object.
+    # The cache is emptied if any of the parameters have changed since it was filled.
+    parameters = tuple(getattr(dist, name, None) for name in _CI_cache_parameter_names)
+    if getattr(dist, "_CI_cache_parameters", None) != parameters:
+        dist._CI_cache = OrderedDict()
+        dist._CI_cache_parameters = parameters
+    key = (
+        func,
+        CI_type,
+        CI,
+        None if q is None else (q.shape, q.astype(float).tobytes()),
+        None if x is None else (x.shape, x.astype(float).tobytes()),
+        # the CHF bounds on time extend to the end of the plotted CHF
+        _CI_cache_chf_end(dist) if func == "CHF" and q is None and x is None else None,
+    )
+    cached = dist._CI_cache.get(key)
+    if cached is None:
+        return key, None
+    dist._CI_cache.move_to_end(key)
+    return key, tuple(np.copy(item) for item in cached)
+
+
+def _set_CI_cache(dist, key, value):
+    # Stores the confidence interval arrays of a distribution object, removing the least recently used if the cache is full.
+    dist._CI_cache[key] = tuple(np.copy(item) for item in value)
+    while len(dist._CI_cache) > CI_cache_size:
+        dist._CI_cache.popitem(last=False)
+
+
+def _linearized_CI(dist_name, CI_type, y, a, b, var_a, var_b, cov_ab):
+    """
+    Calculates the linearized form of the SF used by the confidence bounds and
+    its standard deviation from the variances of the parameters.
+
+    Parameters
+    ----------
+    dist_name : str
+        Must be either "Weibull", "Loglogistic", "Normal", "Lognormal",
+        "Gumbel", or "Gamma".
+    CI_type : str
+        Must be either "time" or "reliability".
+    y : array
+        The reliability for bounds on time, or the time less gamma for bounds
+        on reliability.
+    a : float, array
+        The first parameter. This is alpha for Weibull and Loglogistic, and mu
+        for Normal, Lognormal, Gumbel, and Gamma.
+    b : float, array
+        The second parameter. This is beta for Weibull, Loglogistic, and Gamma,
+        and sigma for Normal, Lognormal, and Gumbel.
+    var_a : float, array
+        The variance of a.
+    var_b : float, array
+        The variance of b.
+    cov_ab : float, array
+        The covariance of a and b.
+
+    Returns
+    -------
+    value : array
+        For bounds on time this is v which is t for Normal and Gumbel and ln(t)
+        otherwise. For bounds on reliability this is u which is ln(-ln(R)) for
+        Weibull and Gumbel, ln(1/R - 1) for Loglogistic, phiinv(R) for Normal
+        and Lognormal, and R for Gamma.
+    sd : array
+        The standard deviation of value.
+
+    Notes
+    -----
+    The inputs are broadcast together so the parameters may have one row for
+    each of many distributions (as is done by batch_extract_CI). The
+    derivatives are in closed form except for the derivative with respect to
+    beta of the Gamma distribution. That derivative is found using autograd
+    with beta given the full shape of the output so each output depends only
+    on its own beta and the elementwise gradient is the derivative at each
+    point.
+    """
+    if CI_type == "time":
+        if dist_name == "Weibull":  # v = ln(t)
+            value = (1 / b) * np.log(-np.log(y)) + np.log(a)
+            d_da, d_db = 1 / a, -np.log(-np.log(y)) / b**2
+        elif dist_name == "Loglogistic":  # v = ln(t)
+            value = (1 / b) * np.log(1 / y - 1) + np.log(a)
+            d_da, d_db = 1 / a, -np.log(1 / y - 1) / b**2
+        elif dist_name in ["Normal", "Lognormal"]:  # v = t or v = ln(t)
+            value = a - b * ss.norm.ppf(y)
+            d_da, d_db = 1, -ss.norm.ppf(y)
+        elif dist_name == "Gumbel":  # v = t
+            value = a + b * np.log(-np.log(y))
+            d_da, d_db = 1, np.log(-np.log(y))
+        else:  # Gamma, v = ln(t)
+            value = np.log(gammainccinv(b, y)) + a
+            shape = np.broadcast(y, a, b).shape
+            y_full = y * np.ones(shape)
+            d_da = 1
+            d_db = elementwise_grad(lambda beta: anp.log(agammainccinv(beta, y_full)))(
+                b * np.ones(shape)
+            )
+    else:
+        if dist_name == "Weibull":  # u = ln(-ln(R))
+            value = b * (np.log(y) - np.log(a))
+            d_da, d_db = -b / a, np.log(y) - np.log(a)
+        elif dist_name == "Loglogistic":  # u = ln(1/R - 1)
+            value = b * (np.log(y) - np.log(a))
+            d_da, d_db = -b / a, np.log(y) - np.log(a)
+        elif dist_name in ["Normal", "Lognormal"]:  # u = phiinv(R)
+            time = y if dist_name == "Normal" else np.log(y)
+            value = (a - time) / b
+            d_da, d_db = 1 / b, (time - a) / b**2
+        elif dist_name == "Gumbel":  # u = ln(-ln(R))
+            value = (y - a) / b
+            d_da, d_db = -1 / b, -(y - a) / b**2
+        else:  # Gamma, u = R
+            x = y / np.exp(a)
+            shape = np.broadcast(x, b).shape
+            x_full = x * np.ones(shape)
+            value = gammaincc(b, x)
+            d_da = np.exp(b * np.log(x) - x - gammaln(b))
+            d_db = elementwise_grad(lambda beta: agammaincc(beta, x_full))(
+                b * np.ones(shape)
+            )
+    sd = (d_da**2 * var_a + d_db**2 * var_b + 2 * d_da * d_db * cov_ab) ** 0.5
+    return value, sd
+
+
 class distribution_confidence_intervals:
     """
     This class contains several subfunctions that provide all the confidence
@@ -2595,6 +2997,12 @@ class distribution_confidence_intervals:
     The class has no parameters or returns as it is used primarily to create the
     confidence interval object which is used by the subfunctions.
 
+    The confidence interval arrays are stored on the distribution object so
+    that repeated calls with the same func, CI_type, CI, q, and x (such as
+    redrawing a plot) do not recalculate them. The most recently used
+    CI_cache_size results are kept and they are discarded if the parameters of
+    the distribution change.
+
     Parameters
     ----------
     None
@@ -2705,49 +3113,78 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            Lambda_upper = self.Lambda * (np.exp(Z * (self.Lambda_SE / self.Lambda)))
-            Lambda_lower = self.Lambda * (np.exp(-Z * (self.Lambda_SE / self.Lambda)))
+            key, cached = _get_CI_cache(self, func, None, CI, q, x)
+            if cached is None:
+                Lambda_upper = self.Lambda * (
+                    np.exp(Z * (self.Lambda_SE / self.Lambda))
+                )
+                Lambda_lower = self.Lambda * (
+                    np.exp(-Z * (self.Lambda_SE / self.Lambda))
+                )
 
-            if x is not None:
-                t = x - self.gamma
-            else:
-                t0 = self.quantile(0.00001) - self.gamma
-                if t0 <= 0:
-                    t0 = 0.0001
-                t = np.geomspace(
-                    t0,
-                    self.quantile(0.99999) - self.gamma,
-                    points,
+                if x is not None:
+                    t = x - self.gamma
+                else:
+                    t0 = self.quantile(0.00001) - self.gamma
+                    if t0 <= 0:
+                        t0 = 0.0001
+                    t = np.geomspace(
+                        t0,
+                        self.quantile(0.99999) - self.gamma,
+                        points,
+                    )
+
+                # calculate the CIs using the formula for SF
+                Y_lower = np.exp(-Lambda_lower * t)
+                Y_upper = np.exp(-Lambda_upper * t)
+
+                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                t, t, Y_lower, Y_upper = clean_CI_arrays(
+                    xlower=t,
+                    xupper=t,
+                    ylower=Y_lower,
+                    yupper=Y_upper,
+                    plot_type=func,
+                    q=q,
+                    x=x,
                 )
+                # artificially correct for any reversals
+                if (x is None or q is None) and len(Y_lower) > 2 and len(Y_upper) > 2:
+                    Y_lower = no_reverse(Y_lower, CI_type=None, plot_type=func)
+                    Y_upper = no_reverse(Y_upper, CI_type=None, plot_type=func)
 
-            # calculate the CIs using the formula for SF
-            Y_lower = np.exp(-Lambda_lower * t)
-            Y_upper = np.exp(-Lambda_upper * t)
-
-            # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-            t, t, Y_lower, Y_upper = clean_CI_arrays(
-                xlower=t,
-                xupper=t,
-                ylower=Y_lower,
-                yupper=Y_upper,
-                plot_type=func,
-                q=q,
-                x=x,
-            )
-            # artificially correct for any reversals
-            if (x is None or q is None) and len(Y_lower) > 2 and len(Y_upper) > 2:
-                Y_lower = no_reverse(Y_lower, CI_type=None, plot_type=func)
-                Y_upper = no_reverse(Y_upper, CI_type=None, plot_type=func)
-
-            if func == "CDF":
-                yy_upper = 1 - Y_upper
-                yy_lower = 1 - Y_lower
-            elif func == "SF":
-                yy_upper = Y_upper
-                yy_lower = Y_lower
-            elif func == "CHF":
-                yy_upper = -np.log(Y_upper)  # same as -np.log(SF)
-                yy_lower = -np.log(Y_lower)
+                if func == "CDF":
+                    yy_upper = 1 - Y_upper
+                    yy_lower = 1 - Y_lower
+                elif func == "SF":
+                    yy_upper = Y_upper
+                    yy_lower = Y_lower
+                elif func == "CHF":
+                    yy_upper = -np.log(Y_upper)  # same as -np.log(SF)
+                    yy_lower = -np.log(Y_lower)
+                _set_CI_cache(
+                    self,
+                    key,
+                    (
+                        Lambda_lower,
+                        Lambda_upper,
+                        t,
+                        Y_lower,
+                        Y_upper,
+                        yy_lower,
+                        yy_upper,
+                    ),
+                )
+            else:
+                (
+                    Lambda_lower,
+                    Lambda_upper,
+                    t,
+                    Y_lower,
+                    Y_upper,
+                    yy_lower,
+                    yy_upper,
+                ) = cached
 
             if plot_CI is True:
                 fill_no_autoscale(
@@ -2896,80 +3333,62 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            def u(t, alpha, beta):  # u = ln(-ln(R))
-                return beta * (anp.log(t) - anp.log(alpha))  # weibull SF linearized
-
-            def v(R, alpha, beta):  # v = ln(t)
-                return (1 / beta) * anp.log(-anp.log(R)) + anp.log(
-                    alpha
-                )  # weibull SF rearranged for t
-
-            du_da = jac(u, 1)  # derivative wrt alpha (bounds on reliability)
-            du_db = jac(u, 2)  # derivative wrt beta (bounds on reliability)
-            dv_da = jac(v, 1)  # derivative wrt alpha (bounds on time)
-            dv_db = jac(v, 2)  # derivative wrt beta (bounds on time)
-
-            def var_u(self, v):  # v is time
-                return (
-                    du_da(v, self.alpha, self.beta) ** 2 * self.alpha_SE**2
-                    + du_db(v, self.alpha, self.beta) ** 2 * self.beta_SE**2
-                    + 2
-                    * du_da(v, self.alpha, self.beta)
-                    * du_db(v, self.alpha, self.beta)
-                    * self.Cov_alpha_beta
-                )
-
-            def var_v(self, u):  # u is reliability
-                return (
-                    dv_da(u, self.alpha, self.beta) ** 2 * self.alpha_SE**2
-                    + dv_db(u, self.alpha, self.beta) ** 2 * self.beta_SE**2
-                    + 2
-                    * dv_da(u, self.alpha, self.beta)
-                    * dv_db(u, self.alpha, self.beta)
-                    * self.Cov_alpha_beta
-                )
-
             # Confidence bounds on time (in terms of reliability)
             if CI_type == "time":
-                # Y is reliability (R)
-                if func == "CHF":
-                    chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
-                    Y = np.exp(-chf_array)
-                else:  # CDF and SF
-                    if q is not None:
-                        Y = q
-                    else:
-                        Y = transform_spaced(
-                            "weibull", y_lower=1e-8, y_upper=1 - 1e-8, num=points
-                        )
-
-                # v is ln(t)
-                v_lower = v(Y, self.alpha, self.beta) - Z * (var_v(self, Y) ** 0.5)
-                v_upper = v(Y, self.alpha, self.beta) + Z * (var_v(self, Y) ** 0.5)
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Y is reliability (R)
+                    if func == "CHF":
+                        chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
+                        Y = np.exp(-chf_array)
+                    else:  # CDF and SF
+                        if q is not None:
+                            Y = q
+                        else:
+                            Y = transform_spaced(
+                                "weibull", y_lower=1e-8, y_upper=1 - 1e-8, num=points
+                            )
 
-                t_lower = np.exp(v_lower) + self.gamma  # transform back from ln(t)
-                t_upper = np.exp(v_upper) + self.gamma
+                    # v is ln(t)
+                    v, sd = _linearized_CI(
+                        "Weibull",
+                        "time",
+                        Y,
+                        self.alpha,
+                        self.beta,
+                        self.alpha_SE**2,
+                        self.beta_SE**2,
+                        self.Cov_alpha_beta,
+                    )
+                    v_lower = v - Z * sd
+                    v_upper = v + Z * sd
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t_lower, t_upper, Y, Y = clean_CI_arrays(
-                    xlower=t_lower,
-                    xupper=t_upper,
-                    ylower=Y,
-                    yupper=Y,
-                    plot_type=func,
-                    q=q,
-                )
-                # artificially correct for any reversals
-                if q is None and len(t_lower) > 2 and len(t_upper) > 2:
-                    t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
-                    t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+                    t_lower = np.exp(v_lower) + self.gamma  # transform back from ln(t)
+                    t_upper = np.exp(v_upper) + self.gamma
 
-                if func == "CDF":
-                    yy = 1 - Y
-                elif func == "SF":
-                    yy = Y
-                elif func == "CHF":
-                    yy = -np.log(Y)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t_lower, t_upper, Y, Y = clean_CI_arrays(
+                        xlower=t_lower,
+                        xupper=t_upper,
+                        ylower=Y,
+                        yupper=Y,
+                        plot_type=func,
+                        q=q,
+                    )
+                    # artificially correct for any reversals
+                    if q is None and len(t_lower) > 2 and len(t_upper) > 2:
+                        t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
+                        t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy = 1 - Y
+                    elif func == "SF":
+                        yy = Y
+                    elif func == "CHF":
+                        yy = -np.log(Y)
+                    _set_CI_cache(self, key, (t_lower, t_upper, yy))
+                else:
+                    t_lower, t_upper, yy = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -2996,50 +3415,64 @@ class distribution_confidence_intervals:
 
             # Confidence bounds on Reliability (in terms of time)
             elif CI_type == "reliability":
-                if x is not None:
-                    t = x - self.gamma
-                else:
-                    t0 = self.quantile(0.00001) - self.gamma
-                    if t0 <= 0:
-                        t0 = 0.0001
-                    t = np.geomspace(
-                        t0,
-                        self.quantile(0.99999) - self.gamma,
-                        points,
-                    )
-
-                # u is reliability ln(-ln(R))
-                u_lower = (
-                    u(t, self.alpha, self.beta) + Z * var_u(self, t) ** 0.5
-                )  # note that gamma is incorporated into u but not in var_u. This is the same as just shifting a Weibull_2P across
-                u_upper = u(t, self.alpha, self.beta) - Z * var_u(self, t) ** 0.5
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    if x is not None:
+                        t = x - self.gamma
+                    else:
+                        t0 = self.quantile(0.00001) - self.gamma
+                        if t0 <= 0:
+                            t0 = 0.0001
+                        t = np.geomspace(
+                            t0,
+                            self.quantile(0.99999) - self.gamma,
+                            points,
+                        )
 
-                Y_lower = np.exp(-np.exp(u_lower))  # transform back from ln(-ln(R))
-                Y_upper = np.exp(-np.exp(u_upper))
+                    # u is reliability ln(-ln(R))
+                    # note that gamma is incorporated into u but not in sd. This is the same as just shifting a Weibull_2P across
+                    u, sd = _linearized_CI(
+                        "Weibull",
+                        "reliability",
+                        t,
+                        self.alpha,
+                        self.beta,
+                        self.alpha_SE**2,
+                        self.beta_SE**2,
+                        self.Cov_alpha_beta,
+                    )
+                    u_lower = u + Z * sd
+                    u_upper = u - Z * sd
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t, t, Y_lower, Y_upper = clean_CI_arrays(
-                    xlower=t,
-                    xupper=t,
-                    ylower=Y_lower,
-                    yupper=Y_upper,
-                    plot_type=func,
-                    x=x,
-                )
-                # artificially correct for any reversals
-                if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
-                    Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
-                    Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+                    Y_lower = np.exp(-np.exp(u_lower))  # transform back from ln(-ln(R))
+                    Y_upper = np.exp(-np.exp(u_upper))
 
-                if func == "CDF":
-                    yy_lower = 1 - Y_lower
-                    yy_upper = 1 - Y_upper
-                elif func == "SF":
-                    yy_lower = Y_lower
-                    yy_upper = Y_upper
-                elif func == "CHF":
-                    yy_lower = -np.log(Y_lower)
-                    yy_upper = -np.log(Y_upper)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t, t, Y_lower, Y_upper = clean_CI_arrays(
+                        xlower=t,
+                        xupper=t,
+                        ylower=Y_lower,
+                        yupper=Y_upper,
+                        plot_type=func,
+                        x=x,
+                    )
+                    # artificially correct for any reversals
+                    if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
+                        Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
+                        Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy_lower = 1 - Y_lower
+                        yy_upper = 1 - Y_upper
+                    elif func == "SF":
+                        yy_lower = Y_lower
+                        yy_upper = Y_upper
+                    elif func == "CHF":
+                        yy_lower = -np.log(Y_lower)
+                        yy_upper = -np.log(Y_upper)
+                    _set_CI_cache(self, key, (t, Y_lower, Y_upper, yy_lower, yy_upper))
+                else:
+                    t, Y_lower, Y_upper, yy_lower, yy_upper = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -3183,91 +3616,75 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            def u(t, mu, beta):  # u = R
-                return agammaincc(beta, t / anp.exp(mu))
-
-            def v(R, mu, beta):  # v = ln(t)
-                return anp.log(agammainccinv(beta, R)) + mu
-
-            du_dm = jac(u, 1)  # derivative wrt mu (bounds on reliability)
-            du_db = jac(u, 2)  # derivative wrt beta (bounds on reliability)
-            dv_dm = jac(v, 1)  # derivative wrt mu (bounds on time)
-            dv_db = jac(v, 2)  # derivative wrt beta (bounds on time)
-
-            def var_u(self, v):  # v is time
-                return (
-                    du_dm(v, self.mu, self.beta) ** 2 * self.mu_SE**2
-                    + du_db(v, self.mu, self.beta) ** 2 * self.beta_SE**2
-                    + 2
-                    * du_dm(v, self.mu, self.beta)
-                    * du_db(v, self.mu, self.beta)
-                    * self.Cov_mu_beta
-                )
-
-            def var_v(self, u):  # u is reliability
-                return (
-                    dv_dm(u, self.mu, self.beta) ** 2 * self.mu_SE**2
-                    + dv_db(u, self.mu, self.beta) ** 2 * self.beta_SE**2
-                    + 2
-                    * dv_dm(u, self.mu, self.beta)
-                    * dv_db(u, self.mu, self.beta)
-                    * self.Cov_mu_beta
-                )
-
             # Confidence bounds on time (in terms of reliability)
             if CI_type == "time":
-                # Y is reliability (R)
-                if func == "CHF":
-                    chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
-                    Y = np.exp(-chf_array)
-                else:  # CDF and SF
-                    if q is not None:
-                        Y = q
-                    else:
-                        if self.beta > 3:
-                            Y = transform_spaced(
-                                "gamma",
-                                y_lower=1e-8,
-                                y_upper=1 - 1e-8,
-                                beta=self.beta,
-                                num=points,
-                            )
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Y is reliability (R)
+                    if func == "CHF":
+                        chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
+                        Y = np.exp(-chf_array)
+                    else:  # CDF and SF
+                        if q is not None:
+                            Y = q
                         else:
-                            Y = np.linspace(1e-8, 1 - 1e-8, points)
-
-                # v is ln(t)
-                v_lower = v(Y, self.mu, self.beta) - Z * (var_v(self, Y) ** 0.5)
-                v_upper = v(Y, self.mu, self.beta) + Z * (var_v(self, Y) ** 0.5)
-
-                t_lower = np.exp(v_lower) + self.gamma
-                t_upper = np.exp(v_upper) + self.gamma
-
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t_lower, t_upper, Y, Y = clean_CI_arrays(
-                    xlower=t_lower,
-                    xupper=t_upper,
-                    ylower=Y,
-                    yupper=Y,
-                    plot_type=func,
-                    q=q,
-                )
-                # artificially correct for any reversals
-                if q is None and len(t_lower) > 2 and len(t_upper) > 2:
-                    t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
-                    t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+                            if self.beta > 3:
+                                Y = transform_spaced(
+                                    "gamma",
+                                    y_lower=1e-8,
+                                    y_upper=1 - 1e-8,
+                                    beta=self.beta,
+                                    num=points,
+                                )
+                            else:
+                                Y = np.linspace(1e-8, 1 - 1e-8, points)
+
+                    # v is ln(t)
+                    v, sd = _linearized_CI(
+                        "Gamma",
+                        "time",
+                        Y,
+                        self.mu,
+                        self.beta,
+                        self.mu_SE**2,
+                        self.beta_SE**2,
+                        self.Cov_mu_beta,
+                    )
+                    v_lower = v - Z * sd
+                    v_upper = v + Z * sd
 
-                if func == "CDF":
-                    yy = 1 - Y
-                elif func == "SF":
-                    yy = Y
-                elif func == "CHF":
-                    yy = -np.log(Y)
+                    t_lower = np.exp(v_lower) + self.gamma
+                    t_upper = np.exp(v_upper) + self.gamma
 
-                if plot_CI is True:
-                    fill_no_autoscale(
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t_lower, t_upper, Y, Y = clean_CI_arrays(
                         xlower=t_lower,
                         xupper=t_upper,
-                        ylower=yy,
+                        ylower=Y,
+                        yupper=Y,
+                        plot_type=func,
+                        q=q,
+                    )
+                    # artificially correct for any reversals
+                    if q is None and len(t_lower) > 2 and len(t_upper) > 2:
+                        t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
+                        t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy = 1 - Y
+                    elif func == "SF":
+                        yy = Y
+                    elif func == "CHF":
+                        yy = -np.log(Y)
+                    _set_CI_cache(self, key, (t_lower, t_upper, yy))
+                else:
+                    t_lower, t_upper, yy = cached
+
+                if plot_CI is True:
+                    fill_no_autoscale(
+                        xlower=t_lower,
+                        xupper=t_upper,
+                        ylower=yy,
                         yupper=yy,
                         color=color,
                         alpha=0.3,
@@ -3287,53 +3704,70 @@ class distribution_confidence_intervals:
 
             # Confidence bounds on Reliability (in terms of time)
             elif CI_type == "reliability":
-                if x is not None:
-                    t = x - self.gamma
-                else:
-                    if self.gamma == 0:
-                        t0 = 0.0001
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    if x is not None:
+                        t = x - self.gamma
                     else:
-                        t0 = self.quantile(0.0000001)
-                    t = np.linspace(
-                        t0 - self.gamma,
-                        self.quantile(0.99999) - self.gamma,
-                        points,
-                    )
-
-                # u is reliability
-                # note that gamma is incorporated into u but not in var_u. This is the same as just shifting a Gamma_2P across
-                R = u(t, self.mu, self.beta)
-                varR = var_u(self, t)
-                R_lower = R / (R + (1 - R) * np.exp((Z * varR**0.5) / (R * (1 - R))))
-                R_upper = R / (R + (1 - R) * np.exp((-Z * varR**0.5) / (R * (1 - R))))
+                        if self.gamma == 0:
+                            t0 = 0.0001
+                        else:
+                            t0 = self.quantile(0.0000001)
+                        t = np.linspace(
+                            t0 - self.gamma,
+                            self.quantile(0.99999) - self.gamma,
+                            points,
+                        )
 
-                # transform back from u = R
-                Y_lower = R_lower
-                Y_upper = R_upper
+                    # u is reliability
+                    # note that gamma is incorporated into u but not in sd. This is the same as just shifting a Gamma_2P across
+                    R, sd = _linearized_CI(
+                        "Gamma",
+                        "reliability",
+                        t,
+                        self.mu,
+                        self.beta,
+                        self.mu_SE**2,
+                        self.beta_SE**2,
+                        self.Cov_mu_beta,
+                    )
+                    R_lower = R / (
+                        R + (1 - R) * np.exp((Z * sd) / (R * (1 - R)))
+                    )
+                    R_upper = R / (
+                        R + (1 - R) * np.exp((-Z * sd) / (R * (1 - R)))
+                    )
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t, t, Y_lower, Y_upper = clean_CI_arrays(
-                    xlower=t,
-                    xupper=t,
-                    ylower=Y_lower,
-                    yupper=Y_upper,
-                    plot_type=func,
-                    x=x,
-                )
-                # artificially correct for any reversals
-                if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
-                    Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
-                    Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+                    # transform back from u = R
+                    Y_lower = R_lower
+                    Y_upper = R_upper
 
-                if func == "CDF":
-                    yy_lower = 1 - Y_lower
-                    yy_upper = 1 - Y_upper
-                elif func == "SF":
-                    yy_lower = Y_lower
-                    yy_upper = Y_upper
-                elif func == "CHF":
-                    yy_lower = -np.log(Y_lower)
-                    yy_upper = -np.log(Y_upper)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t, t, Y_lower, Y_upper = clean_CI_arrays(
+                        xlower=t,
+                        xupper=t,
+                        ylower=Y_lower,
+                        yupper=Y_upper,
+                        plot_type=func,
+                        x=x,
+                    )
+                    # artificially correct for any reversals
+                    if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
+                        Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
+                        Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy_lower = 1 - Y_lower
+                        yy_upper = 1 - Y_upper
+                    elif func == "SF":
+                        yy_lower = Y_lower
+                        yy_upper = Y_upper
+                    elif func == "CHF":
+                        yy_lower = -np.log(Y_lower)
+                        yy_upper = -np.log(Y_upper)
+                    _set_CI_cache(self, key, (t, Y_lower, Y_upper, yy_lower, yy_upper))
+                else:
+                    t, Y_lower, Y_upper, yy_lower, yy_upper = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -3476,76 +3910,59 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            def u(t, mu, sigma):  # u = phiinv(R)
-                return (mu - t) / sigma  # normal SF linearlized
-
-            def v(R, mu, sigma):  # v = t
-                return mu - sigma * ss.norm.ppf(R)
-
-            # for consistency with other distributions, the derivatives are da for d_sigma and db for d_mu. Just think of a is first parameter and b is second parameter.
-            du_da = jac(u, 1)  # derivative wrt mu (bounds on reliability)
-            du_db = jac(u, 2)  # derivative wrt sigma (bounds on reliability)
-            dv_da = jac(v, 1)  # derivative wrt mu (bounds on time)
-            dv_db = jac(v, 2)  # derivative wrt sigma (bounds on time)
-
-            def var_u(self, v):  # v is time
-                return (
-                    du_da(v, self.mu, self.sigma) ** 2 * self.mu_SE**2
-                    + du_db(v, self.mu, self.sigma) ** 2 * self.sigma_SE**2
-                    + 2
-                    * du_da(v, self.mu, self.sigma)
-                    * du_db(v, self.mu, self.sigma)
-                    * self.Cov_mu_sigma
-                )
-
-            def var_v(self, u):  # u is reliability
-                return (
-                    dv_da(u, self.mu, self.sigma) ** 2 * self.mu_SE**2
-                    + dv_db(u, self.mu, self.sigma) ** 2 * self.sigma_SE**2
-                    + 2
-                    * dv_da(u, self.mu, self.sigma)
-                    * dv_db(u, self.mu, self.sigma)
-                    * self.Cov_mu_sigma
-                )
-
             # Confidence bounds on time (in terms of reliability)
             if CI_type == "time":
-                # Y is reliability (R)
-                if func == "CHF":
-                    chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
-                    Y = np.exp(-chf_array)
-                else:  # CDF and SF
-                    if q is not None:
-                        Y = q
-                    else:
-                        Y = transform_spaced(
-                            "normal", y_lower=1e-8, y_upper=1 - 1e-8, num=points
-                        )
-
-                # v is t
-                t_lower = v(Y, self.mu, self.sigma) - Z * (var_v(self, Y) ** 0.5)
-                t_upper = v(Y, self.mu, self.sigma) + Z * (var_v(self, Y) ** 0.5)
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Y is reliability (R)
+                    if func == "CHF":
+                        chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
+                        Y = np.exp(-chf_array)
+                    else:  # CDF and SF
+                        if q is not None:
+                            Y = q
+                        else:
+                            Y = transform_spaced(
+                                "normal", y_lower=1e-8, y_upper=1 - 1e-8, num=points
+                            )
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t_lower, t_upper, Y, Y = clean_CI_arrays(
-                    xlower=t_lower,
-                    xupper=t_upper,
-                    ylower=Y,
-                    yupper=Y,
-                    plot_type=func,
-                    q=q,
-                )
-                # artificially correct for any reversals
-                if q is None and len(t_lower) > 2 and len(t_upper) > 2:
-                    t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
-                    t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+                    # v is t
+                    v, sd = _linearized_CI(
+                        "Normal",
+                        "time",
+                        Y,
+                        self.mu,
+                        self.sigma,
+                        self.mu_SE**2,
+                        self.sigma_SE**2,
+                        self.Cov_mu_sigma,
+                    )
+                    t_lower = v - Z * sd
+                    t_upper = v + Z * sd
 
-                if func == "CDF":
-                    yy = 1 - Y
-                elif func == "SF":
-                    yy = Y
-                elif func == "CHF":
-                    yy = -np.log(Y)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t_lower, t_upper, Y, Y = clean_CI_arrays(
+                        xlower=t_lower,
+                        xupper=t_upper,
+                        ylower=Y,
+                        yupper=Y,
+                        plot_type=func,
+                        q=q,
+                    )
+                    # artificially correct for any reversals
+                    if q is None and len(t_lower) > 2 and len(t_upper) > 2:
+                        t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
+                        t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy = 1 - Y
+                    elif func == "SF":
+                        yy = Y
+                    elif func == "CHF":
+                        yy = -np.log(Y)
+                    _set_CI_cache(self, key, (t_lower, t_upper, yy))
+                else:
+                    t_lower, t_upper, yy = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -3571,43 +3988,58 @@ class distribution_confidence_intervals:
 
             # Confidence bounds on Reliability (in terms of time)
             elif CI_type == "reliability":
-                if x is not None:
-                    t = x
-                else:
-                    t = np.linspace(
-                        self.quantile(0.00001), self.quantile(0.99999), points
-                    )
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    if x is not None:
+                        t = x
+                    else:
+                        t = np.linspace(
+                            self.quantile(0.00001), self.quantile(0.99999), points
+                        )
 
-                # u is reliability u = phiinv(R)
-                u_lower = u(t, self.mu, self.sigma) + Z * var_u(self, t) ** 0.5
-                u_upper = u(t, self.mu, self.sigma) - Z * var_u(self, t) ** 0.5
+                    # u is reliability u = phiinv(R)
+                    u, sd = _linearized_CI(
+                        "Normal",
+                        "reliability",
+                        t,
+                        self.mu,
+                        self.sigma,
+                        self.mu_SE**2,
+                        self.sigma_SE**2,
+                        self.Cov_mu_sigma,
+                    )
+                    u_lower = u + Z * sd
+                    u_upper = u - Z * sd
 
-                Y_lower = ss.norm.cdf(u_lower)  # transform back from u = phiinv(R)
-                Y_upper = ss.norm.cdf(u_upper)
+                    Y_lower = ss.norm.cdf(u_lower)  # transform back from u = phiinv(R)
+                    Y_upper = ss.norm.cdf(u_upper)
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t, t, Y_lower, Y_upper = clean_CI_arrays(
-                    xlower=t,
-                    xupper=t,
-                    ylower=Y_lower,
-                    yupper=Y_upper,
-                    plot_type=func,
-                    x=x,
-                )
-                # artificially correct for any reversals
-                if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
-                    Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
-                    Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
-
-                if func == "CDF":
-                    yy_lower = 1 - Y_lower
-                    yy_upper = 1 - Y_upper
-                elif func == "SF":
-                    yy_lower = Y_lower
-                    yy_upper = Y_upper
-                elif func == "CHF":
-                    yy_lower = -np.log(Y_lower)
-                    yy_upper = -np.log(Y_upper)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t, t, Y_lower, Y_upper = clean_CI_arrays(
+                        xlower=t,
+                        xupper=t,
+                        ylower=Y_lower,
+                        yupper=Y_upper,
+                        plot_type=func,
+                        x=x,
+                    )
+                    # artificially correct for any reversals
+                    if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
+                        Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
+                        Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy_lower = 1 - Y_lower
+                        yy_upper = 1 - Y_upper
+                    elif func == "SF":
+                        yy_lower = Y_lower
+                        yy_upper = Y_upper
+                    elif func == "CHF":
+                        yy_lower = -np.log(Y_lower)
+                        yy_upper = -np.log(Y_upper)
+                    _set_CI_cache(self, key, (t, Y_lower, Y_upper, yy_lower, yy_upper))
+                else:
+                    t, Y_lower, Y_upper, yy_lower, yy_upper = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -3751,79 +4183,62 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            def u(t, mu, sigma):  # u = phiinv(R)
-                return (mu - np.log(t)) / sigma  # lognormal SF linearlized
-
-            def v(R, mu, sigma):  # v = ln(t)
-                return mu - sigma * ss.norm.ppf(R)
-
-            # for consistency with other distributions, the derivatives are da for d_sigma and db for d_mu. Just think of a is first parameter and b is second parameter.
-            du_da = jac(u, 1)  # derivative wrt mu (bounds on reliability)
-            du_db = jac(u, 2)  # derivative wrt sigma (bounds on reliability)
-            dv_da = jac(v, 1)  # derivative wrt mu (bounds on time)
-            dv_db = jac(v, 2)  # derivative wrt sigma (bounds on time)
-
-            def var_u(self, v):  # v is time
-                return (
-                    du_da(v, self.mu, self.sigma) ** 2 * self.mu_SE**2
-                    + du_db(v, self.mu, self.sigma) ** 2 * self.sigma_SE**2
-                    + 2
-                    * du_da(v, self.mu, self.sigma)
-                    * du_db(v, self.mu, self.sigma)
-                    * self.Cov_mu_sigma
-                )
-
-            def var_v(self, u):  # u is reliability
-                return (
-                    dv_da(u, self.mu, self.sigma) ** 2 * self.mu_SE**2
-                    + dv_db(u, self.mu, self.sigma) ** 2 * self.sigma_SE**2
-                    + 2
-                    * dv_da(u, self.mu, self.sigma)
-                    * dv_db(u, self.mu, self.sigma)
-                    * self.Cov_mu_sigma
-                )
-
             if CI_type == "time":
-                # Confidence bounds on time (in terms of reliability)
-                # Y is reliability (R)
-                if func == "CHF":
-                    chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
-                    Y = np.exp(-chf_array)
-                else:  # CDF and SF
-                    if q is not None:
-                        Y = q
-                    else:
-                        Y = transform_spaced(
-                            "normal", y_lower=1e-8, y_upper=1 - 1e-8, num=points
-                        )
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Confidence bounds on time (in terms of reliability)
+                    # Y is reliability (R)
+                    if func == "CHF":
+                        chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
+                        Y = np.exp(-chf_array)
+                    else:  # CDF and SF
+                        if q is not None:
+                            Y = q
+                        else:
+                            Y = transform_spaced(
+                                "normal", y_lower=1e-8, y_upper=1 - 1e-8, num=points
+                            )
 
-                # v is ln(t)
-                v_lower = v(Y, self.mu, self.sigma) - Z * (var_v(self, Y) ** 0.5)
-                v_upper = v(Y, self.mu, self.sigma) + Z * (var_v(self, Y) ** 0.5)
+                    # v is ln(t)
+                    v, sd = _linearized_CI(
+                        "Lognormal",
+                        "time",
+                        Y,
+                        self.mu,
+                        self.sigma,
+                        self.mu_SE**2,
+                        self.sigma_SE**2,
+                        self.Cov_mu_sigma,
+                    )
+                    v_lower = v - Z * sd
+                    v_upper = v + Z * sd
 
-                t_lower = np.exp(v_lower) + self.gamma
-                t_upper = np.exp(v_upper) + self.gamma
+                    t_lower = np.exp(v_lower) + self.gamma
+                    t_upper = np.exp(v_upper) + self.gamma
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t_lower, t_upper, Y, Y = clean_CI_arrays(
-                    xlower=t_lower,
-                    xupper=t_upper,
-                    ylower=Y,
-                    yupper=Y,
-                    plot_type=func,
-                    q=q,
-                )
-                # artificially correct for any reversals
-                if q is None and len(t_lower) > 2 and len(t_upper) > 2:
-                    t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
-                    t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
-
-                if func == "CDF":
-                    yy = 1 - Y
-                elif func == "SF":
-                    yy = Y
-                elif func == "CHF":
-                    yy = -np.log(Y)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t_lower, t_upper, Y, Y = clean_CI_arrays(
+                        xlower=t_lower,
+                        xupper=t_upper,
+                        ylower=Y,
+                        yupper=Y,
+                        plot_type=func,
+                        q=q,
+                    )
+                    # artificially correct for any reversals
+                    if q is None and len(t_lower) > 2 and len(t_upper) > 2:
+                        t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
+                        t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy = 1 - Y
+                    elif func == "SF":
+                        yy = Y
+                    elif func == "CHF":
+                        yy = -np.log(Y)
+                    _set_CI_cache(self, key, (t_lower, t_upper, yy))
+                else:
+                    t_lower, t_upper, yy = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -3848,49 +4263,64 @@ class distribution_confidence_intervals:
                     return t_lower, t_upper
 
             elif CI_type == "reliability":
-                # Confidence bounds on Reliability (in terms of time)
-                if x is not None:
-                    t = x - self.gamma
-                else:
-                    t0 = self.quantile(0.00001) - self.gamma
-                    if t0 <= 0:
-                        t0 = 0.0001
-                    t = np.geomspace(
-                        t0,
-                        self.quantile(0.99999) - self.gamma,
-                        points,
-                    )
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Confidence bounds on Reliability (in terms of time)
+                    if x is not None:
+                        t = x - self.gamma
+                    else:
+                        t0 = self.quantile(0.00001) - self.gamma
+                        if t0 <= 0:
+                            t0 = 0.0001
+                        t = np.geomspace(
+                            t0,
+                            self.quantile(0.99999) - self.gamma,
+                            points,
+                        )
 
-                # u is reliability u = phiinv(R)
-                u_lower = u(t, self.mu, self.sigma) + Z * var_u(self, t) ** 0.5
-                u_upper = u(t, self.mu, self.sigma) - Z * var_u(self, t) ** 0.5
+                    # u is reliability u = phiinv(R)
+                    u, sd = _linearized_CI(
+                        "Lognormal",
+                        "reliability",
+                        t,
+                        self.mu,
+                        self.sigma,
+                        self.mu_SE**2,
+                        self.sigma_SE**2,
+                        self.Cov_mu_sigma,
+                    )
+                    u_lower = u + Z * sd
+                    u_upper = u - Z * sd
 
-                Y_lower = ss.norm.cdf(u_lower)  # transform back from u = phiinv(R)
-                Y_upper = ss.norm.cdf(u_upper)
+                    Y_lower = ss.norm.cdf(u_lower)  # transform back from u = phiinv(R)
+                    Y_upper = ss.norm.cdf(u_upper)
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t, t, Y_lower, Y_upper = clean_CI_arrays(
-                    xlower=t,
-                    xupper=t,
-                    ylower=Y_lower,
-                    yupper=Y_upper,
-                    plot_type=func,
-                    x=x,
-                )
-                # artificially correct for any reversals
-                if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
-                    Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
-                    Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
-
-                if func == "CDF":
-                    yy_lower = 1 - Y_lower
-                    yy_upper = 1 - Y_upper
-                elif func == "SF":
-                    yy_lower = Y_lower
-                    yy_upper = Y_upper
-                elif func == "CHF":
-                    yy_lower = -np.log(Y_lower)
-                    yy_upper = -np.log(Y_upper)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t, t, Y_lower, Y_upper = clean_CI_arrays(
+                        xlower=t,
+                        xupper=t,
+                        ylower=Y_lower,
+                        yupper=Y_upper,
+                        plot_type=func,
+                        x=x,
+                    )
+                    # artificially correct for any reversals
+                    if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
+                        Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
+                        Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy_lower = 1 - Y_lower
+                        yy_upper = 1 - Y_upper
+                    elif func == "SF":
+                        yy_lower = Y_lower
+                        yy_upper = Y_upper
+                    elif func == "CHF":
+                        yy_lower = -np.log(Y_lower)
+                        yy_upper = -np.log(Y_upper)
+                    _set_CI_cache(self, key, (t, Y_lower, Y_upper, yy_lower, yy_upper))
+                else:
+                    t, Y_lower, Y_upper, yy_lower, yy_upper = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -4033,79 +4463,64 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            def u(t, alpha, beta):  # u = ln(1/R - 1)
-                return beta * (anp.log(t) - anp.log(alpha))  # loglogistic SF linearized
-
-            def v(R, alpha, beta):  # v = ln(t)
-                return (1 / beta) * anp.log(1 / R - 1) + anp.log(
-                    alpha
-                )  # loglogistic SF rearranged for t
-
-            du_da = jac(u, 1)  # derivative wrt alpha (bounds on reliability)
-            du_db = jac(u, 2)  # derivative wrt beta (bounds on reliability)
-            dv_da = jac(v, 1)  # derivative wrt alpha (bounds on time)
-            dv_db = jac(v, 2)  # derivative wrt beta (bounds on time)
-
-            def var_u(self, v):  # v is time
-                return (
-                    du_da(v, self.alpha, self.beta) ** 2 * self.alpha_SE**2
-                    + du_db(v, self.alpha, self.beta) ** 2 * self.beta_SE**2
-                    + 2
-                    * du_da(v, self.alpha, self.beta)
-                    * du_db(v, self.alpha, self.beta)
-                    * self.Cov_alpha_beta
-                )
-
-            def var_v(self, u):  # u is reliability
-                return (
-                    dv_da(u, self.alpha, self.beta) ** 2 * self.alpha_SE**2
-                    + dv_db(u, self.alpha, self.beta) ** 2 * self.beta_SE**2
-                    + 2
-                    * dv_da(u, self.alpha, self.beta)
-                    * dv_db(u, self.alpha, self.beta)
-                    * self.Cov_alpha_beta
-                )
-
             if CI_type == "time":  # Confidence bounds on time (in terms of reliability)
-                # Y is reliability (R)
-                if func == "CHF":
-                    chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
-                    Y = np.exp(-chf_array)
-                else:  # CDF and SF
-                    if q is not None:
-                        Y = q
-                    else:
-                        Y = transform_spaced(
-                            "loglogistic", y_lower=1e-8, y_upper=1 - 1e-8, num=points
-                        )
-
-                # v is ln(t)
-                v_lower = v(Y, self.alpha, self.beta) - Z * (var_v(self, Y) ** 0.5)
-                v_upper = v(Y, self.alpha, self.beta) + Z * (var_v(self, Y) ** 0.5)
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Y is reliability (R)
+                    if func == "CHF":
+                        chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
+                        Y = np.exp(-chf_array)
+                    else:  # CDF and SF
+                        if q is not None:
+                            Y = q
+                        else:
+                            Y = transform_spaced(
+                                "loglogistic",
+                                y_lower=1e-8,
+                                y_upper=1 - 1e-8,
+                                num=points,
+                            )
 
-                t_lower = np.exp(v_lower) + self.gamma  # transform back from ln(t)
-                t_upper = np.exp(v_upper) + self.gamma
+                    # v is ln(t)
+                    v, sd = _linearized_CI(
+                        "Loglogistic",
+                        "time",
+                        Y,
+                        self.alpha,
+                        self.beta,
+                        self.alpha_SE**2,
+                        self.beta_SE**2,
+                        self.Cov_alpha_beta,
+                    )
+                    v_lower = v - Z * sd
+                    v_upper = v + Z * sd
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t_lower, t_upper, Y, Y = clean_CI_arrays(
-                    xlower=t_lower,
-                    xupper=t_upper,
-                    ylower=Y,
-                    yupper=Y,
-                    plot_type=func,
-                    q=q,
-                )
-                # artificially correct for any reversals
-                if q is None and len(t_lower) > 2 and len(t_upper) > 2:
-                    t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
-                    t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+                    t_lower = np.exp(v_lower) + self.gamma  # transform back from ln(t)
+                    t_upper = np.exp(v_upper) + self.gamma
 
-                if func == "CDF":
-                    yy = 1 - Y
-                elif func == "SF":
-                    yy = Y
-                elif func == "CHF":
-                    yy = -np.log(Y)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t_lower, t_upper, Y, Y = clean_CI_arrays(
+                        xlower=t_lower,
+                        xupper=t_upper,
+                        ylower=Y,
+                        yupper=Y,
+                        plot_type=func,
+                        q=q,
+                    )
+                    # artificially correct for any reversals
+                    if q is None and len(t_lower) > 2 and len(t_upper) > 2:
+                        t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
+                        t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy = 1 - Y
+                    elif func == "SF":
+                        yy = Y
+                    elif func == "CHF":
+                        yy = -np.log(Y)
+                    _set_CI_cache(self, key, (t_lower, t_upper, yy))
+                else:
+                    t_lower, t_upper, yy = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -4132,50 +4547,64 @@ class distribution_confidence_intervals:
             elif (
                 CI_type == "reliability"
             ):  # Confidence bounds on Reliability (in terms of time)
-                if x is not None:
-                    t = x - self.gamma
-                else:
-                    t0 = self.quantile(0.00001) - self.gamma
-                    if t0 <= 0:
-                        t0 = 0.0001
-                    t = np.geomspace(
-                        t0,
-                        self.quantile(0.99999) - self.gamma,
-                        points,
-                    )
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    if x is not None:
+                        t = x - self.gamma
+                    else:
+                        t0 = self.quantile(0.00001) - self.gamma
+                        if t0 <= 0:
+                            t0 = 0.0001
+                        t = np.geomspace(
+                            t0,
+                            self.quantile(0.99999) - self.gamma,
+                            points,
+                        )
 
-                # u is reliability ln(1/R - 1)
-                u_lower = (
-                    u(t, self.alpha, self.beta) + Z * var_u(self, t) ** 0.5
-                )  # note that gamma is incorporated into u but not in var_u. This is the same as just shifting a Weibull_2P across
-                u_upper = u(t, self.alpha, self.beta) - Z * var_u(self, t) ** 0.5
+                    # u is reliability ln(1/R - 1)
+                    # note that gamma is incorporated into u but not in sd. This is the same as just shifting a Weibull_2P across
+                    u, sd = _linearized_CI(
+                        "Loglogistic",
+                        "reliability",
+                        t,
+                        self.alpha,
+                        self.beta,
+                        self.alpha_SE**2,
+                        self.beta_SE**2,
+                        self.Cov_alpha_beta,
+                    )
+                    u_lower = u + Z * sd
+                    u_upper = u - Z * sd
 
-                Y_lower = 1 / (np.exp(u_lower) + 1)  # transform back from ln(1/R - 1)
-                Y_upper = 1 / (np.exp(u_upper) + 1)
+                    Y_lower = 1 / (np.exp(u_lower) + 1)  # transform back from ln(1/R - 1)
+                    Y_upper = 1 / (np.exp(u_upper) + 1)
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t, t, Y_lower, Y_upper = clean_CI_arrays(
-                    xlower=t,
-                    xupper=t,
-                    ylower=Y_lower,
-                    yupper=Y_upper,
-                    plot_type=func,
-                    x=x,
-                )
-                # artificially correct for any reversals
-                if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
-                    Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
-                    Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
-
-                if func == "CDF":
-                    yy_lower = 1 - Y_lower
-                    yy_upper = 1 - Y_upper
-                elif func == "SF":
-                    yy_lower = Y_lower
-                    yy_upper = Y_upper
-                elif func == "CHF":
-                    yy_lower = -np.log(Y_lower)
-                    yy_upper = -np.log(Y_upper)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t, t, Y_lower, Y_upper = clean_CI_arrays(
+                        xlower=t,
+                        xupper=t,
+                        ylower=Y_lower,
+                        yupper=Y_upper,
+                        plot_type=func,
+                        x=x,
+                    )
+                    # artificially correct for any reversals
+                    if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
+                        Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
+                        Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy_lower = 1 - Y_lower
+                        yy_upper = 1 - Y_upper
+                    elif func == "SF":
+                        yy_lower = Y_lower
+                        yy_upper = Y_upper
+                    elif func == "CHF":
+                        yy_lower = -np.log(Y_lower)
+                        yy_upper = -np.log(Y_upper)
+                    _set_CI_cache(self, key, (t, Y_lower, Y_upper, yy_lower, yy_upper))
+                else:
+                    t, Y_lower, Y_upper, yy_lower, yy_upper = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -4317,75 +4746,58 @@ class distribution_confidence_intervals:
                 plt.title(text_title)
                 plt.subplots_adjust(top=0.81)
 
-            def u(t, mu, sigma):  # u = ln(-ln(R))
-                return (t - mu) / sigma  # gumbel SF linearlized
-
-            def v(R, mu, sigma):  # v = t
-                return mu + sigma * anp.log(-anp.log(R))  # Gumbel SF rearranged for t
-
-            # for consistency with other distributions, the derivatives are da for d_sigma and db for d_mu. Just think of a is first parameter and b is second parameter.
-            du_da = jac(u, 1)  # derivative wrt mu (bounds on reliability)
-            du_db = jac(u, 2)  # derivative wrt sigma (bounds on reliability)
-            dv_da = jac(v, 1)  # derivative wrt mu (bounds on time)
-            dv_db = jac(v, 2)  # derivative wrt sigma (bounds on time)
-
-            def var_u(self, v):  # v is time
-                return (
-                    du_da(v, self.mu, self.sigma) ** 2 * self.mu_SE**2
-                    + du_db(v, self.mu, self.sigma) ** 2 * self.sigma_SE**2
-                    + 2
-                    * du_da(v, self.mu, self.sigma)
-                    * du_db(v, self.mu, self.sigma)
-                    * self.Cov_mu_sigma
-                )
-
-            def var_v(self, u):  # u is reliability
-                return (
-                    dv_da(u, self.mu, self.sigma) ** 2 * self.mu_SE**2
-                    + dv_db(u, self.mu, self.sigma) ** 2 * self.sigma_SE**2
-                    + 2
-                    * dv_da(u, self.mu, self.sigma)
-                    * dv_db(u, self.mu, self.sigma)
-                    * self.Cov_mu_sigma
-                )
-
             if CI_type == "time":  # Confidence bounds on time (in terms of reliability)
-                # Y is reliability (R)
-                if func == "CHF":
-                    chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
-                    Y = np.exp(-chf_array)
-                else:  # CDF and SF
-                    if q is not None:
-                        Y = q
-                    else:
-                        Y = transform_spaced(
-                            "gumbel", y_lower=1e-8, y_upper=1 - 1e-8, num=points
-                        )
-
-                # v is t
-                t_lower = v(Y, self.mu, self.sigma) - Z * (var_v(self, Y) ** 0.5)
-                t_upper = v(Y, self.mu, self.sigma) + Z * (var_v(self, Y) ** 0.5)
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    # Y is reliability (R)
+                    if func == "CHF":
+                        chf_array = np.geomspace(1e-8, self._chf[-1] * 1.5, points)
+                        Y = np.exp(-chf_array)
+                    else:  # CDF and SF
+                        if q is not None:
+                            Y = q
+                        else:
+                            Y = transform_spaced(
+                                "gumbel", y_lower=1e-8, y_upper=1 - 1e-8, num=points
+                            )
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t_lower, t_upper, Y, Y = clean_CI_arrays(
-                    xlower=t_lower,
-                    xupper=t_upper,
-                    ylower=Y,
-                    yupper=Y,
-                    plot_type=func,
-                    q=q,
-                )
-                # artificially correct for any reversals
-                if q is None and len(t_lower) > 2 and len(t_upper) > 2:
-                    t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
-                    t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+                    # v is t
+                    v, sd = _linearized_CI(
+                        "Gumbel",
+                        "time",
+                        Y,
+                        self.mu,
+                        self.sigma,
+                        self.mu_SE**2,
+                        self.sigma_SE**2,
+                        self.Cov_mu_sigma,
+                    )
+                    t_lower = v - Z * sd
+                    t_upper = v + Z * sd
 
-                if func == "CDF":
-                    yy = 1 - Y
-                elif func == "SF":
-                    yy = Y
-                elif func == "CHF":
-                    yy = -np.log(Y)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t_lower, t_upper, Y, Y = clean_CI_arrays(
+                        xlower=t_lower,
+                        xupper=t_upper,
+                        ylower=Y,
+                        yupper=Y,
+                        plot_type=func,
+                        q=q,
+                    )
+                    # artificially correct for any reversals
+                    if q is None and len(t_lower) > 2 and len(t_upper) > 2:
+                        t_lower = no_reverse(t_lower, CI_type=CI_type, plot_type=func)
+                        t_upper = no_reverse(t_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy = 1 - Y
+                    elif func == "SF":
+                        yy = Y
+                    elif func == "CHF":
+                        yy = -np.log(Y)
+                    _set_CI_cache(self, key, (t_lower, t_upper, yy))
+                else:
+                    t_lower, t_upper, yy = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -4412,43 +4824,58 @@ class distribution_confidence_intervals:
             elif (
                 CI_type == "reliability"
             ):  # Confidence bounds on Reliability (in terms of time)
-                if x is not None:
-                    t = x
-                else:
-                    t = np.linspace(
-                        self.quantile(0.00001), self.quantile(0.99999), points
-                    )
-
-                # u is reliability u = ln(-ln(R))
-                u_lower = u(t, self.mu, self.sigma) + Z * var_u(self, t) ** 0.5
-                u_upper = u(t, self.mu, self.sigma) - Z * var_u(self, t) ** 0.5
+                key, cached = _get_CI_cache(self, func, CI_type, CI, q, x)
+                if cached is None:
+                    if x is not None:
+                        t = x
+                    else:
+                        t = np.linspace(
+                            self.quantile(0.00001), self.quantile(0.99999), points
+                        )
 
-                Y_lower = np.exp(-np.exp(u_lower))  # transform back from ln(-ln(R))
-                Y_upper = np.exp(-np.exp(u_upper))
+                    # u is reliability u = ln(-ln(R))
+                    u, sd = _linearized_CI(
+                        "Gumbel",
+                        "reliability",
+                        t,
+                        self.mu,
+                        self.sigma,
+                        self.mu_SE**2,
+                        self.sigma_SE**2,
+                        self.Cov_mu_sigma,
+                    )
+                    u_lower = u + Z * sd
+                    u_upper = u - Z * sd
 
-                # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
-                t, t, Y_lower, Y_upper = clean_CI_arrays(
-                    xlower=t,
-                    xupper=t,
-                    ylower=Y_lower,
-                    yupper=Y_upper,
-                    plot_type=func,
-                    x=x,
-                )
-                # artificially correct for any reversals
-                if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
-                    Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
-                    Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+                    Y_lower = np.exp(-np.exp(u_lower))  # transform back from ln(-ln(R))
+                    Y_upper = np.exp(-np.exp(u_upper))
 
-                if func == "CDF":
-                    yy_lower = 1 - Y_lower
-                    yy_upper = 1 - Y_upper
-                elif func == "SF":
-                    yy_lower = Y_lower
-                    yy_upper = Y_upper
-                elif func == "CHF":
-                    yy_lower = -np.log(Y_lower)
-                    yy_upper = -np.log(Y_upper)
+                    # clean the arrays of illegal values (<=0, nans, >=1 (if CDF or SF))
+                    t, t, Y_lower, Y_upper = clean_CI_arrays(
+                        xlower=t,
+                        xupper=t,
+                        ylower=Y_lower,
+                        yupper=Y_upper,
+                        plot_type=func,
+                        x=x,
+                    )
+                    # artificially correct for any reversals
+                    if x is None and len(Y_lower) > 2 and len(Y_upper) > 2:
+                        Y_lower = no_reverse(Y_lower, CI_type=CI_type, plot_type=func)
+                        Y_upper = no_reverse(Y_upper, CI_type=CI_type, plot_type=func)
+
+                    if func == "CDF":
+                        yy_lower = 1 - Y_lower
+                        yy_upper = 1 - Y_upper
+                    elif func == "SF":
+                        yy_lower = Y_lower
+                        yy_upper = Y_upper
+                    elif func == "CHF":
+                        yy_lower = -np.log(Y_lower)
+                        yy_upper = -np.log(Y_upper)
+                    _set_CI_cache(self, key, (t, Y_lower, Y_upper, yy_lower, yy_upper))
+                else:
+                    t, Y_lower, Y_upper, yy_lower, yy_upper = cached
 
                 if plot_CI is True:
                     fill_no_autoscale(
@@ -4480,6 +4907,7 @@ def linear_regression(
     y_intercept=None,
     RRX_or_RRY="RRX",
     show_plot=False,
+    weights=None,
     **kwargs
 ):
     """
@@ -4508,6 +4936,9 @@ def linear_regression(
     show_plot : bool, optional
         If True, a plot of the line and points will be generated. Use plt.show()
         to show it.
+    weights : array, list, optional
+        The weight of each point in the sum of squares. Default is None which
+        gives each point a weight of 1.
     kwargs
         Keyword arguments for the plot that are passed to matplotlib for the
         line.
@@ -4581,6 +5012,12 @@ def linear_regression(
             )
         raise ValueError(err_str)
 
+    if weights is not None:
+        # weighted least squares is ordinary least squares on rows scaled by sqrt(w)
+        root_w = np.sqrt(np.asarray(weights, dtype=float))
+        xx = (xx.T * root_w).T
+        yy = (yy.T * root_w).T
+
     if RRX_or_RRY == "RRY":
         try:
             solution = (
@@ -4643,7 +5080,16 @@ def linear_regression(
     return m, c
 
 
-def least_squares(dist, failures, right_censored, method="RRX", force_shape=None):
+def least_squares(
+    dist,
+    failures,
+    right_censored,
+    method="RRX",
+    force_shape=None,
+    failure_weights=None,
+    right_censored_weights=None,
+    positions=None,
+):
     """
     Uses least squares or non-linear least squares estimation to fit the
     parameters of the distribution to the plotting positions.
@@ -4671,6 +5117,16 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
     force_shape : float, int, optional
         Used to force the shape (beta or sigma) parameter. Default is None which
         will not force the slope.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Default is None which gives
+        each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Default is None which
+        gives each right censored value a weight of 1.
+    positions : tuple, optional
+        The (x, y) plotting positions of the failures if they have already been
+        calculated (eg. by prepared_data). Default is None which will calculate
+        them from the failures and right_censored data.
 
     Returns
     -------
@@ -4686,6 +5142,10 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
     uses non-linear least squares (NLLS) which uses scipy's curve_fit to find
     the parameters. This may sometimes fail as curve_fit is an optimization
     routine that needs an initial guess provided by this function.
+
+    When weights are given, each failure time is one point on the probability
+    plot (at the plotting position of its last unit) and the squared residual
+    of that point is multiplied by its weight.
     """
 
     if min(failures) <= 0 and dist not in ["Normal_2P", "Gumbel_2P"]:
@@ -4707,13 +5167,27 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
     if method not in ["RRX", "RRY"]:
         raise ValueError('method must be either "RRX" or "RRY". Default is RRX.')
 
-    from reliability.Probability_plotting import (
-        plotting_positions,
-    )  # this import needs to be here to prevent circular import if it is in the main module
+    if positions is None:
+        from reliability.Probability_plotting import (
+            plotting_positions,
+        )  # this import needs to be here to prevent circular import if it is in the main module
 
-    x, y = plotting_positions(failures=failures, right_censored=right_censored)
+        positions = plotting_positions(
+            failures=failures,
+            right_censored=right_censored,
+            failure_weights=failure_weights,
+            right_censored_weights=right_censored_weights,
+        )
+    x, y = positions
     x = np.array(x)
     y = np.array(y)
+    if failure_weights is None:
+        w = None
+        curve_fit_sigma = None
+    else:
+        w = np.asarray(failure_weights, dtype=float)
+        # curve_fit weights the residuals by 1/sigma**2
+        curve_fit_sigma = 1 / np.sqrt(w)
     gamma0 = (
         min(np.hstack([failures, right_censored])) - 0.001
     )  # initial guess for gamma when it is required for the 3P fitters
@@ -4726,7 +5200,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         if force_shape is not None and method == "RRX":
             force_shape = 1 / force_shape  # only needs to be inverted for RRX not RRY
         slope, intercept = linear_regression(
-            xlin, ylin, slope=force_shape, RRX_or_RRY=method
+            xlin, ylin, slope=force_shape, RRX_or_RRY=method, weights=w
         )
         LS_beta = slope
         LS_alpha = np.exp(-intercept / LS_beta)
@@ -4736,7 +5210,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         # Weibull_2P estimate to create the guess for Weibull_3P
         xlin = np.log(x - gamma0)
         ylin = np.log(-np.log(1 - y))
-        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method)
+        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method, weights=w)
         LS_beta = slope
         LS_alpha = np.exp(-intercept / LS_beta)
 
@@ -4755,6 +5229,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[LS_alpha, LS_beta, gamma0],
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -4780,7 +5255,12 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
 
         ylin = -np.log(1 - y)
         slope, _ = linear_regression(
-            x, ylin, x_intercept=x_intercept, y_intercept=y_intercept, RRX_or_RRY=method
+            x,
+            ylin,
+            x_intercept=x_intercept,
+            y_intercept=y_intercept,
+            RRX_or_RRY=method,
+            weights=w,
         )  # equivalent to y = m.x
         LS_Lambda = slope
         guess = [LS_Lambda]
@@ -4790,7 +5270,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         # while it is mathematically possible to use ordinary least squares (y=mx+c) for this, the LS method does not allow bounds on gamma. This can result in gamma > min(data) which should be impossible and will cause other errors.
         xlin = x - gamma0
         ylin = -np.log(1 - y)
-        slope, _ = linear_regression(xlin, ylin, x_intercept=0, RRX_or_RRY="RRX")
+        slope, _ = linear_regression(xlin, ylin, x_intercept=0, RRX_or_RRY="RRX", weights=w)
         LS_Lambda = slope
         # NLLS for Exponential_2P
         def __exponential_2P_CDF(t, Lambda, gamma):
@@ -4807,6 +5287,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[LS_Lambda, gamma0],
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -4826,7 +5307,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         if force_shape is not None and method == "RRY":
             force_shape = 1 / force_shape  # only needs to be inverted for RRY not RRX
         slope, intercept = linear_regression(
-            x, ylin, slope=force_shape, RRX_or_RRY=method
+            x, ylin, slope=force_shape, RRX_or_RRY=method, weights=w
         )
         LS_sigma = 1 / slope
         LS_mu = -intercept * LS_sigma
@@ -4834,7 +5315,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
 
     elif dist == "Gumbel_2P":
         ylin = np.log(-np.log(1 - y))
-        slope, intercept = linear_regression(x, ylin, RRX_or_RRY=method)
+        slope, intercept = linear_regression(x, ylin, RRX_or_RRY=method, weights=w)
         LS_sigma = 1 / slope
         LS_mu = -intercept * LS_sigma
         guess = [LS_mu, LS_sigma]
@@ -4845,7 +5326,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         if force_shape is not None and method == "RRY":
             force_shape = 1 / force_shape  # only needs to be inverted for RRY not RRX
         slope, intercept = linear_regression(
-            xlin, ylin, slope=force_shape, RRX_or_RRY=method
+            xlin, ylin, slope=force_shape, RRX_or_RRY=method, weights=w
         )
         LS_sigma = 1 / slope
         LS_mu = -intercept * LS_sigma
@@ -4856,9 +5337,19 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         def __gamma_optimizer(gamma_guess, x, y):
             xlin = np.log(x - gamma_guess)
             ylin = ss.norm.ppf(y)
-            _, _, r, _, _ = ss.linregress(xlin, ylin)
+            if w is None:
+                _, _, r, _, _ = ss.linregress(xlin, ylin)
+            else:
+                cov = np.cov(xlin, ylin, aweights=w)
+                r = cov[0, 1] / np.sqrt(cov[0, 0] * cov[1, 1])
             return 1 - (r**2)
 
+        def __mean_and_std(values):
+            if w is None:
+                return np.mean(values), np.std(values)
+            mean = np.average(values, weights=w)
+            return mean, np.sqrt(np.average((values - mean) ** 2, weights=w))
+
         # NLLS for Normal_2P which is used by Lognormal_3P by taking the log of the data. This is more accurate than doing it with Lognormal_3P.
         def __normal_2P_CDF(t, mu, sigma):
             return (1 + erf(((t - mu) / sigma) / 2**0.5)) / 2
@@ -4877,8 +5368,9 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 __normal_2P_CDF,
                 np.log(x - gamma),
                 y,
-                p0=[np.mean(np.log(x - gamma)), np.std(np.log(x - gamma))],
+                p0=list(__mean_and_std(np.log(x - gamma))),
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -4891,12 +5383,12 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 "WARNING: Non-linear least squares for Lognormal_3P failed. The result returned is an estimate that is likely to be incorrect.",
                 text_color="red",
             )
-            guess = [np.mean(np.log(x - gamma)), np.std(np.log(x - gamma)), gamma]
+            guess = [*__mean_and_std(np.log(x - gamma)), gamma]
 
     elif dist == "Loglogistic_2P":
         xlin = np.log(x)
         ylin = np.log(1 / y - 1)
-        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method)
+        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method, weights=w)
         LS_beta = -slope
         LS_alpha = np.exp(intercept / LS_beta)
         guess = [LS_alpha, LS_beta]
@@ -4909,7 +5401,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         # Loglogistic_2P estimate to create the guess for Loglogistic_3P
         xlin = np.log(x - gamma0)
         ylin = np.log(1 / y - 1)
-        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method)
+        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method, weights=w)
         LS_beta = -slope
         LS_alpha = np.exp(intercept / LS_beta)
 
@@ -4925,6 +5417,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[LS_alpha, LS_beta, gamma0],
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -4948,7 +5441,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         # Weibull_2P estimate which is converted to a Gamma_2P initial guess
         xlin = np.log(x)
         ylin = np.log(-np.log(1 - y))
-        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method)
+        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method, weights=w)
         LS_beta = slope
         LS_alpha = np.exp(-intercept / LS_beta)
 
@@ -4967,6 +5460,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[alpha_guess, beta_guess],
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -5003,7 +5497,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
         # Weibull_2P estimate which is converted to a Gamma_2P initial guess
         xlin = np.log(x - gamma0 * 0.98)
         ylin = np.log(-np.log(1 - y))
-        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method)
+        slope, intercept = linear_regression(xlin, ylin, RRX_or_RRY=method, weights=w)
         LS_beta = slope
         LS_alpha = np.exp(-intercept / LS_beta)
 
@@ -5022,6 +5516,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[alpha_guess, beta_guess],
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -5039,6 +5534,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[NLLS_alpha_2P, NLLS_beta_2P, gamma0 * 0.98],
                 bounds=curve_fit_bounds_3P,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -5108,6 +5604,7 @@ def least_squares(dist, failures, right_censored, method="RRX", force_shape=None
                 y,
                 p0=[2, 1],
                 bounds=curve_fit_bounds,
+                sigma=curve_fit_sigma,
                 jac="3-point",
                 method="trf",
                 max_nfev=300 * len(failures),
@@ -5287,6 +5784,15 @@ class LS_optimization:
     LL_func_force : function
         The log-likelihood function for when the shape parameter is forced. Only
         required if force_shape is not None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Default is None which gives
+        each failure a weight of 1.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Default is None which
+        gives each right censored value a weight of 1.
+    positions : tuple, optional
+        The (x, y) plotting positions of the failures if they have already been
+        calculated. Default is None which will calculate them.
 
     Returns
     -------
@@ -5299,84 +5805,506 @@ class LS_optimization:
 
     Notes
     -----
-    If method="LS" then both "RRX" and "RRY" will be tried and the best one will
-    be returned.
+    If method="LS" then both "RRX" and "RRY" will be tried and the best one will
+    be returned.
+    """
+
+    def __init__(
+        self,
+        func_name,
+        LL_func,
+        failures,
+        right_censored,
+        method="LS",
+        force_shape=None,
+        LL_func_force=None,
+        failure_weights=None,
+        right_censored_weights=None,
+        positions=None,
+    ):
+        if method not in ["RRX", "RRY", "LS", "NLLS"]:
+            raise ValueError(
+                "method must be either RRX, RRY, LS, or NLLS. Default is LS"
+            )
+        if failure_weights is None and right_censored_weights is None:
+            weights = ()  # the weights are only passed to the LL when given
+        else:
+            weights = (
+                np.ones(len(failures)) if failure_weights is None else failure_weights,
+                np.ones(len(right_censored))
+                if right_censored_weights is None
+                else right_censored_weights,
+            )
+        if func_name in [
+            "Weibull_3P",
+            "Gamma_2P",
+            "Gamma_3P",
+            "Beta_2P",
+            "Lognormal_3P",
+            "Loglogistic_3P",
+            "Exponential_2P",
+        ]:
+            guess = least_squares(
+                dist=func_name, failures=failures, right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+                positions=positions,
+            )
+            LS_method = "NLLS"
+        elif method in ["RRX", "RRY"]:
+            guess = least_squares(
+                dist=func_name,
+                failures=failures,
+                right_censored=right_censored,
+                method=method,
+                force_shape=force_shape,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+                positions=positions,
+            )
+            LS_method = method
+        else:  # LS
+            # RRX
+            guess_RRX = least_squares(
+                dist=func_name,
+                failures=failures,
+                right_censored=right_censored,
+                method="RRX",
+                force_shape=force_shape,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+                positions=positions,
+            )
+            if force_shape is not None:
+                loglik_RRX = -LL_func_force(
+                    guess_RRX, failures, right_censored, force_shape, *weights
+                )
+            else:
+                loglik_RRX = -LL_func(guess_RRX, failures, right_censored, *weights)
+            # RRY
+            guess_RRY = least_squares(
+                dist=func_name,
+                failures=failures,
+                right_censored=right_censored,
+                method="RRY",
+                force_shape=force_shape,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+                positions=positions,
+            )
+            if force_shape is not None:
+                loglik_RRY = -LL_func_force(
+                    guess_RRY, failures, right_censored, force_shape, *weights
+                )
+            else:
+                loglik_RRY = -LL_func(guess_RRY, failures, right_censored, *weights)
+            # take the best one
+            if abs(loglik_RRX) < abs(loglik_RRY):  # RRX is best
+                LS_method = "RRX"
+                guess = guess_RRX
+            else:  # RRY is best
+                LS_method = "RRY"
+                guess = guess_RRY
+        self.guess = guess
+        self.method = LS_method
+
+
+def _standardized_log_densities(family, z, order):
+    """
+    Returns the log PDF and log SF of the standardized distribution (and their
+    first and second derivatives with respect to z) for the families used by
+    the closed form log-likelihood derivatives. The family may be "SEV"
+    (smallest extreme value), "normal", or "logistic".
+    """
+    if family == "SEV":
+        ez = np.exp(z)
+        logf = (z - ez, 1 - ez, -ez)
+        logR = (-ez, -ez, -ez)
+    elif family == "normal":
+        mills = np.exp(ss.norm.logpdf(z) - ss.norm.logsf(z))
+        logf = (ss.norm.logpdf(z), -z, -np.ones_like(z))
+        logR = (ss.norm.logsf(z), -mills, -mills * (mills - z))
+    else:  # logistic
+        p = expit(z)
+        logf = (z - 2 * np.logaddexp(0, z), 1 - 2 * p, -2 * p * (1 - p))
+        logR = (-np.logaddexp(0, z), -p, -p * (1 - p))
+    return logf[: order + 1], logR[: order + 1]
+
+
+def _location_scale_LL_derivatives(
+    family, log_time, mu, sigma, T_f, T_rc, gamma=None, order=2, W_f=1, W_rc=1
+):
+    """
+    Calculates the log-likelihood and its gradient and hessian with respect to
+    (mu, sigma) or (mu, sigma, gamma) for a location-scale distribution of t
+    (log_time=False) or of log(t-gamma) (log_time=True).
+
+    The log-likelihood is sum(W_f*(logf(z_f) - log(sigma) - log(t_f-gamma))) +
+    sum(W_rc*logR(z_rc)) where z=(y-mu)/sigma and y is either t or
+    log(t-gamma). The log(t-gamma) term is only present when log_time is True.
+    """
+    k = 2 if gamma is None else 3
+    value = 0
+    grad = np.zeros(k)
+    hess = np.zeros((k, k))
+    for T, W, is_failure in [
+        (np.asarray(T_f), W_f, True),
+        (np.asarray(T_rc), W_rc, False),
+    ]:
+        if len(T) == 0:
+            continue
+        W = np.broadcast_to(np.asarray(W, dtype=float), T.shape)
+        d = T - gamma if gamma is not None else T
+        if log_time is True:
+            y = np.log(d)
+            y_g = -1 / d
+            y_gg = -1 / d**2
+        else:
+            y = d
+            y_g = -np.ones_like(d)
+            y_gg = np.zeros_like(d)
+        z = (y - mu) / sigma
+        logf, logR = _standardized_log_densities(family, z, order)
+        h = logf if is_failure is True else logR
+
+        value += (W * h[0]).sum()
+        if is_failure is True:
+            value -= W.sum() * np.log(sigma)
+            if log_time is True:
+                value -= (W * y).sum()
+        if order == 0:
+            continue
+
+        # first derivatives of z with respect to mu, sigma, gamma
+        z_1 = [-np.ones_like(z) / sigma, -z / sigma, y_g / sigma][:k]
+        for i in range(k):
+            grad[i] += (W * h[1] * z_1[i]).sum()
+        if is_failure is True:
+            grad[1] -= W.sum() / sigma
+            if log_time is True and k == 3:
+                grad[2] -= (W * y_g).sum()
+        if order == 1:
+            continue
+
+        # second derivatives of z
+        z_2 = np.empty((k, k), dtype=object)
+        z_2[0, 0] = np.zeros_like(z)
+        z_2[0, 1] = z_2[1, 0] = np.ones_like(z) / sigma**2
+        z_2[1, 1] = 2 * z / sigma**2
+        if k == 3:
+            z_2[0, 2] = z_2[2, 0] = np.zeros_like(z)
+            z_2[1, 2] = z_2[2, 1] = -y_g / sigma**2
+            z_2[2, 2] = y_gg / sigma
+        for i in range(k):
+            for j in range(i, k):
+                hess[i, j] += (
+                    W * (h[2] * z_1[i] * z_1[j] + h[1] * z_2[i, j])
+                ).sum()
+                hess[j, i] = hess[i, j]
+        if is_failure is True:
+            hess[1, 1] += W.sum() / sigma**2
+            if log_time is True and k == 3:
+                hess[2, 2] -= (W * y_gg).sum()
+    return value, grad, hess
+
+
+def _scale_shape_LL_derivatives(family, params, T_f, T_rc, W_f=1, W_rc=1, order=2):
+    """
+    Closed form derivatives of the negative log-likelihood for the log
+    location-scale distributions parametrised by alpha (scale) and beta
+    (shape), with an optional gamma (threshold). These are the Weibull
+    (family="SEV") and Loglogistic (family="logistic") distributions, for
+    which mu=log(alpha) and sigma=1/beta.
+    """
+    a, b = params[0], params[1]
+    gamma = params[2] if len(params) == 3 else None
+    value, grad, hess = _location_scale_LL_derivatives(
+        family,
+        True,
+        np.log(a),
+        1 / b,
+        T_f,
+        T_rc,
+        gamma=gamma,
+        order=order,
+        W_f=W_f,
+        W_rc=W_rc,
+    )
+    if order == 0:
+        return -value, None, None
+    # chain rule from (mu, sigma, gamma) to (alpha, beta, gamma)
+    J = np.array([1 / a, -1 / b**2, 1])[: len(params)]
+    J2 = np.array([-1 / a**2, 2 / b**3, 0])[: len(params)]
+    grad_ab = grad * J
+    if order == 1:
+        return -value, -grad_ab, None
+    hess_ab = hess * np.outer(J, J) + np.diag(grad * J2)
+    return -value, -grad_ab, -hess_ab
+
+
+def _location_scale_negative_LL_derivatives(family, log_time):
+    """
+    Closed form derivatives of the negative log-likelihood for the
+    distributions that are parametrised by mu and sigma (with an optional
+    gamma). These are the Normal, Gumbel, and Lognormal distributions.
+    """
+
+    def derivatives(params, T_f, T_rc, W_f=1, W_rc=1, order=2):
+        gamma = params[2] if len(params) == 3 else None
+        value, grad, hess = _location_scale_LL_derivatives(
+            family,
+            log_time,
+            params[0],
+            params[1],
+            T_f,
+            T_rc,
+            gamma=gamma,
+            order=order,
+            W_f=W_f,
+            W_rc=W_rc,
+        )
+        if order == 0:
+            return -value, None, None
+        if order == 1:
+            return -value, -grad, None
+        return -value, -grad, -hess
+
+    return derivatives
+
+
+def _exponential_1P_LL_derivatives(params, T_f, T_rc, W_f=1, W_rc=1, order=2):
+    """
+    Closed form derivatives of the negative log-likelihood for the
+    Exponential_1P distribution.
+    """
+    L = params[0]
+    W_f = np.broadcast_to(np.asarray(W_f, dtype=float), np.shape(T_f))
+    W_rc = np.broadcast_to(np.asarray(W_rc, dtype=float), np.shape(T_rc))
+    r = np.sum(W_f)
+    total_time = np.sum(W_f * T_f) + np.sum(W_rc * T_rc)
+    value = -(r * np.log(L) - L * total_time)
+    grad = np.array([-(r / L - total_time)])
+    hess = np.array([[r / L**2]])
+    return value, grad if order > 0 else None, hess if order > 1 else None
+
+
+def _exponential_2P_LL_derivatives(params, T_f, T_rc, W_f=1, W_rc=1, order=2):
+    """
+    Closed form derivatives of the negative log-likelihood for the
+    Exponential_2P distribution.
+    """
+    L, g = params[0], params[1]
+    W_f = np.broadcast_to(np.asarray(W_f, dtype=float), np.shape(T_f))
+    W_rc = np.broadcast_to(np.asarray(W_rc, dtype=float), np.shape(T_rc))
+    r = np.sum(W_f)
+    n = np.sum(W_f) + np.sum(W_rc)
+    total_time = np.sum(W_f * T_f) + np.sum(W_rc * T_rc) - n * g
+    value = -(r * np.log(L) - L * total_time)
+    grad = np.array([-(r / L - total_time), -L * n])
+    hess = np.array([[r / L**2, -n], [-n, 0]])
+    return value, grad if order > 0 else None, hess if order > 1 else None
+
+
+LL_derivatives_registry = {
+    "Weibull_2P": partial(_scale_shape_LL_derivatives, "SEV"),
+    "Weibull_3P": partial(_scale_shape_LL_derivatives, "SEV"),
+    "Loglogistic_2P": partial(_scale_shape_LL_derivatives, "logistic"),
+    "Loglogistic_3P": partial(_scale_shape_LL_derivatives, "logistic"),
+    "Normal_2P": _location_scale_negative_LL_derivatives("normal", False),
+    "Gumbel_2P": _location_scale_negative_LL_derivatives("SEV", False),
+    "Lognormal_2P": _location_scale_negative_LL_derivatives("normal", True),
+    "Lognormal_3P": _location_scale_negative_LL_derivatives("normal", True),
+    "Exponential_1P": _exponential_1P_LL_derivatives,
+    "Exponential_2P": _exponential_2P_LL_derivatives,
+}
+
+
+def get_LL_derivatives(func_name, LL_func):
+    """
+    Finds the closed form derivatives of the log-likelihood function from a
+    fitter in LL_derivatives_registry.
+
+    Parameters
+    ----------
+    func_name : str
+        The name of the distribution. Eg. "Weibull_2P".
+    LL_func : function
+        The log-likelihood function from the fitter. Eg. Fit_Weibull_2P.LL.
+        The forced shape versions (LL_fb and LL_fs) are also recognised.
+
+    Returns
+    -------
+    derivatives : function, None
+        A function with the signature derivatives(params, *args, order=2)
+        that returns a tuple of the negative log-likelihood, its gradient, and
+        its hessian. The args are the same as those of LL_func. None is
+        returned if closed form derivatives are not available for LL_func.
+
+    Notes
+    -----
+    The closed form derivatives are only used for the log-likelihood function
+    that matches func_name (i.e. Fit_Weibull_2P.LL for "Weibull_2P"), so that
+    other parametrisations of the same distribution fall back to autograd.
+    """
+    derivatives = LL_derivatives_registry.get(func_name)
+    if derivatives is None:
+        return None
+    name = getattr(LL_func, "__qualname__", "")
+    if name == str("Fit_" + func_name + ".LL"):
+        return derivatives
+    if name in [str("Fit_" + func_name + ".LL_fb"), str("Fit_" + func_name + ".LL_fs")]:
+
+        def forced_derivatives(params, T_f, T_rc, force_shape, W_f=1, W_rc=1, order=2):
+            value, grad, hess = derivatives(
+                np.hstack([params[0], force_shape]), T_f, T_rc, W_f, W_rc, order=order
+            )
+            return (
+                value,
+                grad[:1] if grad is not None else None,
+                hess[:1, :1] if hess is not None else None,
+            )
+
+        return forced_derivatives
+    return None
+
+
+def LL_value_and_grad(func_name, LL_func):
+    """
+    Returns a function that evaluates the log-likelihood function and its
+    gradient. This uses the closed form derivatives from
+    LL_derivatives_registry when they are available and autograd otherwise.
+
+    Parameters
+    ----------
+    func_name : str
+        The name of the distribution. Eg. "Weibull_2P".
+    LL_func : function
+        The log-likelihood function from the fitter.
+
+    Returns
+    -------
+    value_and_grad_func : function
+        A function with the same arguments as LL_func which returns a tuple of
+        the value and the gradient.
+    """
+    derivatives = get_LL_derivatives(func_name, LL_func)
+    if derivatives is None:
+        return value_and_grad(LL_func)
+
+    def value_and_grad_func(params, *args):
+        value, grad, _ = derivatives(params, *args, order=1)
+        return value, grad
+
+    return value_and_grad_func
+
+
+def LL_hessian(func_name, LL_func):
+    """
+    Returns a function that evaluates the hessian of the log-likelihood
+    function. This uses the closed form derivatives from
+    LL_derivatives_registry when they are available and autograd otherwise.
+
+    Parameters
+    ----------
+    func_name : str
+        The name of the distribution. Eg. "Weibull_2P".
+    LL_func : function
+        The log-likelihood function from the fitter.
+
+    Returns
+    -------
+    hessian_func : function
+        A function with the same arguments as LL_func which returns the
+        hessian matrix.
+    """
+    derivatives = get_LL_derivatives(func_name, LL_func)
+    if derivatives is None:
+        return hessian(LL_func)
+
+    def hessian_func(params, *args):
+        return derivatives(params, *args, order=2)[2]
+
+    return hessian_func
+
+
+def newton_MLE(
+    func_name, LL_func, initial_guess, args, bounds, max_iterations=50, tol=1e-8
+):
+    """
+    Finds the MLE using Newton's method with the closed form derivatives from
+    LL_derivatives_registry. This converges in a few steps when the initial
+    guess is close to the solution, such as when a fit is updated with a small
+    amount of new data.
+
+    Parameters
+    ----------
+    func_name : str
+        The name of the distribution. Eg. "Lognormal_2P".
+    LL_func : function
+        The log-likelihood function from the fitter.
+    initial_guess : list, array
+        The starting point for Newton's method.
+    args : tuple
+        The arguments of LL_func after the parameters (eg. the failures and
+        right censored times).
+    bounds : list
+        The bounds on each parameter as (lower, upper). None means unbounded.
+    max_iterations : int, optional
+        The maximum number of Newton steps. Default is 50.
+    tol : float, optional
+        The solution has converged when no parameter changes by more than tol
+        (relative to the parameter). Default is 1e-8.
+
+    Returns
+    -------
+    params : array
+        The solution (or the last point reached if not successful)
+    success : bool
+        Whether Newton's method converged to a local minimum of the negative
+        log-likelihood.
+
+    Notes
+    -----
+    Each step is halved until it decreases the negative log-likelihood and
+    stays within the bounds. Newton's method is abandoned (success is False)
+    if the hessian is not positive definite, so the caller can fall back to
+    the optimizers.
     """
-
-    def __init__(
-        self,
-        func_name,
-        LL_func,
-        failures,
-        right_censored,
-        method="LS",
-        force_shape=None,
-        LL_func_force=None,
-    ):
-        if method not in ["RRX", "RRY", "LS", "NLLS"]:
-            raise ValueError(
-                "method must be either RRX, RRY, LS, or NLLS. Default is LS"
-            )
-        if func_name in [
-            "Weibull_3P",
-            "Gamma_2P",
-            "Gamma_3P",
-            "Beta_2P",
-            "Lognormal_3P",
-            "Loglogistic_3P",
-            "Exponential_2P",
-        ]:
-            guess = least_squares(
-                dist=func_name, failures=failures, right_censored=right_censored
-            )
-            LS_method = "NLLS"
-        elif method in ["RRX", "RRY"]:
-            guess = least_squares(
-                dist=func_name,
-                failures=failures,
-                right_censored=right_censored,
-                method=method,
-                force_shape=force_shape,
-            )
-            LS_method = method
-        else:  # LS
-            # RRX
-            guess_RRX = least_squares(
-                dist=func_name,
-                failures=failures,
-                right_censored=right_censored,
-                method="RRX",
-                force_shape=force_shape,
-            )
-            if force_shape is not None:
-                loglik_RRX = -LL_func_force(
-                    guess_RRX, failures, right_censored, force_shape
-                )
-            else:
-                loglik_RRX = -LL_func(guess_RRX, failures, right_censored)
-            # RRY
-            guess_RRY = least_squares(
-                dist=func_name,
-                failures=failures,
-                right_censored=right_censored,
-                method="RRY",
-                force_shape=force_shape,
-            )
-            if force_shape is not None:
-                loglik_RRY = -LL_func_force(
-                    guess_RRY, failures, right_censored, force_shape
-                )
+    derivatives = get_LL_derivatives(func_name, LL_func)
+    params = np.asarray(initial_guess, dtype=float)
+    if derivatives is None:
+        return params, False
+    lower = np.array([-np.inf if b[0] is None else b[0] for b in bounds])
+    upper = np.array([np.inf if b[1] is None else b[1] for b in bounds])
+    with np.errstate(all="ignore"):
+        value, grad, hess = derivatives(params, *args)
+        for _ in range(max_iterations):
+            try:
+                np.linalg.cholesky(hess)  # the hessian must be positive definite
+                step = np.linalg.solve(hess, grad)
+            except LinAlgError:
+                return params, False
+            if not np.all(np.isfinite(step)):
+                return params, False
+            t = 1
+            while t > 1e-6:
+                new_params = params - t * step
+                if np.all(new_params > lower) and np.all(new_params < upper):
+                    new_value = derivatives(new_params, *args, order=0)[0]
+                    if new_value <= value + 1e-12 * abs(value):
+                        break
+                t /= 2
             else:
-                loglik_RRY = -LL_func(guess_RRY, failures, right_censored)
-            # take the best one
-            if abs(loglik_RRX) < abs(loglik_RRY):  # RRX is best
-                LS_method = "RRX"
-                guess = guess_RRX
-            else:  # RRY is best
-                LS_method = "RRY"
-                guess = guess_RRY
-        self.guess = guess
-        self.method = LS_method
+                return params, False
+            params = new_params
+            value, grad, hess = derivatives(params, *args)
+            if np.all(np.abs(t * step) <= tol * (1 + np.abs(params))):
+                try:
+                    np.linalg.cholesky(hess)
+                except LinAlgError:
+                    return params, False
+                return params, bool(np.isfinite(value))
+    return params, False
 
 
 class MLE_optimization:
@@ -5402,12 +6330,29 @@ class MLE_optimization:
         This must be either "TNC", "L-BFGS-B", "nelder-mead", "powell", "best",
         "all" or None. Fot detail on how these optimizers are used, please see
         the `documentation <https://reliability.readthedocs.io/en/latest/Optimizers.html>`_.
+        For Weibull_2P, None will first use the profile likelihood of beta (see
+        weibull_2P_profile_fit) and only use the optimizers if that fails.
+        None will also use the closed form MLE when there is one (see
+        closed_form_MLE) instead of the optimizers.
     force_shape : float, int, optional
         The shape parameter to be forced. Default is None which results in no
         forcing of the shape parameter.
     LL_func_force : function
         The log-likelihood function for when the shape parameter is forced. Only
         required if force_shape is not None.
+    failure_weights : array, list, optional
+        The number of units at each failure time. Default is None which gives
+        each failure a weight of 1. When weights are given they are passed to
+        LL_func (and LL_func_force) as two extra arguments after the data.
+    right_censored_weights : array, list, optional
+        The number of units at each right censored time. Default is None which
+        gives each right censored value a weight of 1.
+    warm_start : bool, optional
+        If True, the initial guess is assumed to be close to the solution (eg.
+        the MLE from a previous fit of most of the same data). When optimizer
+        is None, Newton's method (see newton_MLE) is tried first from the
+        initial guess for the distributions in LL_derivatives_registry. The
+        optimizers are only used if this fails. Default is False.
 
     Returns
     -------
@@ -5468,6 +6413,9 @@ class MLE_optimization:
         optimizer,
         force_shape=None,
         LL_func_force=None,
+        failure_weights=None,
+        right_censored_weights=None,
+        warm_start=False,
     ):
         # this sub-function does the actual optimization. It is called each time a new optimizer is tried
         def loglik_optimizer(
@@ -5480,6 +6428,7 @@ class MLE_optimization:
             force_shape,
             LL_func_force,
             func_name,
+            weights,
         ):
             """
             This sub-function does the actual optimization. It is called each
@@ -5509,6 +6458,9 @@ class MLE_optimization:
                 required if force_shape is not None.
             func_name : str
                 The function name. eg. "Weibull_2P"
+            weights : tuple
+                The failure weights and right censored weights. This is an
+                empty tuple if no weights were given.
 
             Returns
             -------
@@ -5535,15 +6487,18 @@ class MLE_optimization:
 
             if ZI is True:  # Zero Inflated distribution (applies to ZI and DSZI)
                 args = (failures[failures == 0], failures[failures > 0], right_censored)
+                if len(weights) > 0:
+                    W_f, W_rc = weights
+                    args = args + (W_f[failures == 0], W_f[failures > 0], W_rc)
             else:
-                args = (failures, right_censored)
+                args = (failures, right_censored) + weights
 
             if force_shape is None:
                 while delta_LL > 0.001 and runs < 5:
                     # exits after LL convergence or 5 iterations
                     runs += 1
                     result = minimize(
-                        value_and_grad(LL_func),
+                        LL_value_and_grad(func_name, LL_func),
                         guess,
                         args=args,
                         jac=True,
@@ -5551,15 +6506,7 @@ class MLE_optimization:
                         bounds=bounds,
                     )
                     guess = result.x  # update the guess each iteration
-                    if ZI is True:
-                        LL2 = 2 * LL_func(
-                            guess,
-                            failures[failures == 0],
-                            failures[failures > 0],
-                            right_censored,
-                        )
-                    else:
-                        LL2 = 2 * LL_func(guess, failures, right_censored)
+                    LL2 = 2 * LL_func(guess, *args)
                     LL_array.append(np.abs(LL2))
                     delta_LL = abs(LL_array[-1] - LL_array[-2])
             else:  # this will only be run for Weibull_2P, Normal_2P, and Lognormal_2P so the guess is structured with this in mind
@@ -5570,22 +6517,34 @@ class MLE_optimization:
                 ):  # exits after LL convergence or 5 iterations
                     runs += 1
                     result = minimize(
-                        value_and_grad(LL_func_force),
+                        LL_value_and_grad(func_name, LL_func_force),
                         guess,
-                        args=(failures, right_censored, force_shape),
+                        args=(failures, right_censored, force_shape) + weights,
                         jac=True,
                         method=optimizer,
                         bounds=bounds,
                     )
                     guess = result.x
                     LL2 = 2 * LL_func_force(
-                        guess, failures, right_censored, force_shape
+                        guess, failures, right_censored, force_shape, *weights
                     )
                     LL_array.append(np.abs(LL2))
                     delta_LL = abs(LL_array[-1] - LL_array[-2])
                     guess = result.x  # update the guess each iteration
             return result.success, LL_array[-1], result.x
 
+        if failure_weights is None and right_censored_weights is None:
+            weights = ()  # the weights are only passed to the LL when given
+        else:
+            weights = (
+                np.ones(len(failures))
+                if failure_weights is None
+                else np.asarray(failure_weights, dtype=float),
+                np.ones(len(right_censored))
+                if right_censored_weights is None
+                else np.asarray(right_censored_weights, dtype=float),
+            )
+
         # generate the bounds on the solution
         gamma0 = max(0, min(np.hstack([failures, right_censored])) - 0.0001)
         if func_name in ["Weibull_2P", "Gamma_2P", "Beta_2P", "Loglogistic_2P"]:
@@ -5621,6 +6580,85 @@ class MLE_optimization:
                 'func_name is not recognised. Use the correct name e.g. "Weibull_2P"'
             )
 
+        # Weibull_2P has a fast path which is used by default. The MLE of alpha
+        # has a closed form for any given beta, so the MLE reduces to a 1-D root
+        # find on the profile likelihood of beta. The optimizers are only used
+        # if this fails or if an optimizer is specified.
+        if func_name == "Weibull_2P" and optimizer is None:
+            alpha, beta, success = weibull_2P_profile_fit(
+                failures=failures,
+                right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+                initial_beta=initial_guess[1] if len(initial_guess) > 1 else None,
+                force_beta=force_shape,
+            )
+            if success is True:
+                self.scale = alpha
+                self.shape = beta
+                self.optimizer = "profile likelihood"
+                self.success = True
+                return
+
+        # the MLE has a closed form for some distributions and data
+        if (
+            optimizer is None
+            and force_shape is None
+            and getattr(LL_func, "__qualname__", "") == str("Fit_" + func_name + ".LL")
+        ):
+            params = closed_form_MLE(
+                func_name=func_name,
+                failures=failures,
+                right_censored=right_censored,
+                failure_weights=failure_weights,
+                right_censored_weights=right_censored_weights,
+            )
+            if params is not None:
+                self.scale = params[0]
+                if func_name == "Exponential_2P":
+                    self.gamma = params[1]
+                elif func_name != "Exponential_1P":
+                    self.shape = params[1]
+                self.optimizer = "closed form"
+                self.success = True
+                return
+
+        # a warm start from a nearby solution only needs a few Newton steps
+        if (
+            warm_start is True
+            and optimizer is None
+            and func_name in LL_derivatives_registry
+        ):
+            if force_shape is None:
+                params, success = newton_MLE(
+                    func_name,
+                    LL_func,
+                    initial_guess,
+                    (failures, right_censored) + weights,
+                    bounds,
+                )
+            else:
+                params, success = newton_MLE(
+                    func_name,
+                    LL_func_force,
+                    [initial_guess[0]],
+                    (failures, right_censored, force_shape) + weights,
+                    [bounds[0]],
+                )
+            if success is True:
+                self.scale = params[0]
+                if force_shape is not None:
+                    self.shape = force_shape
+                elif func_name == "Exponential_2P":
+                    self.gamma = params[1]
+                elif func_name != "Exponential_1P":
+                    self.shape = params[1]
+                    if len(params) > 2:
+                        self.gamma = params[2]
+                self.optimizer = "Newton"
+                self.success = True
+                return
+
         # determine which optimizers to use
         stop_after_success = False
         if (
@@ -5669,6 +6707,7 @@ class MLE_optimization:
                 force_shape,
                 LL_func_force,
                 func_name,
+                weights,
             )
             ALL_successes.append(optim_results[0])
             ALL_loglik.append(optim_results[1])
@@ -5824,6 +6863,355 @@ class MLE_optimization:
                     self.shape = force_shape
 
 
+def weibull_2P_profile_MLE(
+    times, failure_codes, groups=None, n_groups=None, weights=None, initial_beta=None
+):
+    """
+    Finds the MLE of the Weibull_2P distribution by solving the profile
+    likelihood equation for beta. This works for any number of independent
+    datasets at once, with all the datasets solved simultaneously.
+
+    For a given beta, the MLE of alpha has the closed form
+    alpha = (sum(w*t^beta)/r)^(1/beta) where r is the number of failures. This
+    reduces the MLE to finding the root of a 1-D equation in beta which is
+    monotonically decreasing and therefore has a unique solution. The root is
+    found using Newton's method (in log(beta)) safeguarded by bisection.
+
+    Parameters
+    ----------
+    times : array
+        The failure and right censored times for all the datasets
+    failure_codes : array
+        1 for a failure and 0 for a right censored time. Must be the same
+        length as times.
+    groups : array, optional
+        The integer index (0 to n_groups-1) of the dataset that each time
+        belongs to. Default is None which treats all the times as one dataset.
+    n_groups : int, optional
+        The number of datasets. Default is None which uses max(groups)+1.
+    weights : array, optional
+        The number of units represented by each time. Default is None which
+        gives every time a weight of 1.
+    initial_beta : array, float, optional
+        The starting value of beta for each dataset. Default is None which
+        uses an estimate from the spread of the log failure times.
+
+    Returns
+    -------
+    alpha : array
+        The MLE of alpha for each dataset
+    beta : array
+        The MLE of beta for each dataset
+    success : array
+        A boolean array of whether the root finding converged for each dataset
+
+    Notes
+    -----
+    Each dataset must contain at least 2 distinct failures for the MLE to
+    exist. Datasets that do not meet this requirement will have success=False
+    and alpha and beta of nan.
+    """
+    times = np.asarray(times, dtype=float)
+    F = np.asarray(failure_codes, dtype=float)
+    if groups is None:
+        groups = np.zeros(len(times), dtype=int)
+    else:
+        groups = np.asarray(groups, dtype=int)
+    if n_groups is None:
+        n_groups = int(groups.max()) + 1 if len(groups) > 0 else 0
+    if weights is None:
+        W = np.ones_like(times)
+    else:
+        W = np.asarray(weights, dtype=float)
+
+    def group_sum(values):
+        return np.bincount(groups, weights=values, minlength=n_groups)
+
+    # centering the log times within each group prevents overflow of t^beta
+    u = np.log(times)
+    u_max = np.full(n_groups, -np.inf)
+    np.maximum.at(u_max, groups, u)
+    u_max[~np.isfinite(u_max)] = 0
+    u = u - u_max[groups]
+
+    r = group_sum(W * F)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u_f_mean = group_sum(W * F * u) / r
+        u_f_var = group_sum(W * F * u**2) / r - u_f_mean**2
+    valid = (r > 0) & (u_f_var > 1e-14)
+
+    if initial_beta is None:
+        # the standard deviation of log(t) for a Weibull distribution is pi/(beta*sqrt(6))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.pi / (np.sqrt(6 * u_f_var))
+    else:
+        beta = np.broadcast_to(np.asarray(initial_beta, dtype=float), (n_groups,)).copy()
+    beta[~valid | ~np.isfinite(beta) | (beta <= 0)] = 1.0
+
+    lo = np.zeros(n_groups)
+    hi = np.full(n_groups, np.inf)
+    converged = ~valid
+    for _ in range(100):
+        b = beta[groups]
+        e = W * np.exp(b * u)
+        A0 = group_sum(e)
+        A1 = group_sum(e * u) / A0
+        A2 = group_sum(e * u**2) / A0
+        g = 1 / beta + u_f_mean - A1  # profile score equation
+        dg = -1 / beta**2 - (A2 - A1**2)  # always negative
+        # update the bracket on the root
+        lo = np.where(g > 0, np.maximum(lo, beta), lo)
+        hi = np.where(g < 0, np.minimum(hi, beta), hi)
+        # Newton step in log(beta), limited to a factor of e per iteration
+        step = np.clip(-g / (beta * dg), -1, 1)
+        proposed = beta * np.exp(step)
+        outside = (proposed <= lo) | (proposed >= hi)
+        bisected = np.where(
+            np.isfinite(hi), np.sqrt(np.maximum(lo, hi / np.e) * hi), beta * np.e
+        )
+        proposed = np.where(outside, bisected, proposed)
+        converged = converged | (np.abs(step) < 1e-10) | (g == 0)
+        beta = np.where(converged, beta, proposed)
+        if converged.all():
+            break
+
+    b = beta[groups]
+    A0 = group_sum(W * np.exp(b * u))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = np.exp(u_max + np.log(A0 / r) / beta)
+    success = converged & valid & np.isfinite(alpha) & np.isfinite(beta)
+    alpha = np.where(success, alpha, np.nan)
+    beta = np.where(success, beta, np.nan)
+    return alpha, beta, success
+
+
+def closed_form_MLE(
+    func_name,
+    failures,
+    right_censored,
+    failure_weights=None,
+    right_censored_weights=None,
+    force_shape=None,
+):
+    """
+    Finds the MLE of the distributions for which it has a closed form. These
+    are Exponential_1P and Exponential_2P (with or without right censored
+    data), and Normal_2P and Lognormal_2P when there is no right censored data.
+
+    Parameters
+    ----------
+    func_name : str
+        The name of the distribution. Eg. "Exponential_1P".
+    failures : array
+        The failure times
+    right_censored : array
+        The right censored times. This may be an empty array.
+    failure_weights : array, optional
+        The number of units represented by each failure time. Default is None
+        which gives each failure a weight of 1.
+    right_censored_weights : array, optional
+        The number of units represented by each right censored time. Default is
+        None which gives each right censored time a weight of 1.
+    force_shape : float, optional
+        The value of sigma if it is forced. Only used by Normal_2P and
+        Lognormal_2P. Default is None.
+
+    Returns
+    -------
+    params : array, None
+        The MLE of the parameters. These are [Lambda] for Exponential_1P,
+        [Lambda, gamma] for Exponential_2P, and [mu, sigma] for Normal_2P and
+        Lognormal_2P. None is returned if the MLE does not have a closed form
+        for this distribution and data.
+
+    Notes
+    -----
+    The MLE of Lambda is the number of failures divided by the total time on
+    test. For Exponential_2P the log-likelihood increases with gamma so gamma
+    is at its upper bound. This is the same bound used by MLE_optimization
+    (just below the smallest time) so the results match those of the
+    optimizers.
+
+    Without censoring, the MLE of mu is the mean of the data (or the log of
+    the data for Lognormal_2P) and the MLE of sigma is the standard deviation
+    with n (not n-1) in the denominator.
+    """
+    failures = np.asarray(failures, dtype=float)
+    right_censored = np.asarray(right_censored, dtype=float)
+    if failure_weights is None:
+        failure_weights = np.ones_like(failures)
+    if right_censored_weights is None:
+        right_censored_weights = np.ones_like(right_censored)
+    W_f = np.asarray(failure_weights, dtype=float)
+    W_rc = np.asarray(right_censored_weights, dtype=float)
+    r = np.sum(W_f)
+    if func_name == "Exponential_1P":
+        total_time = np.sum(W_f * failures) + np.sum(W_rc * right_censored)
+        return np.array([r / total_time])
+    elif func_name == "Exponential_2P":
+        gamma = max(0, min(np.hstack([failures, right_censored])) - 0.0001)
+        total_time = np.sum(W_f * (failures - gamma)) + np.sum(
+            W_rc * (right_censored - gamma)
+        )
+        return np.array([r / total_time, gamma])
+    elif func_name in ["Normal_2P", "Lognormal_2P"] and np.sum(W_rc) == 0:
+        x = failures if func_name == "Normal_2P" else np.log(failures)
+        mu = np.sum(W_f * x) / r
+        if force_shape is not None:
+            return np.array([mu, force_shape])
+        sigma = (np.sum(W_f * (x - mu) ** 2) / r) ** 0.5
+        if sigma > 0:
+            return np.array([mu, sigma])
+    return None
+
+
+def weibull_2P_profile_fit(
+    failures,
+    right_censored,
+    failure_weights=None,
+    right_censored_weights=None,
+    initial_beta=None,
+    force_beta=None,
+):
+    """
+    Finds the MLE of the Weibull_2P distribution for a single dataset using the
+    profile likelihood of beta. This is the default method used by
+    Fit_Weibull_2P and Fit_Weibull_2P_grouped.
+
+    Parameters
+    ----------
+    failures : array
+        The failure times
+    right_censored : array
+        The right censored times. This may be an empty array.
+    failure_weights : array, optional
+        The number of units represented by each failure time. Default is None
+        which gives each failure a weight of 1.
+    right_censored_weights : array, optional
+        The number of units represented by each right censored time. Default is
+        None which gives each right censored time a weight of 1.
+    initial_beta : float, optional
+        The starting value of beta for the root finding. Default is None which
+        uses an estimate from the spread of the log failure times.
+    force_beta : float, optional
+        If specified, beta is fixed at this value and only alpha is found. In
+        this case alpha is obtained directly from its closed form.
+
+    Returns
+    -------
+    alpha : float
+        The MLE of alpha
+    beta : float
+        The MLE of beta (or force_beta if specified)
+    success : bool
+        Whether a solution was found
+
+    Notes
+    -----
+    See weibull_2P_profile_MLE for more detail on the method.
+    """
+    failures = np.asarray(failures, dtype=float)
+    right_censored = np.asarray(right_censored, dtype=float)
+    times = np.hstack([failures, right_censored])
+    failure_codes = np.hstack([np.ones_like(failures), np.zeros_like(right_censored)])
+    if failure_weights is None and right_censored_weights is None:
+        weights = None
+    else:
+        if failure_weights is None:
+            failure_weights = np.ones_like(failures)
+        if right_censored_weights is None:
+            right_censored_weights = np.ones_like(right_censored)
+        weights = np.hstack([failure_weights, right_censored_weights]).astype(float)
+
+    if force_beta is None:
+        alpha, beta, success = weibull_2P_profile_MLE(
+            times=times,
+            failure_codes=failure_codes,
+            weights=weights,
+            initial_beta=initial_beta,
+        )
+        return alpha[0], beta[0], bool(success[0])
+    else:
+        # alpha has a closed form when beta is known
+        W = np.ones_like(times) if weights is None else weights
+        t_max = max(times)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            alpha = t_max * (
+                np.sum(W * (times / t_max) ** force_beta) / np.sum(W * failure_codes)
+            ) ** (1 / force_beta)
+        return alpha, force_beta, bool(np.isfinite(alpha) and alpha > 0)
+
+
+def weibull_2P_information(
+    alpha, beta, times, failure_codes, groups=None, n_groups=None, weights=None
+):
+    """
+    Calculates the log-likelihood and the observed information matrix (the
+    hessian of the negative log-likelihood) of the Weibull_2P distribution in
+    closed form. This works for any number of independent datasets at once.
+
+    Parameters
+    ----------
+    alpha : array, float
+        The alpha parameter for each dataset
+    beta : array, float
+        The beta parameter for each dataset
+    times : array
+        The failure and right censored times for all the datasets
+    failure_codes : array
+        1 for a failure and 0 for a right censored time. Must be the same
+        length as times.
+    groups : array, optional
+        The integer index (0 to n_groups-1) of the dataset that each time
+        belongs to. Default is None which treats all the times as one dataset.
+    n_groups : int, optional
+        The number of datasets. Default is None which uses max(groups)+1.
+    weights : array, optional
+        The number of units represented by each time. Default is None which
+        gives every time a weight of 1.
+
+    Returns
+    -------
+    loglik : array
+        The log-likelihood of each dataset
+    information : array
+        The observed information matrix of each dataset. This has shape
+        (n_groups, 2, 2) with the parameters ordered as [alpha, beta].
+    """
+    times = np.asarray(times, dtype=float)
+    F = np.asarray(failure_codes, dtype=float)
+    if groups is None:
+        groups = np.zeros(len(times), dtype=int)
+    else:
+        groups = np.asarray(groups, dtype=int)
+    if n_groups is None:
+        n_groups = int(groups.max()) + 1 if len(groups) > 0 else 0
+    if weights is None:
+        W = np.ones_like(times)
+    else:
+        W = np.asarray(weights, dtype=float)
+    a = np.broadcast_to(np.asarray(alpha, dtype=float), (n_groups,))
+    b = np.broadcast_to(np.asarray(beta, dtype=float), (n_groups,))
+
+    def group_sum(values):
+        return np.bincount(groups, weights=values, minlength=n_groups)
+
+    ln_z = np.log(times) - np.log(a)[groups]
+    z_b = np.exp(b[groups] * ln_z)
+    r = group_sum(W * F)
+    S0 = group_sum(W * z_b)
+    S1 = group_sum(W * z_b * ln_z)
+    S2 = group_sum(W * z_b * ln_z**2)
+
+    loglik = group_sum(W * F * ln_z) * (b - 1) + r * np.log(b / a) - S0
+    information = np.empty((n_groups, 2, 2))
+    information[:, 0, 0] = -(b / a**2) * (r - (1 + b) * S0)
+    information[:, 0, 1] = (r - S0 - b * S1) / a
+    information[:, 1, 0] = information[:, 0, 1]
+    information[:, 1, 1] = r / b**2 + S2
+    return loglik, information
+
+
 class ALT_MLE_optimization:
     """
     This performs the MLE method to find the parameters.
@@ -7465,6 +8853,364 @@ def extract_CI(dist, func="CDF", CI_type="time", CI=0.95, CI_y=None, CI_x=None):
     return lower, upper
 
 
+def batch_extract_CI(
+    dist_name,
+    params,
+    covariances,
+    func="CDF",
+    CI_type="time",
+    CI=0.95,
+    CI_y=None,
+    CI_x=None,
+    gamma=None,
+):
+    """
+    Extracts the confidence bounds at CI_x or CI_y for many fitted
+    distributions at once. This gives the same results as extract_CI (and the
+    CI_x and CI_y options of the CDF, SF, and CHF methods of each distribution)
+    without creating a distribution object for each set of parameters.
+
+    Parameters
+    ----------
+    dist_name : str
+        The name of the distribution. Must be one of "Weibull", "Gamma",
+        "Normal", "Lognormal", "Loglogistic", "Gumbel", or "Exponential".
+    params : array, list
+        The parameters of each distribution as an array with one row per
+        distribution. The columns are the parameters that the covariances refer
+        to which are (alpha, beta) for Weibull and Loglogistic, (mu, beta) for
+        Gamma, (mu, sigma) for Normal, Lognormal, and Gumbel, and (Lambda) for
+        Exponential.
+    covariances : array, list
+        The covariance matrix of the parameters of each distribution as an
+        array of shape (number of distributions, number of parameters, number
+        of parameters). The diagonal is the square of the standard errors.
+    func : str, optional
+        Must be either 'CDF', 'SF', 'CHF'. Default is 'CDF'.
+    CI_type : str, optional
+        Must be either 'time' or 'reliability'. Default is 'time'. This is
+        ignored for the Exponential distribution as the bounds on time and
+        reliability are identical.
+    CI : float, optional
+        The confidence interval. Must be between 0 and 1. Default is 0.95.
+    CI_y : list, array, optional
+        The y-values from which to extract the confidence interval (x-values)
+        for bounds on time.
+    CI_x : list, array, optional
+        The x-values from which to extract the confidence interval (y-values)
+        for bounds on reliability.
+    gamma : float, int, array, list, optional
+        The location parameter of each distribution. Default is None which is
+        the same as 0. Not accepted for Normal or Gumbel.
+
+    Returns
+    -------
+    lower : array
+        The lower confidence bounds with one row per distribution and one
+        column per value of CI_x or CI_y.
+    point : array
+        The point estimates in the same shape as lower. These are the times at
+        CI_y for bounds on time and the values of func at CI_x for bounds on
+        reliability.
+    upper : array
+        The upper confidence bounds in the same shape as lower.
+
+    Notes
+    -----
+    If CI_type="time" then CI_y must be specified in order to extract the
+    confidence bounds on time.
+
+    If CI_type="reliability" then CI_x must be specified in order to extract the
+    confidence bounds on reliability.
+
+    Bounds that can not be calculated (for example at an x-value where the SF
+    is 0) are returned as nan rather than raising an error, so a single
+    distribution can not prevent the bounds of the others being returned.
+
+    .. code:: python
+
+        fit = Fit_Weibull_2P_batch(failures=data)
+        params = np.column_stack([fit.alpha, fit.beta])
+        covariances = np.array(
+            [
+                [[a_SE**2, cov], [cov, b_SE**2]]
+                for a_SE, b_SE, cov in zip(fit.alpha_SE, fit.beta_SE, fit.Cov_alpha_beta)
+            ]
+        )
+        lower, point, upper = batch_extract_CI(
+            "Weibull", params, covariances, CI_y=[0.01, 0.1]
+        )  # B1 and B10 lives of each dataset with their confidence bounds
+    """
+    if dist_name not in [
+        "Weibull",
+        "Gamma",
+        "Normal",
+        "Lognormal",
+        "Loglogistic",
+        "Gumbel",
+        "Exponential",
+    ]:
+        raise ValueError(
+            "dist_name must be Weibull, Gamma, Normal, Lognormal, Loglogistic, Gumbel, or Exponential"
+        )
+    if func not in ["CDF", "SF", "CHF"]:
+        raise ValueError("func must be CDF, SF, or CHF")
+    if type(CI) not in [float, np.float64] or CI <= 0 or CI >= 1:
+        raise ValueError("CI must be between 0 and 1")
+    if CI_y is not None and CI_x is not None:
+        raise ValueError(
+            "Both CI_x and CI_y have been provided. Please provide only one."
+        )
+    if dist_name == "Exponential":
+        CI_type = "time" if CI_y is not None else "reliability"
+    if CI_type == "time" and CI_y is None:
+        raise ValueError(
+            'If CI_type="time" then CI_y must be specified in order to extract the confidence bounds on time.'
+        )
+    if CI_type == "reliability" and CI_x is None:
+        raise ValueError(
+            'If CI_type="reliability" then CI_x must be specified in order to extract the confidence bounds on reliability.'
+        )
+    if CI_type not in ["time", "reliability"]:
+        raise ValueError('CI_type must be "time" or "reliability"')
+
+    number_of_params = 1 if dist_name == "Exponential" else 2
+    params = np.asarray(params, dtype=float).reshape(-1, number_of_params)
+    covariances = np.asarray(covariances, dtype=float).reshape(
+        -1, number_of_params, number_of_params
+    )
+    if len(covariances) != len(params):
+        raise ValueError(
+            "params and covariances must have the same number of distributions"
+        )
+    if gamma is None:
+        gamma = 0
+    elif dist_name in ["Normal", "Gumbel"]:
+        raise ValueError("gamma can not be specified for the " + dist_name + " distribution")
+    # each distribution is a row and each value of CI_x or CI_y is a column
+    gamma = np.asarray(gamma, dtype=float).reshape(-1, 1)
+    a = params[:, [0]]
+    var_a = covariances[:, 0, [0]]
+    if number_of_params == 2:
+        b = params[:, [1]]
+        var_b = covariances[:, 1, [1]]
+        cov_ab = covariances[:, 0, [1]]
+    Z = -ss.norm.ppf((1 - CI) / 2)  # converts CI to Z
+
+    if CI_type == "time":
+        # Y is reliability (R)
+        if func == "SF":
+            Y = np.asarray(CI_y, dtype=float)
+        elif func == "CDF":
+            Y = 1 - np.asarray(CI_y, dtype=float)
+        else:  # CHF
+            Y = np.exp(-np.asarray(CI_y, dtype=float))
+        Y = Y.reshape(1, -1)
+        if dist_name == "Exponential":
+            Lambda_upper = a * (np.exp(Z * (var_a**0.5 / a)))
+            Lambda_lower = a * (np.exp(-Z * (var_a**0.5 / a)))
+            point = -np.log(Y) / a + gamma
+            lower = -np.log(Y) / Lambda_upper + gamma
+            upper = -np.log(Y) / Lambda_lower + gamma
+        else:
+            # v is t for Normal and Gumbel and ln(t) otherwise
+            v, sd = _linearized_CI(dist_name, "time", Y, a, b, var_a, var_b, cov_ab)
+            if dist_name in ["Normal", "Gumbel"]:
+                point = v * np.ones_like(a)
+                lower = v - Z * sd
+                upper = v + Z * sd
+            else:
+                point = np.exp(v) + gamma
+                lower = np.exp(v - Z * sd) + gamma  # transform back from ln(t)
+                upper = np.exp(v + Z * sd) + gamma
+        invalid = ~(np.isfinite(lower) & np.isfinite(upper) & (Y > 0) & (Y < 1))
+    else:
+        t = np.asarray(CI_x, dtype=float).reshape(1, -1) - gamma
+        # SF_lower and SF_upper are the bounds on the SF
+        if dist_name == "Exponential":
+            Lambda_upper = a * (np.exp(Z * (var_a**0.5 / a)))
+            Lambda_lower = a * (np.exp(-Z * (var_a**0.5 / a)))
+            SF = np.exp(-a * t)
+            SF_lower = np.exp(-Lambda_upper * t)
+            SF_upper = np.exp(-Lambda_lower * t)
+        else:
+            u, sd = _linearized_CI(
+                dist_name, "reliability", t, a, b, var_a, var_b, cov_ab
+            )
+            if dist_name in ["Weibull", "Gumbel"]:  # u = ln(-ln(R))
+                SF = np.exp(-np.exp(u))
+                SF_lower = np.exp(-np.exp(u + Z * sd))
+                SF_upper = np.exp(-np.exp(u - Z * sd))
+            elif dist_name == "Loglogistic":  # u = ln(1/R - 1)
+                SF = 1 / (np.exp(u) + 1)
+                SF_lower = 1 / (np.exp(u + Z * sd) + 1)
+                SF_upper = 1 / (np.exp(u - Z * sd) + 1)
+            elif dist_name in ["Normal", "Lognormal"]:  # u = phiinv(R)
+                SF = ss.norm.cdf(u)
+                SF_lower = ss.norm.cdf(u - Z * sd)
+                SF_upper = ss.norm.cdf(u + Z * sd)
+            else:  # Gamma, u = R
+                SF = u
+                SF_lower = u / (u + (1 - u) * np.exp((Z * sd) / (u * (1 - u))))
+                SF_upper = u / (u + (1 - u) * np.exp((-Z * sd) / (u * (1 - u))))
+        if func == "SF":
+            point, lower, upper = SF, SF_lower, SF_upper
+        elif func == "CDF":
+            point, lower, upper = 1 - SF, 1 - SF_upper, 1 - SF_lower
+        else:  # CHF
+            point, lower, upper = -np.log(SF), -np.log(SF_upper), -np.log(SF_lower)
+        invalid = ~(
+            np.isfinite(SF_lower)
+            & np.isfinite(SF_upper)
+            & (SF_lower > 1e-50)
+            & (SF_upper > 1e-50)
+        )
+        if func in ["CDF", "SF"]:
+            invalid = invalid | (SF_lower >= 1) | (SF_upper >= 1)
+    # values that clean_CI_arrays would remove are returned as nan
+    lower = np.where(invalid, np.nan, lower)
+    upper = np.where(invalid, np.nan, upper)
+    return lower, point, upper
+
+
+def bracketed_root(function, y, lower, upper, xtol=1e-14, maxiter=100):
+    """
+    Solves function(x) = y for many values of y at once using Chandrupatla's
+    method. Each element is solved independently on the bracket [lower, upper]
+    and all the elements are iterated simultaneously.
+
+    Chandrupatla's method combines inverse quadratic interpolation with
+    bisection in a similar way to Brent's method. It is guaranteed to converge
+    for any continuous function that changes sign on the bracket.
+
+    Parameters
+    ----------
+    function : function
+        A vectorized function of x which is monotonic on [lower, upper]. It
+        must return an array the same shape as x.
+    y : float, list, array
+        The values of the function for which x is to be found.
+    lower : float, array
+        The lower end of the bracket. Must be broadcastable with y.
+    upper : float, array
+        The upper end of the bracket. Must be broadcastable with y.
+    xtol : float, optional
+        The absolute tolerance on x. A relative tolerance of 2x the machine
+        precision is also applied. Default is 1e-14.
+    maxiter : int, optional
+        The maximum number of iterations. Default is 100.
+
+    Returns
+    -------
+    x : array
+        The solution for each y. This is the same shape as y.
+
+    Notes
+    -----
+    If y is not between function(lower) and function(upper) then the end of
+    the bracket where the function is closest to y is returned.
+    """
+    y = np.asarray(y, dtype=float)
+    shape = y.shape
+    y = y.ravel()
+    a = np.broadcast_to(np.asarray(lower, dtype=float), shape).ravel().astype(float)
+    b = np.broadcast_to(np.asarray(upper, dtype=float), shape).ravel().astype(float)
+    fa = function(a) - y
+    fb = function(b) - y
+    closest = np.where(abs(fa) < abs(fb), a, b)
+    x = np.where(fa * fb <= 0, np.nan, closest)
+    x = np.where(fa == 0, a, np.where(fb == 0, b, x))
+    c, fc = a.copy(), fa.copy()
+    t = np.full(len(y), 0.5)
+    active = np.flatnonzero(np.isnan(x))
+    eps = np.finfo(float).eps
+    for _ in range(maxiter):
+        if len(active) == 0:
+            break
+        a_, b_, fa_, fb_ = a[active], b[active], fa[active], fb[active]
+        xt = a_ + t[active] * (b_ - a_)
+        ft = function(xt) - y[active]
+        # keep the root bracketed between a and b with c as the previous point
+        same_sign = np.sign(ft) == np.sign(fa_)
+        c_ = np.where(same_sign, a_, b_)
+        fc_ = np.where(same_sign, fa_, fb_)
+        b_ = np.where(same_sign, b_, a_)
+        fb_ = np.where(same_sign, fb_, fa_)
+        a_, fa_ = xt, ft
+        # check for convergence
+        xm = np.where(abs(fa_) < abs(fb_), a_, b_)
+        fm = np.where(abs(fa_) < abs(fb_), fa_, fb_)
+        tol = 2 * eps * abs(xm) + xtol
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tlim = tol / abs(b_ - c_)
+            # use inverse quadratic interpolation if it is safe or bisect if not
+            xi = (a_ - b_) / (c_ - b_)
+            phi = (fa_ - fb_) / (fc_ - fb_)
+            iqi = (phi ** 2 < xi) & ((1 - phi) ** 2 < 1 - xi)
+            t_iqi = fa_ / (fb_ - fa_) * fc_ / (fb_ - fc_) + (c_ - a_) / (
+                b_ - a_
+            ) * fa_ / (fc_ - fa_) * fb_ / (fc_ - fb_)
+        t_new = np.clip(np.where(iqi, t_iqi, 0.5), tlim, 1 - tlim)
+        a[active], b[active], c[active] = a_, b_, c_
+        fa[active], fb[active], fc[active] = fa_, fb_, fc_
+        t[active] = t_new
+        converged = (tlim > 0.5) | (fm == 0)
+        x[active[converged]] = xm[converged]
+        active = active[~converged]
+    # any elements that did not converge return the best estimate
+    x[active] = np.where(abs(fa[active]) < abs(fb[active]), a[active], b[active])
+    return x.reshape(shape)
+
+
+def mean_residual_life_from_SF(SF, t, upper, points=None):
+    """
+    Calculates the mean residual life at many times using the survival function
+    of a model that has no closed form for the integral of the SF.
+
+    The mean residual life is MRL(t) = integral of SF from t to inf / SF(t).
+    The values of t are sorted and the integral of the SF is found over each
+    of the intervals between them. All the intervals are integrated at the
+    same time using adaptive quadrature. The integral from each t to inf is
+    then the cumulative sum of the intervals above it. This means that the
+    integral is only done once, no matter how many values of t there are.
+
+    Parameters
+    ----------
+    SF : function
+        The vectorized survival function of the model.
+    t : int, float, list, array
+        Time (x-value) at which mean residual life is to be evaluated.
+    upper : float
+        A value above which the SF is very small. The integral from the largest
+        of t and upper to inf is found separately.
+    points : list, array, optional
+        Points where the SF changes rapidly. These are used as extra breaks
+        between the intervals. Default is None.
+
+    Returns
+    -------
+    MRL : array
+        The mean residual life at each t. This is the same shape as t.
+    """
+    t = np.asarray(t, dtype=float)
+    if points is None:
+        points = []
+    breaks = np.unique(np.hstack([t.ravel(), points, upper]))
+    a = breaks[:-1]
+    width = np.diff(breaks)
+    # each interval is scaled by the SF at its start so that the tolerance of
+    # the integration is relative to each interval rather than the largest one
+    scale = SF(a)
+    scale = np.where(scale > 0, scale, 1)
+    integrals = quad_vec(lambda u: SF(a + u * width) * width / scale, 0, 1)[0]
+    integrals = integrals * scale
+    tail = quad(SF, breaks[-1], np.inf)[0]
+    # the integral from each break to inf
+    integral_R = np.append(np.cumsum(integrals[::-1])[::-1], 0) + tail
+    integral_R = integral_R[np.searchsorted(breaks, t)]
+    return integral_R / SF(t)
+
+
 def unpack_single_arrays(array):
     """
     Unpacks arrays with a single element to return just that element
@@ -1,5 +1,7 @@
-from reliability.Distributions import Normal_Distribution, Weibull_Distribution, Lognormal_Distribution, Exponential_Distribution, Gamma_Distribution, Beta_Distribution, Loglogistic_Distribution, Gumbel_Distribution, Competing_Risks_Model, Mixture_Model
+from reliability.Distributions import Normal_Distribution, Weibull_Distribution, Lognormal_Distribution, Exponential_Distribution, Gamma_Distribution, Beta_Distribution, Loglogistic_Distribution, Gumbel_Distribution, Competing_Risks_Model, Mixture_Model, DSZI_Model, Weibull_Distribution_batch, Normal_Distribution_batch, Lognormal_Distribution_batch, Exponential_Distribution_batch, Gamma_Distribution_batch, Beta_Distribution_batch, Loglogistic_Distribution_batch, Gumbel_Distribution_batch
 from numpy.testing import assert_allclose
+import numpy as np
+from reliability.Utils import batch_extract_CI, CI_cache_size, bracketed_root
 
 atol = 1e-8
 rtol = 1e-7
@@ -160,21 +162,24 @@ def test_Gumbel_Distribution():
 def test_Competing_Risks_Model():
     distributions = [Weibull_Distribution(alpha=30, beta=2), Normal_Distribution(mu=35, sigma=5)]
     dist = Competing_Risks_Model(distributions=distributions)
-    assert_allclose(dist.mean, 23.707625152181073, rtol=rtol, atol=atol)
-    assert_allclose(dist.standard_deviation, 9.832880925543204, rtol=rtol, atol=atol)
-    assert_allclose(dist.variance, 96.68554729591138, rtol=rtol, atol=atol)
-    assert_allclose(dist.skewness, -0.20597940178753704, rtol=rtol, atol=atol)
-    assert_allclose(dist.kurtosis, 2.1824677678598667, rtol=rtol, atol=atol)
+    assert 'mean' not in dist.__dict__
+    assert_allclose(dist.mean, 23.707625152133712, rtol=rtol, atol=atol)
+    assert_allclose(dist.standard_deviation, 9.832880926903771, rtol=rtol, atol=atol)
+    assert_allclose(dist.variance, 96.68554732266794, rtol=rtol, atol=atol)
+    assert_allclose(dist.skewness, -0.2059794024503434, rtol=rtol, atol=atol)
+    assert_allclose(dist.kurtosis, 2.1824677680614077, rtol=rtol, atol=atol)
     assert dist.name2 == 'Competing risks using 2 distributions'
-    assert_allclose(dist.quantile(0.2), 14.170859470541174, rtol=rtol, atol=atol)
-    assert_allclose(dist.inverse_SF(q=0.7), 17.908811127053173, rtol=rtol, atol=atol)
-    assert_allclose(dist.mean_residual_life(20), 9.862745898092886, rtol=rtol, atol=atol)
+    assert_allclose(dist.quantile(0.2), 14.170929225812127, rtol=rtol, atol=atol)
+    assert_allclose(dist.inverse_SF(q=0.7), 17.90876290572508, rtol=rtol, atol=atol)
+    assert_allclose(dist.mean_residual_life(20), 9.86274589809214, rtol=rtol, atol=atol)
     xvals = [dist.quantile(0.001), dist.quantile(0.01), dist.quantile(0.1), dist.quantile(0.9), dist.quantile(0.99), dist.quantile(0.999)]
-    assert_allclose(dist.PDF(xvals=xvals, show_plot=False), [0.00210671, 0.00661657, 0.01947571, 0.02655321, 0.00474024, 0.00062978], rtol=rtol, atol=atol)
-    assert_allclose(dist.CDF(xvals=xvals, show_plot=False), [0.0010001,  0.00999995, 0.09999943, 0.90000184, 0.99000021, 0.99900003], rtol=rtol, atol=atol)
-    assert_allclose(dist.SF(xvals=xvals, show_plot=False), [0.9989999,  0.99000005, 0.90000057, 0.09999816, 0.00999979, 0.00099997], rtol=rtol, atol=atol)
-    assert_allclose(dist.HF(xvals=xvals, show_plot=False), [0.00210882, 0.00668341, 0.02163966, 0.265537, 0.47403341, 0.62980068], rtol=rtol, atol=atol)
-    assert_allclose(dist.CHF(xvals=xvals, show_plot=False), [1.00059934e-03, 1.00502826e-02, 1.05359884e-01, 2.30260350e+00, 4.60519097e+00, 6.90778668e+00], rtol=rtol, atol=atol)
+    assert_allclose(dist.PDF(xvals=xvals, show_plot=False), [0.0021066, 0.00661659, 0.01947576, 0.0265535, 0.00474032, 0.0006298], rtol=rtol, atol=atol)
+    assert_allclose(dist.CDF(xvals=xvals, show_plot=False), [0.001, 0.01, 0.1, 0.9, 0.99, 0.999], rtol=rtol, atol=atol)
+    assert_allclose(dist.SF(xvals=xvals, show_plot=False), [0.999, 0.99, 0.9, 0.1, 0.01, 0.001], rtol=rtol, atol=atol)
+    assert_allclose(dist.HF(xvals=xvals, show_plot=False), [0.00210871, 0.00668342, 0.02163973, 0.26553497, 0.47403183, 0.62979878], rtol=rtol, atol=atol)
+    assert_allclose(dist.CHF(xvals=xvals, show_plot=False), [1.00050033e-03, 1.00503359e-02, 1.05360516e-01, 2.30258509e+00, 4.60517019e+00, 6.90775528e+00], rtol=rtol, atol=atol)
+    samples = dist.random_samples(100000, seed=1)
+    assert_allclose([np.mean(samples), np.std(samples)], [dist.mean, dist.standard_deviation], rtol=0.01)
 
 
 def test_Mixture_Model():
@@ -186,13 +191,157 @@ def test_Mixture_Model():
     assert_allclose(dist.skewness, 0.015505959874527537, rtol=rtol, atol=atol)
     assert_allclose(dist.kurtosis, 3.4018343377801674, rtol=rtol, atol=atol)
     assert dist.name2 == 'Mixture using 2 distributions'
-    assert_allclose(dist.quantile(0.2), 19.085648329240094, rtol=rtol, atol=atol)
-    assert_allclose(dist.inverse_SF(q=0.7), 24.540270766923847, rtol=rtol, atol=atol)
+    assert_allclose(dist.quantile(0.2), 19.085665448002576, rtol=rtol, atol=atol)
+    assert_allclose(dist.inverse_SF(q=0.7), 24.54032038470739, rtol=rtol, atol=atol)
+    assert_allclose(dist.CDF(xvals=dist.quantile(np.linspace(0.01, 0.99, 9)), show_plot=False), np.linspace(0.01, 0.99, 9), rtol=rtol, atol=atol)
     assert_allclose(dist.mean_residual_life(20), 14.686456940211107, rtol=rtol, atol=atol)
     xvals = [dist.quantile(0.001), dist.quantile(0.01), dist.quantile(0.1), dist.quantile(0.9), dist.quantile(0.99), dist.quantile(0.999)]
-    assert_allclose(dist.PDF(xvals=xvals, show_plot=False), [0.0016309, 0.00509925, 0.01423464, 0.01646686, 0.00134902, 0.00016862], rtol=rtol, atol=atol)
-    assert_allclose(dist.CDF(xvals=xvals, show_plot=False), [0.00099994, 0.00999996, 0.10000006, 0.90000056, 0.99000001, 0.999], rtol=rtol, atol=atol)
-    assert_allclose(dist.SF(xvals=xvals, show_plot=False), [0.99900006, 0.99000004, 0.89999994, 0.09999944, 0.00999999, 0.001], rtol=rtol, atol=atol)
-    assert_allclose(dist.HF(xvals=xvals, show_plot=False), [0.00163253, 0.00515076, 0.01581627, 0.16466956, 0.13490177, 0.16861429], rtol=rtol, atol=atol)
-    assert_allclose(dist.CHF(xvals=xvals, show_plot=False), [1.00043950e-03, 1.00502998e-02, 1.05360581e-01, 2.30259070e+00, 4.60517090e+00, 6.90775056e+00], rtol=rtol, atol=atol)
+    assert_allclose(dist.PDF(xvals=xvals, show_plot=False), [0.00163095, 0.00509926, 0.01423464, 0.01646698, 0.00134902, 0.00016861], rtol=rtol, atol=atol)
+    assert_allclose(dist.CDF(xvals=xvals, show_plot=False), [0.001, 0.01, 0.1, 0.9, 0.99, 0.999], rtol=rtol, atol=atol)
+    assert_allclose(dist.SF(xvals=xvals, show_plot=False), [0.999, 0.99, 0.9, 0.1, 0.01, 0.001], rtol=rtol, atol=atol)
+    assert_allclose(dist.HF(xvals=xvals, show_plot=False), [0.00163258, 0.00515077, 0.01581627, 0.1646698, 0.13490176, 0.16861435], rtol=rtol, atol=atol)
+    assert_allclose(dist.CHF(xvals=xvals, show_plot=False), [1.00050033e-03, 1.00503359e-02, 1.05360516e-01, 2.30258509e+00, 4.60517019e+00, 6.90775528e+00], rtol=rtol, atol=atol)
+    samples = dist.random_samples(100000, seed=1)
+    assert_allclose([np.mean(samples), np.std(samples)], [dist.mean, dist.standard_deviation], rtol=0.01)
 
+
+def test_DSZI_Model():
+    dist = DSZI_Model(distribution=Weibull_Distribution(alpha=30, beta=2), DS=0.8, ZI=0.1)
+    assert dist.name2 == 'Defective Subpopulation Zero Inflated Weibull'
+    assert_allclose(dist.quantile(0.2), 11.778608230369683, rtol=rtol, atol=atol)
+    assert_allclose(dist.inverse_SF(q=0.7), 17.40186808819937, rtol=rtol, atol=atol)
+    assert_allclose(dist.quantile([0.3, 0.5]), [17.401868088199365, 27.61463514784295], rtol=rtol, atol=atol)
+    assert_allclose(dist.CDF(xvals=dist.quantile(np.linspace(0.11, 0.79, 9)), show_plot=False), np.linspace(0.11, 0.79, 9), rtol=rtol, atol=atol)
+
+
+def test_distribution_confidence_intervals():
+    # bounds on reliability at CI_x and bounds on time at CI_y. The values are [lower(20), lower(40), upper(20), upper(40), lower_t(0.2), lower_t(0.8), upper_t(0.2), upper_t(0.8)]
+    expected = [
+        (Weibull_Distribution(alpha=50, beta=2, alpha_SE=5, beta_SE=0.3, Cov_alpha_beta=0.2, CI=0.95), [0.0758465208990925, 0.34063412512443936, 0.27715138828736363, 0.6259958511954222, 17.255334964333223, 51.97888395915536, 32.32964642173674, 77.40825648059247]),
+        (Gamma_Distribution(alpha=10, beta=3, mu_SE=0.2, beta_SE=0.5, Cov_mu_beta=-0.08, CI=0.95), [0.201494997135528, 0.5990659323955458, 0.4749952654142461, 0.8726547397355023, 11.553257293249066, 33.77385623261999, 20.395639465675398, 54.21381679880451]),
+        (Normal_Distribution(mu=40, sigma=10, mu_SE=2, sigma_SE=1.5, Cov_mu_sigma=0.1, CI=0.95), [0.0035118529640938423, 0.34753176800558583, 0.09606875889825783, 0.6524682319944142, 27.018539715712645, 43.711458340420585, 36.149035612829074, 53.1209663310377]),
+        (Lognormal_Distribution(mu=3.5, sigma=0.5, mu_SE=0.1, sigma_SE=0.07, Cov_mu_sigma=0.001, CI=0.95), [0.07284747281193427, 0.48333751080957355, 0.2870022542156905, 0.7873606125454822, 17.57355274476614, 39.627987214301974, 26.896164142392905, 64.20529070946806]),
+        (Loglogistic_Distribution(alpha=30, beta=4, alpha_SE=3, beta_SE=0.6, Cov_alpha_beta=0.1, CI=0.95), [0.07163639442514391, 0.577933979520322, 0.3358372316942464, 0.8794422160413605, 16.924432356569362, 34.19067643180946, 26.588779494594316, 52.64593122601581]),
+        (Gumbel_Distribution(mu=40, sigma=8, mu_SE=2, sigma_SE=1.2, Cov_mu_sigma=-0.3, CI=0.95), [0.03177682760601619, 0.458077301395294, 0.18832278140224712, 0.8045208437458644, 22.40866997221186, 39.867317943003535, 33.59229023963589, 47.74684198223023]),
+    ]
+    for dist, values in expected:
+        lower, _, upper = dist.CDF(CI_x=np.array([20.0, 40.0]), CI_type='reliability', show_plot=False)
+        lower_t, _, upper_t = dist.CDF(CI_y=np.array([0.2, 0.8]), CI_type='time', show_plot=False)
+        assert_allclose(np.hstack([lower, upper, lower_t, upper_t]), values, rtol=rtol, atol=atol)
+    # the derivatives are element-wise so a dense grid of bounds is cheap
+    x = np.linspace(1, 150, 100000)
+    lower, _, upper = expected[0][0].CDF(CI_x=x, CI_type='reliability', show_plot=False)
+    assert len(lower) == len(x) and all(lower <= upper)
+
+
+def test_batch_extract_CI():
+    # the batch results must match the CI_x and CI_y results of each distribution
+    params = np.array([[50, 2], [30, 1.5]])
+    SE = np.array([[5, 0.3, 0.2], [4, 0.2, -0.1]])
+    covariances = np.array([[[a_SE ** 2, cov], [cov, b_SE ** 2]] for a_SE, b_SE, cov in SE])
+    gamma = np.array([0, 5])
+    for func in ['CDF', 'SF', 'CHF']:
+        lower_t, point_t, upper_t = batch_extract_CI('Weibull', params, covariances, func=func, CI_type='time', CI_y=[0.1, 0.5], gamma=gamma)
+        lower, point, upper = batch_extract_CI('Weibull', params, covariances, func=func, CI_type='reliability', CI_x=[20, 40], gamma=gamma)
+        for i in range(2):
+            dist = Weibull_Distribution(alpha=params[i, 0], beta=params[i, 1], gamma=gamma[i], alpha_SE=SE[i, 0], beta_SE=SE[i, 1], Cov_alpha_beta=SE[i, 2], CI=0.95)
+            assert_allclose(np.vstack([lower_t[i], point_t[i], upper_t[i]]), np.vstack(getattr(dist, func)(CI_type='time', CI_y=np.array([0.1, 0.5]), show_plot=False)), rtol=rtol, atol=atol)
+            assert_allclose(np.vstack([lower[i], point[i], upper[i]]), np.vstack(getattr(dist, func)(CI_type='reliability', CI_x=np.array([20.0, 40.0]), show_plot=False)), rtol=rtol, atol=atol)
+    dist = Gamma_Distribution(alpha=10, beta=3, mu_SE=0.2, beta_SE=0.5, Cov_mu_beta=-0.08, CI=0.95)
+    lower, point, upper = batch_extract_CI('Gamma', [[np.log(10), 3]], [[[0.04, -0.08], [-0.08, 0.25]]], CI_type='time', CI_y=[0.2, 0.8])
+    assert_allclose(np.vstack([lower[0], point[0], upper[0]]), np.vstack(dist.CDF(CI_type='time', CI_y=np.array([0.2, 0.8]), show_plot=False)), rtol=rtol, atol=atol)
+    # bounds that can not be calculated are nan rather than an error
+    lower, point, upper = batch_extract_CI('Gumbel', [[35, 6]], [[[1, 0.1], [0.1, 1]]], CI_type='reliability', CI_x=[40, 60])
+    assert np.isfinite(lower[0, 0]) and np.isnan(lower[0, 1]) and np.isnan(upper[0, 1])
+
+
+def test_CI_cache():
+    dist = Weibull_Distribution(alpha=50, beta=2, alpha_SE=5, beta_SE=0.3, Cov_alpha_beta=0.2, CI=0.95)
+    lower, point, upper = dist.CDF(CI_type='time', CI_y=np.array([0.1, 0.5]), show_plot=False)
+    lower[0] = 0  # changing the output must not change the cache
+    lower_2, point_2, upper_2 = dist.CDF(CI_type='time', CI_y=np.array([0.1, 0.5]), show_plot=False)
+    assert len(dist._CI_cache) == 1
+    assert lower_2[0] > 0
+    # the cache is discarded when the parameters change
+    dist.alpha = 60
+    lower_3, _, _ = dist.CDF(CI_type='time', CI_y=np.array([0.1, 0.5]), show_plot=False)
+    expected = Weibull_Distribution(alpha=60, beta=2, alpha_SE=5, beta_SE=0.3, Cov_alpha_beta=0.2, CI=0.95).CDF(CI_type='time', CI_y=np.array([0.1, 0.5]), show_plot=False)[0]
+    assert_allclose(lower_3, expected, rtol=rtol, atol=atol)
+    # the least recently used results are removed when the cache is full
+    for i in range(CI_cache_size + 5):
+        dist.SF(CI_type='reliability', CI_x=np.array([10.0 + i]), show_plot=False)
+    assert len(dist._CI_cache) == CI_cache_size
+
+
+def test_lazy_descriptive_statistics():
+    dist = Weibull_Distribution(alpha=5, beta=2, gamma=10)
+    lazy = ['mean', 'variance', 'standard_deviation', 'skewness', 'kurtosis', 'excess_kurtosis', 'median', 'b5', 'b95', 'param_title', 'param_title_long', '_pdf0', '_hf0']
+    assert not any(name in vars(dist) for name in lazy)
+    assert_allclose(dist.b5, dist.quantile(0.05), rtol=rtol, atol=atol)
+    assert vars(dist)['b5'] is dist.b5
+    dist.mean = 100
+    assert dist.mean == 100
+    dist = Loglogistic_Distribution(alpha=5, beta=3)
+    assert dist.kurtosis == r"no kurtosis when $\beta \leq 4$"
+    assert_allclose(dist.variance, dist.standard_deviation ** 2, rtol=rtol, atol=atol)
+
+
+def test_fast_functions():
+    dists = [Weibull_Distribution(alpha=5, beta=2, gamma=10), Normal_Distribution(mu=5, sigma=2), Lognormal_Distribution(mu=2, sigma=0.8, gamma=10), Exponential_Distribution(Lambda=0.2, gamma=10), Gamma_Distribution(alpha=5, beta=2, gamma=10), Beta_Distribution(alpha=2, beta=5), Loglogistic_Distribution(alpha=5, beta=2, gamma=10), Gumbel_Distribution(mu=5, sigma=2)]
+    for dist in dists:
+        xvals = np.array([dist.quantile(0.001), dist.quantile(0.1), dist.quantile(0.5), dist.quantile(0.9), dist.quantile(0.999)])
+        if dist.name not in ['Normal', 'Gumbel', 'Beta']:
+            xvals = np.append(dist.gamma - 1, xvals)
+        for func in ['PDF', 'CDF', 'SF', 'HF', 'CHF']:
+            assert_allclose(getattr(dist, func + '_fast')(xvals), getattr(dist, func)(xvals=xvals, show_plot=False), rtol=rtol, atol=atol)
+            assert_allclose(getattr(dist, func + '_fast')(float(xvals[2])), getattr(dist, func)(xvals=xvals[2:3], show_plot=False), rtol=rtol, atol=atol)
+        assert dist.SF_fast(xvals.reshape(-1, 1)).shape == (len(xvals), 1)
+
+
+def test_distribution_batches():
+    batches = [
+        (Weibull_Distribution_batch(alpha=[5, 8], beta=[2, 0.8], gamma=[0, 10]), [Weibull_Distribution(alpha=5, beta=2), Weibull_Distribution(alpha=8, beta=0.8, gamma=10)]),
+        (Normal_Distribution_batch(mu=[5, 20], sigma=2), [Normal_Distribution(mu=5, sigma=2), Normal_Distribution(mu=20, sigma=2)]),
+        (Lognormal_Distribution_batch(mu=[2, 1], sigma=[0.8, 0.5], gamma=[10, 0]), [Lognormal_Distribution(mu=2, sigma=0.8, gamma=10), Lognormal_Distribution(mu=1, sigma=0.5)]),
+        (Exponential_Distribution_batch(Lambda=[0.2, 0.5], gamma=[0, 10]), [Exponential_Distribution(Lambda=0.2), Exponential_Distribution(Lambda=0.5, gamma=10)]),
+        (Gamma_Distribution_batch(alpha=[5, 3], beta=[2, 0.8], gamma=[10, 0]), [Gamma_Distribution(alpha=5, beta=2, gamma=10), Gamma_Distribution(alpha=3, beta=0.8)]),
+        (Beta_Distribution_batch(alpha=[2, 0.5], beta=[5, 0.7]), [Beta_Distribution(alpha=2, beta=5), Beta_Distribution(alpha=0.5, beta=0.7)]),
+        (Loglogistic_Distribution_batch(alpha=[5, 8], beta=[2, 4], gamma=[10, 0]), [Loglogistic_Distribution(alpha=5, beta=2, gamma=10), Loglogistic_Distribution(alpha=8, beta=4)]),
+        (Gumbel_Distribution_batch(mu=[5, 20], sigma=[2, 4]), [Gumbel_Distribution(mu=5, sigma=2), Gumbel_Distribution(mu=20, sigma=4)]),
+    ]
+    q = np.array([0.01, 0.3, 0.7, 0.99])
+    for batch, dists in batches:
+        xvals = np.sort(np.hstack([dist.quantile(q) for dist in dists]))
+        for func in ['PDF', 'CDF', 'SF', 'HF', 'CHF']:
+            values = getattr(batch, func)(xvals)
+            assert values.shape == (2, len(xvals))
+            for i, dist in enumerate(dists):
+                assert_allclose(values[i], getattr(dist, func + '_fast')(xvals), rtol=rtol, atol=atol)
+        for i, dist in enumerate(dists):
+            assert_allclose(batch.quantile(q)[i], dist.quantile(q), rtol=rtol, atol=atol)
+            assert_allclose(batch.inverse_SF(q)[i], dist.inverse_SF(q), rtol=rtol, atol=atol)
+            assert_allclose(batch.mean_residual_life(dist.quantile(0.5))[i], dist.mean_residual_life(dist.quantile(0.5)), rtol=1e-6, atol=atol)
+    assert Weibull_Distribution_batch(alpha=np.arange(1, 1001), beta=2).SF(5).shape == (1000, 1)
+
+
+def test_bracketed_root():
+    q = np.array([[0.001, 0.1, 0.5], [0.9, 0.99, 0.999]])
+    dist = Normal_Distribution(mu=5, sigma=2)
+    assert_allclose(bracketed_root(dist.CDF_fast, q, -100, 100), dist.quantile(q.ravel()).reshape(2, 3), rtol=rtol, atol=atol)
+    assert_allclose(bracketed_root(dist.SF_fast, q, [-100, -100, -100], 100), dist.inverse_SF(q.ravel()).reshape(2, 3), rtol=rtol, atol=atol)
+    assert_allclose(bracketed_root(lambda x: x ** 3, [-1, 8, 1000], 0, 5), [0, 2, 5], rtol=rtol, atol=atol)
+
+
+def test_mean_residual_life_arrays():
+    dist = Weibull_Distribution(alpha=30, beta=2, gamma=3)
+    assert_allclose(dist.mean_residual_life([0, 10, 20]), [29.586807763582737, 20.81474660579972, 15.501299286212449], rtol=rtol, atol=atol)
+    assert_allclose(dist.mean_residual_life(20), 15.501299286212449, rtol=rtol, atol=atol)
+    distributions = [Weibull_Distribution(alpha=30, beta=2), Normal_Distribution(mu=35, sigma=5)]
+    CR = Competing_Risks_Model(distributions=distributions)
+    assert_allclose(CR.mean_residual_life([0, 10, 20]), [23.70762515221143, 15.718993935798593, 9.862745898092882], rtol=rtol, atol=atol)
+    assert_allclose(CR.mean_residual_life(0), CR.mean, rtol=rtol, atol=atol)
+    MM = Mixture_Model(distributions=distributions, proportions=[0.6, 0.4])
+    assert_allclose(MM.mean_residual_life([0, 10, 20]), [29.952084658165337, 21.52526051400327, 14.686456940445408], rtol=rtol, atol=atol)
+    DSZI = DSZI_Model(distribution=Weibull_Distribution(alpha=30, beta=2, gamma=3), ZI=0.1)
+    assert_allclose(DSZI.mean_residual_life([0, 10, 20]), [29.586807763582737, 20.81474660579972, 15.501299286212449], rtol=rtol, atol=atol)
+    assert_allclose(DSZI_Model(distribution=distributions[0], DS=0.8).mean_residual_life([10, 20]), [np.inf, np.inf])
@@ -1,7 +1,13 @@
-from reliability.Fitters import Fit_Weibull_2P, Fit_Weibull_3P, Fit_Gamma_2P, Fit_Gamma_3P, Fit_Lognormal_2P, Fit_Lognormal_3P, Fit_Loglogistic_2P, Fit_Loglogistic_3P, Fit_Normal_2P, Fit_Exponential_1P, Fit_Exponential_2P, Fit_Beta_2P, Fit_Gumbel_2P, Fit_Weibull_Mixture, Fit_Weibull_CR, Fit_Everything
+from reliability.Fitters import Fit_Weibull_2P, Fit_Weibull_2P_batch, Fit_Weibull_3P, Fit_Gamma_2P, Fit_Gamma_3P, Fit_Lognormal_2P, Fit_Lognormal_3P, Fit_Loglogistic_2P, Fit_Loglogistic_3P, Fit_Normal_2P, Fit_Exponential_1P, Fit_Exponential_2P, Fit_Beta_2P, Fit_Gumbel_2P, Fit_Weibull_Mixture, Fit_Weibull_CR, Fit_Everything, Fit_Lean, Fit_Weibull_ZI
 from reliability.Distributions import Weibull_Distribution, Gamma_Distribution, Lognormal_Distribution, Loglogistic_Distribution, Normal_Distribution, Exponential_Distribution, Beta_Distribution, Gumbel_Distribution, Mixture_Model, Competing_Risks_Model
 from reliability.Other_functions import make_right_censored_data
+from reliability.Nonparametric import KaplanMeier
+from reliability.Probability_plotting import plotting_positions
+from reliability.Utils import LL_value_and_grad, LL_hessian, LL_derivatives_registry, prepared_data, fitters_input_checking
+from autograd import value_and_grad
+from autograd.differential_operators import hessian
 from numpy.testing import assert_allclose
+import numpy as np
 import warnings
 
 # I would like to make these smaller but the slight differences in different python versions (3.6-3.9) mean that tight tolerances result in test failures
@@ -26,6 +32,13 @@ def test_Fit_Weibull_2P():
     assert_allclose(MLE.loglik, -55.4819182629478, rtol=rtol, atol=atol)
     assert_allclose(MLE.AD, 55.60004028891652, rtol=rtol, atol=atol)
     assert_allclose(MLE.Cov_alpha_beta, -0.9178064889295378, rtol=rtol, atol=atol)
+    assert MLE.optimizer == 'profile likelihood'
+
+    # the optimizers are still available and agree with the profile likelihood
+    MLE_TNC = Fit_Weibull_2P(failures=data.failures, right_censored=data.right_censored, method='MLE', optimizer='TNC', show_probability_plot=False, print_results=False)
+    assert MLE_TNC.optimizer == 'TNC'
+    assert_allclose(MLE_TNC.alpha, MLE.alpha, rtol=rtol, atol=atol)
+    assert_allclose(MLE_TNC.beta, MLE.beta, rtol=rtol, atol=atol)
 
     LS = Fit_Weibull_2P(failures=data.failures, right_censored=data.right_censored, method='LS', show_probability_plot=False, print_results=False)
     assert_allclose(LS.alpha, 42.91333312142757, rtol=rtol, atol=atol)
@@ -38,6 +51,37 @@ def test_Fit_Weibull_2P():
     assert_allclose(LS.Cov_alpha_beta, -0.1119680481788733, rtol=rtol, atol=atol)
 
 
+def test_Fit_Weibull_2P_batch():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    failures, right_censored = [], []
+    for seed, (alpha, beta) in enumerate([(50, 2), (500, 0.8), (3, 5)]):
+        dist = Weibull_Distribution(alpha=alpha, beta=beta)
+        rawdata = dist.random_samples(20, seed=seed)
+        data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+        failures.append(data.failures)
+        right_censored.append(data.right_censored)
+
+    batch = Fit_Weibull_2P_batch(failures=failures, right_censored=right_censored)
+    for i in range(len(failures)):
+        MLE = Fit_Weibull_2P(failures=failures[i], right_censored=right_censored[i], method='MLE', show_probability_plot=False, print_results=False)
+        assert_allclose(batch.alpha[i], MLE.alpha, rtol=rtol, atol=atol)
+        assert_allclose(batch.beta[i], MLE.beta, rtol=rtol, atol=atol)
+        assert_allclose(batch.alpha_SE[i], MLE.alpha_SE, rtol=rtol, atol=atol)
+        assert_allclose(batch.beta_SE[i], MLE.beta_SE, rtol=rtol, atol=atol)
+        assert_allclose(batch.Cov_alpha_beta[i], MLE.Cov_alpha_beta, rtol=rtol, atol=atol)
+        assert_allclose(batch.loglik[i], MLE.loglik, rtol=rtol, atol=atol)
+        assert_allclose(batch.AICc[i], MLE.AICc, rtol=rtol, atol=atol)
+        assert_allclose(batch.BIC[i], MLE.BIC, rtol=rtol, atol=atol)
+
+    # the same data supplied as a single array with group labels
+    labels = ['a', 'b', 'c']
+    grouped = Fit_Weibull_2P_batch(failures=np.hstack(failures), right_censored=np.hstack(right_censored), failure_groups=np.repeat(labels, [len(f) for f in failures]), right_censored_groups=np.repeat(labels, [len(rc) for rc in right_censored]))
+    assert_allclose(grouped.alpha, batch.alpha, rtol=rtol, atol=atol)
+    assert_allclose(grouped.beta, batch.beta, rtol=rtol, atol=atol)
+    assert_allclose(batch.distribution.SF([20, 40])[1], Weibull_Distribution(alpha=batch.alpha[1], beta=batch.beta[1]).SF([20, 40], show_plot=False), rtol=rtol, atol=atol)
+
+
 def test_Fit_Weibull_3P():
     # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
     warnings.filterwarnings(action="ignore", category=RuntimeWarning)
@@ -357,6 +401,33 @@ def test_Fit_Beta_2P():
     assert_allclose(LS.Cov_alpha_beta, 8.194012965628652, rtol=rtol, atol=atol)
 
 
+def test_Fit_Lean():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Weibull_Distribution(alpha=50, beta=2, gamma=10)
+    rawdata = dist.random_samples(30, seed=2)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    fitters = {'Weibull_2P': Fit_Weibull_2P, 'Weibull_3P': Fit_Weibull_3P, 'Exponential_1P': Fit_Exponential_1P, 'Exponential_2P': Fit_Exponential_2P, 'Gamma_2P': Fit_Gamma_2P, 'Gamma_3P': Fit_Gamma_3P, 'Lognormal_2P': Fit_Lognormal_2P, 'Lognormal_3P': Fit_Lognormal_3P, 'Normal_2P': Fit_Normal_2P, 'Gumbel_2P': Fit_Gumbel_2P, 'Loglogistic_2P': Fit_Loglogistic_2P, 'Loglogistic_3P': Fit_Loglogistic_3P}
+    for name, fitter in fitters.items():
+        for method in ['MLE', 'RRX']:
+            full = fitter(failures=data.failures, right_censored=data.right_censored, method=method, show_probability_plot=False, print_results=False)
+            lean = Fit_Lean(distribution=name, failures=data.failures, right_censored=data.right_censored, method=method)
+            for i, parameter in enumerate(lean.parameter_names):
+                assert_allclose(lean.params[i], getattr(full, parameter), rtol=rtol, atol=atol)
+                assert_allclose(getattr(lean, parameter + '_SE'), getattr(full, parameter + '_SE'), rtol=rtol, atol=atol)
+                assert_allclose(getattr(lean, parameter + '_upper'), getattr(full, parameter + '_upper'), rtol=rtol, atol=atol)
+            assert_allclose(lean.loglik, full.loglik, rtol=rtol, atol=atol)
+            assert_allclose(lean.AICc, full.AICc, rtol=rtol, atol=atol)
+            assert_allclose(lean.BIC, full.BIC, rtol=rtol, atol=atol)
+            assert_allclose(lean.AD, full.AD, rtol=rtol, atol=atol)
+            assert_allclose(lean.distribution.mean, full.distribution.mean, rtol=rtol, atol=atol)
+
+    lean = Fit_Lean(distribution='Weibull_2P', failures=data.failures, right_censored=data.right_censored)
+    assert lean.optimizer == 'profile likelihood'
+    assert list(lean.results['Parameter']) == ['Alpha', 'Beta']
+    assert not hasattr(lean, '__dict__')
+
+
 def test_Fit_Weibull_Mixture():
     # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
     warnings.filterwarnings(action="ignore", category=RuntimeWarning)
@@ -367,16 +438,16 @@ def test_Fit_Weibull_Mixture():
     data = make_right_censored_data(data=raw_data, threshold=dist.mean)
 
     MLE = Fit_Weibull_Mixture(failures=data.failures, right_censored=data.right_censored, show_probability_plot=False, print_results=False)
-    assert_allclose(MLE.alpha_1, 11.06604639424718, rtol=rtol, atol=atol)
-    assert_allclose(MLE.beta_1, 2.735078296796997, rtol=rtol, atol=atol)
-    assert_allclose(MLE.alpha_2, 34.325433665495346, rtol=rtol, atol=atol)
-    assert_allclose(MLE.beta_2, 7.60238532821206, rtol=rtol, atol=atol)
-    assert_allclose(MLE.proportion_1, 0.23640116719132157, rtol=rtol, atol=atol)
-    assert_allclose(MLE.proportion_2, 0.7635988328086785, rtol=rtol, atol=atol)
-    assert_allclose(MLE.AICc, 471.97390405380236, rtol=rtol, atol=atol)
-    assert_allclose(MLE.BIC, 484.3614571114024, rtol=rtol, atol=atol)
-    assert_allclose(MLE.loglik, -230.66780309073096, rtol=rtol, atol=atol)
-    assert_allclose(MLE.AD, 320.1963544647712, rtol=rtol, atol=atol)
+    assert_allclose(MLE.alpha_1, 13.74417984797113, rtol=rtol, atol=atol)
+    assert_allclose(MLE.beta_1, 2.918248987198683, rtol=rtol, atol=atol)
+    assert_allclose(MLE.alpha_2, 34.7088363469296, rtol=rtol, atol=atol)
+    assert_allclose(MLE.beta_2, 8.227402341260737, rtol=rtol, atol=atol)
+    assert_allclose(MLE.proportion_1, 0.2867676547384936, rtol=rtol, atol=atol)
+    assert_allclose(MLE.proportion_2, 0.7132323452615064, rtol=rtol, atol=atol)
+    assert_allclose(MLE.AICc, 475.77114321316554, rtol=rtol, atol=atol)
+    assert_allclose(MLE.BIC, 488.1586962707656, rtol=rtol, atol=atol)
+    assert_allclose(MLE.loglik, -232.56642267041255, rtol=rtol, atol=atol)
+    assert_allclose(MLE.AD, 320.2014266446219, rtol=rtol, atol=atol)
 
 
 def test_Fit_Weibull_CR():
@@ -388,14 +459,14 @@ def test_Fit_Weibull_CR():
     raw_data = CR_model.random_samples(100, seed=2)
     data = make_right_censored_data(data=raw_data, threshold=40)
     MLE = Fit_Weibull_CR(failures=data.failures, right_censored=data.right_censored, show_probability_plot=False, print_results=False)
-    assert_allclose(MLE.alpha_1, 53.05674752263902, rtol=rtol, atol=atol)
-    assert_allclose(MLE.beta_1, 1.9411091317375062, rtol=rtol, atol=atol)
-    assert_allclose(MLE.alpha_2, 38.026383998212154, rtol=rtol, atol=atol)
-    assert_allclose(MLE.beta_2, 9.033349805988692, rtol=rtol, atol=atol)
-    assert_allclose(MLE.AICc, 665.5311523940719, rtol=rtol, atol=atol)
-    assert_allclose(MLE.BIC, 675.5307805064454, rtol=rtol, atol=atol)
-    assert_allclose(MLE.loglik, -328.5550498812465, rtol=rtol, atol=atol)
-    assert_allclose(MLE.AD, 34.0918038201449, rtol=rtol, atol=atol)
+    assert_allclose(MLE.alpha_1, 49.725626413362995, rtol=rtol, atol=atol)
+    assert_allclose(MLE.beta_1, 2.027898440319283, rtol=rtol, atol=atol)
+    assert_allclose(MLE.alpha_2, 39.9024591237121, rtol=rtol, atol=atol)
+    assert_allclose(MLE.beta_2, 11.823971666442894, rtol=rtol, atol=atol)
+    assert_allclose(MLE.AICc, 642.0268951474607, rtol=rtol, atol=atol)
+    assert_allclose(MLE.BIC, 652.0265232598341, rtol=rtol, atol=atol)
+    assert_allclose(MLE.loglik, -316.80292125794085, rtol=rtol, atol=atol)
+    assert_allclose(MLE.AD, 76.68149432988629, rtol=rtol, atol=atol)
 
 
 def test_Fit_Everything():
@@ -610,3 +681,206 @@ def test_Fit_Everything():
     assert_allclose(LS.Exponential_1P_BIC, 197.06920107995282, rtol=rtol, atol=atol)
     assert_allclose(LS.Exponential_1P_loglik, -95.88544185670239, rtol=rtol, atol=atol)
     assert_allclose(LS.Exponential_1P_AD, 549.85986679373, rtol=rtol, atol=atol)
+
+
+def test_Fit_Everything_executor():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Weibull_Distribution(alpha=50, beta=2)
+    rawdata = dist.random_samples(30, seed=5)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    kwargs = dict(failures=data.failures, right_censored=data.right_censored, exclude=['Weibull_Mixture', 'Weibull_CR', 'Weibull_DS'], show_probability_plot=False, show_histogram_plot=False, show_PP_plot=False, show_best_distribution_probability_plot=False, print_results=False)
+    serial = Fit_Everything(**kwargs)
+    for executor in ['thread', 'process']:
+        concurrent = Fit_Everything(executor=executor, max_workers=2, **kwargs)
+        assert list(concurrent.results['Distribution']) == list(serial.results['Distribution'])
+        assert_allclose(concurrent.results['BIC'].values.astype(float), serial.results['BIC'].values.astype(float), rtol=rtol, atol=atol)
+        assert_allclose(concurrent.Weibull_2P_alpha, serial.Weibull_2P_alpha, rtol=rtol, atol=atol)
+
+
+def test_Fit_Everything_racing():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Lognormal_Distribution(mu=2, sigma=0.5)
+    rawdata = dist.random_samples(100, seed=3)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    kwargs = dict(failures=data.failures, right_censored=data.right_censored, exclude=['Weibull_Mixture', 'Weibull_CR', 'Weibull_DS'], show_probability_plot=False, show_histogram_plot=False, show_PP_plot=False, show_best_distribution_probability_plot=False, print_results=False)
+    full = Fit_Everything(**kwargs)
+    race = Fit_Everything(racing=True, **kwargs)
+    assert race.best_distribution_name == full.best_distribution_name
+    assert len(race.pruned_distributions) > 0
+    assert set(race.pruned_distributions).isdisjoint(race.results['Distribution'].values)
+    assert len(race.results.index) + len(race.pruned_distributions) == len(full.results.index)
+    # the racing score is an upper bound on the BIC of each distribution that was fitted
+    for name, score, pruned in race.racing_scores.values:
+        if not pruned:
+            assert score >= getattr(race, name + '_BIC') - 1e-6
+
+
+def test_LL_derivatives_registry():
+    # the closed form derivatives must match those from autograd
+    dist = Weibull_Distribution(alpha=50, beta=2, gamma=10)
+    rawdata = dist.random_samples(20, seed=5)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    T_f, T_rc = data.failures, data.right_censored
+    LL_funcs = {
+        "Weibull_2P": (Fit_Weibull_2P.LL, [50, 2]),
+        "Weibull_3P": (Fit_Weibull_3P.LL, [40, 1.5, 8]),
+        "Loglogistic_2P": (Fit_Loglogistic_2P.LL, [50, 3]),
+        "Loglogistic_3P": (Fit_Loglogistic_3P.LL, [40, 2, 8]),
+        "Normal_2P": (Fit_Normal_2P.LL, [55, 20]),
+        "Gumbel_2P": (Fit_Gumbel_2P.LL, [60, 15]),
+        "Lognormal_2P": (Fit_Lognormal_2P.LL, [4, 0.5]),
+        "Lognormal_3P": (Fit_Lognormal_3P.LL, [3.8, 0.6, 8]),
+        "Exponential_1P": (Fit_Exponential_1P.LL, [0.02]),
+        "Exponential_2P": (Fit_Exponential_2P.LL, [0.02, 8]),
+    }
+    assert set(LL_funcs.keys()) == set(LL_derivatives_registry.keys())
+    for func_name, (LL_func, params) in LL_funcs.items():
+        params = np.array(params, dtype=float)
+        value, grad = LL_value_and_grad(func_name, LL_func)(params, T_f, T_rc)
+        value_AD, grad_AD = value_and_grad(LL_func)(params, T_f, T_rc)
+        assert_allclose(value, value_AD, rtol=1e-8, atol=1e-8)
+        assert_allclose(grad, grad_AD, rtol=1e-8, atol=1e-8)
+        assert_allclose(LL_hessian(func_name, LL_func)(params, T_f, T_rc), hessian(LL_func)(params, T_f, T_rc), rtol=1e-8, atol=1e-8)
+    # forced shape parameter
+    for func_name, LL_func, params, force in [("Weibull_2P", Fit_Weibull_2P.LL_fb, [50.0], 2.0), ("Normal_2P", Fit_Normal_2P.LL_fs, [55.0], 20.0), ("Lognormal_2P", Fit_Lognormal_2P.LL_fs, [4.0], 0.5)]:
+        params = np.array(params)
+        value, grad = LL_value_and_grad(func_name, LL_func)(params, T_f, T_rc, force)
+        value_AD, grad_AD = value_and_grad(LL_func)(params, T_f, T_rc, force)
+        assert_allclose(value, value_AD, rtol=1e-8, atol=1e-8)
+        assert_allclose(grad, grad_AD, rtol=1e-8, atol=1e-8)
+        assert_allclose(LL_hessian(func_name, LL_func)(params, T_f, T_rc, force), hessian(LL_func)(params, T_f, T_rc, force), rtol=1e-8, atol=1e-8)
+
+
+def test_Fit_weights():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Weibull_Distribution(alpha=50, beta=2, gamma=5)
+    failures = np.unique(np.round(dist.random_samples(40, seed=2), 1))
+    right_censored = np.array([60.5, 80.5, 95.5])
+    failure_weights = np.random.default_rng(3).integers(1, 4, len(failures))
+    right_censored_weights = np.array([2, 3, 1])
+    # fitting the weighted data must give the same result as fitting the expanded data
+    expanded_failures = np.repeat(failures, failure_weights)
+    expanded_right_censored = np.repeat(right_censored, right_censored_weights)
+    for fitter in [Fit_Weibull_2P, Fit_Weibull_3P, Fit_Gamma_2P, Fit_Lognormal_2P, Fit_Normal_2P, Fit_Loglogistic_3P, Fit_Weibull_Mixture]:
+        weighted = fitter(failures=failures, right_censored=right_censored, failure_weights=failure_weights, right_censored_weights=right_censored_weights, show_probability_plot=False, print_results=False)
+        expanded = fitter(failures=expanded_failures, right_censored=expanded_right_censored, show_probability_plot=False, print_results=False)
+        assert_allclose(weighted.loglik, expanded.loglik, rtol=rtol, atol=atol)
+        assert_allclose(weighted.BIC, expanded.BIC, rtol=rtol, atol=atol)
+        assert_allclose(weighted.AD, expanded.AD, rtol=rtol, atol=atol)
+        for parameter in ['alpha', 'beta', 'mu', 'sigma']:
+            if hasattr(expanded, parameter):
+                assert_allclose(getattr(weighted, parameter), getattr(expanded, parameter), rtol=rtol, atol=atol)
+                assert_allclose(getattr(weighted, parameter + '_SE'), getattr(expanded, parameter + '_SE'), rtol=rtol, atol=atol)
+    lean = Fit_Lean(distribution='Gamma_2P', failures=failures, right_censored=right_censored, failure_weights=failure_weights, right_censored_weights=right_censored_weights)
+    full = Fit_Gamma_2P(failures=expanded_failures, right_censored=expanded_right_censored, show_probability_plot=False, print_results=False)
+    assert_allclose(lean.alpha, full.alpha, rtol=rtol, atol=atol)
+    assert_allclose(lean.AD, full.AD, rtol=rtol, atol=atol)
+    for lean_distribution, fitter in [['Gamma_2P', Fit_Gamma_2P], ['Gamma_3P', Fit_Gamma_3P]]:
+        lean = Fit_Lean(distribution=lean_distribution, failures=failures, right_censored=right_censored, failure_weights=failure_weights, right_censored_weights=right_censored_weights)
+        full = fitter(failures=expanded_failures, right_censored=expanded_right_censored, show_probability_plot=False, print_results=False)
+        weighted = fitter(failures=failures, right_censored=right_censored, failure_weights=failure_weights, right_censored_weights=right_censored_weights, show_probability_plot=False, print_results=False)
+        # the expanded data only differs by the convergence of the optimizer
+        assert_allclose(lean.distribution.mu_SE, full.mu_SE, rtol=1e-3, atol=1e-6)
+        assert_allclose(lean.distribution.Cov_mu_beta, full.Cov_mu_beta, rtol=1e-3, atol=1e-6)
+        assert_allclose(lean.distribution.mu_SE, weighted.mu_SE, rtol=rtol, atol=atol)
+        assert_allclose(lean.distribution.Cov_mu_beta, weighted.Cov_mu_beta, rtol=rtol, atol=atol)
+
+    # right censored times tied with weighted failure times must rank the failures first in both forms of the data
+    weighted = Fit_Weibull_2P(failures=[5, 8, 10, 12, 20, 31], right_censored=[5, 10, 40], failure_weights=[3, 1, 2, 1, 1, 1], show_probability_plot=False, print_results=False)
+    expanded = Fit_Weibull_2P(failures=[5, 5, 5, 8, 10, 10, 12, 20, 31], right_censored=[10, 40, 5], show_probability_plot=False, print_results=False)
+    assert_allclose(weighted.AD, expanded.AD, rtol=rtol, atol=atol)
+    x, y = plotting_positions(failures=[10, 5, 8, 12, 20, 31], right_censored=[5, 10, 40], failure_weights=[2, 3, 1, 1, 1, 1])
+    x_expanded, y_expanded = plotting_positions(failures=[5, 5, 5, 8, 10, 10, 12, 20, 31], right_censored=[40, 10, 5])
+    assert_allclose(x, [10, 5, 8, 12, 20, 31], rtol=rtol, atol=atol)
+    assert_allclose(y, y_expanded[[5, 2, 3, 6, 7, 8]], rtol=rtol, atol=atol)
+
+    # the closed form derivatives of the weighted log-likelihood must match those from autograd
+    W_f, W_rc = failure_weights.astype(float), right_censored_weights.astype(float)
+    for func_name, LL_func, params in [("Weibull_3P", Fit_Weibull_3P.LL, [40, 1.5, 4]), ("Normal_2P", Fit_Normal_2P.LL, [45, 20]), ("Exponential_2P", Fit_Exponential_2P.LL, [0.02, 4])]:
+        params = np.array(params, dtype=float)
+        value, grad = LL_value_and_grad(func_name, LL_func)(params, failures, right_censored, W_f, W_rc)
+        value_AD, grad_AD = value_and_grad(LL_func)(params, failures, right_censored, W_f, W_rc)
+        assert_allclose(value, value_AD, rtol=1e-8, atol=1e-8)
+        assert_allclose(grad, grad_AD, rtol=1e-8, atol=1e-8)
+        assert_allclose(LL_hessian(func_name, LL_func)(params, failures, right_censored, W_f, W_rc), hessian(LL_func)(params, failures, right_censored, W_f, W_rc), rtol=1e-8, atol=1e-8)
+
+
+def test_Fit_update():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Lognormal_Distribution(mu=3, sigma=0.5)
+    rawdata = dist.random_samples(200, seed=1)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    new_failures = np.array([12.5, 15.1, 18.3])
+    for fitter, parameters in [(Fit_Weibull_2P, ['alpha', 'beta']), (Fit_Lognormal_2P, ['mu', 'sigma'])]:
+        fit = fitter(failures=data.failures, right_censored=data.right_censored, show_probability_plot=False, print_results=False)
+        updated = fit.update(failures=new_failures, right_censored=[30.5], right_censored_weights=[4])
+        full = fitter(failures=np.hstack([data.failures, new_failures]), right_censored=np.hstack([data.right_censored, [30.5] * 4]), show_probability_plot=False, print_results=False)
+        for parameter in parameters:
+            assert_allclose(getattr(updated, parameter), getattr(full, parameter), rtol=1e-6, atol=1e-6)
+            assert_allclose(getattr(updated, parameter + '_SE'), getattr(full, parameter + '_SE'), rtol=1e-6, atol=1e-6)
+        assert_allclose(updated.loglik, full.loglik, rtol=1e-6, atol=1e-6)
+        assert_allclose(updated.AD, full.AD, rtol=1e-6, atol=1e-6)
+        assert len(fit.failures) == len(data.failures)  # the original fit is not modified
+    updated = Fit_Lognormal_2P(failures=data.failures, right_censored=data.right_censored, show_probability_plot=False, print_results=False).update(failures=new_failures)
+    assert updated.optimizer == 'Newton'
+
+
+def test_Fit_closed_form():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Lognormal_Distribution(mu=3, sigma=0.5, gamma=10)
+    rawdata = dist.random_samples(50, seed=4)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    # the closed form MLE must match the MLE found by the optimizer
+    for fitter, parameters, right_censored in [(Fit_Exponential_1P, ['Lambda'], data.right_censored), (Fit_Exponential_2P, ['Lambda', 'gamma'], data.right_censored), (Fit_Normal_2P, ['mu', 'sigma'], None), (Fit_Lognormal_2P, ['mu', 'sigma'], None)]:
+        failures = data.failures if right_censored is not None else rawdata
+        closed_form = fitter(failures=failures, right_censored=right_censored, show_probability_plot=False, print_results=False)
+        optimized = fitter(failures=failures, right_censored=right_censored, optimizer='best', show_probability_plot=False, print_results=False)
+        assert closed_form.optimizer == 'closed form'
+        for parameter in parameters:
+            assert_allclose(getattr(closed_form, parameter), getattr(optimized, parameter), rtol=rtol, atol=atol)
+            assert_allclose(getattr(closed_form, parameter + '_SE'), getattr(optimized, parameter + '_SE'), rtol=rtol, atol=atol)
+        assert closed_form.loglik >= optimized.loglik - 1e-6
+    # right censored data has no closed form for Normal_2P
+    assert Fit_Normal_2P(failures=data.failures, right_censored=data.right_censored, show_probability_plot=False, print_results=False).optimizer != 'closed form'
+    sigma_forced = Fit_Lognormal_2P(failures=rawdata, force_sigma=0.4, show_probability_plot=False, print_results=False)
+    assert_allclose(sigma_forced.mu, np.mean(np.log(rawdata)), rtol=1e-8, atol=1e-8)
+
+def test_prepared_data():
+    # ignores the runtime warning from scipy when the nelder-mean or powell optimizers are used and jac is not required
+    warnings.filterwarnings(action="ignore", category=RuntimeWarning)
+    dist = Weibull_Distribution(alpha=50, beta=2)
+    rawdata = dist.random_samples(30, seed=2)
+    data = make_right_censored_data(data=rawdata, threshold=dist.mean)
+    prepared = prepared_data(failures=data.failures, right_censored=data.right_censored)
+    # a prepared_data object gives the same results as the arrays
+    for fitter in [Fit_Weibull_2P, Fit_Weibull_3P, Fit_Gamma_2P, Fit_Lognormal_2P, Fit_Exponential_2P, Fit_Loglogistic_2P, Fit_Gumbel_2P, Fit_Weibull_ZI]:
+        from_arrays = fitter(failures=data.failures, right_censored=data.right_censored, show_probability_plot=False, print_results=False)
+        from_prepared = fitter(failures=prepared, show_probability_plot=False, print_results=False)
+        assert_allclose(from_prepared.loglik, from_arrays.loglik, rtol=1e-8, atol=1e-8)
+        assert_allclose(from_prepared.AD, from_arrays.AD, rtol=1e-8, atol=1e-8)
+    assert fitters_input_checking(dist='Weibull_2P', failures=prepared).prepared is prepared
+    # the least squares results are stored so the fitters (and racing in Fit_Everything) share them
+    LS_results = prepared.LS_results(func_name='Weibull_2P', LL_func=Fit_Weibull_2P.LL)
+    assert prepared.LS_results(func_name='Weibull_2P', LL_func=Fit_Weibull_2P.LL) is LS_results
+    assert prepared.LS_results(func_name='Weibull_2P', LL_func=Fit_Weibull_2P.LL, method='RRX') is not LS_results
+    KM = KaplanMeier(failures=data.failures, right_censored=data.right_censored, show_plot=False, print_results=False)
+    codes = np.hstack([np.ones_like(prepared.failures), np.zeros_like(prepared.right_censored)])[prepared.sort_order]
+    assert_allclose(prepared.KM[codes == 1], KM.KM[KM.censor_codes == 1], rtol=1e-8, atol=1e-8)
+    # values removed for a distribution result in new prepared data
+    with_zeros = prepared_data(failures=np.hstack([0, data.failures]), right_censored=data.right_censored)
+    assert fitters_input_checking(dist='Normal_2P', failures=with_zeros).prepared is with_zeros
+    assert len(fitters_input_checking(dist='Weibull_2P', failures=with_zeros).prepared.failures) == len(data.failures)
+    try:
+        Fit_Weibull_2P(failures=prepared, right_censored=data.right_censored, show_probability_plot=False, print_results=False)
+        raise AssertionError('right_censored and a prepared_data object must not both be accepted')
+    except ValueError:
+        pass
+    everything = Fit_Everything(failures=prepared, show_histogram_plot=False, show_probability_plot=False, show_PP_plot=False, show_best_distribution_probability_plot=False, print_results=False)
+    everything_arrays = Fit_Everything(failures=data.failures, right_censored=data.right_censored, show_histogram_plot=False, show_probability_plot=False, show_PP_plot=False, show_best_distribution_probability_plot=False, print_results=False)
+    assert everything.best_distribution_name == everything_arrays.best_distribution_name
+    assert_allclose(everything.Weibull_2P_AD, everything_arrays.Weibull_2P_AD, rtol=1e-8, atol=1e-8)
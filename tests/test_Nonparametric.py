@@ -1,10 +1,11 @@
 from reliability.Datasets import automotive
-from reliability.Nonparametric import KaplanMeier, NelsonAalen, RankAdjustment
+from reliability.Nonparametric import KaplanMeier, NelsonAalen, RankAdjustment, Stratified
 
 failures = automotive().failures
 right_censored = automotive().right_censored
 
 from numpy.testing import assert_allclose
+import numpy as np
 atol = 1e-8
 rtol = 1e-7
 
@@ -15,6 +16,86 @@ def test_KaplanMeier():
     assert_allclose(sum(KMF.SF_lower), 25.645200968606833, rtol=rtol, atol=atol)
     assert_allclose(sum(KMF.SF_upper), 38.377898733187926, rtol=rtol, atol=atol)
 
+def test_KaplanMeier_ties():
+    KMF = KaplanMeier(failures=[5, 5, 5, 8, 10, 10, 12], right_censored=[5, 9, 10, 15], show_plot=False, print_results=False)
+    assert_allclose(KMF.results["Number of items"], [3, 1, 1, 1, 2, 1, 1, 1], rtol=rtol, atol=atol)
+    assert_allclose(KMF.results["Items remaining"], [11, 8, 7, 6, 5, 3, 2, 1], rtol=rtol, atol=atol)
+    assert_allclose(KMF.KM, [0.7272727272727273, 0.7272727272727273, 0.6233766233766234, 0.6233766233766234, 0.374025974025974, 0.374025974025974, 0.187012987012987, 0.187012987012987], rtol=rtol, atol=atol)
+    assert_allclose(KMF.xvals, [0, 5, 5, 5, 8, 8, 9, 10, 10, 10, 12, 12, 15], rtol=rtol, atol=atol)
+    assert_allclose(KMF.SF, [1.0, 1.0, 0.7272727272727273, 0.7272727272727273, 0.7272727272727273, 0.6233766233766234, 0.6233766233766234, 0.6233766233766234, 0.374025974025974, 0.374025974025974, 0.374025974025974, 0.187012987012987, 0.187012987012987], rtol=rtol, atol=atol)
+    assert_allclose(KMF.SF_lower, [1.0, 1.0, 0.4640855755023683, 0.4640855755023683, 0.4640855755023683, 0.3293819183669212, 0.3293819183669212, 0.3293819183669212, 0.05344913468762502, 0.05344913468762502, 0.05344913468762502, 0.0, 0.0], rtol=rtol, atol=atol)
+    assert_allclose(sum(KMF.SF_upper), 10.790812060189783, rtol=rtol, atol=atol)
+
+def test_tied_last_failure():
+    # the confidence bounds at the end of the step plot are the bounds of the last row
+    KMF = KaplanMeier(failures=[1, 2, 3, 3], show_plot=False, print_results=False)
+    assert_allclose(KMF.SF, [1.0, 1.0, 0.75, 0.75, 0.5, 0.5, 0.0], rtol=rtol, atol=atol)
+    assert_allclose(KMF.SF_lower, [1.0, 1.0, 0.3256553497214356, 0.3256553497214356, 0.010009003864986488, 0.010009003864986488, 0.0], rtol=rtol, atol=atol)
+    assert_allclose(KMF.SF_upper, [1.0, 1.0, 1.0, 1.0, 0.9899909961350135, 0.9899909961350135, 0.0], rtol=rtol, atol=atol)
+    for method in [KaplanMeier, NelsonAalen, RankAdjustment]:
+        for data in [[5, 5, 5], [1, 2, 3, 3]]:
+            fit = method(failures=data, show_plot=False, print_results=False)
+            assert (fit.SF_lower <= fit.SF + 1e-12).all() and (fit.SF <= fit.SF_upper + 1e-12).all()
+
+def test_last_failure_bounds():
+    # when the data ends with a failure the bounds at the last point are those of the last row, even without ties
+    NAF = NelsonAalen(failures=failures, show_plot=False, print_results=False)
+    assert_allclose(NAF.SF[-3:], [0.14529803184311985, 0.14529803184311985, 0.05345215875775738], rtol=rtol, atol=atol)
+    assert_allclose(NAF.SF_lower[-3:], [0.0, 0.0, 0.0], rtol=rtol, atol=atol)
+    assert_allclose(NAF.SF_upper[-3:], [0.41546302686310693, 0.41546302686310693, 1.0], rtol=rtol, atol=atol)
+    RAF = RankAdjustment(failures=failures, show_plot=False, print_results=False)
+    assert_allclose(RAF.SF_upper[-3:], [0.46739948699550643, 0.46739948699550643, 1.0], rtol=rtol, atol=atol)
+    KMF = KaplanMeier(failures=failures, show_plot=False, print_results=False)
+    assert_allclose(KMF.SF_upper[-3:], [0.28593850969136847, 0.28593850969136847, 0.0], rtol=rtol, atol=atol)
+
+def test_weights():
+    # the weights give the same results as the expanded data
+    for method in [KaplanMeier, NelsonAalen, RankAdjustment]:
+        expanded = method(failures=[5, 5, 5, 8, 10, 10, 12], right_censored=[5, 9, 10, 15], show_plot=False, print_results=False)
+        weighted = method(failures=[12, 5, 10, 8], right_censored=[5, 9, 10, 15], failure_weights=[1, 3, 2, 1], show_plot=False, print_results=False)
+        assert_allclose(weighted.results.values, expanded.results.values, rtol=rtol, atol=atol)
+        assert_allclose(weighted.SF, expanded.SF, rtol=rtol, atol=atol)
+        assert_allclose(weighted.SF_lower, expanded.SF_lower, rtol=rtol, atol=atol)
+    NAF = NelsonAalen(failures=[5, 8, 10, 12], right_censored=[5, 9, 10, 15], failure_weights=[3, 1, 2, 1], show_plot=False, print_results=False)
+    assert_allclose(NAF.NA, [0.7393231289178774, 0.7393231289178774, 0.6409028812330623, 0.6409028812330623, 0.40865771952970636, 0.40865771952970636, 0.24786343622301313, 0.24786343622301313], rtol=rtol, atol=atol)
+    RAF = RankAdjustment(failures=[5, 8, 10, 12], right_censored=[5, 9, 10, 15], failure_weights=[3, 1, 2, 1], show_plot=False, print_results=False)
+    assert_allclose(RAF.RA, [0.763157894736842, 0.763157894736842, 0.6644736842105263, 0.6644736842105263, 0.4342105263157895, 0.4342105263157895, 0.280701754385965, 0.280701754385965], rtol=rtol, atol=atol)
+    RAF_unsorted = RankAdjustment(failures=[3, 1, 2, 5], show_plot=False, print_results=False)
+    assert_allclose(RAF_unsorted.RA, [0.8409090909090909, 0.6136363636363636, 0.38636363636363635, 0.1590909090909091], rtol=rtol, atol=atol)
+
+def test_Stratified():
+    # each group gives the same results as the unstratified method
+    times = [5, 8, 5, 10, 12, 9, 3, 10, 15, 5, 7, 4, 10, 6]
+    censor_codes = [1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 1, 0, 1, 1]
+    groups = ["a", "a", "a", "a", "a", "a", "b", "a", "a", "a", "b", "b", "a", "b"]
+    weights = [2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3]
+    for method, estimator in [["KM", KaplanMeier], ["NA", NelsonAalen], ["RA", RankAdjustment]]:
+        strata = Stratified(times=times, censor_codes=censor_codes, groups=groups, weights=weights, method=method, print_results=False)
+        group_a = estimator(failures=[5, 5, 5, 8, 10, 10, 12], right_censored=[5, 9, 10, 15], show_plot=False, print_results=False)
+        group_b = estimator(failures=[3, 6, 6, 6, 7], right_censored=[4], show_plot=False, print_results=False)
+        assert (strata.groups == ["a", "b"]).all()
+        assert (strata.results["Group"].values == ["a"] * 8 + ["b"] * 4).all()
+        assert_allclose(strata.results.values[:, 1:].astype(float), np.vstack([group_a.results.values, group_b.results.values]), rtol=rtol, atol=atol)
+    strata = Stratified(times=times, censor_codes=censor_codes, groups=groups, weights=weights, print_results=False)
+    assert_allclose(strata.SF, [0.7272727272727273, 0.7272727272727273, 0.6233766233766234, 0.6233766233766234, 0.374025974025974, 0.374025974025974, 0.187012987012987, 0.187012987012987, 0.8333333333333334, 0.8333333333333334, 0.20833333333333334, 0.0], rtol=rtol, atol=atol)
+
+def test_SF_at_and_quantile():
+    KMF = KaplanMeier(failures=failures, right_censored=right_censored, show_plot=False, print_results=False)
+    # the SF_at values are the same as the step plot values after each step
+    assert_allclose(KMF.SF_at(KMF.data), KMF.KM, rtol=rtol, atol=atol)
+    lower, SF, upper = KMF.SF_at([1000, 5248, 60000, 200000], CI_bounds=True)
+    assert_allclose(lower, [1.0, 0.8955483419499333, 0.4862099502844298, 0.0], rtol=rtol, atol=atol)
+    assert_allclose(SF, [1.0, 0.9642857142857143, 0.6853527444422587, 0.2698576431241394], rtol=rtol, atol=atol)
+    assert_allclose(upper, [1.0, 1.0, 0.8844955386000876, 0.6624463123659248], rtol=rtol, atol=atol)
+    assert_allclose(KMF.CHF_at([1000, 5248, 60000, 200000]), -np.log(SF), rtol=rtol, atol=atol)
+    lower, x, upper = KMF.quantile([0, 0.05, 0.3, 0.5], CI_bounds=True)
+    assert_allclose(lower, [0, 5248, 38700, 49390], rtol=rtol, atol=atol)
+    assert_allclose(x, [0, 7454, 49390, 131900], rtol=rtol, atol=atol)
+    assert_allclose(upper, [0, 45000, 131900, np.inf], rtol=rtol, atol=atol)
+    NAF = NelsonAalen(failures=[1, 2, 3, 4], show_plot=False, print_results=False)
+    assert_allclose(NAF.SF_at([0.5, 1, 2.5, 9]), [1.0, 0.7788007830714049, 0.5580351457700471, 0.12451447144412296], rtol=rtol, atol=atol)
+    assert_allclose(NAF.quantile(0.5), 3, rtol=rtol, atol=atol)
+
 def test_NelsonAalen():
     NAF = NelsonAalen(failures=failures, right_censored=right_censored, show_plot=False, print_results=False)
     assert_allclose(sum(NAF.NA),23.29546519223915,rtol=rtol,atol=atol)
@@ -0,0 +1,50 @@
+from reliability.Probability_plotting import plotting_positions
+from reliability.Nonparametric import RankAdjustment
+from numpy.testing import assert_allclose
+import numpy as np
+
+atol = 1e-8
+rtol = 1e-7
+
+
+def test_plotting_positions():
+    # the values are from the previous (pandas based) implementation. The order of the failures is preserved.
+    x, y = plotting_positions(failures=[30, 10, 40, 20])
+    assert_allclose(x, [30, 10, 40, 20], rtol=rtol, atol=atol)
+    assert_allclose(y, [0.6136363636363636, 0.15909090909090906, 0.8409090909090908, 0.3863636363636363], rtol=rtol, atol=atol)
+    x, y = plotting_positions(failures=[30, 10, 20], right_censored=[15], a=0.5)
+    assert_allclose(x, [30, 10, 20], rtol=rtol, atol=atol)
+    assert_allclose(y, [0.7916666666666666, 0.125, 0.45833333333333326], rtol=rtol, atol=atol)
+
+
+def test_plotting_positions_leading_censored():
+    # right censored values before the first failure
+    x, y = plotting_positions(failures=[30, 10, 40, 20], right_censored=[5, 8, 25])
+    assert_allclose(x, [30, 10, 40, 20], rtol=rtol, atol=atol)
+    assert_allclose(y, [0.56006006006006, 0.13963963963963963, 0.8003003003003003, 0.3198198198198199], rtol=rtol, atol=atol)
+
+
+def test_plotting_positions_tied_failures():
+    # each of the tied failures has its own rank, in the order in which they were given
+    x, y = plotting_positions(failures=[20, 10, 20, 30, 20], right_censored=[35])
+    assert_allclose(x, [20, 10, 20, 30, 20], rtol=rtol, atol=atol)
+    assert_allclose(y, [0.265625, 0.10937499999999999, 0.421875, 0.734375, 0.578125], rtol=rtol, atol=atol)
+
+
+def test_plotting_positions_failures_tied_with_censored():
+    # at tied times the failures are ranked before the right censored items (as in Nonparametric).
+    # The previous implementation did not have a defined order at these ties and gave 0.29922779922779924 at 20.
+    x, y = plotting_positions(failures=[10, 20, 30, 40], right_censored=[20, 5, 40])
+    assert_allclose(x, [10, 20, 30, 40], rtol=rtol, atol=atol)
+    assert_allclose(y, [0.11389961389961388, 0.26833976833976836, 0.4613899613899614, 0.6544401544401545], rtol=rtol, atol=atol)
+    RAF = RankAdjustment(failures=[10, 20, 30, 40], right_censored=[20, 5, 40], show_plot=False, print_results=False)
+    assert_allclose(y, 1 - RAF.RA[RAF.censor_codes == 1], rtol=rtol, atol=atol)
+
+
+def test_plotting_positions_weights():
+    x, y = plotting_positions(failures=[30, 10, 20, 45], right_censored=[15, 50], failure_weights=[2, 3, 1, 4], right_censored_weights=[2, 5])
+    assert_allclose(x, [30, 10, 20, 45], rtol=rtol, atol=atol)
+    assert_allclose(y, [0.3541114058355438, 0.15517241379310348, 0.22148541114058354, 0.6193633952254641], rtol=rtol, atol=atol)
+    # each failure time has the plotting position of the last of its units in the expanded data
+    x_expanded, y_expanded = plotting_positions(failures=np.repeat([30, 10, 20, 45], [2, 3, 1, 4]), right_censored=np.repeat([15, 50], [2, 5]))
+    assert_allclose(y, y_expanded[[1, 4, 5, 9]], rtol=rtol, atol=atol)